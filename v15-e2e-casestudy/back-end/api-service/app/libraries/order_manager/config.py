@@ -5,7 +5,7 @@ This module contains only constants and default values.
 Environment configuration is managed by the consuming application.
 """
 
-from typing import List
+from typing import List, Optional
 
 
 class Config:
@@ -25,6 +25,16 @@ class Config:
     # Default database path (can be overridden by application)
     DEFAULT_DB_PATH: str = "orders.db"
     
+    # Statements at least this slow (ms) are logged with their query plan
+    # (None leaves the slow query log off)
+    DEFAULT_SLOW_QUERY_MS: Optional[float] = None
+    
+    # Orders validated and inserted per transaction by create_orders_bulk
+    DEFAULT_BULK_CHUNK_SIZE: int = 1000
+    
+    # Per-row errors kept in a create_orders_bulk report (counts stay exact)
+    DEFAULT_BULK_MAX_ERRORS: int = 1000
+    
     # Validation constraints
     MAX_CUSTOMER_NAME_LENGTH: int = 255
     MAX_PRODUCT_SKU_LENGTH: int = 100
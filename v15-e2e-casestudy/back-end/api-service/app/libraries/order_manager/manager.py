@@ -5,10 +5,14 @@ This module provides the primary interface for all order management operations.
 """
 
 from datetime import datetime
-from typing import List, Optional
-from sqlalchemy import or_
+from contextlib import contextmanager
+from itertools import islice
+from typing import Any, Dict, Generator, Iterable, List, Optional
+from sqlalchemy import insert, or_
+from sqlalchemy.exc import SQLAlchemyError
 from .config import Config
 from .database import Database
+from .query_stats import QueryCounter
 from .models import Order
 from .exceptions import (
     OrderNotFoundException,
@@ -37,14 +41,44 @@ class OrderManager:
     Provides methods for creating, retrieving, searching, and updating orders.
     """
     
-    def __init__(self, db_path: str = Config.DEFAULT_DB_PATH):
+    def __init__(
+        self,
+        db_path: str = Config.DEFAULT_DB_PATH,
+        slow_query_ms: Optional[float] = Config.DEFAULT_SLOW_QUERY_MS
+    ):
         """
         Initialize the Order Manager.
         
         Args:
             db_path: Path to the SQLite database file. Default: "orders.db"
+            slow_query_ms: Log statements at least this slow with their
+                query plan. None disables the slow query log.
         """
-        self.db = Database(db_path)
+        self.db = Database(db_path, slow_query_ms=slow_query_ms)
+    
+    @contextmanager
+    def count_queries(self, name: str = "block") -> Generator[QueryCounter, None, None]:
+        """
+        Count the SQL statements executed inside a block.
+        
+        Args:
+            name: Label for the block (shown on slow queries)
+            
+        Yields:
+            QueryCounter whose ``count`` is the number of statements so far
+            
+        Example:
+            with manager.count_queries("search") as queries:
+                manager.search_orders(status="Pending")
+            print(queries.count)
+        """
+        with self.db.query_stats.count_queries(name) as counter:
+            yield counter
+    
+    @property
+    def slow_queries(self) -> List[dict]:
+        """Recent slow statements with their query plans, newest first."""
+        return list(reversed(self.db.query_stats.slow_queries))
     
     def create_order(
         self,
@@ -78,42 +112,20 @@ class OrderManager:
             DatabaseException: If database operation fails
         """
         try:
-            # Validate all required fields
-            validate_required_fields(
+            values = self._validate_order(
                 order_date=order_date,
                 customer_name=customer_name,
                 billing_address=billing_address,
                 product_sku=product_sku,
                 quantity=quantity,
                 order_amount=order_amount,
-                order_status=order_status
+                order_status=order_status,
+                remarks=remarks
             )
             
-            # Validate individual fields
-            validate_order_date(order_date)
-            validate_customer_name(customer_name)
-            validate_billing_address(billing_address)
-            validate_product_sku(product_sku)
-            validate_quantity(quantity)
-            validate_order_amount(order_amount)
-            validate_order_status(order_status)
-            
-            # Sanitize inputs
-            customer_name = sanitize_customer_name(customer_name)
-            product_sku = sanitize_product_sku(product_sku)
-            
             # Create order
             with self.db.get_session() as session:
-                order = Order(
-                    order_date=order_date,
-                    customer_name=customer_name,
-                    billing_address=billing_address,
-                    product_sku=product_sku,
-                    quantity=quantity,
-                    order_amount=order_amount,
-                    order_status=order_status,
-                    remarks=remarks
-                )
+                order = Order(**values)
                 session.add(order)
                 session.flush()
                 session.refresh(order)
@@ -124,6 +136,136 @@ class OrderManager:
         except Exception as e:
             raise InvalidOrderDataException(f"Failed to create order: {str(e)}")
     
+    def create_orders_bulk(
+        self,
+        orders: Iterable[Dict[str, Any]],
+        chunk_size: int = Config.DEFAULT_BULK_CHUNK_SIZE,
+        return_ids: bool = False,
+        max_errors: int = Config.DEFAULT_BULK_MAX_ERRORS
+    ) -> Dict[str, Any]:
+        """
+        Create many orders, one transaction per chunk.
+        
+        The orders are consumed ``chunk_size`` at a time, so a generator
+        reading a large file is never held in memory at once. Each chunk
+        is validated like create_order() and its valid orders are inserted
+        with a single executemany. If the chunk's insert fails, its orders
+        are retried one transaction each to find the failing ones. Invalid
+        orders are reported, not raised.
+        
+        Args:
+            orders: Dictionaries with create_order()'s arguments; order_date
+                may also be an ISO 8601 string
+            chunk_size: Orders validated and inserted per transaction
+            return_ids: Include the created order IDs in the report
+            max_errors: Per-row errors to keep in the report
+            
+        Returns:
+            Report dictionary with "total", "created" and "failed" counts,
+            "errors" (list of {"row": 1-based input position, "error":
+            message}), "errors_truncated" and, with return_ids, "order_ids"
+        """
+        report: Dict[str, Any] = {"total": 0, "created": 0, "failed": 0, "errors": [], "errors_truncated": False}
+        if return_ids:
+            report["order_ids"] = []
+        
+        def fail(row: int, message: str):
+            report["failed"] += 1
+            if len(report["errors"]) < max_errors:
+                report["errors"].append({"row": row, "error": message})
+            else:
+                report["errors_truncated"] = True
+        
+        rows = enumerate(orders, start=1)
+        while True:
+            chunk = list(islice(rows, chunk_size))
+            if not chunk:
+                break
+            report["total"] += len(chunk)
+            
+            valid = []
+            for row, data in chunk:
+                try:
+                    valid.append((row, self._validate_bulk_order(data)))
+                except (ValidationException, InvalidOrderDataException) as e:
+                    fail(row, str(e))
+            if not valid:
+                continue
+            
+            try:
+                order_ids = self._insert_orders([values for _, values in valid], return_ids)
+                report["created"] += len(valid)
+            except SQLAlchemyError:
+                order_ids = []
+                for row, values in valid:
+                    try:
+                        order_ids.extend(self._insert_orders([values], return_ids))
+                        report["created"] += 1
+                    except SQLAlchemyError as e:
+                        fail(row, f"Database error: {getattr(e, 'orig', None) or e}")
+            
+            if return_ids:
+                report["order_ids"].extend(order_ids)
+        
+        return report
+    
+    def _validate_bulk_order(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Validate one create_orders_bulk() input (see _validate_order)."""
+        if not isinstance(data, dict):
+            raise InvalidOrderDataException("Order must be a dictionary")
+        
+        order_date = data.get("order_date")
+        if isinstance(order_date, str):
+            try:
+                order_date = datetime.fromisoformat(order_date)
+            except ValueError:
+                raise ValidationException("order_date", "Order date must be an ISO 8601 date and time")
+        
+        return self._validate_order(
+            order_date=order_date,
+            customer_name=data.get("customer_name"),
+            billing_address=data.get("billing_address"),
+            product_sku=data.get("product_sku"),
+            quantity=data.get("quantity"),
+            order_amount=data.get("order_amount"),
+            order_status=data.get("order_status") or "Pending",
+            remarks=data.get("remarks")
+        )
+    
+    @staticmethod
+    def _validate_order(**values: Any) -> Dict[str, Any]:
+        """
+        Validate and sanitize the fields of a new order.
+        
+        Returns:
+            Column values for the new order
+            
+        Raises:
+            ValidationException: If a field is missing or invalid
+        """
+        validate_required_fields(**values)
+        
+        validate_order_date(values["order_date"])
+        validate_customer_name(values["customer_name"])
+        validate_billing_address(values["billing_address"])
+        validate_product_sku(values["product_sku"])
+        validate_quantity(values["quantity"])
+        validate_order_amount(values["order_amount"])
+        validate_order_status(values["order_status"])
+        
+        values["customer_name"] = sanitize_customer_name(values["customer_name"])
+        values["product_sku"] = sanitize_product_sku(values["product_sku"])
+        return values
+    
+    def _insert_orders(self, values: List[Dict[str, Any]], return_ids: bool) -> List[int]:
+        """Insert orders in one transaction (executemany); return their IDs if asked."""
+        statement = insert(Order.__table__)
+        with self.db.get_transaction() as conn:
+            if return_ids:
+                return list(conn.execute(statement.returning(Order.order_id), values).scalars())
+            conn.execute(statement, values)
+        return []
+    
     def get_orders_by_customer(self, customer_name: str) -> List[Order]:
         """
         Retrieve all orders for a specific customer (Feature F-002).
@@ -191,7 +333,8 @@ class OrderManager:
         """
         Search orders by partial customer name match (Feature F-004).
         
-        Performs case-insensitive partial match.
+        Performs case-insensitive partial match through the full-text
+        search index. Best matches come first, then newest first.
         
         Args:
             customer_name_partial: Partial customer name to search
@@ -203,12 +346,12 @@ class OrderManager:
             DatabaseException: If database operation fails
         """
         try:
-            search_pattern = f"%{customer_name_partial}%"
+            matches = self.db.search_index.matches("customer_name", customer_name_partial).subquery()
             
             with self.db.get_session() as session:
-                orders = session.query(Order).filter(
-                    Order.customer_name.ilike(search_pattern)
-                ).order_by(Order.order_date.desc()).all()
+                orders = session.query(Order).join(
+                    matches, matches.c.order_id == Order.order_id
+                ).order_by(matches.c.rank, Order.order_date.desc()).all()
                 
                 return list(orders)
                 
@@ -232,7 +375,8 @@ class OrderManager:
         Args:
             order_status: Filter by exact order status
             product_sku: Filter by exact product SKU
-            billing_address_partial: Filter by partial address match (case-insensitive)
+            billing_address_partial: Filter by partial address match (case-insensitive),
+                looked up in the full-text search index; best matches come first
             
         Returns:
             List of matching Order objects (empty list if none found)
@@ -254,8 +398,10 @@ class OrderManager:
                     query = query.filter(Order.product_sku == product_sku)
                 
                 if billing_address_partial:
-                    search_pattern = f"%{billing_address_partial}%"
-                    query = query.filter(Order.billing_address.ilike(search_pattern))
+                    matches = self.db.search_index.matches("billing_address", billing_address_partial).subquery()
+                    query = query.join(
+                        matches, matches.c.order_id == Order.order_id
+                    ).order_by(matches.c.rank)
                 
                 # Execute query
                 orders = query.order_by(Order.order_date.desc()).all()
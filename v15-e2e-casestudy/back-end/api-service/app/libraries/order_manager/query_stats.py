@@ -0,0 +1 @@
+../../../../libraries/order_manager/query_stats.py
\ No newline at end of file
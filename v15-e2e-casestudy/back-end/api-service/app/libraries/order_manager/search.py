@@ -0,0 +1,120 @@
+"""
+Full-text search index for the Order Manager library.
+
+Partial matches on customer name and billing address use an FTS5 table
+with the trigram tokenizer (``orders_fts``). It is an external content
+table over ``orders`` that stores only the trigram index and is kept in
+sync by triggers. A ``MATCH`` on it finds every row containing a 3+
+character substring without scanning ``orders``, which a leading-wildcard
+``LIKE`` always does.
+
+Terms shorter than 3 characters, and databases whose SQLite has no
+FTS5, fall back to ``LIKE``.
+"""
+
+from sqlalchemy import Float, Integer, literal, literal_column, select, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.sql import Select
+from .models import Order
+
+
+# Shortest term the trigram index can look up
+MIN_TERM_LENGTH = 3
+
+_CREATE_TABLE = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS orders_fts USING fts5("
+    "customer_name, billing_address, "
+    "content='orders', content_rowid='order_id', tokenize='trigram')"
+)
+
+_TRIGGERS = (
+    """CREATE TRIGGER IF NOT EXISTS orders_fts_insert AFTER INSERT ON orders BEGIN
+        INSERT INTO orders_fts(rowid, customer_name, billing_address)
+        VALUES (new.order_id, new.customer_name, new.billing_address);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS orders_fts_delete AFTER DELETE ON orders BEGIN
+        INSERT INTO orders_fts(orders_fts, rowid, customer_name, billing_address)
+        VALUES ('delete', old.order_id, old.customer_name, old.billing_address);
+    END""",
+    # Status updates leave the index alone
+    """CREATE TRIGGER IF NOT EXISTS orders_fts_update AFTER UPDATE OF customer_name, billing_address ON orders BEGIN
+        INSERT INTO orders_fts(orders_fts, rowid, customer_name, billing_address)
+        VALUES ('delete', old.order_id, old.customer_name, old.billing_address);
+        INSERT INTO orders_fts(rowid, customer_name, billing_address)
+        VALUES (new.order_id, new.customer_name, new.billing_address);
+    END""",
+)
+
+
+class SearchIndex:
+    """
+    FTS5 trigram index over ``customer_name`` and ``billing_address``.
+
+    Example:
+        index = SearchIndex()
+        index.create(engine)
+        matches = index.matches("customer_name", "smith").subquery()
+        session.query(Order).join(matches, matches.c.order_id == Order.order_id)
+    """
+
+    def __init__(self):
+        self.available = False
+
+    def create(self, engine: Engine) -> bool:
+        """
+        Create the index and its triggers if missing (idempotent).
+
+        An index created over existing orders is built from them.
+
+        Args:
+            engine: Engine of the order database
+
+        Returns:
+            True if the index exists, False if SQLite lacks FTS5
+        """
+        with engine.begin() as conn:
+            existed = conn.execute(
+                text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'orders_fts'")
+            ).first() is not None
+            try:
+                conn.execute(text(_CREATE_TABLE))
+            except OperationalError:
+                # SQLite compiled without FTS5 (or without the trigram tokenizer)
+                self.available = False
+                return False
+            for trigger in _TRIGGERS:
+                conn.execute(text(trigger))
+            if not existed:
+                conn.execute(text("INSERT INTO orders_fts(orders_fts) VALUES ('rebuild')"))
+        self.available = True
+        return True
+
+    def matches(self, column: str, term: str) -> Select:
+        """
+        Select the orders whose ``column`` contains ``term``, with a rank.
+
+        Lower rank is a better match (FTS5 bm25); ``LIKE`` matches rank 0,
+        so only order by the rank of a single ``matches()`` select, never
+        of several combined.
+
+        Args:
+            column: "customer_name" or "billing_address"
+            term: Substring to find (case-insensitive)
+
+        Returns:
+            Select of ``(order_id, rank)`` rows
+        """
+        if self.available and len(term) >= MIN_TERM_LENGTH:
+            quoted = '"' + term.replace('"', '""') + '"'
+            return (
+                select(
+                    literal_column("rowid", Integer).label("order_id"),
+                    literal_column("rank", Float).label("rank")
+                )
+                .select_from(text("orders_fts"))
+                .where(literal_column("orders_fts").op("MATCH")(f"{column} : {quoted}"))
+            )
+        return select(Order.order_id, literal(0.0).label("rank")).where(
+            getattr(Order, column).ilike(f"%{term}%")
+        )
@@ -0,0 +1,49 @@
+"""
+Tests for the bundled order_manager library
+"""
+from datetime import datetime
+
+import pytest
+from app.libraries.order_manager import OrderManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Order manager over a fresh database."""
+    return OrderManager(db_path=str(tmp_path / "orders.db"))
+
+
+def order(**overrides):
+    """Valid create_orders_bulk() input."""
+    data = {
+        "order_date": datetime(2024, 1, 15, 10, 0),
+        "customer_name": "Jane Doe",
+        "billing_address": "1 Main St",
+        "product_sku": "SKU-1",
+        "quantity": 1,
+        "order_amount": 999,
+    }
+    data.update(overrides)
+    return data
+
+
+def test_bulk_report_caps_errors(manager):
+    """Test create_orders_bulk keeps at most max_errors errors but exact counts."""
+    orders = [order(quantity=0) for _ in range(20)] + [order()]
+
+    report = manager.create_orders_bulk(orders, chunk_size=8, max_errors=5)
+
+    assert report["total"] == 21
+    assert report["created"] == 1
+    assert report["failed"] == 20
+    assert [error["row"] for error in report["errors"]] == [1, 2, 3, 4, 5]
+    assert report["errors_truncated"] is True
+
+
+def test_bulk_report_not_truncated_under_cap(manager):
+    """Test errors_truncated stays False when every error fits."""
+    report = manager.create_orders_bulk([order(quantity=0), order()])
+
+    assert report["failed"] == 1
+    assert len(report["errors"]) == 1
+    assert report["errors_truncated"] is False
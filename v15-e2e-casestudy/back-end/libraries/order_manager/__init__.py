@@ -25,6 +25,7 @@ __description__ = "Python library for managing customer orders"
 from .manager import OrderManager
 from .models import Order
 from .config import Config
+from .query_stats import QueryStats, QueryCounter
 from .exceptions import (
     OrderManagerException,
     OrderNotFoundException,
@@ -44,6 +45,10 @@ __all__ = [
     # Configuration
     "Config",
     
+    # Query statistics
+    "QueryStats",
+    "QueryCounter",
+    
     # Exceptions
     "OrderManagerException",
     "OrderNotFoundException",
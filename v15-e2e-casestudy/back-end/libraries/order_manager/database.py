@@ -7,12 +7,14 @@ context-managed database sessions.
 
 from contextlib import contextmanager
 from pathlib import Path
-from typing import Generator
+from typing import Generator, Optional
 from sqlalchemy import create_engine, event
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine
 from sqlalchemy.orm import sessionmaker, Session
 from .models import Base
 from .exceptions import DatabaseException
+from .query_stats import QueryStats
+from .search import SearchIndex
 
 
 # Enable foreign key support for SQLite
@@ -32,12 +34,14 @@ class Database:
     context-managed sessions for transactions.
     """
     
-    def __init__(self, db_path: str):
+    def __init__(self, db_path: str, slow_query_ms: Optional[float] = None):
         """
         Initialize the database manager.
         
         Args:
             db_path: Path to the SQLite database file
+            slow_query_ms: Log statements at least this slow with their
+                query plan (None disables the slow query log)
             
         Raises:
             DatabaseException: If database initialization fails
@@ -45,6 +49,8 @@ class Database:
         self.db_path = db_path
         self._engine = None
         self._session_factory = None
+        self.query_stats = QueryStats(slow_query_ms)
+        self.search_index = SearchIndex()
         
         try:
             # Create parent directories if they don't exist
@@ -59,6 +65,7 @@ class Database:
                 future=True,
                 connect_args={"check_same_thread": False}
             )
+            self.query_stats.attach(self._engine)
             
             # Create session factory
             self._session_factory = sessionmaker(
@@ -79,13 +86,15 @@ class Database:
         """
         Initialize database tables.
         
-        Creates all tables defined in the models if they don't exist.
+        Creates all tables defined in the models and the full-text
+        search index if they don't exist.
         
         Raises:
             DatabaseException: If table creation fails
         """
         try:
             Base.metadata.create_all(self._engine)
+            self.search_index.create(self._engine)
         except Exception as e:
             raise DatabaseException(
                 f"Failed to create database tables: {str(e)}",
@@ -126,6 +135,23 @@ class Database:
         finally:
             session.close()
     
+    def get_transaction(self) -> Connection:
+        """
+        Begin a Core connection transaction for bulk writes.
+        
+        Unlike get_session, errors are not wrapped: SQLAlchemy exceptions
+        propagate so callers can tell database errors apart and retry.
+        
+        Returns:
+            SQLAlchemy Connection with a transaction begun (use as a
+            context manager; commits on success, rolls back on error)
+            
+        Example:
+            with db.get_transaction() as conn:
+                conn.execute(insert(Order.__table__), rows)
+        """
+        return self._engine.begin()
+    
     def close(self) -> None:
         """
         Close the database connection.
@@ -0,0 +1,140 @@
+"""
+Query statistics for the Order Manager library.
+
+This module attaches cursor hooks to a database engine that count the
+statements executed inside a ``count_queries()`` block and keep the
+slowest recent statements together with their SQLite query plan.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Deque, Dict, Generator, List, Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+logger = logging.getLogger(__name__)
+
+# Statements EXPLAIN QUERY PLAN accepts
+EXPLAINABLE_PREFIXES = ("SELECT", "INSERT", "UPDATE", "DELETE", "REPLACE", "WITH")
+
+
+class QueryCounter:
+    """Number of statements executed inside a ``count_queries()`` block."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.count = 0
+
+
+class QueryStats:
+    """
+    Per-engine query counting and slow query log.
+
+    Example:
+        stats = QueryStats(slow_query_ms=50)
+        stats.attach(engine)
+
+        with stats.count_queries("search") as counter:
+            manager.search_orders(status="Pending")
+        print(counter.count, stats.slow_queries)
+    """
+
+    def __init__(self, slow_query_ms: Optional[float] = None, history: int = 100):
+        """
+        Initialize query statistics.
+
+        Args:
+            slow_query_ms: Statements at least this slow are logged with their
+                query plan (None disables the slow query log)
+            history: Number of slow statements kept
+        """
+        self.slow_query_ms = slow_query_ms
+        self.slow_queries: Deque[Dict] = deque(maxlen=history)
+        self._local = threading.local()
+
+    @property
+    def _counters(self) -> List[QueryCounter]:
+        counters = getattr(self._local, "counters", None)
+        if counters is None:
+            counters = self._local.counters = []
+        return counters
+
+    def attach(self, engine: Engine) -> None:
+        """
+        Attach the cursor hooks to an engine.
+
+        Args:
+            engine: SQLAlchemy engine to instrument
+        """
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    @contextmanager
+    def count_queries(self, name: str = "block") -> Generator[QueryCounter, None, None]:
+        """
+        Count the statements executed in this block.
+
+        Blocks nest; an outer block also counts the statements of inner ones.
+        Counting is per thread, so concurrent callers do not see each
+        other's statements.
+
+        Args:
+            name: Label recorded on slow queries from this block
+
+        Yields:
+            QueryCounter with the running statement count
+        """
+        counter = QueryCounter(name)
+        self._counters.append(counter)
+        try:
+            yield counter
+        finally:
+            self._counters.remove(counter)
+            if counter.count:
+                logger.debug(f"{name}: {counter.count} queries")
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        context._query_stats_start = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        counters = self._counters
+        for counter in counters:
+            counter.count += 1
+
+        start = getattr(context, "_query_stats_start", None)
+        if start is None or self.slow_query_ms is None:
+            return
+        duration_ms = (time.perf_counter() - start) * 1000
+        if duration_ms < self.slow_query_ms:
+            return
+
+        entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "duration_ms": round(duration_ms, 3),
+            "block": counters[-1].name if counters else None,
+            "statement": statement,
+            "parameters": repr(parameters)[:500],
+            "plan": [] if executemany else self._explain(conn, statement, parameters),
+        }
+        self.slow_queries.append(entry)
+        plan = "".join(f"\n  {line}" for line in entry["plan"])
+        logger.warning(f"Slow query ({entry['duration_ms']:.1f}ms): {statement[:200]}{plan}")
+
+    @staticmethod
+    def _explain(conn, statement: str, parameters) -> List[str]:
+        """Run EXPLAIN QUERY PLAN on the same connection, bypassing the hooks."""
+        if not statement.lstrip().upper().startswith(EXPLAINABLE_PREFIXES):
+            return []
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+            return [str(row[-1]) for row in cursor.fetchall()]
+        except Exception as e:
+            return [f"EXPLAIN failed: {e}"]
+        finally:
+            cursor.close()
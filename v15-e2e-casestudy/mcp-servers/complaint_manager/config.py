@@ -25,6 +25,10 @@ class Config:
     # Database Configuration
     DATABASE_PATH = os.getenv('DATABASE_PATH', 'db/complaints.db')
     
+    # Query Diagnostics (0 disables)
+    SLOW_QUERY_MS = float(os.getenv('SLOW_QUERY_MS', '0'))
+    TOOL_QUERY_WARN = int(os.getenv('TOOL_QUERY_WARN', '10'))
+    
     # Seed Database Configuration
     SEED_DATABASE = os.getenv('SEED_DATABASE', 'false').lower() in ('true', '1', 'yes')
     
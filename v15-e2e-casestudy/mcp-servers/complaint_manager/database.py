@@ -9,6 +9,7 @@ import logging
 
 from .models import Base
 from .config import config
+from . import query_stats
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,9 @@ class Database:
                 connect_args={"check_same_thread": False}
             )
             
+            # Per-tool query counts and slow query log
+            query_stats.attach(self.engine)
+            
             # Create session factory
             self.SessionLocal = sessionmaker(
                 autocommit=False,
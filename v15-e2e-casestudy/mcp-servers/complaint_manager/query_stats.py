@@ -0,0 +1,89 @@
+"""
+Query statistics for the complaint database
+Counts SQL statements per tool call and logs slow statements with their query plan
+"""
+
+import functools
+import logging
+import time
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+
+from .config import config
+
+logger = logging.getLogger(__name__)
+
+# Statements EXPLAIN QUERY PLAN accepts
+EXPLAINABLE_PREFIXES = ("SELECT", "INSERT", "UPDATE", "DELETE", "REPLACE", "WITH")
+
+# Statement count of the tool call running in this context
+_query_count: ContextVar[Optional[List[int]]] = ContextVar("query_count", default=None)
+
+
+def _explain(conn, statement: str, parameters) -> List[str]:
+    """Run EXPLAIN QUERY PLAN on the same connection, bypassing the hooks"""
+    if not statement.lstrip().upper().startswith(EXPLAINABLE_PREFIXES):
+        return []
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+        return [str(row[-1]) for row in cursor.fetchall()]
+    except Exception as e:
+        return [f"EXPLAIN failed: {e}"]
+    finally:
+        cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_stats_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    count = _query_count.get()
+    if count is not None:
+        count[0] += 1
+
+    start = getattr(context, "_query_stats_start", None)
+    if start is None or config.SLOW_QUERY_MS <= 0:
+        return
+    duration_ms = (time.perf_counter() - start) * 1000
+    if duration_ms < config.SLOW_QUERY_MS:
+        return
+
+    plan = [] if executemany else _explain(conn, statement, parameters)
+    logger.warning(
+        f"Slow query ({duration_ms:.1f}ms): {statement[:200]}"
+        + "".join(f"\n  {line}" for line in plan)
+    )
+
+
+def attach(engine):
+    """Attach query counting and slow query hooks to an engine"""
+    from sqlalchemy import event
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def count_queries(func: Callable) -> Callable:
+    """
+    Log (at DEBUG) how many SQL statements each call of a tool function runs
+    Warns when the count reaches TOOL_QUERY_WARN
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        count = [0]
+        token = _query_count.set(count)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            _query_count.reset(token)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            message = f"{func.__name__} ran {count[0]} queries in {elapsed_ms:.1f}ms"
+            if config.TOOL_QUERY_WARN and count[0] >= config.TOOL_QUERY_WARN:
+                logger.warning(message)
+            else:
+                logger.debug(message)
+
+    return wrapper
@@ -10,10 +10,12 @@ import logging
 from .database import db
 from .models import Complaint
 from .config import config
+from .query_stats import count_queries
 
 logger = logging.getLogger(__name__)
 
 
+@count_queries
 def create_complaint(
     description: str,
     customer_name: str,
@@ -77,6 +79,7 @@ def create_complaint(
         }
 
 
+@count_queries
 def get_complaint(complaint_id: int) -> Dict[str, Any]:
     """
     Get a complaint by ID
@@ -117,6 +120,7 @@ def get_complaint(complaint_id: int) -> Dict[str, Any]:
         }
 
 
+@count_queries
 def update_complaint(
     complaint_id: int,
     status: Optional[str] = None,
@@ -206,6 +210,7 @@ def update_complaint(
         }
 
 
+@count_queries
 def list_complaints(limit: int = 100) -> Dict[str, Any]:
     """
     List all complaints
@@ -241,6 +246,7 @@ def list_complaints(limit: int = 100) -> Dict[str, Any]:
         }
 
 
+@count_queries
 def filter_complaints(
     status: Optional[str] = None,
     priority: Optional[str] = None,
@@ -321,6 +327,7 @@ def filter_complaints(
         }
 
 
+@count_queries
 def delete_complaint(complaint_id: int) -> Dict[str, Any]:
     """
     Delete a complaint by ID
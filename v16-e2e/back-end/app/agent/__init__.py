@@ -5,7 +5,12 @@ This module provides the agent management system including:
 - Agent factory for creating configured agents
 - Agent manager for lifecycle and execution
 - System instructions and prompts
+
+``ToolMetricsMiddleware`` subclasses agent_framework's middleware, so it is
+loaded on first access to keep agent_framework out of the import path
+until the agent is built.
 """
+from importlib import import_module
 
 from .factory import AgentFactory
 from .manager import (
@@ -14,6 +19,13 @@ from .manager import (
     get_agent_manager,
     shutdown_agent_manager
 )
+from .token_budget import (
+    TokenBudgetLimiter,
+    TokenReservation,
+    estimate_tokens,
+    get_token_budget_limiter,
+    reset_token_budget_limiter
+)
 from .instructions import (
     AGENT_SYSTEM_PROMPT,
     get_full_system_prompt,
@@ -21,6 +33,21 @@ from .instructions import (
     get_error_handling_prompt
 )
 
+# Attributes imported on first access (name -> submodule)
+_LAZY_ATTRIBUTES = {
+    "ToolMetricsMiddleware": ".middleware",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     # Factory
     "AgentFactory",
@@ -31,6 +58,16 @@ __all__ = [
     "get_agent_manager",
     "shutdown_agent_manager",
     
+    # Middleware
+    "ToolMetricsMiddleware",
+    
+    # Token budget
+    "TokenBudgetLimiter",
+    "TokenReservation",
+    "estimate_tokens",
+    "get_token_budget_limiter",
+    "reset_token_budget_limiter",
+    
     # Instructions
     "AGENT_SYSTEM_PROMPT",
     "get_full_system_prompt",
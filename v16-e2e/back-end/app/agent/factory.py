@@ -3,32 +3,22 @@ Agent factory for creating and configuring AI agents.
 
 This module handles the creation of agent instances with
 proper configuration, tools, and instructions.
+
+The Azure client, agent_framework and the tool modules take most of the
+service's import time, so they are imported inside the methods that use
+them rather than at module load.
 """
 import logging
-from typing import List, Optional
-from agent_framework.azure import AzureOpenAIResponsesClient
-from azure.identity import AzureCliCredential
+from typing import TYPE_CHECKING, List, Optional
 
 from ..config.settings import get_settings
-from ..tools.wrappers import (
-    # Order tools
-    create_new_order,
-    get_order,
-    get_customer_orders,
-    find_orders,
-    update_order,
-    list_all_orders,
-    # Email tools
-    send_simple_email,
-    send_formatted_email,
-    send_email_with_files,
-    send_complete_email,
-    test_email_connection,
-)
 from ..tools.mcp_handler import get_mcp_tool, is_mcp_available
 from .instructions import get_full_system_prompt
 from ..utils.exceptions import AgentInitializationError
 
+if TYPE_CHECKING:
+    from agent_framework.azure import AzureOpenAIResponsesClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -36,7 +26,7 @@ class AgentFactory:
     """Factory for creating AI agent instances."""
     
     @staticmethod
-    def create_client() -> AzureOpenAIResponsesClient:
+    def create_client() -> "AzureOpenAIResponsesClient":
         """
         Create Azure OpenAI Responses client.
         
@@ -51,6 +41,9 @@ class AgentFactory:
             
             logger.info("Creating Azure OpenAI Responses client...")
             
+            from agent_framework.azure import AzureOpenAIResponsesClient
+            from azure.identity import AzureCliCredential
+            
             credential = AzureCliCredential()
             client = AzureOpenAIResponsesClient(
                 project_endpoint=settings.azure_ai_project_endpoint,
@@ -68,7 +61,7 @@ class AgentFactory:
     
     @staticmethod
     def create_agent(
-        client: AzureOpenAIResponsesClient,
+        client: "AzureOpenAIResponsesClient",
         name: str = "CustomerServiceAgent",
         instructions: Optional[str] = None,
         tools: Optional[List] = None
@@ -101,11 +94,14 @@ class AgentFactory:
             
             logger.info(f"Registering {len(tools)} tools with agent")
             
+            from .middleware import ToolMetricsMiddleware
+            
             # Create agent using client
             agent = client.as_agent(
                 name=name,
                 instructions=instructions,
-                tools=tools
+                tools=tools,
+                middleware=[ToolMetricsMiddleware()]
             )
             
             logger.info(f"Agent '{name}' created successfully")
@@ -124,19 +120,34 @@ class AgentFactory:
         Returns:
             List: List of all tools
         """
+        from ..tools.wrappers import (
+            # Email tools
+            send_simple_email,
+            send_formatted_email,
+            send_email_with_files,
+            send_complete_email,
+            test_email_connection,
+        )
+        
         tools = []
         
-        # Add order management tools (6)
+        # Add order management tools (11), awaiting the database if possible
+        order_module = AgentFactory._order_tool_module()
         order_tools = [
-            create_new_order,
-            get_order,
-            get_customer_orders,
-            find_orders,
-            update_order,
-            list_all_orders
+            order_module.create_new_order,
+            order_module.get_order,
+            order_module.get_customer_orders,
+            order_module.find_orders,
+            order_module.update_order,
+            order_module.list_all_orders,
+            order_module.create_orders_in_bulk,
+            order_module.update_orders_in_bulk,
+            order_module.summarize_orders,
+            order_module.get_top_products,
+            order_module.summarize_customer
         ]
         tools.extend(order_tools)
-        logger.debug(f"Added {len(order_tools)} order management tools")
+        logger.debug(f"Added {len(order_tools)} order management tools ({order_module.__name__})")
         
         # Add email tools (5)
         email_tools = [
@@ -161,6 +172,25 @@ class AgentFactory:
         logger.info(f"Total tools available: {len(tools)}")
         return tools
     
+    @staticmethod
+    def _order_tool_module():
+        """
+        Pick the order tool implementations.
+        
+        Returns:
+            module: async_order_tools with ORDER_TOOLS_ASYNC and aiosqlite
+            installed, otherwise order_tools
+        """
+        from ..tools.order_management import async_database_available
+        
+        if get_settings().ORDER_TOOLS_ASYNC:
+            if async_database_available():
+                from ..tools.wrappers import async_order_tools
+                return async_order_tools
+            logger.warning("ORDER_TOOLS_ASYNC is on but aiosqlite is not installed; using sync order tools")
+        from ..tools.wrappers import order_tools
+        return order_tools
+    
     @staticmethod
     def get_tool_descriptions() -> dict:
         """
@@ -177,6 +207,11 @@ class AgentFactory:
             "find_orders": "Search orders by multiple criteria",
             "update_order": "Update order status",
             "list_all_orders": "List all orders in system",
+            "create_orders_in_bulk": "Create up to 500 orders in one call",
+            "update_orders_in_bulk": "Update the status of many orders (by ID or filter) in one call",
+            "summarize_orders": "Order and revenue totals by status (and day) for a date range",
+            "get_top_products": "Best-selling products overall or for a customer",
+            "summarize_customer": "A customer's order totals and top products",
             
             # Email tools
             "send_simple_email": "Send plain text email",
@@ -4,36 +4,49 @@ Agent manager for handling agent lifecycle and execution.
 This module manages agent instances, sessions, and conversation execution.
 """
 import logging
-from typing import Optional, Dict, Any
-from agent_framework.azure import AzureOpenAIResponsesClient
-from azure.identity import AzureCliCredential
+import time
+from typing import TYPE_CHECKING, Optional, Dict, Any
 
 from ..config.settings import get_settings
 from .factory import AgentFactory
+from .token_budget import TokenReservation, estimate_tokens, get_token_budget_limiter
 from ..utils.exceptions import (
     AgentInitializationError,
     AgentExecutionError,
+    RateLimitError,
     SessionNotFoundError
 )
 from ..utils.helpers import generate_session_id
+from ..utils.metrics import AGENT_RUN_DURATION, AGENT_TIME_TO_FIRST_TOKEN
+from ..utils.tracing import detached_span, iterate_in_span, start_span
+
+if TYPE_CHECKING:
+    from agent_framework.azure import AzureOpenAIResponsesClient
 
 logger = logging.getLogger(__name__)
 
+# Usage detail keys summed across streamed usage updates
+TOKEN_COUNT_KEYS = ("input_token_count", "output_token_count", "total_token_count")
+
 
 class AgentManager:
     """Manager for AI agent lifecycle and execution."""
     
     def __init__(self):
         """Initialize agent manager."""
-        self._client: Optional[AzureOpenAIResponsesClient] = None
+        self._client: Optional["AzureOpenAIResponsesClient"] = None
         self._agent = None  # Agent instance from agent_framework
         self._sessions: Dict[str, Any] = {}  # session_id -> AgentSession
         self._initialized = False
     
-    def initialize(self) -> bool:
+    def initialize(self, client: Optional["AzureOpenAIResponsesClient"] = None) -> bool:
         """
         Initialize the agent manager and create default agent.
         
+        Args:
+            client: Pre-built Azure OpenAI client (created here if omitted,
+                so startup can build it while the MCP server connects)
+        
         Returns:
             bool: True if initialization successful
             
@@ -48,7 +61,7 @@ class AgentManager:
             logger.info("Initializing agent manager...")
             
             # Create Azure OpenAI client
-            self._client = AgentFactory.create_client()
+            self._client = client if client is not None else AgentFactory.create_client()
             logger.debug("Azure OpenAI client created")
             
             # Create default agent using factory
@@ -160,10 +173,74 @@ class AgentManager:
         
         return False
     
+    def reserve_tokens(
+        self,
+        session_id: str,
+        message: str,
+        tenant_id: str = "default"
+    ) -> Optional[TokenReservation]:
+        """
+        Pre-admit a message against the tenant/session token budget.
+        
+        Args:
+            session_id: Session identifier
+            message: User message (used to estimate prompt size)
+            tenant_id: Tenant identifier
+            
+        Returns:
+            TokenReservation: Reservation to settle after the run, or None
+            if token budgets are disabled
+            
+        Raises:
+            RateLimitError: If the token budget is exhausted
+        """
+        limiter = get_token_budget_limiter()
+        if limiter is None:
+            return None
+        
+        overhead = get_settings().TOKEN_BUDGET_PROMPT_OVERHEAD
+        return limiter.reserve(tenant_id, session_id, estimate_tokens(message, overhead))
+    
+    def release_tokens(self, reservation: Optional[TokenReservation]):
+        """
+        Release a reservation that no run has settled (no-op once settled).
+        
+        Args:
+            reservation: Reservation returned by reserve_tokens(), or None
+        """
+        self._settle_tokens(reservation, {"total_token_count": 0})
+    
+    @staticmethod
+    def _settle_tokens(reservation: Optional[TokenReservation], usage: Optional[Dict[str, Any]]):
+        """Debit the actual token usage of a run against its reservation."""
+        if reservation is None:
+            return
+        
+        limiter = get_token_budget_limiter()
+        if limiter is not None:
+            limiter.settle(reservation, AgentManager._total_tokens(usage))
+    
+    @staticmethod
+    def _total_tokens(usage: Optional[Dict[str, Any]]) -> Optional[int]:
+        """Get prompt plus completion tokens from usage details."""
+        if not usage:
+            return None
+        
+        total = usage.get("total_token_count")
+        if total is None:
+            input_tokens = usage.get("input_token_count")
+            output_tokens = usage.get("output_token_count")
+            if input_tokens is None and output_tokens is None:
+                return None
+            total = (input_tokens or 0) + (output_tokens or 0)
+        return total
+    
     async def execute(
         self,
         session_id: str,
         message: str,
+        tenant_id: str = "default",
+        reservation: Optional[TokenReservation] = None,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -172,44 +249,69 @@ class AgentManager:
         Args:
             session_id: Session identifier
             message: User message
+            tenant_id: Tenant identifier for token budgeting
+            reservation: Token reservation obtained via reserve_tokens()
+                (reserved automatically if not provided)
             **kwargs: Additional execution parameters
             
         Returns:
-            dict: Execution result with response and metadata
+            dict: Execution result with response, token usage and metadata
             
         Raises:
             SessionNotFoundError: If session doesn't exist
+            RateLimitError: If the token budget is exhausted
             AgentExecutionError: If execution fails
         """
+        usage = None
         try:
             # Get session
             session = self.get_session(session_id)
             
+            if reservation is None:
+                reservation = self.reserve_tokens(session_id, message, tenant_id)
+            
             logger.info(f"Executing agent for session: {session_id}")
             logger.debug(f"User message: {message}")
             
             # Run agent (this is async in agent_framework)
-            result = await self._agent.run(message, session=session)
+            start_time = time.perf_counter()
+            try:
+                with start_span("agent.run", {"session.id": session_id, "agent.mode": "sync"}):
+                    result = await self._agent.run(message, session=session)
+            except Exception:
+                AGENT_RUN_DURATION.labels("sync", "error").observe(time.perf_counter() - start_time)
+                raise
+            AGENT_RUN_DURATION.labels("sync", "success").observe(time.perf_counter() - start_time)
+            usage = getattr(result, "usage_details", None)
             
             logger.info(f"Agent execution successful for session: {session_id}")
             
             return {
                 "session_id": session_id,
                 "response": str(result),
-                "status": "success"
+                "status": "success",
+                "usage": dict(usage) if usage else None
             }
             
         except SessionNotFoundError:
+            # Nothing ran - release any pre-admitted tokens
+            self._settle_tokens(reservation, {"total_token_count": 0})
+            raise
+        except RateLimitError:
             raise
         except Exception as e:
             error_msg = f"Agent execution failed: {str(e)}"
             logger.error(error_msg)
             raise AgentExecutionError(error_msg)
+        finally:
+            self._settle_tokens(reservation, usage)
     
     async def execute_stream(
         self,
         session_id: str,
         message: str,
+        tenant_id: str = "default",
+        reservation: Optional[TokenReservation] = None,
         **kwargs
     ):
         """
@@ -218,6 +320,9 @@ class AgentManager:
         Args:
             session_id: Session identifier
             message: User message
+            tenant_id: Tenant identifier for token budgeting
+            reservation: Token reservation obtained via reserve_tokens()
+                (reserved automatically if not provided)
             **kwargs: Additional execution parameters
             
         Yields:
@@ -225,36 +330,68 @@ class AgentManager:
             
         Raises:
             SessionNotFoundError: If session doesn't exist
+            RateLimitError: If the token budget is exhausted
             AgentExecutionError: If execution fails
         """
+        usage: Dict[str, Any] = {}
         try:
             # Get session
             session = self.get_session(session_id)
             
+            if reservation is None:
+                reservation = self.reserve_tokens(session_id, message, tenant_id)
+            
             logger.info(f"Executing agent (streaming) for session: {session_id}")
             logger.debug(f"User message: {message}")
             
             # Run agent with streaming enabled
+            start_time = time.perf_counter()
+            first_token = True
+            outcome = "error"
             stream = self._agent.run(message, session=session, stream=True)
             
             # Yield text chunks as they arrive
-            try:
-                async for update in stream:
-                    if update.text:
-                        yield update.text
-            except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
-                # Client disconnected - exit gracefully
-                logger.debug(f"Client disconnected during streaming for session: {session_id}")
-                return
+            with detached_span("agent.run", {"session.id": session_id, "agent.mode": "stream"}) as span:
+                try:
+                    async for update in iterate_in_span(span, stream):
+                        for content in update.contents or ():
+                            if content.type == "usage" and content.usage_details:
+                                for key in TOKEN_COUNT_KEYS:
+                                    value = content.usage_details.get(key)
+                                    if isinstance(value, (int, float)):
+                                        usage[key] = usage.get(key, 0) + value
+                        if update.text:
+                            if first_token:
+                                AGENT_TIME_TO_FIRST_TOKEN.observe(time.perf_counter() - start_time)
+                                first_token = False
+                            yield update.text
+                    outcome = "success"
+                except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
+                    # Client disconnected - exit gracefully
+                    outcome = "disconnected"
+                    logger.debug(f"Client disconnected during streaming for session: {session_id}")
+                    return
+                except GeneratorExit:
+                    # Consumer closed the stream early
+                    outcome = "disconnected"
+                    raise
+                finally:
+                    AGENT_RUN_DURATION.labels("stream", outcome).observe(time.perf_counter() - start_time)
             
             logger.info(f"Agent streaming execution complete for session: {session_id}")
             
         except SessionNotFoundError:
+            # Nothing ran - release any pre-admitted tokens
+            self._settle_tokens(reservation, {"total_token_count": 0})
+            raise
+        except RateLimitError:
             raise
         except Exception as e:
             error_msg = f"Agent streaming execution failed: {str(e)}"
             logger.error(error_msg)
             raise AgentExecutionError(error_msg)
+        finally:
+            self._settle_tokens(reservation, usage)
     
     def get_session_count(self) -> int:
         """
@@ -310,10 +447,17 @@ class AgentManager:
 _agent_manager: Optional[AgentManager] = None
 
 
-def initialize_agent_manager() -> AgentManager:
+def initialize_agent_manager(client: Optional["AzureOpenAIResponsesClient"] = None) -> AgentManager:
     """
     Initialize and get the global agent manager instance.
     
+    The manager is published only once initialized, so while startup is
+    still running ``get_agent_manager()`` returns None and the agent
+    routes answer 503.
+    
+    Args:
+        client: Pre-built Azure OpenAI client (optional)
+    
     Returns:
         AgentManager: Initialized agent manager
         
@@ -322,12 +466,11 @@ def initialize_agent_manager() -> AgentManager:
     """
     global _agent_manager
     
-    if _agent_manager is None:
-        _agent_manager = AgentManager()
-    
-    if not _agent_manager.is_initialized():
-        _agent_manager.initialize()
+    manager = _agent_manager or AgentManager()
+    if not manager.is_initialized():
+        manager.initialize(client)
     
+    _agent_manager = manager
     return _agent_manager
 
 
@@ -0,0 +1,63 @@
+"""
+Agent middleware for tool-level instrumentation.
+
+Function middleware runs around every tool invocation made by the agent,
+including tools loaded from the MCP server.
+"""
+import logging
+import time
+from functools import partial
+from typing import Awaitable, Callable
+
+from agent_framework import FunctionInvocationContext, FunctionMiddleware, MCPStreamableHTTPTool
+
+from ..utils.db_metrics import query_scope
+from ..utils.metrics import MCP_CALL_DURATION, TOOL_CALL_DURATION, TOOL_CALLS, TOOL_DB_QUERIES
+
+logger = logging.getLogger(__name__)
+
+
+def _tool_source(function) -> str:
+    """Classify a tool as local or served by an MCP server."""
+    func = getattr(function, "func", None)
+    if isinstance(func, partial) and isinstance(getattr(func.func, "__self__", None), MCPStreamableHTTPTool):
+        return "mcp"
+    return "local"
+
+
+def _is_error_result(result) -> bool:
+    """Detect error results returned (not raised) by the tool wrappers."""
+    return isinstance(result, dict) and result.get("status") == "error"
+
+
+class ToolMetricsMiddleware(FunctionMiddleware):
+    """Record latency, outcome and SQL statement count for every agent tool call."""
+    
+    async def process(
+        self,
+        context: FunctionInvocationContext,
+        call_next: Callable[[], Awaitable[None]],
+    ) -> None:
+        name = context.function.name
+        source = _tool_source(context.function)
+        outcome = "error"
+        start_time = time.perf_counter()
+        
+        with query_scope(f"tool:{name}") as queries:
+            try:
+                await call_next()
+                if not _is_error_result(context.result):
+                    outcome = "success"
+            finally:
+                duration = time.perf_counter() - start_time
+                TOOL_CALL_DURATION.labels(name, source).observe(duration)
+                TOOL_CALLS.labels(name, source, outcome).inc()
+                if source == "mcp":
+                    MCP_CALL_DURATION.labels("call_tool").observe(duration)
+                else:
+                    TOOL_DB_QUERIES.labels(name).observe(queries.count)
+
+
+__all__ = [
+    "ToolMetricsMiddleware",
+]
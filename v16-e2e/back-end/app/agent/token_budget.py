@@ -0,0 +1,318 @@
+"""
+Token Budget Rate Limiting
+
+Token-bucket limiter that meters LLM token usage per tenant (and optionally
+per session). Requests are pre-admitted against an estimate of the prompt
+size and the bucket is reconciled with the actual prompt and completion
+token counts once the agent run has finished.
+"""
+import time
+from dataclasses import dataclass
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
+from ..config.settings import get_settings
+from ..utils.exceptions import RateLimitError
+from ..utils.logger import get_logger
+from ..utils.metrics import RATE_LIMIT_REJECTIONS
+
+logger = get_logger(__name__)
+
+# Rough characters-per-token ratio used for pre-admission estimates
+CHARS_PER_TOKEN = 4
+
+# Prune idle buckets after this many reservations
+PRUNE_INTERVAL = 1000
+
+
+def estimate_tokens(text: str, overhead: int = 0) -> int:
+    """
+    Estimate the number of prompt tokens for a message.
+
+    Args:
+        text: Message text
+        overhead: Fixed per-turn overhead (system prompt, tool schemas)
+
+    Returns:
+        int: Estimated token count (at least 1)
+    """
+    return max(1, len(text or "") // CHARS_PER_TOKEN) + overhead
+
+
+class TokenBucket:
+    """
+    Single token bucket with continuous refill.
+
+    The balance may go negative when actual usage exceeds the reserved
+    estimate; the debt is paid back by refill before new work is admitted.
+    """
+
+    __slots__ = ("capacity", "refill_rate", "tokens", "updated_at")
+
+    def __init__(self, capacity: int, refill_rate: float):
+        """
+        Initialize token bucket.
+
+        Args:
+            capacity: Maximum number of tokens the bucket can hold
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+
+    def refill(self, now: float):
+        """Add tokens accrued since the last update."""
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            self.updated_at = now
+
+    def retry_after(self, amount: int) -> int:
+        """Seconds until ``amount`` tokens are available."""
+        missing = amount - self.tokens
+        if missing <= 0:
+            return 0
+        return int(missing / self.refill_rate) + 1
+
+    def is_full(self) -> bool:
+        """Check whether the bucket has fully refilled."""
+        return self.tokens >= self.capacity
+
+
+@dataclass
+class TokenReservation:
+    """Tokens reserved for a single agent run."""
+    tenant_id: str
+    session_id: Optional[str]
+    reserved: int
+    settled: bool = False
+
+
+class TokenBudgetLimiter:
+    """
+    Token budget limiter keyed by tenant and optionally by session.
+
+    Uses the same tenant identifiers as SessionManager. Each agent run
+    reserves an estimated amount up front and is settled with the actual
+    token usage reported by the model.
+    """
+
+    def __init__(
+        self,
+        tokens_per_minute: int,
+        burst: Optional[int] = None,
+        session_tokens_per_minute: int = 0
+    ):
+        """
+        Initialize token budget limiter.
+
+        Args:
+            tokens_per_minute: Token refill rate per tenant
+            burst: Tenant bucket capacity (defaults to tokens_per_minute)
+            session_tokens_per_minute: Per-session budget (0 disables)
+        """
+        self.tokens_per_minute = tokens_per_minute
+        self.burst = burst or tokens_per_minute
+        self.session_tokens_per_minute = session_tokens_per_minute
+        self._tenant_buckets: Dict[str, TokenBucket] = {}
+        self._session_buckets: Dict[str, TokenBucket] = {}
+        self._lock = Lock()
+        self._reservations = 0
+        self._rejections = 0
+        self._tokens_consumed = 0
+
+    def _get_bucket(self, buckets: Dict[str, TokenBucket], key: str, per_minute: int, capacity: int) -> TokenBucket:
+        """Get or create a bucket (caller must hold the lock)."""
+        bucket = buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(capacity, per_minute / 60.0)
+            buckets[key] = bucket
+        return bucket
+
+    def _buckets_for(self, tenant_id: str, session_id: Optional[str], now: float) -> list[Tuple[str, TokenBucket]]:
+        """Resolve and refill the buckets that apply to a request (caller must hold the lock)."""
+        buckets = [(
+            "tenant",
+            self._get_bucket(self._tenant_buckets, tenant_id, self.tokens_per_minute, self.burst)
+        )]
+        if self.session_tokens_per_minute and session_id:
+            buckets.append((
+                "session",
+                self._get_bucket(
+                    self._session_buckets,
+                    f"{tenant_id}:{session_id}",
+                    self.session_tokens_per_minute,
+                    self.session_tokens_per_minute
+                )
+            ))
+        for _, bucket in buckets:
+            bucket.refill(now)
+        return buckets
+
+    def reserve(self, tenant_id: str, session_id: Optional[str], estimated_tokens: int) -> TokenReservation:
+        """
+        Pre-admit a request against the tenant and session budgets.
+
+        Args:
+            tenant_id: Tenant identifier
+            session_id: Session identifier (used when per-session budgets are enabled)
+            estimated_tokens: Estimated prompt tokens for the request
+
+        Returns:
+            TokenReservation: Reservation to settle after the run
+
+        Raises:
+            RateLimitError: If any applicable budget is exhausted
+        """
+        now = time.monotonic()
+
+        with self._lock:
+            buckets = self._buckets_for(tenant_id, session_id, now)
+
+            for scope, bucket in buckets:
+                # Never require more than a full bucket, otherwise large prompts could never run
+                needed = min(estimated_tokens, bucket.capacity)
+                if bucket.tokens < needed:
+                    self._rejections += 1
+                    RATE_LIMIT_REJECTIONS.labels("token_budget", scope).inc()
+                    retry_after = bucket.retry_after(needed)
+                    raise RateLimitError(
+                        f"Token budget exceeded for {scope}. Please try again in {retry_after} seconds.",
+                        details={
+                            "scope": scope,
+                            "tenant_id": tenant_id,
+                            "session_id": session_id,
+                            "limit": int(bucket.capacity),
+                            "remaining": max(0, int(bucket.tokens)),
+                            "retry_after": retry_after
+                        }
+                    )
+
+            for _, bucket in buckets:
+                bucket.tokens -= estimated_tokens
+
+            self._reservations += 1
+            if self._reservations % PRUNE_INTERVAL == 0:
+                self._prune(now)
+
+        return TokenReservation(tenant_id=tenant_id, session_id=session_id, reserved=estimated_tokens)
+
+    def settle(self, reservation: TokenReservation, actual_tokens: Optional[int]):
+        """
+        Reconcile a reservation with the actual token usage.
+
+        Args:
+            reservation: Reservation returned by reserve()
+            actual_tokens: Prompt plus completion tokens reported by the model
+                (None keeps the estimate as the charge)
+        """
+        if reservation.settled:
+            return
+        reservation.settled = True
+
+        charged = reservation.reserved if actual_tokens is None else actual_tokens
+        delta = charged - reservation.reserved
+        now = time.monotonic()
+
+        with self._lock:
+            self._tokens_consumed += charged
+            if delta:
+                for _, bucket in self._buckets_for(reservation.tenant_id, reservation.session_id, now):
+                    bucket.tokens -= delta
+
+        logger.debug(
+            f"Token usage settled for tenant {reservation.tenant_id}: {charged} tokens",
+            extra={
+                "tenant_id": reservation.tenant_id,
+                "session_id": reservation.session_id,
+                "estimated_tokens": reservation.reserved,
+                "actual_tokens": actual_tokens
+            }
+        )
+
+    def _prune(self, now: float):
+        """Drop buckets that have fully refilled (caller must hold the lock)."""
+        for buckets in (self._tenant_buckets, self._session_buckets):
+            idle = []
+            for key, bucket in buckets.items():
+                bucket.refill(now)
+                if bucket.is_full():
+                    idle.append(key)
+            for key in idle:
+                del buckets[key]
+
+    def get_remaining(self, tenant_id: str) -> int:
+        """Get the remaining token balance for a tenant."""
+        with self._lock:
+            bucket = self._tenant_buckets.get(tenant_id)
+            if bucket is None:
+                return self.burst
+            bucket.refill(time.monotonic())
+            return max(0, int(bucket.tokens))
+
+    def get_stats(self) -> dict:
+        """Get token budget statistics."""
+        with self._lock:
+            return {
+                "tracked_tenants": len(self._tenant_buckets),
+                "tracked_sessions": len(self._session_buckets),
+                "tokens_per_minute_limit": self.tokens_per_minute,
+                "burst_limit": self.burst,
+                "session_tokens_per_minute_limit": self.session_tokens_per_minute,
+                "reservations": self._reservations,
+                "rejections": self._rejections,
+                "tokens_consumed": self._tokens_consumed
+            }
+
+
+def create_token_budget_limiter() -> TokenBudgetLimiter:
+    """
+    Create token budget limiter instance from settings.
+
+    Returns:
+        TokenBudgetLimiter instance
+    """
+    settings = get_settings()
+    return TokenBudgetLimiter(
+        tokens_per_minute=settings.TOKEN_BUDGET_PER_MINUTE,
+        burst=settings.TOKEN_BUDGET_BURST or None,
+        session_tokens_per_minute=settings.TOKEN_BUDGET_SESSION_PER_MINUTE
+    )
+
+
+# Global token budget limiter instance
+_token_budget_limiter: Optional[TokenBudgetLimiter] = None
+
+
+def get_token_budget_limiter() -> Optional[TokenBudgetLimiter]:
+    """
+    Get or create the global token budget limiter.
+
+    Returns:
+        TokenBudgetLimiter if token budgets are enabled, None otherwise
+    """
+    global _token_budget_limiter
+    if not get_settings().ENABLE_TOKEN_BUDGET:
+        return None
+    if _token_budget_limiter is None:
+        _token_budget_limiter = create_token_budget_limiter()
+    return _token_budget_limiter
+
+
+def reset_token_budget_limiter():
+    """Reset the global token budget limiter (for testing)."""
+    global _token_budget_limiter
+    _token_budget_limiter = None
+
+
+__all__ = [
+    "TokenBucket",
+    "TokenReservation",
+    "TokenBudgetLimiter",
+    "estimate_tokens",
+    "create_token_budget_limiter",
+    "get_token_budget_limiter",
+    "reset_token_budget_limiter",
+]
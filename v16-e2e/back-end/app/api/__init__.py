@@ -26,7 +26,8 @@ from .routes import (
     agent_router,
     health_router,
     info_router,
-    sessions_router
+    sessions_router,
+    metrics_router
 )
 
 from .middleware import (
@@ -34,6 +35,12 @@ from .middleware import (
     setup_custom_middleware
 )
 
+from .responses import (
+    FastJSONResponse,
+    model_response,
+    list_response
+)
+
 from .error_handlers import (
     setup_exception_handlers
 )
@@ -57,6 +64,12 @@ __all__ = [
     "health_router",
     "info_router",
     "sessions_router",
+    "metrics_router",
+    
+    # Responses
+    "FastJSONResponse",
+    "model_response",
+    "list_response",
     
     # Setup functions
     "setup_cors_middleware",
@@ -126,7 +126,8 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException)
     
     return JSONResponse(
         status_code=exc.status_code,
-        content=error_response.dict()
+        content=error_response.dict(),
+        headers=getattr(exc, "headers", None)
     )
 
 
@@ -19,6 +19,9 @@ from .request_logging import (
     ContextInjectionMiddleware
 )
 from .errors import ErrorHandlingMiddleware
+from .metrics import MetricsMiddleware
+from .drain import DrainMiddleware
+from .compression import CompressionMiddleware
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +48,10 @@ def setup_cors_middleware(app: FastAPI) -> None:
                 "X-Response-Time",
                 "X-RateLimit-Limit",
                 "X-RateLimit-Remaining",
-                "X-RateLimit-Reset"
+                "X-RateLimit-Reset",
+                "X-TokenBudget-Limit",
+                "X-TokenBudget-Remaining",
+                "Retry-After"
             ]
         )
         logger.info("CORS middleware configured")
@@ -58,16 +64,30 @@ def setup_custom_middleware(app: FastAPI) -> None:
     Setup custom middleware for the application.
     
     Middleware order is IMPORTANT - they execute in reverse order of registration:
-    1. Error handling (innermost - catches all exceptions)
+    0. Compression (innermost - compresses route responses, not SSE)
+    1. Error handling (catches all exceptions)
     2. Request logging (logs requests/responses)
     3. Context injection (adds request context)
-    4. Rate limiting (outermost - rejects excessive requests early)
+    4. Rate limiting (rejects excessive requests early)
+    5. Metrics (times every request, including rejections)
+    6. Drain (outermost - counts in-flight requests, refuses new ones at shutdown)
     
     Args:
         app: FastAPI application
     """
     settings = get_settings()
     
+    # 0. Compression middleware (optional, gzip/brotli by Accept-Encoding)
+    if settings.ENABLE_COMPRESSION:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MIN_SIZE,
+            level=settings.COMPRESSION_LEVEL
+        )
+        logger.info(f"✓ Compression middleware added (>= {settings.COMPRESSION_MIN_SIZE} bytes)")
+    else:
+        logger.info("✗ Compression middleware disabled")
+    
     # 1. Error handling middleware (catches all exceptions)
     app.add_middleware(ErrorHandlingMiddleware)
     logger.info("✓ Error handling middleware added")
@@ -87,6 +107,17 @@ def setup_custom_middleware(app: FastAPI) -> None:
         logger.info(f"✓ Rate limiting middleware added ({settings.RATE_LIMIT_PER_MINUTE} req/min)")
     else:
         logger.info("✗ Rate limiting middleware disabled")
+    
+    # 5. Metrics middleware (optional, records request latency)
+    if settings.ENABLE_METRICS:
+        app.add_middleware(MetricsMiddleware)
+        logger.info("✓ Metrics middleware added")
+    else:
+        logger.info("✗ Metrics middleware disabled")
+    
+    # 6. Drain middleware (in-flight tracking for graceful shutdown)
+    app.add_middleware(DrainMiddleware)
+    logger.info("✓ Drain middleware added")
 
 
 __all__ = [
@@ -103,6 +134,15 @@ __all__ = [
     # Error Handling
     "ErrorHandlingMiddleware",
     
+    # Metrics
+    "MetricsMiddleware",
+    
+    # Graceful shutdown
+    "DrainMiddleware",
+    
+    # Compression
+    "CompressionMiddleware",
+    
     # Setup functions
     "setup_cors_middleware",
     "setup_custom_middleware",
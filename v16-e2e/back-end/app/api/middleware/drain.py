@@ -0,0 +1,65 @@
+"""
+Drain Middleware
+
+Counts in-flight requests for graceful shutdown and refuses new ones
+while the service drains.
+"""
+from fastapi import status
+from fastapi.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from ...utils.drain import RequestDrain, get_request_drain
+
+
+class DrainMiddleware:
+    """
+    In-flight request tracking middleware.
+
+    A request counts as in flight until its response (including the whole
+    body of a streaming response) has been sent. While draining, new
+    requests get 503 with ``Connection: close`` so clients retry on another
+    instance; health checks still answer so probes can see the service is
+    not ready.
+    """
+
+    # Paths served while draining
+    HEALTH_PATHS = frozenset([
+        "/health",
+        "/health/ready",
+        "/health/live",
+    ])
+
+    def __init__(self, app: ASGIApp, drain: RequestDrain = None):
+        """
+        Initialize drain middleware.
+
+        Args:
+            app: ASGI application
+            drain: Request drain (defaults to the global one)
+        """
+        self.app = app
+        self.drain = drain or get_request_drain()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Track the request, or refuse it while draining."""
+        if scope["type"] != "http" or scope["path"] in self.HEALTH_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        if self.drain.draining:
+            response = JSONResponse(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                content={
+                    "error": "Service shutting down",
+                    "message": "This instance is shutting down. Please retry."
+                },
+                headers={"Connection": "close", "Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+
+        self.drain.enter()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.drain.leave()
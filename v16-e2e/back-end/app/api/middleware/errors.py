@@ -6,7 +6,7 @@ Global exception handling and standardized error responses.
 from datetime import datetime
 from fastapi import Request
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ...utils.exceptions import (
     APIException,
@@ -26,21 +26,46 @@ from ...utils.logger import get_logger
 logger = get_logger(__name__)
 
 
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
+class ErrorHandlingMiddleware:
     """
     Middleware for global exception handling.
     
     Catches all exceptions and returns standardized JSON error responses.
+    Exceptions raised after the response has started (e.g. mid-stream)
+    cannot be turned into a new response and are re-raised.
     """
     
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize error handling middleware.
+        
+        Args:
+            app: ASGI application
+        """
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """Handle exceptions during request processing."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        response_started = False
+        
+        async def send_tracking_start(message: Message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+        
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_tracking_start)
         
         except Exception as exc:
-            return await self.handle_exception(request, exc)
+            if response_started:
+                raise
+            response = await self.handle_exception(Request(scope, receive), exc)
+            await response(scope, receive, send)
     
     async def handle_exception(self, request: Request, exc: Exception) -> JSONResponse:
         """
@@ -0,0 +1,62 @@
+"""
+Metrics Middleware
+
+Records HTTP request latency and SQL statement count histograms labelled by
+route template.
+"""
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ...utils.db_metrics import query_scope
+from ...utils.metrics import DB_QUERIES_PER_REQUEST, HTTP_REQUEST_DURATION
+
+
+class MetricsMiddleware:
+    """
+    Middleware to record request latency and query count per route.
+
+    The ``route`` label is the matched route template (e.g.
+    ``/api/v1/sessions/{session_id}/history``), never the raw path, so label
+    cardinality stays bounded. Unmatched requests are grouped under
+    ``unmatched``. Duration covers the full response, including streamed
+    bodies.
+    """
+
+    # Paths excluded from latency metrics (scrapes would skew the histogram)
+    EXCLUDED_PATHS = frozenset(["/metrics"])
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize metrics middleware.
+
+        Args:
+            app: ASGI application
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        """Process request with latency recording."""
+        if scope["type"] != "http" or scope["path"] in self.EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+        start_time = time.perf_counter()
+
+        async def send_with_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        with query_scope(scope["path"]) as queries:
+            try:
+                await self.app(scope, receive, send_with_status)
+            finally:
+                route = getattr(scope.get("route"), "path", "unmatched")
+                HTTP_REQUEST_DURATION.labels(
+                    scope["method"],
+                    route,
+                    str(status_code)
+                ).observe(time.perf_counter() - start_time)
+                DB_QUERIES_PER_REQUEST.labels(scope["method"], route).observe(queries.count)
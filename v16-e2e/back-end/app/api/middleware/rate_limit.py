@@ -7,12 +7,14 @@ import time
 from typing import Dict, Tuple
 from collections import defaultdict
 from threading import Lock
-from fastapi import Request, HTTPException, status
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi import status
+from starlette.datastructures import MutableHeaders
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from ...config import get_settings
 from ...utils.logger import get_logger
+from ...utils.metrics import RATE_LIMIT_REJECTIONS
 
 logger = get_logger(__name__)
 
@@ -101,57 +103,63 @@ class SlidingWindowRateLimiter:
             }
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """
     Rate limiting middleware for FastAPI.
     
     Enforces rate limits per IP address with configurable exclusions.
+    Implemented as a pure ASGI middleware so streaming responses and
+    client disconnects pass through untouched.
     """
     
     # Paths that bypass rate limiting
-    EXCLUDED_PATHS = [
+    EXCLUDED_PATHS = frozenset([
         "/health",
         "/health/readiness",
         "/health/liveness",
         "/docs",
         "/redoc",
-        "/openapi.json"
-    ]
+        "/openapi.json",
+        "/metrics"
+    ])
     
-    def __init__(self, app, rate_limiter: SlidingWindowRateLimiter):
+    def __init__(self, app: ASGIApp, rate_limiter: SlidingWindowRateLimiter):
         """
         Initialize rate limit middleware.
         
         Args:
-            app: FastAPI application
+            app: ASGI application
             rate_limiter: Rate limiter instance
         """
-        super().__init__(app)
+        self.app = app
         self.rate_limiter = rate_limiter
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """Process request with rate limiting."""
-        # Skip rate limiting for excluded paths
-        if request.url.path in self.EXCLUDED_PATHS:
-            return await call_next(request)
+        # Skip rate limiting for non-HTTP traffic and excluded paths
+        if scope["type"] != "http" or scope["path"] in self.EXCLUDED_PATHS:
+            await self.app(scope, receive, send)
+            return
         
         # Get client IP
-        ip_address = request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        ip_address = client[0] if client else "unknown"
         
         # Check rate limit
         allowed, metadata = self.rate_limiter.is_allowed(ip_address)
         
         if not allowed:
+            RATE_LIMIT_REJECTIONS.labels("requests", "ip").inc()
             logger.warning(
                 f"Rate limit exceeded for IP: {ip_address}",
                 extra={
                     "ip": ip_address,
-                    "path": request.url.path,
+                    "path": scope["path"],
                     "retry_after": metadata["retry_after"]
                 }
             )
             
-            return JSONResponse(
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "error": "Rate limit exceeded",
@@ -166,16 +174,20 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                     "Retry-After": str(metadata["retry_after"])
                 }
             )
+            await response(scope, receive, send)
+            return
         
-        # Process request
-        response = await call_next(request)
-        
-        # Add rate limit headers
-        response.headers["X-RateLimit-Limit"] = str(metadata["limit"])
-        response.headers["X-RateLimit-Remaining"] = str(metadata["remaining"])
-        response.headers["X-RateLimit-Reset"] = str(metadata["reset"])
+        async def send_with_headers(message: Message):
+            # Add rate limit headers
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-RateLimit-Limit"] = str(metadata["limit"])
+                headers["X-RateLimit-Remaining"] = str(metadata["remaining"])
+                headers["X-RateLimit-Reset"] = str(metadata["reset"])
+            await send(message)
         
-        return response
+        # Process request
+        await self.app(scope, receive, send_with_headers)
 
 
 def create_rate_limiter() -> SlidingWindowRateLimiter:
@@ -6,140 +6,198 @@ Comprehensive request and response logging with performance timing.
 import time
 import uuid
 from datetime import datetime
-from starlette.middleware.base import BaseHTTPMiddleware
-from fastapi import Request
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from ...utils.logger import get_logger
+from ...utils.db_metrics import current_query_scope
+from ...utils.logger import get_log_sampler, get_logger
+from ...utils.tracing import finish_server_span, start_server_span
 
 logger = get_logger(__name__)
 
 
-class RequestLoggingMiddleware(BaseHTTPMiddleware):
+class RequestLoggingMiddleware:
     """
     Middleware to log all HTTP requests and responses.
     
     Features:
     - Assigns unique request ID
     - Logs request details (method, path, IP, user agent)
-    - Logs response details (status code, duration)
+    - Logs response details (status code, duration, SQL statements run
+      so far when query counting is active)
     - Injects request ID into response headers
+    - Samples routine logs per route; errors and slow requests are
+      always logged
+    - Opens the root SERVER span of the request trace (when tracing is
+      enabled), named after the matched route template
+    
+    Implemented as a pure ASGI middleware: the response is timed when its
+    headers are sent, and the body (including SSE streams) is forwarded
+    without buffering or an extra task.
     """
     
     # Paths to exclude from detailed logging
-    MINIMAL_LOG_PATHS = ["/health", "/health/liveness"]
+    MINIMAL_LOG_PATHS = frozenset(["/health", "/health/liveness", "/metrics"])
+    
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize request logging middleware.
+        
+        Args:
+            app: ASGI application
+        """
+        self.app = app
     
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """Process request with logging."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
         # Generate unique request ID
         request_id = str(uuid.uuid4())
-        request.state.request_id = request_id
+        scope.setdefault("state", {})["request_id"] = request_id
         
         # Get request details
-        method = request.method
-        path = request.url.path
-        ip = request.client.host if request.client else "unknown"
-        user_agent = request.headers.get("user-agent", "unknown")
+        method = scope["method"]
+        path = scope["path"]
         
         # Minimal logging for health checks
         is_minimal = path in self.MINIMAL_LOG_PATHS
         
+        # Decide once per request so start and response lines stay paired
+        sampler = get_log_sampler()
+        sampled = sampler.sample_route(path)
+        
         # Log request start
-        if not is_minimal:
+        if is_minimal:
+            logger.debug(
+                f"→ {method} {path}",
+                extra={"request_id": request_id}
+            )
+        elif sampled:
+            client = scope.get("client")
             logger.info(
                 f"→ Request started: {method} {path}",
                 extra={
                     "request_id": request_id,
                     "method": method,
                     "path": path,
-                    "ip": ip,
-                    "user_agent": user_agent,
-                    "timestamp": datetime.utcnow().isoformat()
+                    "ip": client[0] if client else "unknown",
+                    "user_agent": Headers(scope=scope).get("user-agent", "unknown"),
+                    "timestamp": datetime.utcnow().isoformat(),
+                    "sampled": True
                 }
             )
-        else:
-            logger.debug(
-                f"→ {method} {path}",
-                extra={"request_id": request_id}
-            )
         
         # Start timer
-        start_time = time.time()
+        start_time = time.perf_counter()
+        status_code = None
         
-        try:
-            # Process request
-            response = await call_next(request)
+        async def send_with_logging(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                # Calculate duration up to the response headers
+                duration_ms = (time.perf_counter() - start_time) * 1000
+                status_code = message["status"]
+                
+                # Log response (errors and slow requests regardless of sampling)
+                if is_minimal:
+                    logger.debug(
+                        f"← {status_code}",
+                        extra={"request_id": request_id, "duration_ms": round(duration_ms, 2)}
+                    )
+                elif sampled or status_code >= 400 or sampler.is_slow(duration_ms):
+                    log_level = "info" if status_code < 400 else "warning" if status_code < 500 else "error"
+                    log_func = getattr(logger, log_level)
+                    
+                    extra = {
+                        "request_id": request_id,
+                        "status_code": status_code,
+                        "duration_ms": round(duration_ms, 2),
+                        "path": path,
+                        "method": method,
+                        "sampled": True
+                    }
+                    queries = current_query_scope()
+                    if queries is not None:
+                        extra["db_queries"] = queries.count
+                    
+                    log_func(
+                        f"← Response: {status_code} ({duration_ms:.2f}ms)",
+                        extra=extra
+                    )
+                
+                # Add request ID to response headers
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+                headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
             
-            # Calculate duration
-            duration_ms = (time.time() - start_time) * 1000
+            await send(message)
+        
+        with start_server_span(scope) as span:
+            try:
+                # Process request
+                await self.app(scope, receive, send_with_logging)
             
-            # Log response
-            if not is_minimal:
-                log_level = "info" if response.status_code < 400 else "warning" if response.status_code < 500 else "error"
-                log_func = getattr(logger, log_level)
+            except Exception as e:
+                # Log error
+                duration_ms = (time.perf_counter() - start_time) * 1000
                 
-                log_func(
-                    f"← Response: {response.status_code} ({duration_ms:.2f}ms)",
+                logger.error(
+                    f"← Request failed: {str(e)} ({duration_ms:.2f}ms)",
                     extra={
                         "request_id": request_id,
-                        "status_code": response.status_code,
+                        "error": str(e),
+                        "error_type": type(e).__name__,
                         "duration_ms": round(duration_ms, 2),
                         "path": path,
                         "method": method
-                    }
+                    },
+                    exc_info=True
                 )
-            else:
-                logger.debug(
-                    f"← {response.status_code}",
-                    extra={"request_id": request_id, "duration_ms": round(duration_ms, 2)}
-                )
-            
-            # Add request ID to response headers
-            response.headers["X-Request-ID"] = request_id
-            response.headers["X-Response-Time"] = f"{duration_ms:.2f}ms"
-            
-            return response
-        
-        except Exception as e:
-            # Log error
-            duration_ms = (time.time() - start_time) * 1000
-            
-            logger.error(
-                f"← Request failed: {str(e)} ({duration_ms:.2f}ms)",
-                extra={
-                    "request_id": request_id,
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                    "duration_ms": round(duration_ms, 2),
-                    "path": path,
-                    "method": method
-                },
-                exc_info=True
-            )
+                
+                # Re-raise to let error handlers deal with it
+                raise
             
-            # Re-raise to let error handlers deal with it
-            raise
+            finally:
+                finish_server_span(span, scope, status_code)
 
 
-class ContextInjectionMiddleware(BaseHTTPMiddleware):
+class ContextInjectionMiddleware:
     """
     Middleware to inject context into request state.
     
     Makes request ID and other context available to route handlers.
     """
     
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize context injection middleware.
+        
+        Args:
+            app: ASGI application
+        """
+        self.app = app
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
         """Inject context into request."""
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        state = scope.setdefault("state", {})
+        
         # Ensure request has request_id (in case logging middleware is disabled)
-        if not hasattr(request.state, "request_id"):
-            request.state.request_id = str(uuid.uuid4())
+        if "request_id" not in state:
+            state["request_id"] = str(uuid.uuid4())
         
         # Add timestamp
-        request.state.timestamp = datetime.utcnow()
+        state["timestamp"] = datetime.utcnow()
         
         # Add client info
-        request.state.client_ip = request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        state["client_ip"] = client[0] if client else "unknown"
         
         # Process request
-        response = await call_next(request)
-        
-        return response
+        await self.app(scope, receive, send)
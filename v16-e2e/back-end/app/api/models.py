@@ -211,6 +211,56 @@ class ListToolsResponse(BaseModel):
     categories: List[str] = Field(..., description="Available tool categories")
 
 
+class CpuProfileStatus(BaseModel):
+    """Status of the current or last CPU profile."""
+    active: bool = Field(..., description="Whether a profile is running")
+    samples: int = Field(..., description="Samples taken")
+    interval_ms: float = Field(..., description="Sampling interval in milliseconds")
+    unique_stacks: int = Field(..., description="Distinct stacks recorded")
+    started_at: Optional[float] = Field(None, description="Start time (Unix seconds)")
+    stopped_at: Optional[float] = Field(None, description="Stop time (Unix seconds)")
+
+
+class MemorySnapshotResponse(BaseModel):
+    """tracemalloc snapshot report."""
+    traced_bytes: int = Field(..., description="Memory currently traced")
+    peak_bytes: int = Field(..., description="Peak traced memory")
+    top: List[Dict[str, Any]] = Field(..., description="Largest allocation sites")
+    growth: List[Dict[str, Any]] = Field(..., description="Allocation sites that grew since the previous snapshot")
+
+
+class AsyncTaskInfo(BaseModel):
+    """A pending asyncio task and its await stack."""
+    name: str = Field(..., description="Task name")
+    state: str = Field(..., description="pending, done or cancelled")
+    coroutine: str = Field(..., description="Coroutine qualified name")
+    stack: List[str] = Field(..., description="Await chain, outermost frame first")
+
+
+class AsyncTasksResponse(BaseModel):
+    """All asyncio tasks on the event loop."""
+    total_count: int = Field(..., description="Number of tasks")
+    tasks: List[AsyncTaskInfo] = Field(..., description="Tasks")
+
+
+class LoopMonitorStatus(BaseModel):
+    """Event loop lag statistics."""
+    running: bool = Field(..., description="Whether the monitor is running")
+    interval_ms: float = Field(..., description="Heartbeat interval")
+    threshold_ms: float = Field(..., description="Stall threshold that captures a stack")
+    last_lag_ms: float = Field(..., description="Most recent scheduling lag")
+    max_lag_ms: float = Field(..., description="Largest lag since startup")
+    stall_count: int = Field(..., description="Stalls since startup")
+    stalls: List[Dict[str, Any]] = Field(..., description="Recent stalls with stacks, newest first")
+
+
+class SlowQueriesResponse(BaseModel):
+    """Slow query log contents."""
+    threshold_ms: Optional[float] = Field(None, description="Slow query threshold (null if disabled)")
+    total_count: int = Field(..., description="Slow statements recorded since startup or last clear")
+    queries: List[Dict[str, Any]] = Field(..., description="Recent slow statements with query plans, newest first")
+
+
 # ====================
 # Validation Helpers
 # ====================
@@ -292,6 +342,12 @@ __all__ = [
     "APIInfo",
     "ToolInfo",
     "ListToolsResponse",
+    "CpuProfileStatus",
+    "MemorySnapshotResponse",
+    "AsyncTaskInfo",
+    "AsyncTasksResponse",
+    "LoopMonitorStatus",
+    "SlowQueriesResponse",
     
     # Utility models
     "PaginationParams",
@@ -0,0 +1,143 @@
+"""
+Fast JSON Responses
+
+Response class used by the performance profile (``PERFORMANCE_PROFILE``),
+and streamed JSON for large list responses.
+
+``FastJSONResponse`` renders with orjson, which serializes datetimes,
+dates, UUIDs and enums natively (no per-value Python callback) and writes
+pydantic models straight from their field values, skipping the
+intermediate ``model_dump()``/``jsonable_encoder`` copy. Falls back to the
+standard JSON encoder when orjson is not installed.
+
+Models rendered this way are written field by field as stored, so they
+must not rely on aliases or custom serializers; the response models in
+this API don't.
+
+Responses with at least ``STREAM_JSON_MIN_ITEMS`` list items are streamed:
+the body is encoded in batches as it is sent, so the memory used for it is
+bounded by the batch size rather than the response size. The bytes are the
+same as the non-streamed rendering.
+"""
+import json
+from typing import Any, Iterable, Iterator, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+from ..config import get_settings
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast encoder
+    orjson = None
+
+
+def _default(obj: Any) -> Any:
+    """orjson fallback for types it does not serialize natively."""
+    if isinstance(obj, BaseModel):
+        return obj.__dict__
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return jsonable_encoder(obj)
+
+
+# List items encoded per streamed chunk
+STREAM_BATCH_SIZE = 500
+
+
+def _dumps(content: Any) -> bytes:
+    """Encode content as compact JSON, preferring orjson when installed."""
+    if orjson is None:  # pragma: no cover - optional fast encoder
+        return json.dumps(
+            jsonable_encoder(content), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        ).encode("utf-8")
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson when available."""
+
+    def render(self, content: Any) -> bytes:
+        return _dumps(content)
+
+
+def iter_json_object(head: dict, items_key: str, items: Iterable, batch_size: int = STREAM_BATCH_SIZE) -> Iterator[bytes]:
+    """
+    Encode ``{**head, items_key: [*items]}`` as JSON, a batch of items at a time.
+
+    Args:
+        head: Fields written before the list
+        items_key: Name of the list field (written last)
+        items: List items
+        batch_size: Items encoded per chunk
+
+    Yields:
+        bytes: JSON body chunks
+    """
+    opening = _dumps(head)[:-1]
+    yield opening + (b"," if head else b"") + _dumps(items_key) + b":["
+
+    batch: List[bytes] = []
+    first = True
+    for item in items:
+        batch.append(_dumps(item))
+        if len(batch) >= batch_size:
+            yield (b"" if first else b",") + b",".join(batch)
+            first = False
+            batch = []
+    if batch:
+        yield (b"" if first else b",") + b",".join(batch)
+    yield b"]}"
+
+
+def model_response(model: BaseModel, status_code: int = 200):
+    """
+    Return a response model for an endpoint.
+
+    Under the performance profile the model is rendered directly by
+    ``FastJSONResponse``; otherwise it is returned as-is for FastAPI to
+    validate and serialize against the route's ``response_model``.
+
+    Args:
+        model: Response model instance
+        status_code: HTTP status code
+
+    Returns:
+        FastJSONResponse or the model itself
+    """
+    if get_settings().PERFORMANCE_PROFILE:
+        return FastJSONResponse(model, status_code=status_code)
+    return model
+
+
+def list_response(model: BaseModel, items_key: str):
+    """
+    Return a response model whose last field is a (possibly large) list.
+
+    Lists of at least ``STREAM_JSON_MIN_ITEMS`` items are streamed with
+    ``iter_json_object``; smaller responses go through ``model_response``.
+
+    Args:
+        model: Response model instance; ``items_key`` must be its last field
+        items_key: Name of the list field
+
+    Returns:
+        StreamingResponse, FastJSONResponse or the model itself
+    """
+    items = getattr(model, items_key)
+    threshold = get_settings().STREAM_JSON_MIN_ITEMS
+    if not threshold or len(items) < threshold:
+        return model_response(model)
+
+    head = {name: value for name, value in model.__dict__.items() if name != items_key}
+    return StreamingResponse(iter_json_object(head, items_key, items), media_type="application/json")
+
+
+__all__ = [
+    "FastJSONResponse",
+    "iter_json_object",
+    "model_response",
+    "list_response",
+]
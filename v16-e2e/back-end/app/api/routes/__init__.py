@@ -8,10 +8,12 @@ from .agent import router as agent_router
 from .health import router as health_router
 from .info import router as info_router
 from .sessions import router as sessions_router
+from .metrics import router as metrics_router
 
 __all__ = [
     "agent_router",
     "health_router",
     "info_router",
     "sessions_router",
+    "metrics_router",
 ]
@@ -7,6 +7,7 @@ import logging
 from datetime import datetime
 from fastapi import APIRouter, HTTPException, status, Header
 from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 from typing import Optional
 
 from ..models import (
@@ -22,6 +23,7 @@ from ...agent.manager import get_agent_manager
 from ...utils.exceptions import (
     AgentInitializationError,
     AgentExecutionError,
+    RateLimitError,
     SessionNotFoundError
 )
 from ...utils.helpers import format_timestamp, generate_request_id
@@ -31,6 +33,38 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/agent", tags=["Agent"])
 
 
+def _token_budget_exceeded(request_id: str, exc: RateLimitError) -> HTTPException:
+    """
+    Build a 429 response for an exhausted token budget.
+    
+    Args:
+        request_id: Request ID for tracking
+        exc: Rate limit error raised by the token budget limiter
+        
+    Returns:
+        HTTPException: 429 exception with rate limit headers
+    """
+    details = exc.details
+    logger.warning(
+        f"[{request_id}] Token budget exceeded: {str(exc)}",
+        extra={
+            "request_id": request_id,
+            "tenant_id": details.get("tenant_id"),
+            "session_id": details.get("session_id"),
+            "retry_after": details.get("retry_after")
+        }
+    )
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail=str(exc),
+        headers={
+            "X-TokenBudget-Limit": str(details.get("limit", 0)),
+            "X-TokenBudget-Remaining": str(details.get("remaining", 0)),
+            "Retry-After": str(details.get("retry_after", 1))
+        }
+    )
+
+
 @router.post(
     "/sessions",
     response_model=CreateSessionResponse,
@@ -133,7 +167,8 @@ async def send_message(
         # Execute agent
         result = await agent_manager.execute(
             session_id=request.session_id,
-            message=request.message
+            message=request.message,
+            tenant_id=request.tenant_id or "default"
         )
         
         logger.info(f"[{request_id}] Message processed successfully")
@@ -144,10 +179,13 @@ async def send_message(
             status="success",
             timestamp=format_timestamp(datetime.now()),
             metadata={
-                "request_id": request_id
+                "request_id": request_id,
+                "usage": result.get("usage")
             }
         )
         
+    except RateLimitError as e:
+        raise _token_budget_exceeded(request_id, e)
     except SessionNotFoundError as e:
         logger.warning(f"[{request_id}] Session not found: {str(e)}")
         raise HTTPException(
@@ -203,12 +241,18 @@ async def send_message_stream(
                 detail="Agent manager not initialized"
             )
         
+        # Pre-admit against the token budget so exhaustion returns 429, not an SSE error
+        tenant_id = request.tenant_id or "default"
+        reservation = agent_manager.reserve_tokens(request.session_id, request.message, tenant_id)
+        
         # Create async generator for SSE
         async def event_generator():
             try:
                 async for chunk in agent_manager.execute_stream(
                     session_id=request.session_id,
-                    message=request.message
+                    message=request.message,
+                    tenant_id=tenant_id,
+                    reservation=reservation
                 ):
                     # Send as Server-Sent Event
                     yield f"data: {chunk}\n\n"
@@ -229,7 +273,12 @@ async def send_message_stream(
             except Exception as e:
                 logger.error(f"[{request_id}] Unexpected error: {str(e)}")
                 yield f"event: error\ndata: {str(e)}\n\n"
+            finally:
+                agent_manager.release_tokens(reservation)
         
+        # The generator's finally only runs once it has started; the
+        # background task releases the reservation if the client went
+        # away before the first chunk (a no-op once the run settled it)
         return StreamingResponse(
             event_generator(),
             media_type="text/event-stream",
@@ -237,11 +286,14 @@ async def send_message_stream(
                 "Cache-Control": "no-cache",
                 "Connection": "keep-alive",
                 "X-Request-ID": request_id
-            }
+            },
+            background=BackgroundTask(agent_manager.release_tokens, reservation)
         )
         
     except HTTPException:
         raise
+    except RateLimitError as e:
+        raise _token_budget_exceeded(request_id, e)
     except Exception as e:
         logger.error(f"[{request_id}] Failed to initiate streaming: {str(e)}")
         raise HTTPException(
@@ -3,13 +3,37 @@ API Information Endpoints
 
 Endpoints for retrieving API information and available tools.
 """
+import asyncio
+import hmac
 import logging
-from fastapi import APIRouter, status
+from typing import Literal, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response, status
+from fastapi.responses import PlainTextResponse
 
-from ..models import APIInfo, ListToolsResponse, ToolInfo
+from ..models import (
+    APIInfo,
+    AsyncTasksResponse,
+    CpuProfileStatus,
+    ListToolsResponse,
+    LoopMonitorStatus,
+    MemorySnapshotResponse,
+    SlowQueriesResponse,
+    SuccessResponse,
+    ToolInfo,
+)
 from ...config.settings import get_settings
 from ...agent.factory import AgentFactory
 from ...tools.mcp_handler import is_mcp_available
+from ...utils.exceptions import AuthenticationError, AuthorizationError, ValidationError
+from ...utils.db_metrics import get_slow_query_log
+from ...utils.loop_monitor import get_loop_monitor
+from ...utils.profiling import (
+    dump_asyncio_tasks,
+    get_cpu_profiler,
+    get_memory_profiler,
+    render_collapsed,
+    render_flamegraph,
+)
 from ... import __version__
 
 logger = logging.getLogger(__name__)
@@ -72,7 +96,9 @@ async def list_tools() -> ListToolsResponse:
     # Order tools
     order_tool_names = [
         "create_new_order", "get_order", "get_customer_orders",
-        "find_orders", "update_order", "list_all_orders"
+        "find_orders", "update_order", "list_all_orders",
+        "create_orders_in_bulk", "update_orders_in_bulk", "summarize_orders",
+        "get_top_products", "summarize_customer"
     ]
     for name in order_tool_names:
         if name in tool_descriptions:
@@ -117,5 +143,240 @@ async def list_tools() -> ListToolsResponse:
     )
 
 
+# ============================================
+# Admin: Profiling
+# ============================================
+
+async def require_admin(x_admin_key: Optional[str] = Header(default=None)) -> None:
+    """
+    Require the admin key for diagnostic endpoints.
+
+    Raises:
+        AuthorizationError: If admin endpoints are disabled (no ADMIN_API_KEY)
+        AuthenticationError: If the X-Admin-Key header is missing or wrong
+    """
+    admin_key = get_settings().ADMIN_API_KEY
+    if not admin_key:
+        raise AuthorizationError("Admin endpoints are disabled (ADMIN_API_KEY not set)")
+    if not x_admin_key or not hmac.compare_digest(x_admin_key.encode(), admin_key.encode()):
+        raise AuthenticationError("Invalid or missing X-Admin-Key header")
+
+
+def _render_cpu_profile(output: str) -> Response:
+    """Render the last CPU profile as collapsed stacks or a flamegraph."""
+    profiler = get_cpu_profiler()
+    counts = profiler.result()
+    if output == "svg":
+        title = f"CPU profile - {profiler.samples} samples every {profiler.status()['interval_ms']}ms"
+        return Response(content=render_flamegraph(counts, title=title), media_type="image/svg+xml")
+    return PlainTextResponse(render_collapsed(counts))
+
+
+@router.post(
+    "/profiling/cpu/start",
+    response_model=CpuProfileStatus,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Start CPU Profile",
+    description="Start sampling all thread stacks for up to N seconds (admin)",
+    dependencies=[Depends(require_admin)]
+)
+async def start_cpu_profile(
+    seconds: float = Query(default=30.0, gt=0, description="Stop automatically after this many seconds"),
+    interval_ms: float = Query(default=10.0, ge=1, le=1000, description="Sampling interval in milliseconds")
+) -> CpuProfileStatus:
+    """
+    Start a sampling CPU profile.
+    
+    Returns:
+        CpuProfileStatus: Profile status
+    """
+    max_seconds = get_settings().PROFILING_MAX_SECONDS
+    if seconds > max_seconds:
+        raise ValidationError(f"seconds must be at most {max_seconds}")
+    
+    profiler = get_cpu_profiler()
+    try:
+        profiler.start(seconds, interval_ms / 1000)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    
+    logger.warning(f"CPU profile started ({seconds}s, every {interval_ms}ms)")
+    return CpuProfileStatus(**profiler.status())
+
+
+@router.post(
+    "/profiling/cpu/stop",
+    summary="Stop CPU Profile",
+    description="Stop the running CPU profile and return it as collapsed stacks or flamegraph SVG (admin)",
+    dependencies=[Depends(require_admin)]
+)
+async def stop_cpu_profile(
+    output: Literal["collapsed", "svg"] = Query(default="collapsed", alias="format", description="collapsed or svg")
+) -> Response:
+    """
+    Stop the CPU profile and return the result.
+    
+    Returns:
+        Response: Collapsed stacks (text/plain) or flamegraph (image/svg+xml)
+    """
+    await asyncio.to_thread(get_cpu_profiler().stop)
+    logger.warning("CPU profile stopped")
+    return _render_cpu_profile(output)
+
+
+@router.get(
+    "/profiling/cpu",
+    summary="Get CPU Profile",
+    description="Return the current or last CPU profile (admin)",
+    dependencies=[Depends(require_admin)]
+)
+async def get_cpu_profile(
+    output: Literal["collapsed", "svg", "status"] = Query(default="collapsed", alias="format", description="collapsed, svg or status")
+):
+    """
+    Get the current or last CPU profile.
+    
+    Returns:
+        Profile status, collapsed stacks or flamegraph SVG
+    """
+    if output == "status":
+        return CpuProfileStatus(**get_cpu_profiler().status())
+    return _render_cpu_profile(output)
+
+
+@router.post(
+    "/profiling/memory/start",
+    response_model=SuccessResponse,
+    summary="Start Memory Tracing",
+    description="Start tracemalloc allocation tracing (admin)",
+    dependencies=[Depends(require_admin)]
+)
+async def start_memory_tracing(
+    frames: int = Query(default=1, ge=1, le=50, description="Traceback depth recorded per allocation")
+) -> SuccessResponse:
+    """
+    Start tracemalloc.
+    
+    Returns:
+        SuccessResponse: Confirmation
+    """
+    get_memory_profiler().start(frames)
+    logger.warning(f"Memory tracing started ({frames} frames)")
+    return SuccessResponse(message="Memory tracing started", data={"frames": frames})
+
+
+@router.post(
+    "/profiling/memory/snapshot",
+    response_model=MemorySnapshotResponse,
+    summary="Memory Snapshot",
+    description="Take a tracemalloc snapshot and diff it against the previous one (admin)",
+    dependencies=[Depends(require_admin)]
+)
+async def take_memory_snapshot(
+    limit: int = Query(default=25, ge=1, le=500, description="Entries per report"),
+    group_by: Literal["lineno", "filename", "traceback"] = Query(default="lineno", description="Grouping key")
+) -> MemorySnapshotResponse:
+    """
+    Take a memory snapshot.
+    
+    Returns:
+        MemorySnapshotResponse: Top allocations and growth since the last snapshot
+    """
+    try:
+        report = await asyncio.to_thread(get_memory_profiler().snapshot, limit, group_by)
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return MemorySnapshotResponse(**report)
+
+
+@router.post(
+    "/profiling/memory/stop",
+    response_model=SuccessResponse,
+    summary="Stop Memory Tracing",
+    description="Stop tracemalloc and discard snapshots (admin)",
+    dependencies=[Depends(require_admin)]
+)
+async def stop_memory_tracing() -> SuccessResponse:
+    """
+    Stop tracemalloc.
+    
+    Returns:
+        SuccessResponse: Confirmation
+    """
+    get_memory_profiler().stop()
+    logger.warning("Memory tracing stopped")
+    return SuccessResponse(message="Memory tracing stopped")
+
+
+@router.get(
+    "/profiling/tasks",
+    response_model=AsyncTasksResponse,
+    summary="Asyncio Tasks",
+    description="List every asyncio task with its await stack (admin)",
+    dependencies=[Depends(require_admin)]
+)
+async def list_asyncio_tasks(
+    limit: int = Query(default=50, ge=1, le=500, description="Maximum frames per task")
+) -> AsyncTasksResponse:
+    """
+    Dump asyncio task stacks.
+    
+    Returns:
+        AsyncTasksResponse: Tasks and their await chains
+    """
+    tasks = dump_asyncio_tasks(limit=limit)
+    return AsyncTasksResponse(total_count=len(tasks), tasks=tasks)
+
+
+@router.get(
+    "/profiling/loop",
+    response_model=LoopMonitorStatus,
+    summary="Event Loop Lag",
+    description="Event loop lag statistics and recent stalls with stack traces (admin)",
+    dependencies=[Depends(require_admin)]
+)
+async def get_loop_status() -> LoopMonitorStatus:
+    """
+    Get event loop monitor status.
+    
+    Returns:
+        LoopMonitorStatus: Lag statistics and recent stalls
+    """
+    monitor = get_loop_monitor()
+    if monitor is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event loop monitor is not running (ENABLE_LOOP_MONITOR)"
+        )
+    return LoopMonitorStatus(**monitor.status())
+
+
+@router.get(
+    "/profiling/queries",
+    response_model=SlowQueriesResponse,
+    summary="Slow Queries",
+    description="Recent slow SQL statements with EXPLAIN QUERY PLAN output (admin)",
+    dependencies=[Depends(require_admin)]
+)
+async def get_slow_queries(
+    clear: bool = Query(default=False, description="Empty the log after reading")
+) -> SlowQueriesResponse:
+    """
+    Get the slow query log.
+    
+    Returns:
+        SlowQueriesResponse: Slow statements, newest first
+    """
+    slow_log = get_slow_query_log()
+    response = SlowQueriesResponse(
+        threshold_ms=slow_log.threshold * 1000 if slow_log.threshold != float("inf") else None,
+        total_count=slow_log.total,
+        queries=slow_log.snapshot()
+    )
+    if clear:
+        slow_log.clear()
+    return response
+
+
 # Export router
-__all__ = ["router"]
+__all__ = ["router", "require_admin"]
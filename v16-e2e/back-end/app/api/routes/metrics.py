@@ -0,0 +1,65 @@
+"""
+Metrics Endpoint
+
+Exposes operational metrics in the Prometheus text format.
+"""
+import logging
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from ...agent.manager import get_agent_manager
+from ...utils.metrics import (
+    ACTIVE_SESSIONS,
+    CONTENT_TYPE_LATEST,
+    ORDER_CACHE_ENTRIES,
+    ORDER_CACHE_HIT_RATIO,
+    ORDER_CACHE_LOOKUPS,
+    ORDER_CACHE_MEMORY_BYTES,
+    get_metrics_registry,
+)
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(tags=["Metrics"])
+
+
+def _active_session_count() -> int:
+    """Count active agent sessions (0 before the agent is initialized)."""
+    manager = get_agent_manager()
+    return manager.get_session_count() if manager else 0
+
+
+def _order_cache_stat(name: str):
+    """Read one order cache statistic (0 when the cache is off)."""
+    def read() -> float:
+        # Imported on first scrape: order management pulls in SQLAlchemy
+        from ...tools.order_management import get_cache_stats
+        return get_cache_stats().get(name, 0)
+    return read
+
+
+ACTIVE_SESSIONS.set_function(_active_session_count)
+ORDER_CACHE_LOOKUPS.labels("hit").set_function(_order_cache_stat("hits"))
+ORDER_CACHE_LOOKUPS.labels("miss").set_function(_order_cache_stat("misses"))
+ORDER_CACHE_HIT_RATIO.set_function(_order_cache_stat("hit_ratio"))
+ORDER_CACHE_ENTRIES.set_function(_order_cache_stat("entries"))
+ORDER_CACHE_MEMORY_BYTES.set_function(_order_cache_stat("memory_bytes"))
+
+
+@router.get(
+    "/metrics",
+    summary="Prometheus Metrics",
+    description="Operational metrics in the Prometheus text exposition format",
+    response_class=Response
+)
+async def metrics() -> Response:
+    """
+    Render all registered metrics.
+    
+    Returns:
+        Response: Prometheus text exposition
+    """
+    return Response(
+        content=get_metrics_registry().render(),
+        media_type=CONTENT_TYPE_LATEST
+    )
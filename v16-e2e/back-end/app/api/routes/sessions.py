@@ -7,6 +7,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from typing import Optional
 from datetime import datetime
 
+from ..responses import list_response
 from ...session.manager import SessionManager, get_session_manager
 from ...session.models import SessionHistoryResponse, SessionListResponse, SessionSummary
 from ...utils.exceptions import SessionNotFoundError, SessionExpiredError
@@ -40,14 +41,14 @@ async def get_session_history(
     try:
         session = await session_manager.get_session(session_id, tenant_id)
         
-        return SessionHistoryResponse(
+        return list_response(SessionHistoryResponse(
             session_id=session.session_id,
             tenant_id=session.tenant_id,
             message_count=len(session.messages),
             created_at=session.created_at,
             last_activity=session.last_activity,
             messages=session.messages
-        )
+        ), "messages")
     
     except SessionNotFoundError as e:
         logger.warning(f"Session not found: {session_id}", extra={"session_id": session_id, "tenant_id": tenant_id})
@@ -142,13 +143,13 @@ async def list_sessions(
         # Get total count for tenant
         total = session_manager.store.count_by_tenant(tenant_id)
         
-        return SessionListResponse(
+        return list_response(SessionListResponse(
             tenant_id=tenant_id,
             total=total,
             limit=limit,
             offset=offset,
             sessions=sessions
-        )
+        ), "sessions")
     
     except Exception as e:
         logger.error(f"Error listing sessions: {e}", extra={"tenant_id": tenant_id})
@@ -1,6 +1,6 @@
 """Configuration Management"""
 
-from .settings import Settings, get_settings, get_config
+from .settings import Settings, get_settings, get_config, parse_sample_rates
 from .validation import (
     validate_file_path,
     validate_directory,
@@ -13,6 +13,7 @@ __all__ = [
     "Settings",
     "get_settings",
     "get_config",
+    "parse_sample_rates",
     "validate_file_path",
     "validate_directory",
     "validate_port",
@@ -11,6 +11,31 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
 
+def parse_sample_rates(spec: str) -> dict[str, float]:
+    """
+    Parse a sample rate spec of the form "prefix:rate,prefix:rate".
+    
+    Args:
+        spec: Comma-separated prefix/rate pairs (rates between 0 and 1)
+        
+    Returns:
+        dict: Rates keyed by prefix
+    """
+    rates = {}
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        prefix, sep, rate = item.rpartition(":")
+        if not sep or not prefix:
+            raise ValueError(f"Invalid sample rate '{item}', expected prefix:rate")
+        value = float(rate)
+        if not 0.0 <= value <= 1.0:
+            raise ValueError(f"Sample rate for '{prefix}' must be between 0 and 1")
+        rates[prefix.strip()] = value
+    return rates
+
+
 class Settings(BaseSettings):
     """Application settings with environment variable support"""
     
@@ -20,6 +45,15 @@ class Settings(BaseSettings):
     SERVER_HOST: str = Field(default="0.0.0.0", description="Server host address")
     SERVER_PORT: int = Field(default=9080, ge=1024, le=65535, description="Server port")
     LOG_LEVEL: str = Field(default="INFO", description="Logging level")
+    PERFORMANCE_PROFILE: bool = Field(default=False, description="Serve with uvloop, httptools and orjson-rendered responses")
+    
+    # ============================================
+    # Response Compression and Streaming
+    # ============================================
+    ENABLE_COMPRESSION: bool = Field(default=True, description="Compress responses with gzip/brotli when the client accepts it")
+    COMPRESSION_MIN_SIZE: int = Field(default=1024, ge=0, description="Smallest response body compressed, in bytes")
+    COMPRESSION_LEVEL: int = Field(default=6, ge=1, le=9, description="gzip compression level")
+    STREAM_JSON_MIN_ITEMS: int = Field(default=1000, ge=0, description="Stream list responses with at least this many items (0 = never)")
     
     # ============================================
     # CORS Configuration
@@ -33,6 +67,40 @@ class Settings(BaseSettings):
     ENABLE_RATE_LIMITING: bool = Field(default=False, description="Enable rate limiting")
     RATE_LIMIT_PER_MINUTE: int = Field(default=100, ge=1, description="Requests per minute per IP")
     
+    # ============================================
+    # Token Budget (LLM usage per tenant/session)
+    # ============================================
+    ENABLE_TOKEN_BUDGET: bool = Field(default=False, description="Enable token budget limiting")
+    TOKEN_BUDGET_PER_MINUTE: int = Field(default=60000, ge=1, description="LLM tokens per minute per tenant")
+    TOKEN_BUDGET_BURST: int = Field(default=0, ge=0, description="Tenant bucket capacity (0 = per-minute budget)")
+    TOKEN_BUDGET_SESSION_PER_MINUTE: int = Field(default=0, ge=0, description="LLM tokens per minute per session (0 = disabled)")
+    TOKEN_BUDGET_PROMPT_OVERHEAD: int = Field(default=1500, ge=0, description="Estimated system prompt and tool tokens per turn")
+    
+    # ============================================
+    # Metrics
+    # ============================================
+    ENABLE_METRICS: bool = Field(default=True, description="Expose Prometheus metrics at /metrics")
+    ENABLE_LOOP_MONITOR: bool = Field(default=True, description="Measure event loop lag and capture stalls")
+    LOOP_MONITOR_INTERVAL_MS: int = Field(default=100, ge=10, description="Event loop heartbeat interval in ms")
+    LOOP_SLOW_CALLBACK_MS: int = Field(default=100, ge=10, description="Stall length that captures a stack trace in ms")
+    LOOP_STALL_HISTORY: int = Field(default=50, ge=1, description="Recent loop stalls kept for /info/profiling/loop")
+    
+    # ============================================
+    # Tracing (OpenTelemetry)
+    # ============================================
+    ENABLE_TRACING: bool = Field(default=False, description="Export OpenTelemetry traces")
+    OTEL_SERVICE_NAME: str = Field(default="msev15e2e-backend", description="Service name on exported spans")
+    OTEL_EXPORTER_OTLP_ENDPOINT: str = Field(default="http://localhost:4317", description="OTLP collector endpoint")
+    OTEL_EXPORTER_OTLP_PROTOCOL: str = Field(default="grpc", description="OTLP protocol: grpc or http")
+    OTEL_TRACES_SAMPLE_RATIO: float = Field(default=1.0, ge=0.0, le=1.0, description="Fraction of new traces sampled")
+    TRACING_MAX_QUEUE_SIZE: int = Field(default=2048, ge=1, description="Max spans buffered for export")
+    
+    # ============================================
+    # Admin / Profiling
+    # ============================================
+    ADMIN_API_KEY: str = Field(default="", description="Key for admin endpoints (X-Admin-Key); empty disables them")
+    PROFILING_MAX_SECONDS: int = Field(default=120, ge=1, description="Longest CPU profile an admin can request")
+    
     # ============================================
     # Azure OpenAI Configuration
     # ============================================
@@ -50,6 +118,20 @@ class Settings(BaseSettings):
     # Database Configuration
     # ============================================
     ORDER_DB_PATH: str = Field(default="./data/orders.db", description="SQLite database path")
+    SLOW_QUERY_MS: float = Field(default=100.0, ge=0, description="Statements at least this slow are logged with their query plan")
+    SLOW_QUERY_HISTORY: int = Field(default=100, ge=1, description="Slow statements kept for /info/profiling/queries")
+    ORDER_DB_PROFILE: str = Field(default="default", description="SQLite storage profile: default or performance (WAL and tuned pragmas)")
+    ORDER_DB_MMAP_SIZE_MB: int = Field(default=256, ge=0, description="Memory-mapped I/O per connection (performance profile)")
+    ORDER_DB_CACHE_SIZE_MB: int = Field(default=64, ge=1, description="Page cache per connection (performance profile)")
+    ORDER_DB_BUSY_TIMEOUT_MS: int = Field(default=5000, ge=0, description="Wait for the write lock before failing (performance profile)")
+    ORDER_DB_POOL_SIZE: int = Field(default=8, ge=1, description="Pooled connections (performance profile)")
+    ORDER_TOOLS_ASYNC: bool = Field(default=True, description="Run order tools on the asyncio database layer (aiosqlite) instead of blocking the event loop")
+    ORDER_CACHE_MODE: str = Field(default="local", description="Order lookup cache: off, local (one writer process) or shared (database version counter)")
+    ORDER_CACHE_MAX_ENTRIES: int = Field(default=1024, ge=1, description="Cached order lookups kept")
+    ORDER_CACHE_MAX_MB: int = Field(default=32, ge=1, description="Estimated memory of cached order lookups")
+    ORDER_CACHE_TTL_SECONDS: float = Field(default=30.0, gt=0, description="How long a cached order lookup is served")
+    ORDER_EVENTS_RETENTION_HOURS: float = Field(default=168.0, ge=0, description="How long order change events are kept (0 = keep all)")
+    ORDER_EVENTS_COMPACT_INTERVAL_MINUTES: int = Field(default=60, ge=1, description="How often expired order change events are deleted")
     
     # ============================================
     # Email Configuration
@@ -60,6 +142,20 @@ class Settings(BaseSettings):
     SENDER_PASSWORD: str = Field(..., description="Sender email password/app password")
     SENDER_NAME: str = Field(default="Customer Service", description="Sender display name")
     
+    # ============================================
+    # Startup and Shutdown
+    # ============================================
+    BACKGROUND_STARTUP: bool = Field(default=True, description="Initialize MCP and the agent after the server starts listening")
+    SHUTDOWN_READINESS_DELAY_SECONDS: float = Field(default=5.0, ge=0, description="Seconds to keep serving while reporting not ready before closing the listener")
+    SHUTDOWN_DRAIN_TIMEOUT_SECONDS: float = Field(default=20.0, ge=0, description="Seconds to wait for in-flight requests at shutdown")
+    
+    # ============================================
+    # Health Probes
+    # ============================================
+    ENABLE_HEALTH_PROBES: bool = Field(default=True, description="Probe dependencies in the background for /health")
+    HEALTH_PROBE_INTERVAL_SECONDS: float = Field(default=30.0, gt=0, description="Seconds between dependency probe rounds")
+    HEALTH_PROBE_TIMEOUT_SECONDS: float = Field(default=5.0, gt=0, description="Timeout for each dependency probe")
+    
     # ============================================
     # Logging Configuration
     # ============================================
@@ -67,6 +163,13 @@ class Settings(BaseSettings):
     LOG_FILE_PATH: str = Field(default="./logs/app.log", description="Log file path")
     LOG_MAX_SIZE_MB: int = Field(default=100, ge=1, description="Max log file size in MB")
     LOG_BACKUP_COUNT: int = Field(default=5, ge=0, description="Number of log backups")
+    LOG_QUEUE_ENABLED: bool = Field(default=True, description="Write logs from a background thread")
+    LOG_QUEUE_SIZE: int = Field(default=10000, ge=1, description="Max pending log records")
+    LOG_QUEUE_FULL_POLICY: str = Field(default="drop", description="When the log queue is full: drop or block")
+    LOG_FORMAT: str = Field(default="text", description="File log format: text or json")
+    LOG_SAMPLE_RATES: str = Field(default="", description="Per-logger sample rates (logger.prefix:rate,...)")
+    LOG_ROUTE_SAMPLE_RATES: str = Field(default="", description="Per-route sample rates for successful requests (/path:rate,...)")
+    LOG_SLOW_REQUEST_MS: float = Field(default=1000.0, ge=0, description="Requests slower than this are always logged")
     
     # ============================================
     # Agent Configuration
@@ -100,6 +203,63 @@ class Settings(BaseSettings):
             raise ValueError(f"LOG_LEVEL must be one of: {', '.join(valid_levels)}")
         return v_upper
     
+    @field_validator("LOG_QUEUE_FULL_POLICY")
+    @classmethod
+    def validate_log_queue_policy(cls, v: str) -> str:
+        """Validate log queue full policy"""
+        valid_policies = ["drop", "block"]
+        v_lower = v.lower()
+        if v_lower not in valid_policies:
+            raise ValueError(f"LOG_QUEUE_FULL_POLICY must be one of: {', '.join(valid_policies)}")
+        return v_lower
+    
+    @field_validator("ORDER_DB_PROFILE")
+    @classmethod
+    def validate_order_db_profile(cls, v: str) -> str:
+        """Validate SQLite storage profile"""
+        valid_profiles = ["default", "performance"]
+        v_lower = v.lower()
+        if v_lower not in valid_profiles:
+            raise ValueError(f"ORDER_DB_PROFILE must be one of: {', '.join(valid_profiles)}")
+        return v_lower
+    
+    @field_validator("ORDER_CACHE_MODE")
+    @classmethod
+    def validate_order_cache_mode(cls, v: str) -> str:
+        """Validate order cache mode"""
+        valid_modes = ["off", "local", "shared"]
+        v_lower = v.lower()
+        if v_lower not in valid_modes:
+            raise ValueError(f"ORDER_CACHE_MODE must be one of: {', '.join(valid_modes)}")
+        return v_lower
+    
+    @field_validator("LOG_FORMAT")
+    @classmethod
+    def validate_log_format(cls, v: str) -> str:
+        """Validate file log format"""
+        valid_formats = ["json", "text"]
+        v_lower = v.lower()
+        if v_lower not in valid_formats:
+            raise ValueError(f"LOG_FORMAT must be one of: {', '.join(valid_formats)}")
+        return v_lower
+    
+    @field_validator("OTEL_EXPORTER_OTLP_PROTOCOL")
+    @classmethod
+    def validate_otlp_protocol(cls, v: str) -> str:
+        """Validate OTLP exporter protocol"""
+        valid_protocols = ["grpc", "http"]
+        v_lower = v.lower()
+        if v_lower not in valid_protocols:
+            raise ValueError(f"OTEL_EXPORTER_OTLP_PROTOCOL must be one of: {', '.join(valid_protocols)}")
+        return v_lower
+    
+    @field_validator("LOG_SAMPLE_RATES", "LOG_ROUTE_SAMPLE_RATES")
+    @classmethod
+    def validate_sample_rates(cls, v: str) -> str:
+        """Validate sample rate specs"""
+        parse_sample_rates(v)
+        return v
+    
     @field_validator("AZURE_AI_PROJECT_ENDPOINT", "MCP_SERVER_URL")
     @classmethod
     def validate_url(cls, v: str) -> str:
@@ -128,6 +288,21 @@ class Settings(BaseSettings):
         """Convert log size from MB to bytes"""
         return self.LOG_MAX_SIZE_MB * 1024 * 1024
     
+    @property
+    def log_sample_rates(self) -> dict[str, float]:
+        """Parse per-logger sample rates"""
+        return parse_sample_rates(self.LOG_SAMPLE_RATES)
+    
+    @property
+    def log_route_sample_rates(self) -> dict[str, float]:
+        """Parse per-route sample rates"""
+        return parse_sample_rates(self.LOG_ROUTE_SAMPLE_RATES)
+    
+    @property
+    def rate_limit_per_minute(self) -> int:
+        """Alias for RATE_LIMIT_PER_MINUTE"""
+        return self.RATE_LIMIT_PER_MINUTE
+    
     @property
     def api_host(self) -> str:
         """Alias for SERVER_HOST"""
@@ -209,6 +384,7 @@ class Settings(BaseSettings):
         sensitive_fields = [
             "AZURE_OPENAI_API_KEY",
             "SENDER_PASSWORD",
+            "ADMIN_API_KEY",
         ]
         
         for field in sensitive_fields:
@@ -230,14 +406,21 @@ class Settings(BaseSettings):
         lines.append("=" * 60)
         
         sections = {
-            "Server": ["SERVER_HOST", "SERVER_PORT", "LOG_LEVEL"],
+            "Server": ["SERVER_HOST", "SERVER_PORT", "LOG_LEVEL", "PERFORMANCE_PROFILE"],
             "CORS": ["ENABLE_CORS", "CORS_ORIGINS"],
+            "Compression": ["ENABLE_COMPRESSION", "COMPRESSION_MIN_SIZE", "COMPRESSION_LEVEL", "STREAM_JSON_MIN_ITEMS"],
             "Rate Limiting": ["ENABLE_RATE_LIMITING", "RATE_LIMIT_PER_MINUTE"],
+            "Token Budget": ["ENABLE_TOKEN_BUDGET", "TOKEN_BUDGET_PER_MINUTE", "TOKEN_BUDGET_BURST", "TOKEN_BUDGET_SESSION_PER_MINUTE", "TOKEN_BUDGET_PROMPT_OVERHEAD"],
+            "Metrics": ["ENABLE_METRICS", "ENABLE_LOOP_MONITOR", "LOOP_MONITOR_INTERVAL_MS", "LOOP_SLOW_CALLBACK_MS", "LOOP_STALL_HISTORY"],
+            "Admin": ["ADMIN_API_KEY", "PROFILING_MAX_SECONDS"],
+            "Tracing": ["ENABLE_TRACING", "OTEL_SERVICE_NAME", "OTEL_EXPORTER_OTLP_ENDPOINT", "OTEL_EXPORTER_OTLP_PROTOCOL", "OTEL_TRACES_SAMPLE_RATIO", "TRACING_MAX_QUEUE_SIZE"],
             "Azure OpenAI": ["AZURE_AI_PROJECT_ENDPOINT", "AZURE_OPENAI_RESPONSES_DEPLOYMENT_NAME", "AZURE_OPENAI_API_KEY"],
             "MCP Server": ["MCP_SERVER_URL", "MCP_SERVER_REQUIRED"],
-            "Database": ["ORDER_DB_PATH"],
+            "Database": ["ORDER_DB_PATH", "SLOW_QUERY_MS", "SLOW_QUERY_HISTORY", "ORDER_DB_PROFILE", "ORDER_DB_MMAP_SIZE_MB", "ORDER_DB_CACHE_SIZE_MB", "ORDER_DB_BUSY_TIMEOUT_MS", "ORDER_DB_POOL_SIZE", "ORDER_TOOLS_ASYNC", "ORDER_CACHE_MODE", "ORDER_CACHE_MAX_ENTRIES", "ORDER_CACHE_MAX_MB", "ORDER_CACHE_TTL_SECONDS", "ORDER_EVENTS_RETENTION_HOURS", "ORDER_EVENTS_COMPACT_INTERVAL_MINUTES"],
             "Email": ["SMTP_SERVER", "SMTP_PORT", "SENDER_EMAIL", "SENDER_PASSWORD", "SENDER_NAME"],
-            "Logging": ["LOG_TO_FILE", "LOG_FILE_PATH", "LOG_MAX_SIZE_MB", "LOG_BACKUP_COUNT"],
+            "Startup and Shutdown": ["BACKGROUND_STARTUP", "SHUTDOWN_READINESS_DELAY_SECONDS", "SHUTDOWN_DRAIN_TIMEOUT_SECONDS"],
+            "Health Probes": ["ENABLE_HEALTH_PROBES", "HEALTH_PROBE_INTERVAL_SECONDS", "HEALTH_PROBE_TIMEOUT_SECONDS"],
+            "Logging": ["LOG_TO_FILE", "LOG_FILE_PATH", "LOG_MAX_SIZE_MB", "LOG_BACKUP_COUNT", "LOG_QUEUE_ENABLED", "LOG_QUEUE_SIZE", "LOG_QUEUE_FULL_POLICY", "LOG_FORMAT", "LOG_SAMPLE_RATES", "LOG_ROUTE_SAMPLE_RATES", "LOG_SLOW_REQUEST_MS"],
             "Agent": ["AGENT_NAME", "AGENT_MODEL", "AGENT_MAX_TURNS", "AGENT_TIMEOUT_SECONDS"],
             "Session": ["SESSION_CLEANUP_ENABLED", "SESSION_MAX_AGE_HOURS", "SESSION_CLEANUP_INTERVAL_MINUTES"],
         }
@@ -15,11 +15,6 @@ class SessionMessage(BaseModel):
     content: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
     tool_calls: Optional[List[Dict[str, Any]]] = None
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class SessionData(BaseModel):
@@ -32,11 +27,6 @@ class SessionData(BaseModel):
     last_activity: datetime = Field(default_factory=datetime.utcnow)
     metadata: Dict[str, Any] = Field(default_factory=dict)
     
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-    
     def add_message(self, role: str, content: str, tool_calls: Optional[List[Dict]] = None):
         """Add a message to the session."""
         message = SessionMessage(
@@ -64,11 +54,6 @@ class SessionSummary(BaseModel):
     message_count: int
     created_at: datetime
     last_activity: datetime
-    
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
 
 
 class SessionHistoryResponse(BaseModel):
@@ -16,13 +16,26 @@ from .checks import (
     run_all_checks,
 )
 
+from .runtime import get_server_options
+
+from .services import (
+    StartupState,
+    get_startup_state,
+    initialize_services,
+    start_services,
+    stop_services,
+)
+
 from .shutdown import (
     ShutdownHandler,
     create_shutdown_handler,
     cleanup_sessions,
     close_database_connections,
+    close_async_database_connections,
     stop_background_tasks,
+    drain_in_flight_requests,
     flush_logs,
+    DrainingServer,
 )
 
 __all__ = [
@@ -38,11 +51,22 @@ __all__ = [
     "check_database",
     "check_smtp_configuration",
     "run_all_checks",
+    # Runtime
+    "get_server_options",
+    # Services
+    "StartupState",
+    "get_startup_state",
+    "initialize_services",
+    "start_services",
+    "stop_services",
     # Shutdown
     "ShutdownHandler",
     "create_shutdown_handler",
     "cleanup_sessions",
     "close_database_connections",
+    "close_async_database_connections",
     "stop_background_tasks",
+    "drain_in_flight_requests",
     "flush_logs",
+    "DrainingServer",
 ]
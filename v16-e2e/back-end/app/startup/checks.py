@@ -5,6 +5,7 @@ Pre-flight checks to ensure all dependencies and services are available.
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from pathlib import Path
 
@@ -233,28 +234,34 @@ def run_all_checks(settings, logger: Optional[logging.Logger] = None) -> tuple[b
         logger.info("Running startup checks...")
         logger.info("=" * 60)
     
-    # Critical checks (must pass)
-    critical_checks = [
-        ("Configuration", lambda: check_configuration(settings, logger)),
-        ("Database", lambda: check_database(settings, logger)),
-    ]
+    # The checks are independent and mostly wait on the network (the MCP
+    # check alone can take its full timeout), so they run concurrently;
+    # results are evaluated in the original order
+    with ThreadPoolExecutor(max_workers=6, thread_name_prefix="startup-check") as executor:
+        # Critical checks (must pass)
+        critical_checks = [
+            ("Configuration", executor.submit(check_configuration, settings, logger)),
+            ("Database", executor.submit(check_database, settings, logger)),
+        ]
+        
+        # Non-critical checks (warnings only)
+        non_critical_checks = [
+            ("Azure OpenAI", executor.submit(check_azure_openai, settings, logger)),
+            ("SMTP Configuration", executor.submit(check_smtp_configuration, settings, logger)),
+        ]
+        
+        # MCP server check (special handling)
+        mcp_check = executor.submit(check_mcp_server, settings, logger)
     
-    for name, check_func in critical_checks:
-        if not check_func():
+    for name, future in critical_checks:
+        if not future.result():
             return False, [f"Critical check failed: {name}"]
     
-    # Non-critical checks (warnings only)
-    non_critical_checks = [
-        ("Azure OpenAI", lambda: check_azure_openai(settings, logger)),
-        ("SMTP Configuration", lambda: check_smtp_configuration(settings, logger)),
-    ]
-    
-    for name, check_func in non_critical_checks:
-        if not check_func():
+    for name, future in non_critical_checks:
+        if not future.result():
             warnings.append(f"{name} check failed (non-critical)")
     
-    # MCP server check (special handling)
-    mcp_available, mcp_error = check_mcp_server(settings, logger)
+    mcp_available, mcp_error = mcp_check.result()
     if not mcp_available:
         if settings.MCP_SERVER_REQUIRED:
             return False, [f"MCP server required but unavailable: {mcp_error}"]
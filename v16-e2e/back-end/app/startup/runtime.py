@@ -0,0 +1,46 @@
+"""
+Server Runtime Options
+
+Event loop and HTTP parser selection for uvicorn.
+
+The performance profile (``PERFORMANCE_PROFILE``) asks for uvloop and the
+httptools parser explicitly, so a missing package is reported at startup
+instead of silently falling back; without the profile uvicorn picks
+(``auto``).
+"""
+
+import importlib.util
+import logging
+from typing import Optional
+
+
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+def get_server_options(settings, logger: Optional[logging.Logger] = None) -> dict:
+    """
+    Get uvicorn loop and HTTP implementation options.
+    
+    Args:
+        settings: Application settings instance
+        logger: Logger instance
+        
+    Returns:
+        dict: ``loop`` and ``http`` keyword arguments for ``uvicorn.Config``
+    """
+    if not settings.PERFORMANCE_PROFILE:
+        return {"loop": "auto", "http": "auto"}
+    
+    options = {}
+    for option, module, fallback in (("loop", "uvloop", "asyncio"), ("http", "httptools", "h11")):
+        if _installed(module):
+            options[option] = module
+        else:
+            options[option] = fallback
+            if logger:
+                logger.warning(f"Performance profile: {module} not installed, using {fallback}")
+    
+    if logger:
+        logger.info(f"Performance profile: loop={options['loop']}, http={options['http']}, orjson responses")
+    return options
@@ -0,0 +1,238 @@
+"""
+Service Initialization
+
+Brings up the order database (creating its tables if needed), MCP handler
+and agent manager.
+
+With ``BACKGROUND_STARTUP`` (the default) this runs as a task started from
+the application lifespan, so the server starts listening immediately and
+liveness probes pass while the slow parts (importing agent_framework and
+the Azure SDK, connecting to MCP) are still running. ``/health/ready``
+reports ``startup: false`` and the agent routes answer 503 until it
+finishes.
+
+The MCP connection and the Azure OpenAI client are independent, so they
+are created concurrently; the agent is assembled once both are done
+because its tool list depends on whether MCP is available.
+
+Once the services are up, a background task deletes order change events
+older than ``ORDER_EVENTS_RETENTION_HOURS`` every
+``ORDER_EVENTS_COMPACT_INTERVAL_MINUTES``.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+STARTING = "starting"
+READY = "ready"
+FAILED = "failed"
+
+
+class StartupState:
+    """Progress of service initialization."""
+
+    def __init__(self):
+        self.status = STARTING
+        self.error: Optional[str] = None
+        self.duration: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        """Whether all services finished initializing."""
+        return self.status == READY
+
+
+# Global startup state and background tasks
+_startup_state = StartupState()
+_startup_task: Optional[asyncio.Task] = None
+_compaction_task: Optional[asyncio.Task] = None
+
+
+def get_startup_state() -> StartupState:
+    """
+    Get the global startup state.
+
+    Returns:
+        StartupState: Current initialization progress
+    """
+    return _startup_state
+
+
+def _prepare_database(settings) -> None:
+    """Point order management at the configured database and create its tables."""
+    from ..tools.order_management import configure_cache, configure_storage, init_db, set_database_path
+    from ..utils.db_metrics import instrument_sqlalchemy
+    from ..utils.tracing import instrument_sqlalchemy_tracing, is_tracing_enabled
+
+    # Configure database path for order management
+    logger.info(f"Configuring database path: {settings.database_path}")
+    set_database_path(str(settings.database_path))
+    configure_storage(
+        profile=settings.ORDER_DB_PROFILE,
+        mmap_size_mb=settings.ORDER_DB_MMAP_SIZE_MB,
+        cache_size_mb=settings.ORDER_DB_CACHE_SIZE_MB,
+        busy_timeout_ms=settings.ORDER_DB_BUSY_TIMEOUT_MS,
+        pool_size=settings.ORDER_DB_POOL_SIZE
+    )
+    configure_cache(
+        mode=settings.ORDER_CACHE_MODE,
+        max_entries=settings.ORDER_CACHE_MAX_ENTRIES,
+        max_mb=settings.ORDER_CACHE_MAX_MB,
+        ttl_seconds=settings.ORDER_CACHE_TTL_SECONDS
+    )
+
+    # Time and count database queries for /metrics, log slow ones
+    if settings.ENABLE_METRICS:
+        instrument_sqlalchemy(settings.SLOW_QUERY_MS, settings.SLOW_QUERY_HISTORY)
+    if is_tracing_enabled():
+        instrument_sqlalchemy_tracing()
+
+    init_db()
+
+
+def _connect_mcp() -> None:
+    """Connect to the MCP server; the service runs without it on failure."""
+    from ..tools.mcp_handler import initialize_mcp_handler
+
+    try:
+        initialize_mcp_handler()
+        logger.info("✓ MCP handler initialized")
+    except Exception as e:
+        logger.warning(f"MCP initialization failed (continuing without MCP): {str(e)}")
+
+
+async def initialize_services(settings) -> None:
+    """
+    Initialize the database, MCP handler, agent manager and health prober.
+
+    Args:
+        settings: Application settings instance
+
+    Raises:
+        Exception: If agent initialization fails (also recorded in the startup state)
+    """
+    from ..agent.factory import AgentFactory
+    from ..agent.manager import initialize_agent_manager
+    from ..utils.health_prober import start_health_prober
+
+    start = time.perf_counter()
+    _startup_state.status = STARTING
+    _startup_state.error = None
+
+    try:
+        # Everything that imports heavy modules runs in worker threads so the
+        # event loop keeps serving; database setup, MCP connection and Azure
+        # client creation are independent
+        logger.info("Initializing database, MCP handler and agent client...")
+        _, _, client = await asyncio.gather(
+            asyncio.to_thread(_prepare_database, settings),
+            asyncio.to_thread(_connect_mcp),
+            asyncio.to_thread(AgentFactory.create_client)
+        )
+
+        # The agent's tool list depends on MCP availability
+        await asyncio.to_thread(initialize_agent_manager, client)
+        logger.info("✓ Agent manager initialized")
+
+        # Probe dependencies in the background; /health serves cached results
+        await start_health_prober(settings)
+        start_event_compaction(settings)
+
+    except Exception as e:
+        _startup_state.status = FAILED
+        _startup_state.error = str(e)
+        logger.error(f"Service initialization failed: {str(e)}", exc_info=True)
+        raise
+
+    _startup_state.status = READY
+    _startup_state.duration = time.perf_counter() - start
+    logger.info(f"Services ready in {_startup_state.duration:.2f}s")
+
+
+def start_services(settings) -> asyncio.Task:
+    """
+    Start service initialization as a background task.
+
+    Args:
+        settings: Application settings instance
+
+    Returns:
+        asyncio.Task: Initialization task
+    """
+    global _startup_task
+
+    async def run():
+        try:
+            await initialize_services(settings)
+        except Exception:
+            pass  # Logged and recorded in the startup state; readiness stays false
+
+    _startup_task = asyncio.get_running_loop().create_task(run(), name="service-startup")
+    return _startup_task
+
+
+async def _compact_events_periodically(retention_hours: float, interval_seconds: float) -> None:
+    """Delete expired order change events, then wait for the next round."""
+    from ..tools.order_management import compact_events
+
+    while True:
+        try:
+            deleted = await asyncio.to_thread(compact_events, retention_hours)
+            if deleted:
+                logger.info(f"Compacted {deleted} order change event(s)")
+        except Exception as e:
+            logger.warning(f"Order change event compaction failed: {str(e)}")
+        await asyncio.sleep(interval_seconds)
+
+
+def start_event_compaction(settings) -> Optional[asyncio.Task]:
+    """
+    Start deleting expired order change events in the background.
+
+    Args:
+        settings: Application settings instance
+
+    Returns:
+        asyncio.Task: Compaction task (None if retention is unlimited)
+    """
+    global _compaction_task
+
+    if settings.ORDER_EVENTS_RETENTION_HOURS <= 0:
+        return None
+    _compaction_task = asyncio.get_running_loop().create_task(
+        _compact_events_periodically(
+            settings.ORDER_EVENTS_RETENTION_HOURS,
+            settings.ORDER_EVENTS_COMPACT_INTERVAL_MINUTES * 60
+        ),
+        name="order-event-compaction"
+    )
+    return _compaction_task
+
+
+async def stop_services() -> None:
+    """Cancel initialization if it is still running, and event compaction, at shutdown."""
+    global _startup_task, _compaction_task
+
+    for task in (_startup_task, _compaction_task):
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    _startup_task = None
+    _compaction_task = None
+
+
+__all__ = [
+    "StartupState",
+    "get_startup_state",
+    "initialize_services",
+    "start_services",
+    "start_event_compaction",
+    "stop_services",
+]
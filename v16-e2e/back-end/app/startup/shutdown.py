@@ -2,14 +2,25 @@
 Graceful Shutdown Handler
 
 Handles application shutdown with proper cleanup.
+
+Shutdown drains instead of dropping in-flight work: on SIGTERM/SIGINT the
+server keeps serving for ``SHUTDOWN_READINESS_DELAY_SECONDS`` while
+``/health/ready`` reports not ready, then closes the listener and waits up
+to ``SHUTDOWN_DRAIN_TIMEOUT_SECONDS`` for running requests (SSE streams,
+tool calls) to finish before the lifespan shutdown releases resources.
 """
 
 import signal
 import logging
 import sys
+import time
 from typing import Optional, Callable
 import asyncio
 
+import uvicorn
+
+from ..utils.drain import get_request_drain
+
 
 class ShutdownHandler:
     """Handles graceful application shutdown"""
@@ -130,41 +141,142 @@ def close_database_connections(logger: Optional[logging.Logger] = None) -> None:
     if logger:
         logger.info("Closing database connections...")
     
-    # Database connection cleanup will be implemented in Phase 2
-    # For now, just log the intent
+    try:
+        # Only dispose if order management was used; importing it would load SQLAlchemy
+        database = sys.modules.get("app.tools.order_management.database")
+        if database is not None:
+            database.dispose_engine()
+        
+        if logger:
+            logger.info("✓ Database connections closed")
     
-    if logger:
-        logger.info("✓ Database connections closed")
+    except Exception as e:
+        if logger:
+            logger.warning(f"Error closing database connections: {e}")
 
 
-def stop_background_tasks(logger: Optional[logging.Logger] = None) -> None:
+async def close_async_database_connections(logger: Optional[logging.Logger] = None) -> None:
     """
-    Stop background tasks.
+    Close the async order tools' aiosqlite connections.
     
     Args:
         logger: Logger instance
     """
+    try:
+        database = sys.modules.get("app.tools.order_management.database")
+        if database is not None:
+            await database.dispose_async_engine()
+    
+    except Exception as e:
+        if logger:
+            logger.warning(f"Error closing async database connections: {e}")
+
+
+async def stop_background_tasks(logger: Optional[logging.Logger] = None) -> None:
+    """
+    Stop background tasks (service initialization and health probing).
+    
+    Args:
+        logger: Logger instance
+    """
+    # Import here to avoid circular dependencies
+    from .services import stop_services
+    from ..utils.health_prober import stop_health_prober
+    
     if logger:
         logger.info("Stopping background tasks...")
     
-    # Background task cleanup (session cleanup, etc.)
-    # Will be implemented in Phase 5
+    await stop_services()
+    await stop_health_prober()
     
     if logger:
         logger.info("✓ Background tasks stopped")
 
 
+async def drain_in_flight_requests(timeout: float, logger: Optional[logging.Logger] = None) -> bool:
+    """
+    Refuse new requests and wait for in-flight ones to finish.
+    
+    Args:
+        timeout: Maximum seconds to wait
+        logger: Logger instance
+        
+    Returns:
+        bool: True if all in-flight requests finished in time
+    """
+    drain = get_request_drain()
+    drain.start()
+    
+    if logger:
+        logger.info(f"Draining {drain.in_flight} in-flight request(s) (up to {timeout:g}s)...")
+    
+    start = time.monotonic()
+    drained = await drain.wait_idle(timeout)
+    
+    if logger:
+        if drained:
+            logger.info(f"✓ In-flight requests drained in {time.monotonic() - start:.2f}s")
+        else:
+            logger.warning(f"Drain timed out with {drain.in_flight} request(s) still running")
+    return drained
+
+
+class DrainingServer(uvicorn.Server):
+    """
+    Uvicorn server that reports not ready before it stops listening.
+    
+    On the first shutdown signal the server keeps serving for
+    ``readiness_delay`` seconds while ``/health/ready`` reports not ready,
+    so load balancers stop routing new requests here, then shuts down as
+    usual: the listener closes and in-flight requests get up to the
+    config's ``timeout_graceful_shutdown`` to finish. A second signal
+    shuts down immediately.
+    """
+    
+    def __init__(self, config: uvicorn.Config, readiness_delay: float = 0.0):
+        super().__init__(config)
+        self.readiness_delay = readiness_delay
+        self._exit_at: Optional[float] = None
+    
+    def handle_exit(self, sig: int, frame) -> None:
+        if self._exit_at is None and self.readiness_delay > 0 and not self.should_exit:
+            # Runs in a signal handler: only set state, on_tick does the rest
+            self._captured_signals.append(sig)
+            self._exit_at = time.monotonic() + self.readiness_delay
+            get_request_drain().begin_shutdown()
+            return
+        super().handle_exit(sig, frame)
+    
+    async def on_tick(self, counter: int) -> bool:
+        if self._exit_at is not None and not self.should_exit and time.monotonic() >= self._exit_at:
+            # Stop accepting; requests arriving on open connections get 503
+            get_request_drain().start()
+            self.should_exit = True
+        return await super().on_tick(counter)
+
+
 def flush_logs(logger: Optional[logging.Logger] = None) -> None:
     """
-    Flush all log handlers.
+    Drain queued log records and flush all log handlers.
     
     Args:
         logger: Logger instance
     """
+    # Import here to avoid circular dependencies
+    from ..utils.logger import flush_log_queues, get_log_queue_stats
+    
     if logger:
         logger.info("Flushing logs...")
-        for handler in logging.root.handlers:
-            handler.flush()
+        dropped = sum(stats["dropped"] for stats in get_log_queue_stats().values())
+        if dropped:
+            logger.warning(f"  • {dropped} log record(s) dropped (queue full)")
+    
+    if not flush_log_queues():
+        print("Warning: timed out draining log queue", file=sys.stderr)
+    
+    for handler in logging.root.handlers:
+        handler.flush()
+    if logger:
         for handler in logger.handlers:
             handler.flush()
 
@@ -181,8 +293,7 @@ def create_shutdown_handler(logger: Optional[logging.Logger] = None) -> Shutdown
     """
     handler = ShutdownHandler(logger)
     
-    # Register default cleanup callbacks
-    handler.register_callback(lambda: stop_background_tasks(logger))
+    # Register default cleanup callbacks (background tasks are stopped by the lifespan)
     handler.register_callback(lambda: cleanup_sessions(logger))
     handler.register_callback(lambda: close_database_connections(logger))
     handler.register_callback(lambda: flush_logs(logger))
@@ -5,12 +5,14 @@ This module handles the connection to the MCP server and exposes
 complaint management operations to the agent.
 """
 import logging
-from typing import Optional
-from agent_framework import MCPStreamableHTTPTool
+from typing import TYPE_CHECKING, Optional
 
 from ..config.settings import get_settings
 from ..utils.exceptions import MCPConnectionError, MCPServerUnavailableError
 
+if TYPE_CHECKING:
+    from agent_framework import MCPStreamableHTTPTool
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,6 +46,8 @@ class MCPHandler:
         try:
             logger.info(f"Connecting to MCP server at {self.mcp_url}...")
             
+            from agent_framework import MCPStreamableHTTPTool
+            
             # Create MCP tool
             self._mcp_tool = MCPStreamableHTTPTool(
                 name="complaint_management",
@@ -82,7 +86,7 @@ class MCPHandler:
         """
         return self._connected
     
-    def get_mcp_tool(self) -> Optional[MCPStreamableHTTPTool]:
+    def get_mcp_tool(self) -> Optional["MCPStreamableHTTPTool"]:
         """
         Get the MCP tool instance.
         
@@ -160,7 +164,7 @@ def get_mcp_handler() -> Optional[MCPHandler]:
     return _mcp_handler
 
 
-def get_mcp_tool() -> Optional[MCPStreamableHTTPTool]:
+def get_mcp_tool() -> Optional["MCPStreamableHTTPTool"]:
     """
     Get the MCP tool for agent registration.
     
@@ -41,7 +41,12 @@ from .database import (
     init_db,
     get_db_session,
     get_database_path,
-    set_database_path
+    set_database_path,
+    configure_storage,
+    get_storage_pragmas,
+    dispose_engine,
+    dispose_async_engine,
+    async_database_available
 )
 
 # Operations
@@ -51,17 +56,60 @@ from .operations import (
     get_orders_by_customer,
     search_orders,
     update_order_status,
-    get_all_orders
+    get_all_orders,
+    get_orders_page,
+    get_orders_by_customer_page,
+    search_orders_page
 )
 
+# Async operations (same functions as coroutines):
+#     from app.tools.order_management import async_operations
+from . import async_operations
+
+# Lookup cache
+from .cache import configure_cache, get_cache_stats, clear_cache, CACHE_MODES
+
+# Order summaries
+from .summaries import (
+    get_status_totals,
+    get_daily_totals,
+    get_top_skus,
+    get_customer_summary,
+    rebuild_summaries,
+    verify_summaries
+)
+
+# Order change feed
+from .events import (
+    read_events,
+    tail_events,
+    tail_events_async,
+    latest_event_sequence,
+    get_consumer_offset,
+    commit_offset,
+    compact_events,
+    get_event_stats,
+    invalidate_events,
+    EVENT_TYPES
+)
+
+# Bulk ingestion and status updates
+from .bulk import create_orders_bulk, read_orders_file
+from .status_updates import update_order_status_bulk
+
+# Pagination
+from .pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+
 # Models
-from .models import Order
+from .models import Order, OrderEvent
 
 # Exceptions
 from .exceptions import (
     OrderManagementError,
     ValidationError,
     OrderNotFoundError,
+    VersionConflictError,
+    EventsExpiredError,
     DatabaseError
 )
 
@@ -75,6 +123,11 @@ __all__ = [
     "get_db_session",
     "get_database_path",
     "set_database_path",
+    "configure_storage",
+    "get_storage_pragmas",
+    "dispose_engine",
+    "dispose_async_engine",
+    "async_database_available",
     
     # Operations
     "create_order",
@@ -83,16 +136,54 @@ __all__ = [
     "search_orders",
     "update_order_status",
     "get_all_orders",
+    "get_orders_page",
+    "get_orders_by_customer_page",
+    "search_orders_page",
+    "create_orders_bulk",
+    "read_orders_file",
+    "update_order_status_bulk",
+    "async_operations",
+    
+    # Order summaries
+    "get_status_totals",
+    "get_daily_totals",
+    "get_top_skus",
+    "get_customer_summary",
+    "rebuild_summaries",
+    "verify_summaries",
+    
+    # Order change feed
+    "read_events",
+    "tail_events",
+    "tail_events_async",
+    "latest_event_sequence",
+    "get_consumer_offset",
+    "commit_offset",
+    "compact_events",
+    "get_event_stats",
+    "invalidate_events",
+    "EVENT_TYPES",
+    
+    # Lookup cache
+    "configure_cache",
+    "get_cache_stats",
+    "clear_cache",
+    "CACHE_MODES",
     
     # Models
     "Order",
+    "OrderEvent",
     
     # Exceptions
     "OrderManagementError",
     "ValidationError",
     "OrderNotFoundError",
+    "VersionConflictError",
+    "EventsExpiredError",
     "DatabaseError",
     
     # Constants
     "VALID_ORDER_STATUSES",
+    "DEFAULT_PAGE_SIZE",
+    "MAX_PAGE_SIZE",
 ]
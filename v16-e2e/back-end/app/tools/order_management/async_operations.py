@@ -0,0 +1,510 @@
+"""
+Async CRUD operations for order management system.
+
+The same functions as operations.py, with the same arguments, results
+and exceptions, as coroutines on SQLAlchemy's asyncio extension with
+aiosqlite. SQLite calls run on aiosqlite's connection threads, so
+awaiting them never blocks the event loop.
+
+The read statements, search and pagination are shared with
+operations.py. Writes are single Core statements with ``RETURNING``
+instead of ORM add/commit/refresh, so each write is one round trip to the
+connection thread. Lookups go through the same order cache, and writes
+bump the cache version and invalidate it like the sync writes. The
+summary queries of summaries.py are here too.
+
+Usage:
+    from app.tools.order_management import async_operations as orders
+
+    order = await orders.create_order("John Doe", "123 Main St", "SKU-001", 2, 99.99)
+    page = await orders.get_orders_page(limit=20)
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from .cache import BUMP_VERSION, customer_key, get_cache_async, invalidate, order_key
+from .database import get_async_db_connection, search_index_available_async
+from .exceptions import DatabaseError, OrderNotFoundError
+from .models import ORDER_COLUMNS, row_to_dict
+from .operations import (
+    LISTING_KEYS,
+    LISTING_ORDER,
+    SELECT_ORDER_BY_ID,
+    SELECT_ORDERS,
+    SELECT_ORDERS_BY_CUSTOMER,
+    _search_statement,
+    orders_table,
+    status_update_statement,
+    unmatched_status_update,
+)
+from .pagination import page_size, page_statement, split_page
+from .status_updates import apply_status_updates, invalidate_status_updates, prepare_status_updates
+from .summaries import (
+    customer_summary_result,
+    customer_summary_statement,
+    daily_totals_result,
+    daily_totals_statement,
+    status_totals_result,
+    status_totals_statement,
+    top_skus_result,
+    top_skus_statement,
+)
+from .validations import normalize_new_order, validate_order_status
+
+
+async def create_order(
+    customer_name: str,
+    billing_address: str,
+    product_sku: str,
+    quantity: int,
+    order_amount: float,
+    remarks: Optional[str] = None,
+    order_status: str = "PENDING",
+    order_date: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """
+    Create a new order.
+
+    Args:
+        customer_name: Name of the customer
+        billing_address: Billing address
+        product_sku: Product SKU/code
+        quantity: Quantity ordered
+        order_amount: Total order amount
+        remarks: Additional remarks (optional)
+        order_status: Order status (default: PENDING)
+        order_date: Order date or ISO format string (default: current timestamp)
+
+    Returns:
+        dict: Created order data
+
+    Raises:
+        ValidationError: If validation fails
+        DatabaseError: If database operation fails
+    """
+    values = normalize_new_order({
+        "customer_name": customer_name,
+        "billing_address": billing_address,
+        "product_sku": product_sku,
+        "quantity": quantity,
+        "order_amount": order_amount,
+        "remarks": remarks,
+        "order_status": order_status,
+        "order_date": order_date
+    })
+
+    try:
+        async with get_async_db_connection() as conn:
+            row = (await conn.execute(insert(orders_table).values(**values).returning(*ORDER_COLUMNS))).one()
+            version = (await conn.execute(BUMP_VERSION)).scalar()
+            await conn.commit()
+
+        invalidate(customer_names=[values["customer_name"]], version=version)
+        return row_to_dict(row)
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to create order: {str(e)}")
+
+
+async def get_order_by_id(order_id: int) -> Dict[str, Any]:
+    """
+    Get order details by order ID.
+
+    Args:
+        order_id: Order ID to retrieve
+
+    Returns:
+        dict: Order data
+
+    Raises:
+        OrderNotFoundError: If order is not found
+        DatabaseError: If database operation fails
+    """
+    try:
+        cache = await get_cache_async()
+        if cache is not None:
+            key = order_key(order_id)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            generation = cache.generation
+
+        async with get_async_db_connection() as conn:
+            row = (await conn.execute(SELECT_ORDER_BY_ID, {"order_id": order_id})).first()
+
+        if row is None:
+            raise OrderNotFoundError(f"Order with ID {order_id} not found")
+
+        order = row_to_dict(row)
+        if cache is not None:
+            cache.put(key, order, generation)
+        return order
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve order: {str(e)}")
+
+
+async def get_orders_by_customer(customer_name: str) -> List[Dict[str, Any]]:
+    """
+    Get all orders for a specific customer.
+
+    Args:
+        customer_name: Name of the customer
+
+    Returns:
+        list: List of order dictionaries
+
+    Raises:
+        DatabaseError: If database operation fails
+    """
+    try:
+        cache = await get_cache_async()
+        if cache is not None:
+            key = customer_key(customer_name)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            generation = cache.generation
+
+        async with get_async_db_connection() as conn:
+            rows = (await conn.execute(
+                SELECT_ORDERS_BY_CUSTOMER.order_by(*LISTING_ORDER),
+                {"customer_name": customer_name}
+            )).all()
+
+        orders = [row_to_dict(row) for row in rows]
+        if cache is not None:
+            cache.put(key, orders, generation)
+        return orders
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve orders: {str(e)}")
+
+
+async def get_orders_by_customer_page(
+    customer_name: str,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get one page of a customer's orders, newest first.
+
+    Args:
+        customer_name: Name of the customer
+        limit: Page size (default 20, at most 100)
+        cursor: next_cursor of the previous page, or None for the first page
+
+    Returns:
+        dict: "orders" (list of order dictionaries) and "next_cursor"
+        (None on the last page)
+
+    Raises:
+        ValidationError: If the cursor is invalid
+        DatabaseError: If database operation fails
+    """
+    try:
+        statement = SELECT_ORDERS.where(orders_table.c.customer_name == customer_name)
+        return await _page(statement, LISTING_KEYS, limit, cursor)
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve orders: {str(e)}")
+
+
+async def search_orders(
+    product_sku: Optional[str] = None,
+    billing_address: Optional[str] = None,
+    order_status: Optional[str] = None
+) -> List[Dict[str, Any]]:
+    """
+    Search orders by product SKU, billing address, or order status.
+
+    Same matching and order as operations.search_orders.
+
+    Args:
+        product_sku: Product SKU to search (partial match, case-insensitive)
+        billing_address: Billing address to search (partial match, case-insensitive)
+        order_status: Order status to filter by (exact match, case-insensitive)
+
+    Returns:
+        list: List of matching order dictionaries
+
+    Raises:
+        ValidationError: If validation fails
+        DatabaseError: If database operation fails
+    """
+    if order_status:
+        validate_order_status(order_status)
+
+    try:
+        statement, keys = await _search(product_sku, billing_address, order_status)
+        async with get_async_db_connection() as conn:
+            rows = (await conn.execute(statement.order_by(*(key.order_by() for key in keys)))).all()
+
+        return [row_to_dict(row) for row in rows]
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to search orders: {str(e)}")
+
+
+async def search_orders_page(
+    product_sku: Optional[str] = None,
+    billing_address: Optional[str] = None,
+    order_status: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get one page of search_orders results, in the same order.
+
+    Args:
+        product_sku: Product SKU to search (partial match, case-insensitive)
+        billing_address: Billing address to search (partial match, case-insensitive)
+        order_status: Order status to filter by (exact match, case-insensitive)
+        limit: Page size (default 20, at most 100)
+        cursor: next_cursor of the previous page (with the same criteria),
+            or None for the first page
+
+    Returns:
+        dict: "orders" (list of order dictionaries) and "next_cursor"
+        (None on the last page)
+
+    Raises:
+        ValidationError: If validation fails or the cursor is invalid
+        DatabaseError: If database operation fails
+    """
+    if order_status:
+        validate_order_status(order_status)
+
+    try:
+        statement, keys = await _search(product_sku, billing_address, order_status)
+        return await _page(statement, keys, limit, cursor)
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to search orders: {str(e)}")
+
+
+async def _search(product_sku, billing_address, order_status):
+    """Build the search statement (checking for the FTS5 index without blocking)."""
+    await search_index_available_async()
+    return _search_statement(product_sku, billing_address, order_status)
+
+
+async def _page(statement, keys, limit, cursor) -> Dict[str, Any]:
+    """Fetch one page of a read statement as order dictionaries."""
+    size = page_size(limit)
+    statement = page_statement(statement, keys, size, cursor)
+    async with get_async_db_connection() as conn:
+        rows = (await conn.execute(statement)).all()
+    rows, next_cursor = split_page(rows, keys, size)
+    return {
+        "orders": [row_to_dict(row) for row in rows],
+        "next_cursor": next_cursor
+    }
+
+
+async def update_order_status(order_id: int, new_status: str, expected_version: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Update the status of an order.
+
+    Args:
+        order_id: Order ID to update
+        new_status: New order status
+        expected_version: Only update if the order is still at this
+            version (optional; the version is in every order dictionary)
+
+    Returns:
+        dict: Updated order data (with the incremented version), or the
+        order unchanged if it already has the new status
+
+    Raises:
+        ValidationError: If validation fails
+        OrderNotFoundError: If order is not found
+        VersionConflictError: If the order is no longer at expected_version
+        DatabaseError: If database operation fails
+    """
+    validate_order_status(new_status)
+
+    statement = status_update_statement(order_id, new_status, expected_version)
+    try:
+        async with get_async_db_connection() as conn:
+            row = (await conn.execute(statement)).first()
+            if row is None:
+                current = (await conn.execute(SELECT_ORDER_BY_ID, {"order_id": order_id})).first()
+                await conn.rollback()
+                return unmatched_status_update(order_id, current, new_status, expected_version)
+            version = (await conn.execute(BUMP_VERSION)).scalar()
+            await conn.commit()
+
+        order = row_to_dict(row)
+        invalidate(order_ids=[order_id], customer_names=[order["customer_name"]], version=version)
+        return order
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to update order status: {str(e)}")
+
+
+async def update_order_status_bulk(
+    new_status: str,
+    order_ids=None,
+    expected_versions=None,
+    current_status: Optional[str] = None,
+    customer_name: Optional[str] = None,
+    start_date=None,
+    end_date=None
+) -> Dict[str, Any]:
+    """
+    Set the status of many orders in one transaction.
+
+    Same arguments and report as status_updates.update_order_status_bulk.
+
+    Raises:
+        ValidationError: If validation fails or neither IDs nor a filter
+            are given
+        DatabaseError: If database operation fails
+    """
+    request = prepare_status_updates(
+        new_status, order_ids, expected_versions, current_status, customer_name, start_date, end_date
+    )
+    try:
+        async with get_async_db_connection() as conn:
+            report, customers, version = await conn.run_sync(apply_status_updates, request)
+            await conn.commit()
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to update order statuses: {str(e)}")
+
+    invalidate_status_updates(report, customers, version)
+    return report
+
+
+async def get_all_orders(limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Get all orders.
+
+    Args:
+        limit: Optional limit on number of orders to return
+
+    Returns:
+        list: List of all order dictionaries
+
+    Raises:
+        DatabaseError: If database operation fails
+    """
+    try:
+        statement = SELECT_ORDERS.order_by(*LISTING_ORDER)
+
+        if limit:
+            statement = statement.limit(limit)
+
+        async with get_async_db_connection() as conn:
+            rows = (await conn.execute(statement)).all()
+
+        return [row_to_dict(row) for row in rows]
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve orders: {str(e)}")
+
+
+async def get_orders_page(limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get one page of all orders, newest first.
+
+    Args:
+        limit: Page size (default 20, at most 100)
+        cursor: next_cursor of the previous page, or None for the first page
+
+    Returns:
+        dict: "orders" (list of order dictionaries) and "next_cursor"
+        (None on the last page)
+
+    Raises:
+        ValidationError: If the cursor is invalid
+        DatabaseError: If database operation fails
+    """
+    try:
+        return await _page(SELECT_ORDERS, LISTING_KEYS, limit, cursor)
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve orders: {str(e)}")
+
+
+async def get_status_totals(start_date=None, end_date=None) -> Dict[str, Any]:
+    """
+    Get order totals per status over a range of order days.
+
+    Same result as summaries.get_status_totals.
+
+    Raises:
+        ValidationError: If a date is invalid
+        DatabaseError: If database operation fails
+    """
+    statement = status_totals_statement(start_date, end_date)
+    try:
+        async with get_async_db_connection() as conn:
+            rows = (await conn.execute(statement)).all()
+        return status_totals_result(rows, start_date, end_date)
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve order totals: {str(e)}")
+
+
+async def get_daily_totals(start_date=None, end_date=None, order_status: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Get order totals per order day, optionally for one status.
+
+    Same result as summaries.get_daily_totals.
+
+    Raises:
+        ValidationError: If a date or the status is invalid
+        DatabaseError: If database operation fails
+    """
+    if order_status:
+        validate_order_status(order_status)
+    statement = daily_totals_statement(start_date, end_date, order_status)
+    try:
+        async with get_async_db_connection() as conn:
+            rows = (await conn.execute(statement)).all()
+        return daily_totals_result(rows)
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve order totals: {str(e)}")
+
+
+async def get_top_skus(customer_name: Optional[str] = None, limit: Optional[int] = 10, rank_by: str = "amount") -> List[Dict[str, Any]]:
+    """
+    Get the best-selling product SKUs, overall or for one customer.
+
+    Same result as summaries.get_top_skus.
+
+    Raises:
+        ValidationError: If rank_by is invalid
+        DatabaseError: If database operation fails
+    """
+    statement = top_skus_statement(customer_name, limit, rank_by)
+    try:
+        async with get_async_db_connection() as conn:
+            rows = (await conn.execute(statement)).all()
+        return top_skus_result(rows)
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve top SKUs: {str(e)}")
+
+
+async def get_customer_summary(customer_name: str) -> Dict[str, Any]:
+    """
+    Get a customer's order totals.
+
+    Same result as summaries.get_customer_summary.
+
+    Raises:
+        DatabaseError: If database operation fails
+    """
+    try:
+        async with get_async_db_connection() as conn:
+            row = (await conn.execute(customer_summary_statement(customer_name))).first()
+        return customer_summary_result(customer_name, row)
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve customer summary: {str(e)}")
@@ -0,0 +1,205 @@
+"""
+Bulk order ingestion for order management system.
+
+``create_orders_bulk`` imports any number of orders with bounded memory
+and one transaction per chunk instead of one per order:
+
+1. The input iterable is consumed ``chunk_size`` orders at a time, so a
+   generator reading a large file is never held in memory at once.
+2. Each chunk is validated with the same rules as ``create_order``;
+   invalid orders are reported and skipped.
+3. The valid orders of the chunk are inserted with a single
+   ``executemany`` in one transaction. If that fails, the chunk is
+   retried one order per transaction so the failing orders can be
+   reported individually.
+
+``read_orders_file`` streams orders from CSV or JSON Lines files.
+"""
+import csv
+import json
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from .cache import bump_version, invalidate
+from .database import get_db_transaction
+from .exceptions import ValidationError
+from .models import Order
+from .validations import normalize_new_order
+
+# Orders validated and inserted per transaction
+DEFAULT_CHUNK_SIZE = 1000
+
+# Per-row errors kept in the report (the counts are always exact)
+MAX_REPORTED_ERRORS = 1000
+
+# Fields an imported order may set
+ORDER_INPUT_FIELDS = (
+    "customer_name",
+    "billing_address",
+    "product_sku",
+    "quantity",
+    "order_amount",
+    "remarks",
+    "order_status",
+    "order_date",
+)
+
+
+def create_orders_bulk(
+    orders: Iterable[Dict[str, Any]],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    return_ids: bool = False,
+    max_errors: int = MAX_REPORTED_ERRORS
+) -> Dict[str, Any]:
+    """
+    Create many orders, a chunk per transaction.
+
+    Args:
+        orders: Order dictionaries with create_order's fields (other keys
+            are ignored); consumed lazily
+        chunk_size: Orders validated and inserted per transaction
+        return_ids: Include the created order IDs in the report (keep off
+            for large imports)
+        max_errors: Per-row errors to keep in the report
+
+    Returns:
+        dict: Report with "total", "created", "failed", "errors" (list of
+        {"row": 1-based input position, "error": message}),
+        "errors_truncated" and, with return_ids, "order_ids"
+    """
+    report: Dict[str, Any] = {"total": 0, "created": 0, "failed": 0, "errors": [], "errors_truncated": False}
+    if return_ids:
+        report["order_ids"] = []
+
+    def fail(row: int, message: str):
+        report["failed"] += 1
+        if len(report["errors"]) < max_errors:
+            report["errors"].append({"row": row, "error": message})
+        else:
+            report["errors_truncated"] = True
+
+    rows = enumerate(orders, start=1)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        report["total"] += len(chunk)
+
+        valid: List[Tuple[int, Dict[str, Any]]] = []
+        for row, data in chunk:
+            try:
+                valid.append((row, prepare_order(data)))
+            except ValidationError as e:
+                fail(row, str(e))
+        if not valid:
+            continue
+
+        try:
+            order_ids = _insert([values for _, values in valid], return_ids)
+        except SQLAlchemyError:
+            # Find the offending orders: retry one transaction per order
+            order_ids = []
+            for row, values in valid:
+                try:
+                    order_ids.extend(_insert([values], return_ids))
+                except SQLAlchemyError as e:
+                    fail(row, f"Database error: {e.orig if getattr(e, 'orig', None) else e}")
+                    continue
+                report["created"] += 1
+        else:
+            report["created"] += len(valid)
+
+        if return_ids:
+            report["order_ids"].extend(order_ids)
+
+    return report
+
+
+def prepare_order(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Validate one order for insertion, applying create_order's defaults.
+
+    Args:
+        data: Order dictionary
+
+    Returns:
+        dict: Column values for the orders table
+
+    Raises:
+        ValidationError: If the order is invalid
+    """
+    if not isinstance(data, dict):
+        # read_orders_file yields the parse error for unreadable lines
+        raise ValidationError(data if isinstance(data, str) else "order must be an object")
+
+    return normalize_new_order({field: data.get(field) for field in ORDER_INPUT_FIELDS})
+
+
+def _insert(values: List[Dict[str, Any]], return_ids: bool) -> List[int]:
+    """Insert rows in one transaction (executemany); return their IDs if asked."""
+    statement = insert(Order.__table__)
+    order_ids = []
+    with get_db_transaction() as conn:
+        if return_ids:
+            order_ids = list(conn.execute(statement.returning(Order.__table__.c.order_id), values).scalars())
+        else:
+            conn.execute(statement, values)
+        version = bump_version(conn)
+    invalidate(customer_names={row["customer_name"] for row in values}, version=version)
+    return order_ids
+
+
+def read_orders_file(path, file_format: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Stream orders from a CSV or JSON Lines file.
+
+    CSV files need a header row naming the order fields. Empty CSV cells
+    become None, and quantity/order_amount are converted to numbers
+    (left as text if they are not numbers, so validation reports them).
+    A JSONL line that is not valid JSON yields a string in its place,
+    which create_orders_bulk reports as an error for that row.
+
+    Args:
+        path: File path
+        file_format: "csv" or "jsonl"; inferred from the extension if None
+
+    Yields:
+        dict: One order per row or line
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    path = Path(path)
+    file_format = (file_format or path.suffix.lstrip(".")).lower()
+    if file_format == "ndjson":
+        file_format = "jsonl"
+    if file_format not in ("csv", "jsonl"):
+        raise ValueError(f"Unsupported import format: {file_format} (expected csv or jsonl)")
+
+    with path.open(newline="", encoding="utf-8") as f:
+        if file_format == "csv":
+            for record in csv.DictReader(f):
+                yield _coerce_csv_record(record)
+        else:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    yield f"invalid JSON: {e}"
+
+
+def _coerce_csv_record(record: Dict[str, str]) -> Dict[str, Any]:
+    values: Dict[str, Any] = {key: (value if value != "" else None) for key, value in record.items()}
+    for field, convert in (("quantity", int), ("order_amount", float)):
+        if values.get(field) is not None:
+            try:
+                values[field] = convert(values[field])
+            except ValueError:
+                pass
+    return values
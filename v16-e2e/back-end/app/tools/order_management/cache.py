@@ -0,0 +1,350 @@
+"""
+Read-through cache for order lookups.
+
+``get_order_by_id`` and ``get_orders_by_customer`` results are kept in an
+in-process LRU cache with a time-to-live, keyed by order ID and by
+customer name. Writes invalidate exactly the entries they change:
+``create_order`` and ``create_orders_bulk`` the customers' listings,
+``update_order_status`` the order and its customer's listing.
+
+Cache modes:
+- ``off``: every lookup reads the database.
+- ``local``: one process writes the database; its own writes keep the
+  cache exact, and the TTL bounds staleness from anything else.
+- ``shared``: several processes write the database. Every write
+  transaction increments the version counter in ``order_cache_version``;
+  a lookup first reads the counter (one primary-key read) and drops the
+  whole cache when another process has written since.
+
+A lookup that misses records the cache's generation before reading the
+database, and its result is only stored if nothing was invalidated in
+between, so a read racing a write can never cache the old row.
+"""
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterable, Optional
+
+from sqlalchemy import insert, select, update
+
+from .database import get_async_db_connection, get_db_connection
+from .models import CacheVersion
+
+CACHE_MODES = ("off", "local", "shared")
+
+# Single row of the version counter
+_VERSION_ID = 1
+SELECT_VERSION = select(CacheVersion.version).where(CacheVersion.id == _VERSION_ID)
+BUMP_VERSION = (
+    update(CacheVersion)
+    .where(CacheVersion.id == _VERSION_ID)
+    .values(version=CacheVersion.version + 1)
+    .returning(CacheVersion.version)
+    .execution_options(synchronize_session=False)
+)
+
+
+class OrderCache:
+    """
+    Thread-safe LRU cache with a per-entry time-to-live.
+
+    Values are order dictionaries or lists of them; they are copied on the
+    way in and out, so callers may modify what they get.
+
+    Args:
+        max_entries: Entries kept before the least recently used is evicted
+        max_bytes: Estimated memory kept before evicting
+        ttl_seconds: How long an entry is served after it was stored
+        clock: Monotonic time source (seconds)
+    """
+
+    def __init__(self, max_entries: int = 1024, max_bytes: int = 32 * 1024 * 1024,
+                 ttl_seconds: float = 30.0, clock=time.monotonic):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (expires_at, value, estimated bytes)
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._bytes = 0
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @property
+    def generation(self) -> int:
+        """Number of invalidations so far; pass it to put()."""
+        return self._generation
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Get a copy of a cached value.
+
+        Returns:
+            The value, or None on a miss or an expired entry
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return _copy(value)
+
+    def put(self, key: Hashable, value: Any, generation: int) -> bool:
+        """
+        Store a value read from the database.
+
+        Args:
+            key: Cache key
+            value: Order dictionary or list of them
+            generation: ``generation`` read before the database read; the
+                value is dropped if an invalidation happened since
+
+        Returns:
+            bool: Whether the value was stored
+        """
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return False
+        value = _copy(value)
+        with self._lock:
+            if generation != self._generation:
+                return False
+            self._remove(key)
+            self._entries[key] = (self._clock() + self.ttl_seconds, value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+        return True
+
+    def invalidate(self, keys: Iterable[Hashable]) -> None:
+        """Drop the given keys and fail puts of reads already in flight."""
+        with self._lock:
+            self._generation += 1
+            self.invalidations += 1
+            for key in keys:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get counters and sizes.
+
+        Returns:
+            dict: entries, memory_bytes (estimated), hits, misses,
+            hit_ratio, evictions, expirations, invalidations and limits
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "memory_bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+
+def _copy(value: Any) -> Any:
+    if isinstance(value, list):
+        return [dict(item) for item in value]
+    return dict(value)
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate memory of an order dict or list (keys are shared, not counted)."""
+    if isinstance(value, list):
+        return sys.getsizeof(value) + sum(_estimate_size(item) for item in value)
+    return sys.getsizeof(value) + sum(sys.getsizeof(item) for item in value.values())
+
+
+# Current cache (None when off), its mode, and the version counter value
+# the cache contents are known to be current for (shared mode)
+_mode = os.getenv("ORDER_CACHE_MODE", "off")
+_cache: Optional[OrderCache] = OrderCache() if _mode != "off" else None
+_seen_version: Optional[int] = None
+_version_lock = threading.Lock()
+
+
+def configure_cache(
+    mode: str = "local",
+    max_entries: int = 1024,
+    max_mb: int = 32,
+    ttl_seconds: float = 30.0
+):
+    """
+    Set the cache mode and size, dropping anything cached.
+
+    Args:
+        mode: "off", "local" or "shared" (several processes write the
+            database)
+        max_entries: Cached lookups kept
+        max_mb: Estimated memory kept
+        ttl_seconds: How long a cached lookup is served
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    global _mode, _cache, _seen_version
+    if mode not in CACHE_MODES:
+        raise ValueError(f"Unknown cache mode: {mode}")
+    _mode = mode
+    _cache = OrderCache(max_entries, max_mb * 1024 * 1024, ttl_seconds) if mode != "off" else None
+    _seen_version = None
+
+
+def get_cache() -> Optional[OrderCache]:
+    """
+    Get the cache to use for a lookup.
+
+    In shared mode this reads the database's version counter and clears
+    the cache if another process has written since it was filled.
+
+    Returns:
+        OrderCache, or None when caching is off
+    """
+    cache = _cache
+    if cache is None or _mode != "shared":
+        return cache
+    with get_db_connection() as conn:
+        version = conn.execute(SELECT_VERSION).scalar()
+    _sync_version(cache, version)
+    return cache
+
+
+async def get_cache_async() -> Optional[OrderCache]:
+    """get_cache() for the async operations (reads the version counter without blocking)."""
+    cache = _cache
+    if cache is None or _mode != "shared":
+        return cache
+    async with get_async_db_connection() as conn:
+        version = (await conn.execute(SELECT_VERSION)).scalar()
+    _sync_version(cache, version)
+    return cache
+
+
+def _sync_version(cache: OrderCache, version: Optional[int]) -> None:
+    """Clear the cache if the version counter moved since it was filled."""
+    global _seen_version
+    with _version_lock:
+        if version != _seen_version:
+            cache.clear()
+            _seen_version = version
+
+
+def bump_version(conn) -> Optional[int]:
+    """
+    Increment the version counter inside a write transaction.
+
+    Called by every write whatever the mode, so processes running in
+    shared mode see writes from processes that don't cache.
+
+    Args:
+        conn: Connection or Session of the write transaction
+
+    Returns:
+        int: New version (None if init_db has not created the counter)
+    """
+    return conn.execute(BUMP_VERSION).scalar()
+
+
+def invalidate(order_ids: Iterable[Any] = (), customer_names: Iterable[str] = (), version: Optional[int] = None):
+    """
+    Drop the cached lookups a committed write changed.
+
+    Args:
+        order_ids: IDs of changed orders
+        customer_names: Customers whose order lists changed
+        version: Version the write's bump_version returned
+    """
+    global _seen_version
+    cache = _cache
+    if cache is None:
+        return
+    keys = [order_key(order_id) for order_id in order_ids]
+    keys.extend(customer_key(name) for name in customer_names)
+    cache.invalidate(keys)
+    if _mode == "shared" and version is not None:
+        with _version_lock:
+            # Only this write happened since the cache was last current
+            if _seen_version is not None and version == _seen_version + 1:
+                _seen_version = version
+
+
+def create_version_counter(engine) -> None:
+    """Create the version counter's row if missing (called by init_db)."""
+    with engine.begin() as conn:
+        conn.execute(
+            insert(CacheVersion).prefix_with("OR IGNORE").values(id=_VERSION_ID, version=0)
+        )
+
+
+def order_key(order_id: Any) -> tuple:
+    """Cache key of a get_order_by_id lookup."""
+    try:
+        order_id = int(order_id)
+    except (TypeError, ValueError):
+        pass
+    return ("order", order_id)
+
+
+def customer_key(customer_name: str) -> tuple:
+    """Cache key of a get_orders_by_customer lookup."""
+    return ("customer", customer_name)
+
+
+def get_cache_mode() -> str:
+    """Get the current cache mode."""
+    return _mode
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    Get the cache's hit ratio, memory use and counters.
+
+    Returns:
+        dict: "mode" plus OrderCache.stats() (just the mode when off)
+    """
+    cache = _cache
+    if cache is None:
+        return {"mode": _mode}
+    return {"mode": _mode, **cache.stats()}
+
+
+def clear_cache() -> None:
+    """Drop everything cached (e.g. after switching databases)."""
+    global _seen_version
+    if _cache is not None:
+        _cache.clear()
+    _seen_version = None
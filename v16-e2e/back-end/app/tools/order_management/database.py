@@ -1,11 +1,31 @@
 """
 Database configuration and session management for order management system.
+
+Storage profiles:
+- ``default``: SQLite's defaults (rollback journal, full fsync per commit)
+  and SQLAlchemy's default pool.
+- ``performance``: every connection is opened in WAL mode with
+  ``synchronous=NORMAL``, memory-mapped reads, a larger page cache, a busy
+  timeout and in-memory temp storage, from a pool sized for concurrent
+  threads. Readers no longer block behind a writer and commits no longer
+  fsync the database file; a power loss can roll back the last
+  transactions but cannot corrupt the database.
+
+The async operations (async_operations.py) use a second engine on the
+same database file through aiosqlite, with the same storage profile.
 """
 import os
 from pathlib import Path
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, declarative_base
 
+try:
+    # The asyncio extension also needs greenlet
+    import aiosqlite
+    import greenlet  # noqa: F401
+except ImportError:  # pragma: no cover
+    aiosqlite = None
+
 # Get database path from environment or use default
 # This will be overridden by the application settings
 DATABASE_PATH = os.getenv('ORDER_DB_PATH', './data/orders.db')
@@ -18,6 +38,24 @@ engine = None
 SessionLocal = None
 Base = declarative_base()
 
+# asyncio engine (aiosqlite), created on first async use
+async_engine = None
+
+# Whether the current database has the FTS5 search index (None: not checked yet)
+_search_index = None
+
+# Storage profile applied when the engine is created
+STORAGE_PROFILES = ("default", "performance")
+# Same default as Settings.ORDER_DB_PROFILE, so library use matches the server
+DEFAULT_STORAGE_PROFILE = "default"
+_storage = {
+    "profile": os.getenv('ORDER_DB_PROFILE', DEFAULT_STORAGE_PROFILE),
+    "mmap_size_mb": 256,
+    "cache_size_mb": 64,
+    "busy_timeout_ms": 5000,
+    "pool_size": 8,
+}
+
 
 def _get_engine():
     """Get or create SQLAlchemy engine"""
@@ -27,14 +65,81 @@ def _get_engine():
         db_path = Path(DATABASE_PATH)
         db_path.parent.mkdir(parents=True, exist_ok=True)
         
+        options = {}
+        if _storage["profile"] == "performance":
+            # One connection per concurrently active thread; WAL lets them read in parallel
+            options = {"pool_size": _storage["pool_size"], "max_overflow": _storage["pool_size"]}
+
         engine = create_engine(
             DATABASE_URL,
             echo=False,  # Set to True for SQL query logging
-            connect_args={"check_same_thread": False}  # Needed for SQLite
+            connect_args={"check_same_thread": False},  # Needed for SQLite
+            **options
         )
+        if _storage["profile"] == "performance":
+            event.listen(engine, "connect", _apply_pragmas)
     return engine
 
 
+def _get_async_engine():
+    """Get or create the asyncio engine (same database and storage profile)"""
+    global async_engine
+    if async_engine is None:
+        if aiosqlite is None:
+            raise RuntimeError("Async order operations need the aiosqlite package")
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        Path(DATABASE_PATH).parent.mkdir(parents=True, exist_ok=True)
+        options = {}
+        if _storage["profile"] == "performance":
+            options = {"pool_size": _storage["pool_size"], "max_overflow": _storage["pool_size"]}
+
+        async_engine = create_async_engine(f"sqlite+aiosqlite:///{DATABASE_PATH}", echo=False, **options)
+        if _storage["profile"] == "performance":
+            event.listen(async_engine.sync_engine, "connect", _apply_pragmas)
+    return async_engine
+
+
+def async_database_available():
+    """
+    Check whether the async operations can run (aiosqlite is installed).
+    
+    Returns:
+        bool: True if aiosqlite and greenlet are importable
+    """
+    return aiosqlite is not None
+
+
+def get_storage_pragmas():
+    """
+    Get the PRAGMAs run on each new connection under the current profile.
+    
+    Returns:
+        list: (name, value) pairs, empty for the default profile
+    """
+    if _storage["profile"] != "performance":
+        return []
+    return [
+        ("journal_mode", "WAL"),
+        ("synchronous", "NORMAL"),
+        ("busy_timeout", _storage["busy_timeout_ms"]),
+        ("mmap_size", _storage["mmap_size_mb"] * 1024 * 1024),
+        # Negative cache_size is in KiB
+        ("cache_size", -_storage["cache_size_mb"] * 1024),
+        ("temp_store", "MEMORY"),
+    ]
+
+
+def _apply_pragmas(dbapi_connection, connection_record):
+    """Apply the storage profile's PRAGMAs to a new DBAPI connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for name, value in get_storage_pragmas():
+            cursor.execute(f"PRAGMA {name}={value}")
+    finally:
+        cursor.close()
+
+
 def _get_session_local():
     """Get or create session factory"""
     global SessionLocal
@@ -45,10 +150,56 @@ def _get_session_local():
 
 def init_db():
     """
-    Initialize the database by creating all tables.
+    Initialize the database by creating all tables, the cache version
+    counter, the search index, the summary triggers and the change feed
+    triggers.
     Should be called once when setting up the library.
     """
+    global _search_index
+    from .cache import create_version_counter
+    from .events import create_event_feed
+    from .search import create_search_index
+    from .summaries import create_summaries
+
     Base.metadata.create_all(bind=_get_engine())
+    _add_version_column(_get_engine())
+    create_version_counter(_get_engine())
+    _search_index = create_search_index(_get_engine())
+    create_summaries(_get_engine())
+    create_event_feed(_get_engine())
+
+
+def _add_version_column(engine):
+    """Add orders.version to databases created before it (create_all only adds tables)."""
+    with engine.begin() as conn:
+        columns = {row[1] for row in conn.execute(text("PRAGMA table_info(orders)"))}
+        if "version" not in columns:
+            conn.execute(text("ALTER TABLE orders ADD COLUMN version INTEGER NOT NULL DEFAULT 1"))
+
+
+def search_index_available():
+    """
+    Check whether substring search can use the FTS5 index.
+    
+    Returns:
+        bool: True if the database has the ``orders_fts`` table
+    """
+    global _search_index
+    if _search_index is None:
+        from .search import has_search_index
+        with _get_engine().connect() as conn:
+            _search_index = has_search_index(conn)
+    return _search_index
+
+
+async def search_index_available_async():
+    """search_index_available() for the async operations (checks through aiosqlite)."""
+    global _search_index
+    if _search_index is None:
+        from .search import has_search_index
+        async with _get_async_engine().connect() as conn:
+            _search_index = await conn.run_sync(has_search_index)
+    return _search_index
 
 
 def get_db_session():
@@ -69,6 +220,56 @@ def get_db_session():
     return _get_session_local()()
 
 
+def get_db_connection():
+    """
+    Get a Core connection for read queries.
+    
+    Reads through a connection skip the ORM session, identity map and
+    per-row object construction.
+    
+    Returns:
+        Connection: SQLAlchemy connection (use as a context manager)
+        
+    Usage:
+        with get_db_connection() as conn:
+            rows = conn.execute(statement).all()
+    """
+    return _get_engine().connect()
+
+
+def get_db_transaction():
+    """
+    Get a Core connection in a transaction for writes.
+    
+    The transaction commits when the block exits normally and rolls back
+    if it raises.
+    
+    Returns:
+        Connection: SQLAlchemy connection with a transaction begun (use
+        as a context manager)
+        
+    Usage:
+        with get_db_transaction() as conn:
+            conn.execute(statement, rows)
+    """
+    return _get_engine().begin()
+
+
+def get_async_db_connection():
+    """
+    Get an asyncio Core connection (aiosqlite).
+    
+    Returns:
+        AsyncConnection: SQLAlchemy async connection (use as an async
+        context manager)
+        
+    Usage:
+        async with get_async_db_connection() as conn:
+            rows = (await conn.execute(statement)).all()
+    """
+    return _get_async_engine().connect()
+
+
 def get_database_path():
     """
     Get the current database path.
@@ -86,9 +287,89 @@ def set_database_path(path: str):
     Args:
         path: Path to the SQLite database file
     """
-    global DATABASE_PATH, DATABASE_URL, engine, SessionLocal
+    global DATABASE_PATH, DATABASE_URL, engine, SessionLocal, _search_index
+    from .cache import clear_cache
+
     DATABASE_PATH = path
     DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
     # Reset engine and session to force recreation with new path
     engine = None
     SessionLocal = None
+    _drop_async_engine()
+    _search_index = None
+    clear_cache()
+
+
+def configure_storage(
+    profile: str = DEFAULT_STORAGE_PROFILE,
+    mmap_size_mb: int = 256,
+    cache_size_mb: int = 64,
+    busy_timeout_ms: int = 5000,
+    pool_size: int = 8
+):
+    """
+    Set the storage profile (must be called before init_db).
+    
+    Args:
+        profile: "default" or "performance"
+        mmap_size_mb: Memory-mapped I/O size per connection
+        cache_size_mb: Page cache size per connection
+        busy_timeout_ms: How long a writer waits for the lock before failing
+        pool_size: Pooled connections (as many again may overflow)
+        
+    Raises:
+        ValueError: If the profile is unknown
+    """
+    global engine, SessionLocal
+    if profile not in STORAGE_PROFILES:
+        raise ValueError(f"Unknown storage profile: {profile}")
+    _storage.update(
+        profile=profile,
+        mmap_size_mb=mmap_size_mb,
+        cache_size_mb=cache_size_mb,
+        busy_timeout_ms=busy_timeout_ms,
+        pool_size=pool_size
+    )
+    # Reset engine and session to force recreation with the new profile
+    if engine is not None:
+        engine.dispose()
+    engine = None
+    SessionLocal = None
+    _drop_async_engine()
+
+
+def dispose_engine():
+    """
+    Close all pooled connections and drop the engine.
+    
+    The next session creates a new engine, so this is safe to call
+    while the library is still in use (e.g. at shutdown or in tests).
+    Idle aiosqlite connections can only be closed from the event loop;
+    use dispose_async_engine there.
+    """
+    global engine, SessionLocal
+    if engine is not None:
+        engine.dispose()
+    engine = None
+    SessionLocal = None
+    _drop_async_engine()
+
+
+async def dispose_async_engine():
+    """
+    Close all pooled aiosqlite connections and drop the asyncio engine.
+    
+    The next async operation creates a new engine.
+    """
+    global async_engine
+    current, async_engine = async_engine, None
+    if current is not None:
+        await current.dispose()
+
+
+def _drop_async_engine():
+    """Drop the asyncio engine without awaiting (its connections close when collected)."""
+    global async_engine
+    if async_engine is not None:
+        async_engine.sync_engine.dispose(close=False)
+    async_engine = None
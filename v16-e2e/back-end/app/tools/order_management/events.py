@@ -0,0 +1,450 @@
+"""
+Order change feed (transactional outbox) for order management system.
+
+Triggers on ``orders`` append an event to ``order_events`` for every
+inserted, updated or deleted order, in the same transaction as the
+change: an event exists exactly when its change committed, whichever
+write path made it (``create_order``, ``update_order_status``, the bulk
+and async operations, raw SQL).
+
+Events carry a sequence number that only grows. SQLite runs one write
+transaction at a time, so events commit in sequence order and a reader
+never sees a later event before an earlier one. Consumers read the feed
+after the last sequence number they processed:
+
+- ``read_events`` returns one batch
+- ``tail_events`` (and ``tail_events_async``) yields events as they
+  arrive, polling for new ones, and with a consumer name commits the
+  consumer's offset after each batch it has processed (at-least-once:
+  after a crash the uncommitted batch is delivered again)
+
+``compact_events`` deletes events older than a retention period. A
+consumer whose position falls behind the oldest retained event gets
+``EventsExpiredError`` and has to resynchronise from ``orders``.
+
+Event types: ``order.created``, ``order.status_changed`` (with
+``previous_status`` in the payload), ``order.updated`` (any other change)
+and ``order.deleted``.
+
+Usage:
+    for event in tail_events(consumer="analytics"):
+        handle(event)
+"""
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import delete, func, select, text
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.exc import SQLAlchemyError
+
+from .cache import invalidate
+from .database import get_async_db_connection, get_db_connection, get_db_transaction
+from .exceptions import DatabaseError, EventsExpiredError, ValidationError
+from .models import EventConsumer, OrderEvent
+
+events_table = OrderEvent.__table__
+consumers_table = EventConsumer.__table__
+
+EVENT_TYPES = ("order.created", "order.status_changed", "order.updated", "order.deleted")
+
+DEFAULT_BATCH_SIZE = 100
+MAX_BATCH_SIZE = 1000
+
+# Fields of an event's payload, taken from the changed orders row
+_PAYLOAD_FIELDS = (
+    "order_id", "customer_name", "billing_address", "product_sku", "quantity",
+    "order_amount", "remarks", "order_status", "version",
+)
+_NOW = "strftime('%Y-%m-%d %H:%M:%f', 'now')"
+
+
+def _append(event_type: str, row: str, extra: str = "") -> str:
+    """SQL appending the event of one changed orders row ("{row}" is new or old)."""
+    payload = ", ".join(f"'{field}', {row}.{field}" for field in _PAYLOAD_FIELDS)
+    payload += f", 'order_date', replace({row}.order_date, ' ', 'T'){extra}"
+    return (
+        "INSERT INTO order_events "
+        "(event_type, order_id, customer_name, order_status, version, payload, created_at) "
+        f"VALUES ({event_type}, {row}.order_id, {row}.customer_name, {row}.order_status, {row}.version, "
+        f"json_object({payload}), {_NOW});"
+    )
+
+
+def _trigger(name: str, event: str, statement: str) -> str:
+    return f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON orders BEGIN\n        {statement}\n    END"
+
+
+_TRIGGERS = (
+    _trigger("order_events_insert", "INSERT", _append("'order.created'", "new")),
+    _trigger("order_events_update", "UPDATE", _append(
+        "CASE WHEN old.order_status IS NOT new.order_status "
+        "THEN 'order.status_changed' ELSE 'order.updated' END",
+        "new", ", 'previous_status', old.order_status"
+    )),
+    _trigger("order_events_delete", "DELETE", _append("'order.deleted'", "old")),
+)
+
+SELECT_LATEST_SEQUENCE = text("SELECT seq FROM sqlite_sequence WHERE name = 'order_events'")
+SELECT_OLDEST_SEQUENCE = select(func.min(events_table.c.sequence))
+SELECT_EVENT_COUNT = select(func.count()).select_from(events_table)
+SELECT_CONSUMERS = select(consumers_table).order_by(consumers_table.c.consumer)
+
+
+def create_event_feed(engine) -> None:
+    """
+    Create the change feed triggers if missing (idempotent).
+
+    Orders that existed before the feed have no events. The tables
+    themselves are created with the other models.
+
+    Args:
+        engine: SQLAlchemy engine of the order database
+    """
+    with engine.begin() as conn:
+        for trigger in _TRIGGERS:
+            conn.execute(text(trigger))
+
+
+def events_statement(after: int, limit: int):
+    """Select the events after a sequence number, oldest first."""
+    return (
+        select(events_table)
+        .where(events_table.c.sequence > after)
+        .order_by(events_table.c.sequence)
+        .limit(limit)
+    )
+
+
+def event_to_dict(row) -> Dict[str, Any]:
+    """Convert an order_events row to an event dictionary."""
+    return {
+        "sequence": row.sequence,
+        "event_type": row.event_type,
+        "order_id": row.order_id,
+        "customer_name": row.customer_name,
+        "order_status": row.order_status,
+        "version": row.version,
+        "payload": json.loads(row.payload),
+        "created_at": row.created_at.isoformat(),
+    }
+
+
+def _validate_position(after: Any) -> int:
+    try:
+        after = int(after)
+    except (TypeError, ValueError):
+        raise ValidationError("after must be a sequence number")
+    if after < 0:
+        raise ValidationError("after must not be negative")
+    return after
+
+
+def _batch_size(limit: Optional[int]) -> int:
+    """Clamp a requested batch size to 1..MAX_BATCH_SIZE."""
+    if limit is None:
+        return DEFAULT_BATCH_SIZE
+    return max(1, min(int(limit), MAX_BATCH_SIZE))
+
+
+def check_retained(after: int, first_sequence: Optional[int], latest_sequence) -> None:
+    """
+    Raise EventsExpiredError if events after a position were compacted.
+
+    Args:
+        after: Position the events were read after
+        first_sequence: Sequence number of the first event read (None if
+            none was)
+        latest_sequence: Callable returning the last sequence number
+            ever assigned (only called when nothing was read)
+    """
+    if first_sequence is not None:
+        expired = first_sequence > after + 1
+    else:
+        expired = (latest_sequence() or 0) > after
+    if expired:
+        raise EventsExpiredError(
+            f"Order events after sequence {after} were compacted; resynchronise from the orders "
+            f"and continue from latest_event_sequence()"
+        )
+
+
+def read_events(after: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Read the events after a sequence number.
+
+    Args:
+        after: Last sequence number already processed (0 for the start)
+        limit: Maximum events to return (1-1000, default 100)
+
+    Returns:
+        list: Events, oldest first
+
+    Raises:
+        ValidationError: If after is not a sequence number
+        EventsExpiredError: If events after ``after`` were compacted
+        DatabaseError: If database operation fails
+    """
+    after = _validate_position(after)
+    try:
+        with get_db_connection() as conn:
+            rows = conn.execute(events_statement(after, _batch_size(limit))).all()
+            check_retained(after, rows[0].sequence if rows else None,
+                           lambda: conn.execute(SELECT_LATEST_SEQUENCE).scalar())
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to read order events: {str(e)}")
+    return [event_to_dict(row) for row in rows]
+
+
+async def read_events_async(after: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Async read_events (aiosqlite); same arguments, results and exceptions."""
+    after = _validate_position(after)
+    try:
+        async with get_async_db_connection() as conn:
+            rows = (await conn.execute(events_statement(after, _batch_size(limit)))).all()
+            latest = None if rows else (await conn.execute(SELECT_LATEST_SEQUENCE)).scalar()
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to read order events: {str(e)}")
+    check_retained(after, rows[0].sequence if rows else None, lambda: latest)
+    return [event_to_dict(row) for row in rows]
+
+
+def latest_event_sequence() -> int:
+    """
+    Get the sequence number of the newest event (0 if there never was one).
+
+    A consumer that only cares about changes from now on (a cache) starts
+    tailing after it.
+    """
+    try:
+        with get_db_connection() as conn:
+            return conn.execute(SELECT_LATEST_SEQUENCE).scalar() or 0
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to read order events: {str(e)}")
+
+
+def get_consumer_offset(consumer: str) -> Optional[int]:
+    """
+    Get the last sequence number a consumer committed.
+
+    Args:
+        consumer: Consumer name
+
+    Returns:
+        int: Committed position (None if the consumer never committed)
+    """
+    try:
+        with get_db_connection() as conn:
+            return conn.execute(
+                select(consumers_table.c.position).where(consumers_table.c.consumer == consumer)
+            ).scalar()
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to read consumer offset: {str(e)}")
+
+
+def commit_offset_statement(consumer: str, position: int):
+    """Upsert a consumer's position."""
+    statement = insert(consumers_table).values(
+        consumer=consumer, position=position, updated_at=datetime.utcnow()
+    )
+    return statement.on_conflict_do_update(
+        index_elements=[consumers_table.c.consumer],
+        set_={"position": statement.excluded.position, "updated_at": statement.excluded.updated_at},
+    )
+
+
+def commit_offset(consumer: str, position: int) -> None:
+    """
+    Record that a consumer processed every event up to a sequence number.
+
+    Args:
+        consumer: Consumer name
+        position: Sequence number of the last processed event
+
+    Raises:
+        ValidationError: If the consumer name is empty or the position invalid
+        DatabaseError: If database operation fails
+    """
+    if not consumer:
+        raise ValidationError("consumer name is required")
+    position = _validate_position(position)
+    try:
+        with get_db_transaction() as conn:
+            conn.execute(commit_offset_statement(consumer, position))
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to commit consumer offset: {str(e)}")
+
+
+def _start_position(consumer: Optional[str], after: Optional[int]) -> int:
+    """Where a tail starts: ``after``, else the consumer's offset, else before the oldest event."""
+    if after is not None:
+        return _validate_position(after)
+    if consumer:
+        offset = get_consumer_offset(consumer)
+        if offset is not None:
+            return offset
+    try:
+        with get_db_connection() as conn:
+            oldest = conn.execute(SELECT_OLDEST_SEQUENCE).scalar()
+            return oldest - 1 if oldest is not None else conn.execute(SELECT_LATEST_SEQUENCE).scalar() or 0
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to read order events: {str(e)}")
+
+
+def tail_events(
+    consumer: Optional[str] = None,
+    after: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    poll_interval: float = 1.0,
+    follow: bool = True
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield order events as they are committed.
+
+    Starts after ``after``; without it after the consumer's committed
+    offset, and for a new (or unnamed) consumer at the oldest retained
+    event. With a consumer name, the offset is committed once every event
+    of a batch was yielded and the caller asked for the next one.
+
+    Args:
+        consumer: Consumer name whose offset is read and committed (optional)
+        after: Sequence number to start after (overrides the offset)
+        batch_size: Events read per query (1-1000, default 100)
+        poll_interval: Seconds to wait when there are no new events
+        follow: Keep waiting for new events (False: stop when caught up)
+
+    Yields:
+        dict: Events, oldest first
+
+    Raises:
+        EventsExpiredError: If events after the position were compacted
+        DatabaseError: If database operation fails
+    """
+    position = _start_position(consumer, after)
+    size = _batch_size(batch_size)
+    while True:
+        events = read_events(position, size)
+        yield from events
+        if events:
+            position = events[-1]["sequence"]
+            if consumer:
+                commit_offset(consumer, position)
+        if len(events) < size:
+            if not follow:
+                return
+            time.sleep(poll_interval)
+
+
+async def tail_events_async(
+    consumer: Optional[str] = None,
+    after: Optional[int] = None,
+    batch_size: Optional[int] = None,
+    poll_interval: float = 1.0,
+    follow: bool = True
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Async tail_events: reads through aiosqlite and waits with asyncio.sleep.
+
+    Same arguments and behaviour as tail_events; use with ``async for``.
+    """
+    position = await asyncio.to_thread(_start_position, consumer, after)
+    size = _batch_size(batch_size)
+    while True:
+        events = await read_events_async(position, size)
+        for event in events:
+            yield event
+        if events:
+            position = events[-1]["sequence"]
+            if consumer:
+                await _commit_offset_async(consumer, position)
+        if len(events) < size:
+            if not follow:
+                return
+            await asyncio.sleep(poll_interval)
+
+
+async def _commit_offset_async(consumer: str, position: int) -> None:
+    try:
+        async with get_async_db_connection() as conn:
+            await conn.execute(commit_offset_statement(consumer, position))
+            await conn.commit()
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to commit consumer offset: {str(e)}")
+
+
+def compact_events(retention_hours: float) -> int:
+    """
+    Delete events older than the retention period.
+
+    Consumers that have not read them yet get EventsExpiredError on their
+    next read. Sequence numbers are never reused.
+
+    Args:
+        retention_hours: Age in hours of the oldest event kept
+
+    Returns:
+        int: Number of events deleted
+
+    Raises:
+        ValidationError: If retention_hours is negative
+        DatabaseError: If database operation fails
+    """
+    if retention_hours < 0:
+        raise ValidationError("retention_hours must not be negative")
+    cutoff = datetime.utcnow() - timedelta(hours=retention_hours)
+    try:
+        with get_db_transaction() as conn:
+            return conn.execute(delete(events_table).where(events_table.c.created_at < cutoff)).rowcount
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to compact order events: {str(e)}")
+
+
+def get_event_stats() -> Dict[str, Any]:
+    """
+    Describe the change feed and its consumers.
+
+    Returns:
+        dict: "events" retained, "oldest_sequence" and "latest_sequence"
+        (None/0 when empty), and "consumers" with each consumer's
+        "position", "lag" (events behind the latest) and "updated_at"
+    """
+    try:
+        with get_db_connection() as conn:
+            latest = conn.execute(SELECT_LATEST_SEQUENCE).scalar() or 0
+            stats = {
+                "events": conn.execute(SELECT_EVENT_COUNT).scalar(),
+                "oldest_sequence": conn.execute(SELECT_OLDEST_SEQUENCE).scalar(),
+                "latest_sequence": latest,
+                "consumers": [
+                    {
+                        "consumer": row.consumer,
+                        "position": row.position,
+                        "lag": latest - row.position,
+                        "updated_at": row.updated_at.isoformat(),
+                    }
+                    for row in conn.execute(SELECT_CONSUMERS)
+                ],
+            }
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to read order event stats: {str(e)}")
+    return stats
+
+
+def invalidate_events(events: Iterable[Dict[str, Any]]) -> None:
+    """
+    Drop the cached lookups of the orders changed by a batch of events.
+
+    Lets a process keep its order cache current from the feed, including
+    writes made by other processes.
+
+    Args:
+        events: Events from read_events or tail_events
+    """
+    order_ids, customers = set(), set()
+    for event in events:
+        order_ids.add(event["order_id"])
+        customers.add(event["customer_name"])
+    if order_ids:
+        invalidate(order_ids=order_ids, customer_names=customers)
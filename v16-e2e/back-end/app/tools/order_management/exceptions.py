@@ -18,6 +18,16 @@ class OrderNotFoundError(OrderManagementError):
     pass
 
 
+class VersionConflictError(OrderManagementError):
+    """Raised when an order changed since the version the caller expected."""
+    pass
+
+
+class EventsExpiredError(OrderManagementError):
+    """Raised when order events a consumer has not read were compacted."""
+    pass
+
+
 class DatabaseError(OrderManagementError):
     """Raised when a database operation fails."""
     pass
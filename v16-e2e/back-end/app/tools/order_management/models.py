@@ -2,7 +2,7 @@
 SQLAlchemy models for order management system.
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, DateTime
+from sqlalchemy import Column, Integer, String, Float, DateTime, Text
 from .database import Base
 
 
@@ -20,6 +20,7 @@ class Order(Base):
         order_amount: Total amount for the order
         remarks: Additional remarks or notes
         order_status: Current status of the order
+        version: Incremented by every status update (optimistic concurrency)
     """
     __tablename__ = "orders"
     
@@ -32,6 +33,7 @@ class Order(Base):
     order_amount = Column(Float, nullable=False)
     remarks = Column(String(1000), nullable=True)
     order_status = Column(String(50), nullable=False, index=True)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
     
     def to_dict(self):
         """
@@ -49,8 +51,138 @@ class Order(Base):
             "quantity": self.quantity,
             "order_amount": self.order_amount,
             "remarks": self.remarks,
-            "order_status": self.order_status
+            "order_status": self.order_status,
+            "version": self.version
         }
     
     def __repr__(self):
         return f"<Order(order_id={self.order_id}, customer={self.customer_name}, status={self.order_status})>"
+
+
+class CacheVersion(Base):
+    """
+    Single-row counter incremented by every order write transaction.
+    
+    Processes caching order lookups in shared mode compare it with the
+    value their cache was filled at (see cache.py).
+    """
+    __tablename__ = "order_cache_version"
+    
+    id = Column(Integer, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+
+
+class CustomerSummary(Base):
+    """
+    Order totals per customer, maintained by triggers (see summaries.py).
+    """
+    __tablename__ = "order_summary_customer"
+    
+    customer_name = Column(String(255), primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    total_quantity = Column(Integer, nullable=False, default=0)
+    total_amount = Column(Float, nullable=False, default=0.0)
+
+
+class SkuSummary(Base):
+    """
+    Order totals per product SKU, maintained by triggers (see summaries.py).
+    """
+    __tablename__ = "order_summary_sku"
+    
+    product_sku = Column(String(100), primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    total_quantity = Column(Integer, nullable=False, default=0)
+    total_amount = Column(Float, nullable=False, default=0.0)
+
+
+class CustomerSkuSummary(Base):
+    """
+    Order totals per customer and product SKU, maintained by triggers
+    (see summaries.py).
+    """
+    __tablename__ = "order_summary_customer_sku"
+    
+    customer_name = Column(String(255), primary_key=True)
+    product_sku = Column(String(100), primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    total_quantity = Column(Integer, nullable=False, default=0)
+    total_amount = Column(Float, nullable=False, default=0.0)
+
+
+class StatusDaySummary(Base):
+    """
+    Order totals per order day and status, maintained by triggers
+    (see summaries.py).
+    """
+    __tablename__ = "order_summary_status_day"
+    
+    order_day = Column(String(10), primary_key=True)
+    order_status = Column(String(50), primary_key=True)
+    order_count = Column(Integer, nullable=False, default=0)
+    total_quantity = Column(Integer, nullable=False, default=0)
+    total_amount = Column(Float, nullable=False, default=0.0)
+
+
+class OrderEvent(Base):
+    """
+    Change feed entry written by triggers on ``orders`` in the same
+    transaction as the change (see events.py).
+    
+    Sequence numbers are AUTOINCREMENT, so they only grow and are never
+    reused after compaction deletes old events.
+    """
+    __tablename__ = "order_events"
+    __table_args__ = {"sqlite_autoincrement": True}
+    
+    sequence = Column(Integer, primary_key=True)
+    event_type = Column(String(50), nullable=False)
+    order_id = Column(Integer, nullable=False)
+    customer_name = Column(String(255), nullable=False)
+    order_status = Column(String(50), nullable=False)
+    version = Column(Integer, nullable=False)
+    payload = Column(Text, nullable=False)
+    created_at = Column(DateTime, nullable=False, index=True)
+
+
+class EventConsumer(Base):
+    """
+    Last change feed sequence number a named consumer has processed.
+    """
+    __tablename__ = "order_event_consumers"
+    
+    consumer = Column(String(100), primary_key=True)
+    position = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+# Columns returned by read queries, in to_dict() order
+ORDER_FIELDS = (
+    "order_id",
+    "order_date",
+    "customer_name",
+    "billing_address",
+    "product_sku",
+    "quantity",
+    "order_amount",
+    "remarks",
+    "order_status",
+    "version",
+)
+ORDER_COLUMNS = tuple(Order.__table__.c[name] for name in ORDER_FIELDS)
+
+
+def row_to_dict(row) -> dict:
+    """
+    Convert a row selected with ORDER_COLUMNS to the same dictionary as Order.to_dict().
+    
+    Args:
+        row: Result row whose first columns are ORDER_COLUMNS
+        
+    Returns:
+        dict: Dictionary containing order data
+    """
+    order = dict(zip(ORDER_FIELDS, row))
+    if order["order_date"] is not None:
+        order["order_date"] = order["order_date"].isoformat()
+    return order
@@ -1,15 +1,45 @@
 """
 CRUD operations for order management system.
+
+create_order goes through the ORM. A status update is one Core
+``UPDATE ... RETURNING`` that also increments the order's version, so a
+caller can update only if the order is unchanged since it was read. As
+in update_order_status_bulk, an order already in the new status is left
+alone (no new version, change event or cache invalidation).
+Reads use SQLAlchemy Core: they select the order columns (ORDER_COLUMNS)
+and build the result dictionaries straight from the rows, without ORM
+objects, identity map or session. The
+statements are built from bound parameters, so SQLAlchemy compiles each
+statement shape once and reuses it from the engine's compiled cache.
+
+Lookups by order ID and by customer name are served from the order
+cache when it is enabled (see cache.py); every write bumps the cache
+version in its transaction and invalidates the entries it changed after
+committing.
 """
 from datetime import datetime
 from typing import List, Optional, Dict, Any
-from sqlalchemy import or_
+from sqlalchemy import bindparam, func, literal, select, union_all, update
 from sqlalchemy.exc import SQLAlchemyError
 
-from .database import get_db_session
-from .models import Order
-from .validations import validate_order_data, validate_order_status, VALID_ORDER_STATUSES
-from .exceptions import ValidationError, OrderNotFoundError, DatabaseError
+from .cache import bump_version, customer_key, get_cache, invalidate, order_key
+from .database import get_db_connection, get_db_session, search_index_available
+from .models import Order, ORDER_COLUMNS, row_to_dict
+from .pagination import SortKey, datetime_key, fetch_page
+from .search import MIN_TERM_LENGTH, substring_matches
+from .validations import normalize_new_order, validate_order_status, VALID_ORDER_STATUSES
+from .exceptions import OrderNotFoundError, VersionConflictError, DatabaseError
+
+# Listing order: newest first, order_id breaking ties (table columns, so
+# their values can be read back from result rows)
+orders_table = Order.__table__
+LISTING_KEYS = [datetime_key(orders_table.c.order_date), SortKey(orders_table.c.order_id)]
+LISTING_ORDER = [key.order_by() for key in LISTING_KEYS]
+
+# Read statements
+SELECT_ORDERS = select(*ORDER_COLUMNS)
+SELECT_ORDER_BY_ID = SELECT_ORDERS.where(Order.order_id == bindparam("order_id"))
+SELECT_ORDERS_BY_CUSTOMER = SELECT_ORDERS.where(Order.customer_name == bindparam("customer_name"))
 
 
 def create_order(
@@ -33,7 +63,7 @@ def create_order(
         order_amount: Total order amount
         remarks: Additional remarks (optional)
         order_status: Order status (default: PENDING)
-        order_date: Order date (default: current timestamp)
+        order_date: Order date or ISO format string (default: current timestamp)
         
     Returns:
         dict: Created order data
@@ -42,20 +72,17 @@ def create_order(
         ValidationError: If validation fails
         DatabaseError: If database operation fails
     """
-    # Prepare order data
-    order_data = {
+    # Validate order data and apply defaults (shared with async create_order)
+    order_data = normalize_new_order({
         "customer_name": customer_name,
         "billing_address": billing_address,
         "product_sku": product_sku,
         "quantity": quantity,
         "order_amount": order_amount,
         "remarks": remarks,
-        "order_status": order_status.upper() if order_status else "PENDING",
+        "order_status": order_status,
         "order_date": order_date
-    }
-    
-    # Validate order data
-    validate_order_data(order_data, is_update=False)
+    })
     
     # Create order
     session = get_db_session()
@@ -68,11 +95,13 @@ def create_order(
             order_amount=order_data["order_amount"],
             remarks=order_data["remarks"],
             order_status=order_data["order_status"],
-            order_date=order_data["order_date"] or datetime.utcnow()
+            order_date=order_data["order_date"]
         )
         
         session.add(new_order)
+        version = bump_version(session)
         session.commit()
+        invalidate(customer_names=[order_data["customer_name"]], version=version)
         session.refresh(new_order)
         
         result = new_order.to_dict()
@@ -99,21 +128,28 @@ def get_order_by_id(order_id: int) -> Dict[str, Any]:
         OrderNotFoundError: If order is not found
         DatabaseError: If database operation fails
     """
-    session = get_db_session()
     try:
-        order = session.query(Order).filter(Order.order_id == order_id).first()
-        
-        if not order:
+        cache = get_cache()
+        if cache is not None:
+            key = order_key(order_id)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            generation = cache.generation
+        
+        with get_db_connection() as conn:
+            row = conn.execute(SELECT_ORDER_BY_ID, {"order_id": order_id}).first()
+        
+        if row is None:
             raise OrderNotFoundError(f"Order with ID {order_id} not found")
         
-        return order.to_dict()
+        order = row_to_dict(row)
+        if cache is not None:
+            cache.put(key, order, generation)
+        return order
         
-    except OrderNotFoundError:
-        raise
     except SQLAlchemyError as e:
         raise DatabaseError(f"Failed to retrieve order: {str(e)}")
-    finally:
-        session.close()
 
 
 def get_orders_by_customer(customer_name: str) -> List[Dict[str, Any]]:
@@ -129,18 +165,57 @@ def get_orders_by_customer(customer_name: str) -> List[Dict[str, Any]]:
     Raises:
         DatabaseError: If database operation fails
     """
-    session = get_db_session()
     try:
-        orders = session.query(Order).filter(
-            Order.customer_name == customer_name
-        ).order_by(Order.order_date.desc()).all()
+        cache = get_cache()
+        if cache is not None:
+            key = customer_key(customer_name)
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+            generation = cache.generation
+        
+        with get_db_connection() as conn:
+            rows = conn.execute(
+                SELECT_ORDERS_BY_CUSTOMER.order_by(*LISTING_ORDER),
+                {"customer_name": customer_name}
+            ).all()
+        
+        orders = [row_to_dict(row) for row in rows]
+        if cache is not None:
+            cache.put(key, orders, generation)
+        return orders
+        
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve orders: {str(e)}")
+
+
+def get_orders_by_customer_page(
+    customer_name: str,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get one page of a customer's orders, newest first.
+    
+    Args:
+        customer_name: Name of the customer
+        limit: Page size (default 20, at most 100)
+        cursor: next_cursor of the previous page, or None for the first page
         
-        return [order.to_dict() for order in orders]
+    Returns:
+        dict: "orders" (list of order dictionaries) and "next_cursor"
+        (None on the last page)
+        
+    Raises:
+        ValidationError: If the cursor is invalid
+        DatabaseError: If database operation fails
+    """
+    try:
+        statement = SELECT_ORDERS.where(Order.customer_name == customer_name)
+        return _page(statement, LISTING_KEYS, limit, cursor)
         
     except SQLAlchemyError as e:
         raise DatabaseError(f"Failed to retrieve orders: {str(e)}")
-    finally:
-        session.close()
 
 
 def search_orders(
@@ -152,6 +227,11 @@ def search_orders(
     Search orders by product SKU, billing address, or order status.
     Supports partial matching and case-insensitive search for product_sku and billing_address.
     
+    Orders matching any of the given criteria are returned, best text
+    match first, then newest first. Partial matches of 3+ characters are
+    looked up in the FTS5 trigram index (see search.py) instead of
+    scanning the table.
+    
     Args:
         product_sku: Product SKU to search (partial match, case-insensitive)
         billing_address: Billing address to search (partial match, case-insensitive)
@@ -168,77 +248,205 @@ def search_orders(
     if order_status:
         validate_order_status(order_status)
     
-    session = get_db_session()
     try:
-        query = session.query(Order)
-        
-        # Build filter conditions
-        filters = []
-        
-        if product_sku:
-            filters.append(Order.product_sku.ilike(f"%{product_sku}%"))
+        statement, keys = _search_statement(product_sku, billing_address, order_status)
+        with get_db_connection() as conn:
+            rows = conn.execute(statement.order_by(*(key.order_by() for key in keys))).all()
         
-        if billing_address:
-            filters.append(Order.billing_address.ilike(f"%{billing_address}%"))
+        return [row_to_dict(row) for row in rows]
         
-        if order_status:
-            filters.append(Order.order_status == order_status.upper())
-        
-        # Apply filters
-        if filters:
-            query = query.filter(or_(*filters))
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to search orders: {str(e)}")
+
+
+def search_orders_page(
+    product_sku: Optional[str] = None,
+    billing_address: Optional[str] = None,
+    order_status: Optional[str] = None,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Get one page of search_orders results, in the same order.
+    
+    Args:
+        product_sku: Product SKU to search (partial match, case-insensitive)
+        billing_address: Billing address to search (partial match, case-insensitive)
+        order_status: Order status to filter by (exact match, case-insensitive)
+        limit: Page size (default 20, at most 100)
+        cursor: next_cursor of the previous page (with the same criteria),
+            or None for the first page
         
-        orders = query.order_by(Order.order_date.desc()).all()
+    Returns:
+        dict: "orders" (list of order dictionaries) and "next_cursor"
+        (None on the last page)
         
-        return [order.to_dict() for order in orders]
+    Raises:
+        ValidationError: If validation fails or the cursor is invalid
+        DatabaseError: If database operation fails
+    """
+    if order_status:
+        validate_order_status(order_status)
+    
+    try:
+        statement, keys = _search_statement(product_sku, billing_address, order_status)
+        return _page(statement, keys, limit, cursor)
         
-    except ValidationError:
-        raise
     except SQLAlchemyError as e:
         raise DatabaseError(f"Failed to search orders: {str(e)}")
-    finally:
-        session.close()
 
 
-def update_order_status(order_id: int, new_status: str) -> Dict[str, Any]:
+def _search_statement(product_sku, billing_address, order_status):
+    """
+    Build the search statement and its sort order.
+    
+    Orders matching more criteria come first. When every criterion is a
+    trigram index lookup, ties are broken by bm25 rank; otherwise (LIKE
+    fallback or status, which have no rank) they are newest first.
+    
+    Returns:
+        tuple: (select of ORDER_COLUMNS and the sort key columns, sort keys)
+    """
+    use_index = search_index_available()
+    
+    # (order_id, rank) for each criterion; an order matches if any does
+    terms = [term for term in (product_sku, billing_address) if term]
+    matches = [
+        substring_matches(column, term, use_index)
+        for column, term in (("product_sku", product_sku), ("billing_address", billing_address))
+        if term
+    ]
+    ranked_by_index = use_index and not order_status and all(len(term) >= MIN_TERM_LENGTH for term in terms)
+    if order_status:
+        matches.append(
+            select(Order.order_id, literal(0.0).label("rank"))
+            .where(Order.order_status == order_status.upper())
+        )
+    
+    if not matches:
+        return SELECT_ORDERS, LISTING_KEYS
+    
+    hits = (matches[0] if len(matches) == 1 else union_all(*matches)).subquery()
+    ranked = (
+        select(
+            hits.c.order_id,
+            func.count().label("matched"),
+            func.sum(hits.c.rank).label("rank")
+        )
+        .group_by(hits.c.order_id)
+        .subquery()
+    )
+    statement = select(*ORDER_COLUMNS, ranked.c.matched, ranked.c.rank).join_from(
+        Order, ranked, ranked.c.order_id == Order.order_id
+    )
+    keys = [SortKey(ranked.c.matched)]
+    if ranked_by_index:
+        keys.append(SortKey(ranked.c.rank, descending=False))
+    return statement, [*keys, *LISTING_KEYS]
+
+
+def _page(statement, keys, limit, cursor) -> Dict[str, Any]:
+    """Fetch one page of a read statement as order dictionaries."""
+    with get_db_connection() as conn:
+        rows, next_cursor = fetch_page(conn, statement, keys, limit, cursor)
+    return {
+        "orders": [row_to_dict(row) for row in rows],
+        "next_cursor": next_cursor
+    }
+
+
+def update_order_status(order_id: int, new_status: str, expected_version: Optional[int] = None) -> Dict[str, Any]:
     """
     Update the status of an order.
     
     Args:
         order_id: Order ID to update
         new_status: New order status
+        expected_version: Only update if the order is still at this
+            version (optional; the version is in every order dictionary)
         
     Returns:
-        dict: Updated order data
+        dict: Updated order data (with the incremented version), or the
+        order unchanged if it already has the new status
         
     Raises:
         ValidationError: If validation fails
         OrderNotFoundError: If order is not found
+        VersionConflictError: If the order is no longer at expected_version
         DatabaseError: If database operation fails
     """
     # Validate status
     validate_order_status(new_status)
     
-    session = get_db_session()
+    statement = status_update_statement(order_id, new_status, expected_version)
     try:
-        order = session.query(Order).filter(Order.order_id == order_id).first()
+        with get_db_connection() as conn:
+            row = conn.execute(statement).first()
+            if row is None:
+                current = conn.execute(SELECT_ORDER_BY_ID, {"order_id": order_id}).first()
+                conn.rollback()
+                return unmatched_status_update(order_id, current, new_status, expected_version)
+            version = bump_version(conn)
+            conn.commit()
+        
+        order = row_to_dict(row)
+        invalidate(order_ids=[order_id], customer_names=[order["customer_name"]], version=version)
+        return order
         
-        if not order:
-            raise OrderNotFoundError(f"Order with ID {order_id} not found")
-        
-        order.order_status = new_status.upper()
-        session.commit()
-        session.refresh(order)
-        
-        return order.to_dict()
-        
-    except (ValidationError, OrderNotFoundError):
-        raise
     except SQLAlchemyError as e:
-        session.rollback()
         raise DatabaseError(f"Failed to update order status: {str(e)}")
-    finally:
-        session.close()
+
+
+def status_update_statement(order_id: int, new_status: str, expected_version: Optional[int] = None):
+    """
+    Build the single-statement status update of one order.
+    
+    Sets the status and increments the version in one ``UPDATE ...
+    RETURNING``; with expected_version the row only matches at that version.
+    
+    Returns:
+        Update: returning ORDER_COLUMNS of the updated row (none if the
+        order is missing, at another version or already in new_status)
+    """
+    statement = (
+        update(orders_table)
+        .where(orders_table.c.order_id == order_id, orders_table.c.order_status != new_status.upper())
+        .values(order_status=new_status.upper(), version=orders_table.c.version + 1)
+    )
+    if expected_version is not None:
+        statement = statement.where(orders_table.c.version == expected_version)
+    return statement.returning(*ORDER_COLUMNS)
+
+
+def unmatched_status_update(
+    order_id: int, current, new_status: str, expected_version: Optional[int]
+) -> Dict[str, Any]:
+    """
+    Resolve a status update that matched no row.
+    
+    Args:
+        order_id: Order ID that was updated
+        current: The order's row now (ORDER_COLUMNS; None if it does not exist)
+        new_status: Status the caller set
+        expected_version: Version the caller expected
+        
+    Returns:
+        dict: The unchanged order, if it already has new_status (at the
+        expected version)
+        
+    Raises:
+        OrderNotFoundError: If the order does not exist
+        VersionConflictError: If the order is no longer at expected_version
+    """
+    if current is None:
+        raise OrderNotFoundError(f"Order with ID {order_id} not found")
+    if expected_version is not None and current.version != expected_version:
+        raise VersionConflictError(
+            f"Order {order_id} is at version {current.version}, not {expected_version}; "
+            f"it was changed since it was read"
+        )
+    # Already in new_status: a no-op, as in update_order_status_bulk
+    return row_to_dict(current)
 
 
 def get_all_orders(limit: Optional[int] = None) -> List[Dict[str, Any]]:
@@ -254,18 +462,39 @@ def get_all_orders(limit: Optional[int] = None) -> List[Dict[str, Any]]:
     Raises:
         DatabaseError: If database operation fails
     """
-    session = get_db_session()
     try:
-        query = session.query(Order).order_by(Order.order_date.desc())
+        statement = SELECT_ORDERS.order_by(*LISTING_ORDER)
         
         if limit:
-            query = query.limit(limit)
+            statement = statement.limit(limit)
         
-        orders = query.all()
+        with get_db_connection() as conn:
+            rows = conn.execute(statement).all()
         
-        return [order.to_dict() for order in orders]
+        return [row_to_dict(row) for row in rows]
+        
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve orders: {str(e)}")
+
+
+def get_orders_page(limit: Optional[int] = None, cursor: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Get one page of all orders, newest first.
+    
+    Args:
+        limit: Page size (default 20, at most 100)
+        cursor: next_cursor of the previous page, or None for the first page
+        
+    Returns:
+        dict: "orders" (list of order dictionaries) and "next_cursor"
+        (None on the last page)
+        
+    Raises:
+        ValidationError: If the cursor is invalid
+        DatabaseError: If database operation fails
+    """
+    try:
+        return _page(SELECT_ORDERS, LISTING_KEYS, limit, cursor)
         
     except SQLAlchemyError as e:
         raise DatabaseError(f"Failed to retrieve orders: {str(e)}")
-    finally:
-        session.close()
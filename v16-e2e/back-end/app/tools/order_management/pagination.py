@@ -0,0 +1,182 @@
+"""
+Keyset pagination for order management system.
+
+Pages are read with a ``WHERE (sort key) < (last row's sort key)``
+condition instead of ``OFFSET``, so fetching a page costs the same
+however deep into the results it is, and orders inserted meanwhile do
+not shift later pages. Listings are keyed on ``(order_date, order_id)``,
+newest first; ranked search results on ``(rank, order_date, order_id)``.
+
+The position is handed to the caller as an opaque cursor token: the last
+row's sort key as URL-safe base64 JSON.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, or_, tuple_
+
+from .exceptions import ValidationError
+
+# Page size when the caller gives none, and the largest allowed
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+class SortKey:
+    """
+    One column of a keyset sort order.
+
+    Args:
+        column: SQL expression sorted on
+        descending: Whether the column sorts high to low
+        parse: Converts the cursor's JSON value back to a bind value
+        dump: Converts a row value to a JSON value
+    """
+
+    def __init__(
+        self,
+        column,
+        descending: bool = True,
+        parse: Callable[[Any], Any] = lambda value: value,
+        dump: Callable[[Any], Any] = lambda value: value
+    ):
+        self.column = column
+        self.descending = descending
+        self.parse = parse
+        self.dump = dump
+
+    def order_by(self):
+        return self.column.desc() if self.descending else self.column.asc()
+
+
+def datetime_key(column, descending: bool = True) -> SortKey:
+    """Sort key for a DateTime column (ISO 8601 in the cursor)."""
+    return SortKey(column, descending, parse=datetime.fromisoformat, dump=lambda value: value.isoformat())
+
+
+def page_size(limit: Optional[int]) -> int:
+    """
+    Clamp a requested page size to 1..MAX_PAGE_SIZE.
+
+    Args:
+        limit: Requested page size (None for the default)
+
+    Returns:
+        int: Page size to use
+    """
+    if limit is None:
+        return DEFAULT_PAGE_SIZE
+    return max(1, min(int(limit), MAX_PAGE_SIZE))
+
+
+def encode_cursor(keys: Sequence[SortKey], values: Sequence[Any]) -> str:
+    """
+    Encode a row's sort key values as a cursor token.
+
+    Args:
+        keys: Sort order of the query
+        values: The row's values for those keys
+
+    Returns:
+        str: Opaque cursor token
+    """
+    payload = json.dumps([key.dump(value) for key, value in zip(keys, values)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(keys: Sequence[SortKey], cursor: str) -> List[Any]:
+    """
+    Decode a cursor token produced by encode_cursor for the same sort order.
+
+    Args:
+        keys: Sort order of the query
+        cursor: Cursor token
+
+    Returns:
+        list: Sort key values to continue after
+
+    Raises:
+        ValidationError: If the cursor is malformed or from another listing
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(keys):
+            raise ValueError("wrong number of values")
+        return [key.parse(value) for key, value in zip(keys, values)]
+    except (ValueError, TypeError, UnicodeError, binascii.Error):
+        raise ValidationError("Invalid cursor; pass back the next_cursor of a previous page unchanged")
+
+
+def after(keys: Sequence[SortKey], values: Sequence[Any]):
+    """
+    Build the condition selecting rows that sort after ``values``.
+
+    Args:
+        keys: Sort order of the query
+        values: Sort key values of the last row already returned
+
+    Returns:
+        SQL boolean expression
+    """
+    if all(key.descending for key in keys):
+        # A single row-value comparison lets SQLite range-scan the index
+        return tuple_(*(key.column for key in keys)) < tuple_(*values)
+    if not any(key.descending for key in keys):
+        return tuple_(*(key.column for key in keys)) > tuple_(*values)
+
+    conditions = []
+    for i, key in enumerate(keys):
+        ties = [keys[j].column == values[j] for j in range(i)]
+        beyond = key.column < values[i] if key.descending else key.column > values[i]
+        conditions.append(and_(*ties, beyond))
+    return or_(*conditions)
+
+
+def fetch_page(conn, statement, keys: Sequence[SortKey], limit: Optional[int], cursor: Optional[str]) -> Tuple[list, Optional[str]]:
+    """
+    Fetch one page of a query in keyset order.
+
+    The sort key columns must be among the statement's selected columns.
+
+    Args:
+        conn: SQLAlchemy connection
+        statement: Core select, not yet ordered or limited
+        keys: Sort order
+        limit: Page size (clamped by page_size)
+        cursor: Cursor from the previous page, or None for the first
+
+    Returns:
+        tuple: (rows, next cursor or None on the last page)
+
+    Raises:
+        ValidationError: If the cursor is invalid
+    """
+    size = page_size(limit)
+    rows = conn.execute(page_statement(statement, keys, size, cursor)).all()
+    return split_page(rows, keys, size)
+
+
+def page_statement(statement, keys: Sequence[SortKey], size: int, cursor: Optional[str]):
+    """
+    Order and limit a statement to one page plus one row (see fetch_page).
+
+    Raises:
+        ValidationError: If the cursor is invalid
+    """
+    if cursor:
+        statement = statement.where(after(keys, decode_cursor(keys, cursor)))
+    return statement.order_by(*(key.order_by() for key in keys)).limit(size + 1)
+
+
+def split_page(rows: list, keys: Sequence[SortKey], size: int) -> Tuple[list, Optional[str]]:
+    """Trim the rows of page_statement to the page and build the next cursor."""
+    next_cursor = None
+    if len(rows) > size:
+        rows = rows[:size]
+        last = rows[-1]._mapping
+        next_cursor = encode_cursor(keys, [last[key.column] for key in keys])
+    return rows, next_cursor
@@ -0,0 +1,133 @@
+"""
+Full-text search index for order management system.
+
+Substring search on ``product_sku`` and ``billing_address`` uses an FTS5
+table with the trigram tokenizer (``orders_fts``). It is an external
+content table over ``orders``: it stores only the trigram index, and
+triggers on ``orders`` keep it in sync. A ``MATCH`` on it finds every
+row containing a substring of 3+ characters without scanning ``orders``,
+where ``LIKE '%x%'`` cannot use the B-tree indexes and always does.
+
+Search terms shorter than 3 characters cannot be looked up by trigram
+and fall back to ``LIKE``. So does everything when the SQLite build has
+no FTS5.
+"""
+from sqlalchemy import Float, Integer, literal, literal_column, select, text
+from sqlalchemy.exc import OperationalError
+
+from .models import Order
+
+# Columns indexed for substring search
+SEARCH_COLUMNS = ("product_sku", "billing_address")
+
+# Shortest term the trigram index can look up
+MIN_TERM_LENGTH = 3
+
+_CREATE_TABLE = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS orders_fts USING fts5("
+    "product_sku, billing_address, "
+    "content='orders', content_rowid='order_id', tokenize='trigram')"
+)
+
+_TRIGGERS = (
+    """CREATE TRIGGER IF NOT EXISTS orders_fts_insert AFTER INSERT ON orders BEGIN
+        INSERT INTO orders_fts(rowid, product_sku, billing_address)
+        VALUES (new.order_id, new.product_sku, new.billing_address);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS orders_fts_delete AFTER DELETE ON orders BEGIN
+        INSERT INTO orders_fts(orders_fts, rowid, product_sku, billing_address)
+        VALUES ('delete', old.order_id, old.product_sku, old.billing_address);
+    END""",
+    # Only changes to indexed columns touch the index (not status updates)
+    """CREATE TRIGGER IF NOT EXISTS orders_fts_update AFTER UPDATE OF product_sku, billing_address ON orders BEGIN
+        INSERT INTO orders_fts(orders_fts, rowid, product_sku, billing_address)
+        VALUES ('delete', old.order_id, old.product_sku, old.billing_address);
+        INSERT INTO orders_fts(rowid, product_sku, billing_address)
+        VALUES (new.order_id, new.product_sku, new.billing_address);
+    END""",
+)
+
+
+def create_search_index(engine) -> bool:
+    """
+    Create the FTS5 table and its triggers if missing (idempotent).
+
+    An index created over existing orders is built from them.
+
+    Args:
+        engine: SQLAlchemy engine of the order database
+
+    Returns:
+        bool: True if the index exists, False if SQLite lacks FTS5
+    """
+    with engine.begin() as conn:
+        existed = has_search_index(conn)
+        try:
+            conn.execute(text(_CREATE_TABLE))
+        except OperationalError:
+            # SQLite compiled without FTS5 (or without the trigram tokenizer)
+            return False
+        for trigger in _TRIGGERS:
+            conn.execute(text(trigger))
+        if not existed:
+            conn.execute(text("INSERT INTO orders_fts(orders_fts) VALUES ('rebuild')"))
+    return True
+
+
+def has_search_index(conn) -> bool:
+    """
+    Check whether the database has the FTS5 search index.
+
+    Args:
+        conn: SQLAlchemy connection or session
+
+    Returns:
+        bool: True if ``orders_fts`` exists
+    """
+    return conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'orders_fts'")
+    ).first() is not None
+
+
+def match_expression(column: str, term: str) -> str:
+    """
+    Build an FTS5 query matching ``term`` as a substring of one column.
+
+    Args:
+        column: Indexed column name
+        term: Substring to find (any characters; quoted here)
+
+    Returns:
+        str: FTS5 MATCH expression
+    """
+    quoted = '"' + term.replace('"', '""') + '"'
+    return f"{column} : {quoted}"
+
+
+def substring_matches(column: str, term: str, use_index: bool):
+    """
+    Select the orders whose ``column`` contains ``term``, with a rank.
+
+    Lower rank is a better match (FTS5 bm25); ``LIKE`` matches rank 0, so
+    ranks only compare between rows of index lookups.
+
+    Args:
+        column: Indexed column name
+        term: Substring to find (case-insensitive)
+        use_index: Whether the FTS5 index exists
+
+    Returns:
+        Select: ``(order_id, rank)`` rows
+    """
+    if use_index and len(term) >= MIN_TERM_LENGTH:
+        return (
+            select(
+                literal_column("rowid", Integer).label("order_id"),
+                literal_column("rank", Float).label("rank")
+            )
+            .select_from(text("orders_fts"))
+            .where(literal_column("orders_fts").op("MATCH")(match_expression(column, term)))
+        )
+    return select(Order.order_id, literal(0.0).label("rank")).where(
+        getattr(Order, column).ilike(f"%{term}%")
+    )
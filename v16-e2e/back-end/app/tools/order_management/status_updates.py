@@ -0,0 +1,212 @@
+"""
+Batched order status updates for order management system.
+
+``update_order_status_bulk`` changes the status of many orders with
+set-based ``UPDATE ... WHERE ... RETURNING`` statements in one
+transaction, instead of a read-modify-write per order. The orders are
+picked by ID, by filters (current status, customer, order date range),
+or both:
+
+- "mark all CONFIRMED orders from yesterday as SHIPPED" is one statement
+- with ``expected_versions``, an order is only updated if it is still at
+  the version the caller read (optimistic concurrency: a concurrent
+  update makes it a ``version_conflict`` instead of being overwritten)
+
+Every updated order's version is incremented. Orders already in the new
+status are left alone. When orders are given by ID, each gets an outcome:
+``updated``, ``unchanged``, ``not_matched`` (excluded by a filter),
+``version_conflict`` or ``not_found``.
+"""
+from datetime import datetime, time, timedelta
+from itertools import islice
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+
+from sqlalchemy import or_, select, tuple_, update
+from sqlalchemy.exc import SQLAlchemyError
+
+from .cache import bump_version, invalidate
+from .database import get_db_transaction
+from .exceptions import DatabaseError, ValidationError
+from .models import Order
+from .validations import validate_day, validate_order_status
+
+orders_table = Order.__table__
+
+# Order IDs per statement (well under SQLite's bound parameter limit)
+ID_CHUNK_SIZE = 500
+
+OUTCOMES = ("updated", "unchanged", "not_matched", "version_conflict", "not_found")
+
+
+def update_order_status_bulk(
+    new_status: str,
+    order_ids: Optional[Iterable[int]] = None,
+    expected_versions: Optional[Mapping[int, int]] = None,
+    current_status: Optional[str] = None,
+    customer_name: Optional[str] = None,
+    start_date=None,
+    end_date=None
+) -> Dict[str, Any]:
+    """
+    Set the status of many orders in one transaction.
+
+    Args:
+        new_status: New order status
+        order_ids: Orders to update (optional if a filter is given)
+        expected_versions: Order ID -> version the caller read; these
+            orders are only updated at that version (their IDs need not
+            be repeated in order_ids)
+        current_status: Only update orders in this status
+        customer_name: Only update this customer's orders
+        start_date: Only update orders placed on or after this day
+            (YYYY-MM-DD or date)
+        end_date: Only update orders placed on or before this day
+
+    Returns:
+        dict: "new_status", "updated_count", "counts" per outcome and
+        "results", one {"order_id", "outcome", "version"} per order (per
+        given ID, or per updated order when selecting by filters only);
+        conflicts also carry "expected_version"
+
+    Raises:
+        ValidationError: If validation fails or neither IDs nor a filter
+            are given
+        DatabaseError: If database operation fails
+    """
+    request = prepare_status_updates(
+        new_status, order_ids, expected_versions, current_status, customer_name, start_date, end_date
+    )
+    try:
+        with get_db_transaction() as conn:
+            report, customers, version = apply_status_updates(conn, request)
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to update order statuses: {str(e)}")
+
+    invalidate_status_updates(report, customers, version)
+    return report
+
+
+def prepare_status_updates(
+    new_status, order_ids, expected_versions, current_status, customer_name, start_date, end_date
+) -> Dict[str, Any]:
+    """Validate the arguments of update_order_status_bulk into a request for apply_status_updates."""
+    validate_order_status(new_status)
+    if current_status:
+        validate_order_status(current_status)
+    try:
+        versions = {int(order_id): int(version) for order_id, version in (expected_versions or {}).items()}
+        ids = [int(order_id) for order_id in (order_ids or ())]
+    except (TypeError, ValueError):
+        raise ValidationError("order IDs and expected versions must be integers")
+    ids = list(dict.fromkeys(ids + list(versions)))
+
+    start, end = validate_day(start_date, "start_date"), validate_day(end_date, "end_date")
+    filters = []
+    if current_status:
+        filters.append(orders_table.c.order_status == current_status.upper())
+    if customer_name:
+        filters.append(orders_table.c.customer_name == customer_name)
+    if start is not None:
+        filters.append(orders_table.c.order_date >= datetime.combine(start, time.min))
+    if end is not None:
+        filters.append(orders_table.c.order_date < datetime.combine(end + timedelta(days=1), time.min))
+    if not ids and not filters:
+        raise ValidationError("Give order IDs or at least one filter (current_status, customer_name, dates)")
+
+    return {"new_status": new_status.upper(), "ids": ids, "versions": versions, "filters": filters,
+            "by_id": bool(ids)}
+
+
+def apply_status_updates(conn, request: Dict[str, Any]):
+    """
+    Run a prepared bulk status update on a connection (no commit).
+
+    Returns:
+        tuple: (report, customer names of updated orders, cache version)
+    """
+    new_status = request["new_status"]
+    base = (
+        update(orders_table)
+        .where(orders_table.c.order_status != new_status, *request["filters"])
+        .values(order_status=new_status, version=orders_table.c.version + 1)
+        .returning(orders_table.c.order_id, orders_table.c.customer_name, orders_table.c.version)
+    )
+
+    updated: Dict[int, int] = {}
+    customers = set()
+    if request["by_id"]:
+        ids = iter(request["ids"])
+        while True:
+            chunk = list(islice(ids, ID_CHUNK_SIZE))
+            if not chunk:
+                break
+            for order_id, customer, version in conn.execute(base.where(_id_condition(chunk, request["versions"]))):
+                updated[order_id] = version
+                customers.add(customer)
+    else:
+        for order_id, customer, version in conn.execute(base):
+            updated[order_id] = version
+            customers.add(customer)
+
+    results: List[Dict[str, Any]] = []
+    if request["by_id"]:
+        current = _current_versions(conn, [i for i in request["ids"] if i not in updated])
+        for order_id in request["ids"]:
+            results.append(_outcome(order_id, updated, current, request["versions"], new_status))
+    else:
+        results = [{"order_id": order_id, "outcome": "updated", "version": version}
+                   for order_id, version in sorted(updated.items())]
+
+    version = bump_version(conn) if updated else None
+    counts = {outcome: 0 for outcome in OUTCOMES}
+    for result in results:
+        counts[result["outcome"]] += 1
+    report = {"new_status": new_status, "updated_count": len(updated), "counts": counts, "results": results}
+    return report, customers, version
+
+
+def _id_condition(order_ids: List[int], versions: Mapping[int, int]):
+    """Match the given orders, those with an expected version only at it."""
+    plain = [order_id for order_id in order_ids if order_id not in versions]
+    checked = [(order_id, versions[order_id]) for order_id in order_ids if order_id in versions]
+    conditions = []
+    if plain:
+        conditions.append(orders_table.c.order_id.in_(plain))
+    if checked:
+        conditions.append(tuple_(orders_table.c.order_id, orders_table.c.version).in_(checked))
+    return or_(*conditions) if len(conditions) > 1 else conditions[0]
+
+
+def _current_versions(conn, order_ids: List[int]) -> Dict[int, tuple]:
+    """Status and version of the orders that were not updated."""
+    current = {}
+    ids = iter(order_ids)
+    while True:
+        chunk = list(islice(ids, ID_CHUNK_SIZE))
+        if not chunk:
+            return current
+        statement = select(orders_table.c.order_id, orders_table.c.order_status, orders_table.c.version).where(
+            orders_table.c.order_id.in_(chunk)
+        )
+        for order_id, status, version in conn.execute(statement):
+            current[order_id] = (status, version)
+
+
+def _outcome(order_id, updated, current, versions, new_status) -> Dict[str, Any]:
+    if order_id in updated:
+        return {"order_id": order_id, "outcome": "updated", "version": updated[order_id]}
+    if order_id not in current:
+        return {"order_id": order_id, "outcome": "not_found", "version": None}
+    status, version = current[order_id]
+    if order_id in versions and versions[order_id] != version:
+        return {"order_id": order_id, "outcome": "version_conflict", "version": version,
+                "expected_version": versions[order_id]}
+    outcome = "unchanged" if status == new_status else "not_matched"
+    return {"order_id": order_id, "outcome": outcome, "version": version}
+
+
+def invalidate_status_updates(report: Dict[str, Any], customers, version) -> None:
+    """Drop the cached lookups of the updated orders after commit."""
+    if report["updated_count"]:
+        updated = [result["order_id"] for result in report["results"] if result["outcome"] == "updated"]
+        invalidate(order_ids=updated, customer_names=customers, version=version)
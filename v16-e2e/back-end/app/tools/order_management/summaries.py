@@ -0,0 +1,434 @@
+"""
+Incrementally maintained order summaries for order management system.
+
+Order count, quantity and amount totals are kept per customer
+(``order_summary_customer``), per product SKU (``order_summary_sku``),
+per customer and SKU (``order_summary_customer_sku``) and per order day
+and status (``order_summary_status_day``). Triggers on ``orders`` apply
+each inserted, updated or deleted row to its groups, so every write path
+(``create_order``, ``update_order_status``, ``create_orders_bulk``, the
+async operations) keeps them current in the same transaction. A status
+update only touches its two day/status groups.
+
+Questions like "revenue by status this month" or "top SKUs for a
+customer" then read one row per group instead of aggregating orders.
+The summaries can always be rebuilt from ``orders``
+(``rebuild_summaries``) and checked against them (``verify_summaries``).
+"""
+from datetime import date
+from typing import Any, Dict, List, Optional, Union
+
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import SQLAlchemyError
+
+from .database import get_db_connection, get_db_transaction
+from .exceptions import DatabaseError, ValidationError
+from .models import CustomerSkuSummary, CustomerSummary, SkuSummary, StatusDaySummary
+from .pagination import page_size
+from .validations import validate_day, validate_order_status
+
+# Summary table -> its group key columns and their value for an orders
+# row ("{row}" is new, old, or orders when rebuilding)
+SUMMARY_KEYS = {
+    "order_summary_customer": (("customer_name", "{row}.customer_name"),),
+    "order_summary_sku": (("product_sku", "{row}.product_sku"),),
+    "order_summary_customer_sku": (
+        ("customer_name", "{row}.customer_name"),
+        ("product_sku", "{row}.product_sku"),
+    ),
+    "order_summary_status_day": (
+        ("order_day", "date({row}.order_date)"),
+        ("order_status", "{row}.order_status"),
+    ),
+}
+TOTAL_COLUMNS = ("order_count", "total_quantity", "total_amount")
+
+# Columns whose changes move an order between groups or change totals
+_STATUS_DAY_COLUMNS = "order_status, order_date, quantity, order_amount"
+_CUSTOMER_SKU_COLUMNS = "customer_name, product_sku, quantity, order_amount"
+_CUSTOMER_SKU_TABLES = ("order_summary_customer", "order_summary_sku", "order_summary_customer_sku")
+
+# How a summary can be ranked
+RANK_COLUMNS = {
+    "amount": "total_amount",
+    "quantity": "total_quantity",
+    "orders": "order_count",
+}
+
+
+def _apply(table: str, row: str, sign: int) -> str:
+    """SQL adding (sign 1) or removing (sign -1) one orders row to its group."""
+    keys = SUMMARY_KEYS[table]
+    names = ", ".join(name for name, _ in keys)
+    values = ", ".join(expr.format(row=row) for _, expr in keys)
+    prefix = "-" if sign < 0 else ""
+    statement = (
+        f"INSERT INTO {table} ({names}, {', '.join(TOTAL_COLUMNS)}) "
+        f"VALUES ({values}, {prefix}1, {prefix}{row}.quantity, {prefix}{row}.order_amount) "
+        f"ON CONFLICT ({names}) DO UPDATE SET "
+        + ", ".join(f"{column} = {column} + excluded.{column}" for column in TOTAL_COLUMNS)
+        + ";"
+    )
+    if sign < 0:
+        # Drop groups with no orders left
+        condition = " AND ".join(f"{name} = {expr.format(row=row)}" for name, expr in keys)
+        statement += f"\n        DELETE FROM {table} WHERE {condition} AND order_count = 0;"
+    return statement
+
+
+def _trigger(name: str, event: str, statements: List[str]) -> str:
+    body = "\n        ".join(statements)
+    return f"CREATE TRIGGER IF NOT EXISTS {name} AFTER {event} ON orders BEGIN\n        {body}\n    END"
+
+
+_TRIGGERS = (
+    _trigger("order_summaries_insert", "INSERT", [_apply(table, "new", 1) for table in SUMMARY_KEYS]),
+    _trigger("order_summaries_delete", "DELETE", [_apply(table, "old", -1) for table in SUMMARY_KEYS]),
+    # Status updates only touch the day/status summary
+    _trigger(
+        "order_summaries_update_status_day", f"UPDATE OF {_STATUS_DAY_COLUMNS}",
+        [_apply("order_summary_status_day", "old", -1), _apply("order_summary_status_day", "new", 1)]
+    ),
+    _trigger(
+        "order_summaries_update_customer_sku", f"UPDATE OF {_CUSTOMER_SKU_COLUMNS}",
+        [_apply(table, row, sign) for table in _CUSTOMER_SKU_TABLES for row, sign in (("old", -1), ("new", 1))]
+    ),
+)
+
+
+def _group_select(table: str) -> str:
+    """SQL aggregating orders into the groups of one summary table."""
+    keys = SUMMARY_KEYS[table]
+    values = ", ".join(expr.format(row="orders") for _, expr in keys)
+    positions = ", ".join(str(i + 1) for i in range(len(keys)))
+    return (
+        f"SELECT {values}, count(*), sum(orders.quantity), sum(orders.order_amount) "
+        f"FROM orders GROUP BY {positions}"
+    )
+
+
+def create_summaries(engine) -> None:
+    """
+    Create the summary triggers if missing (idempotent).
+
+    Summaries created over existing orders are built from them. The
+    tables themselves are created with the other models.
+
+    Args:
+        engine: SQLAlchemy engine of the order database
+    """
+    with engine.begin() as conn:
+        existed = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'order_summaries_insert'")
+        ).first() is not None
+        for trigger in _TRIGGERS:
+            conn.execute(text(trigger))
+        if not existed:
+            _rebuild(conn)
+
+
+def rebuild_summaries() -> None:
+    """
+    Recompute every summary from ``orders`` in one transaction.
+
+    Raises:
+        DatabaseError: If database operation fails
+    """
+    try:
+        with get_db_transaction() as conn:
+            _rebuild(conn)
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to rebuild order summaries: {str(e)}")
+
+
+def _rebuild(conn) -> None:
+    for table, keys in SUMMARY_KEYS.items():
+        names = ", ".join(name for name, _ in keys)
+        conn.execute(text(f"DELETE FROM {table}"))
+        conn.execute(text(
+            f"INSERT INTO {table} ({names}, {', '.join(TOTAL_COLUMNS)}) {_group_select(table)}"
+        ))
+
+
+def verify_summaries(tolerance: float = 0.005) -> List[Dict[str, Any]]:
+    """
+    Compare every summary with totals aggregated from ``orders``.
+
+    Args:
+        tolerance: Largest accepted difference of an amount total
+            (summing and subtracting floats drifts slightly)
+
+    Returns:
+        list: One entry per mismatched group (table, key, expected and
+        actual totals, None for a missing group); empty if consistent
+    """
+    mismatches = []
+    with get_db_connection() as conn:
+        for table, keys in SUMMARY_KEYS.items():
+            names = ", ".join(name for name, _ in keys)
+            width = len(keys)
+            actual = {
+                tuple(row[:width]): tuple(row[width:])
+                for row in conn.execute(text(f"SELECT {names}, {', '.join(TOTAL_COLUMNS)} FROM {table}"))
+            }
+            expected = {
+                tuple(row[:width]): tuple(row[width:])
+                for row in conn.execute(text(_group_select(table)))
+            }
+            for key in expected.keys() | actual.keys():
+                want, got = expected.get(key), actual.get(key)
+                if want is None or got is None or want[:2] != got[:2] or abs(want[2] - got[2]) > tolerance:
+                    mismatches.append({"table": table, "key": key, "expected": want, "actual": got})
+    return mismatches
+
+
+def _totals(row) -> Dict[str, Any]:
+    """Totals of a summary row (amounts rounded to cents)."""
+    return {
+        "order_count": row.order_count or 0,
+        "total_quantity": row.total_quantity or 0,
+        "total_amount": round(row.total_amount or 0.0, 2),
+    }
+
+
+def _day(value: Optional[Union[str, date]], name: str) -> Optional[str]:
+    """Validate a date bound and return it as an ``order_day`` value."""
+    day = validate_day(value, name)
+    return day.isoformat() if day is not None else None
+
+
+def _rank_column(table, rank_by: str):
+    if rank_by not in RANK_COLUMNS:
+        raise ValidationError(f"Invalid rank_by: {rank_by}. Must be one of: {', '.join(RANK_COLUMNS)}")
+    return getattr(table, RANK_COLUMNS[rank_by])
+
+
+def status_totals_statement(start_date=None, end_date=None):
+    """
+    Build the per-status totals query over a range of order days.
+
+    Args:
+        start_date: First order day (inclusive), None for no bound
+        end_date: Last order day (inclusive), None for no bound
+
+    Returns:
+        Select: ``(order_status, order_count, total_quantity, total_amount)`` rows
+
+    Raises:
+        ValidationError: If a date is invalid
+    """
+    statement = select(
+        StatusDaySummary.order_status,
+        func.sum(StatusDaySummary.order_count).label("order_count"),
+        func.sum(StatusDaySummary.total_quantity).label("total_quantity"),
+        func.sum(StatusDaySummary.total_amount).label("total_amount"),
+    ).group_by(StatusDaySummary.order_status).order_by(StatusDaySummary.order_status)
+    return _day_range(statement, start_date, end_date)
+
+
+def daily_totals_statement(start_date=None, end_date=None, order_status: Optional[str] = None):
+    """
+    Build the per-day totals query, optionally for one status.
+
+    Args:
+        start_date: First order day (inclusive), None for no bound
+        end_date: Last order day (inclusive), None for no bound
+        order_status: Only count orders in this status
+
+    Returns:
+        Select: ``(order_day, order_count, total_quantity, total_amount)`` rows, oldest first
+
+    Raises:
+        ValidationError: If a date is invalid
+    """
+    statement = select(
+        StatusDaySummary.order_day,
+        func.sum(StatusDaySummary.order_count).label("order_count"),
+        func.sum(StatusDaySummary.total_quantity).label("total_quantity"),
+        func.sum(StatusDaySummary.total_amount).label("total_amount"),
+    ).group_by(StatusDaySummary.order_day).order_by(StatusDaySummary.order_day)
+    if order_status:
+        statement = statement.where(StatusDaySummary.order_status == order_status.upper())
+    return _day_range(statement, start_date, end_date)
+
+
+def _day_range(statement, start_date, end_date):
+    start, end = _day(start_date, "start_date"), _day(end_date, "end_date")
+    if start is not None:
+        statement = statement.where(StatusDaySummary.order_day >= start)
+    if end is not None:
+        statement = statement.where(StatusDaySummary.order_day <= end)
+    return statement
+
+
+def top_skus_statement(customer_name: Optional[str] = None, limit: Optional[int] = 10, rank_by: str = "amount"):
+    """
+    Build the top SKUs query, overall or for one customer.
+
+    Args:
+        customer_name: Only this customer's orders (None for all orders)
+        limit: SKUs to return (at most 100)
+        rank_by: "amount", "quantity" or "orders"
+
+    Returns:
+        Select: ``(product_sku, order_count, total_quantity, total_amount)`` rows, best first
+
+    Raises:
+        ValidationError: If rank_by is invalid
+    """
+    table = SkuSummary if customer_name is None else CustomerSkuSummary
+    rank = _rank_column(table, rank_by)
+    statement = select(table.product_sku, table.order_count, table.total_quantity, table.total_amount)
+    if customer_name is not None:
+        statement = statement.where(CustomerSkuSummary.customer_name == customer_name)
+    return statement.order_by(rank.desc(), table.product_sku).limit(page_size(limit))
+
+
+def customer_summary_statement(customer_name: str):
+    """
+    Build the query for one customer's totals.
+
+    Args:
+        customer_name: Name of the customer
+
+    Returns:
+        Select: at most one ``(order_count, total_quantity, total_amount)`` row
+    """
+    return select(
+        CustomerSummary.order_count, CustomerSummary.total_quantity, CustomerSummary.total_amount
+    ).where(CustomerSummary.customer_name == customer_name)
+
+
+def status_totals_result(rows, start_date=None, end_date=None) -> Dict[str, Any]:
+    """Shape status_totals_statement rows as the get_status_totals result."""
+    statuses = [{"order_status": row.order_status, **_totals(row)} for row in rows]
+    return {
+        "start_date": _day(start_date, "start_date"),
+        "end_date": _day(end_date, "end_date"),
+        "order_count": sum(status["order_count"] for status in statuses),
+        "total_quantity": sum(status["total_quantity"] for status in statuses),
+        "total_amount": round(sum(status["total_amount"] for status in statuses), 2),
+        "statuses": statuses,
+    }
+
+
+def daily_totals_result(rows) -> List[Dict[str, Any]]:
+    """Shape daily_totals_statement rows as the get_daily_totals result."""
+    return [{"order_day": row.order_day, **_totals(row)} for row in rows]
+
+
+def top_skus_result(rows) -> List[Dict[str, Any]]:
+    """Shape top_skus_statement rows as the get_top_skus result."""
+    return [{"product_sku": row.product_sku, **_totals(row)} for row in rows]
+
+
+def customer_summary_result(customer_name: str, row) -> Dict[str, Any]:
+    """Shape a customer_summary_statement row as the get_customer_summary result."""
+    if row is None:
+        return {"customer_name": customer_name, "order_count": 0, "total_quantity": 0, "total_amount": 0.0}
+    return {"customer_name": customer_name, **_totals(row)}
+
+
+def get_status_totals(start_date=None, end_date=None) -> Dict[str, Any]:
+    """
+    Get order totals per status over a range of order days.
+
+    Args:
+        start_date: First order day, YYYY-MM-DD or date (inclusive, optional)
+        end_date: Last order day, YYYY-MM-DD or date (inclusive, optional)
+
+    Returns:
+        dict: Overall order_count, total_quantity and total_amount, and
+        the same totals per status in "statuses"
+
+    Raises:
+        ValidationError: If a date is invalid
+        DatabaseError: If database operation fails
+    """
+    statement = status_totals_statement(start_date, end_date)
+    try:
+        with get_db_connection() as conn:
+            rows = conn.execute(statement).all()
+        return status_totals_result(rows, start_date, end_date)
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve order totals: {str(e)}")
+
+
+def get_daily_totals(start_date=None, end_date=None, order_status: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Get order totals per order day, optionally for one status.
+
+    Args:
+        start_date: First order day, YYYY-MM-DD or date (inclusive, optional)
+        end_date: Last order day, YYYY-MM-DD or date (inclusive, optional)
+        order_status: Only count orders in this status (optional)
+
+    Returns:
+        list: order_day with its order_count, total_quantity and
+        total_amount, oldest first (days without orders are left out)
+
+    Raises:
+        ValidationError: If a date or the status is invalid
+        DatabaseError: If database operation fails
+    """
+    if order_status:
+        validate_order_status(order_status)
+    statement = daily_totals_statement(start_date, end_date, order_status)
+    try:
+        with get_db_connection() as conn:
+            rows = conn.execute(statement).all()
+        return daily_totals_result(rows)
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve order totals: {str(e)}")
+
+
+def get_top_skus(customer_name: Optional[str] = None, limit: Optional[int] = 10, rank_by: str = "amount") -> List[Dict[str, Any]]:
+    """
+    Get the best-selling product SKUs, overall or for one customer.
+
+    Args:
+        customer_name: Only this customer's orders (optional)
+        limit: SKUs to return (default 10, at most 100)
+        rank_by: "amount" (revenue), "quantity" or "orders"
+
+    Returns:
+        list: product_sku with its order_count, total_quantity and
+        total_amount, best first
+
+    Raises:
+        ValidationError: If rank_by is invalid
+        DatabaseError: If database operation fails
+    """
+    statement = top_skus_statement(customer_name, limit, rank_by)
+    try:
+        with get_db_connection() as conn:
+            rows = conn.execute(statement).all()
+        return top_skus_result(rows)
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve top SKUs: {str(e)}")
+
+
+def get_customer_summary(customer_name: str) -> Dict[str, Any]:
+    """
+    Get a customer's order totals.
+
+    Args:
+        customer_name: Name of the customer
+
+    Returns:
+        dict: customer_name, order_count, total_quantity and total_amount
+        (zero for a customer without orders)
+
+    Raises:
+        DatabaseError: If database operation fails
+    """
+    try:
+        with get_db_connection() as conn:
+            row = conn.execute(customer_summary_statement(customer_name)).first()
+        return customer_summary_result(customer_name, row)
+
+    except SQLAlchemyError as e:
+        raise DatabaseError(f"Failed to retrieve customer summary: {str(e)}")
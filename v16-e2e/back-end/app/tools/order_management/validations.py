@@ -1,7 +1,7 @@
 """
 Validation logic for order management system.
 """
-from datetime import datetime
+from datetime import date, datetime
 from .exceptions import ValidationError
 
 # Valid order statuses
@@ -101,6 +101,34 @@ def validate_order_data(order_data, is_update=False):
         raise ValidationError("; ".join(errors))
 
 
+def normalize_new_order(order_data):
+    """
+    Validate a new order and apply create_order's defaults.
+    
+    The status is upper-cased (PENDING if empty), an ISO format order_date
+    string is parsed and a missing order_date becomes the current time.
+    
+    Args:
+        order_data: Dictionary with create_order's fields
+        
+    Returns:
+        dict: Column values for the orders table (a new dictionary)
+        
+    Raises:
+        ValidationError: If validation fails
+    """
+    values = dict(order_data)
+    status = values.get("order_status")
+    values["order_status"] = (status.upper() if isinstance(status, str) else status) or "PENDING"
+    validate_order_data(values, is_update=False)
+    
+    if isinstance(values.get("order_date"), str):
+        values["order_date"] = datetime.fromisoformat(values["order_date"])
+    elif values.get("order_date") is None:
+        values["order_date"] = datetime.utcnow()
+    return values
+
+
 def validate_order_status(status):
     """
     Validate an order status value.
@@ -116,3 +144,29 @@ def validate_order_status(status):
     
     if status.upper() not in VALID_ORDER_STATUSES:
         raise ValidationError(f"order_status must be one of: {', '.join(VALID_ORDER_STATUSES)}")
+
+
+def validate_day(value, name="date"):
+    """
+    Validate an optional date bound given as YYYY-MM-DD, date or datetime.
+    
+    Args:
+        value: Date bound (None or "" for no bound)
+        name: Argument name used in the error message
+        
+    Returns:
+        date: The day, or None for no bound
+        
+    Raises:
+        ValidationError: If the value is not a valid date
+    """
+    if value is None or value == "":
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValidationError(f"Invalid {name}: {value}. Expected YYYY-MM-DD format.")
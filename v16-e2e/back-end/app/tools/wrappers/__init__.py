@@ -11,7 +11,12 @@ from .order_tools import (
     get_customer_orders,
     find_orders,
     update_order,
-    list_all_orders
+    list_all_orders,
+    create_orders_in_bulk,
+    update_orders_in_bulk,
+    summarize_orders,
+    get_top_products,
+    summarize_customer
 )
 
 from .email_tools import (
@@ -24,13 +29,18 @@ from .email_tools import (
 
 # Export all tools
 __all__ = [
-    # Order tools (6)
+    # Order tools (11)
     "create_new_order",
     "get_order",
     "get_customer_orders",
     "find_orders",
     "update_order",
     "list_all_orders",
+    "create_orders_in_bulk",
+    "update_orders_in_bulk",
+    "summarize_orders",
+    "get_top_products",
+    "summarize_customer",
     
     # Email tools (5)
     "send_simple_email",
@@ -0,0 +1,335 @@
+"""
+Async order management tools for AI agent.
+
+The same tools as order_tools.py (names, parameters, descriptions and
+results), as coroutines over order_management.async_operations, so the
+agent awaits order database I/O instead of running it on the event loop.
+create_orders_in_bulk has no async library counterpart and runs the
+bulk import in a worker thread.
+
+The agent factory registers these instead of order_tools when
+ORDER_TOOLS_ASYNC is on and aiosqlite is installed.
+"""
+import asyncio
+from agent_framework import tool
+from typing import Dict, List, Optional
+from datetime import datetime
+
+from ..order_management import (
+    async_operations,
+    create_orders_bulk,
+    DEFAULT_PAGE_SIZE,
+    OrderNotFoundError,
+    VersionConflictError,
+    ValidationError,
+    DatabaseError
+)
+from ...utils.tracing import traced
+from . import order_tools
+from .order_tools import MAX_TOOL_BULK_ORDERS, bulk_update_result
+
+
+def _described_as(sync_tool):
+    """Give an async tool the description (docstring) of its sync counterpart."""
+    def decorator(func):
+        func.__doc__ = sync_tool.func.__doc__
+        return func
+    return decorator
+
+
+@tool
+@traced("tool.create_new_order")
+@_described_as(order_tools.create_new_order)
+async def create_new_order(
+    order_date: str,
+    customer_name: str,
+    billing_address: str,
+    product_sku: str,
+    quantity: int,
+    order_amount: float,
+    remarks: Optional[str] = None
+) -> dict:
+    try:
+        # Parse order_date string to datetime object
+        order_date_obj = None
+        if order_date:
+            try:
+                order_date_obj = datetime.strptime(order_date, "%Y-%m-%d")
+            except ValueError:
+                return {
+                    "status": "error",
+                    "error": f"Invalid date format: {order_date}. Expected YYYY-MM-DD format.",
+                    "error_type": "ValidationError"
+                }
+
+        return await async_operations.create_order(
+            customer_name=customer_name,
+            billing_address=billing_address,
+            product_sku=product_sku,
+            quantity=quantity,
+            order_amount=order_amount,
+            remarks=remarks,
+            order_date=order_date_obj
+        )
+    except (ValidationError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+
+
+@tool
+@traced("tool.get_order")
+@_described_as(order_tools.get_order)
+async def get_order(order_id: str) -> dict:
+    try:
+        return await async_operations.get_order_by_id(order_id)
+    except (OrderNotFoundError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+
+
+@tool
+@traced("tool.get_customer_orders")
+@_described_as(order_tools.get_customer_orders)
+async def get_customer_orders(
+    customer_name: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None
+) -> dict:
+    try:
+        page = await async_operations.get_orders_by_customer_page(customer_name, limit=limit, cursor=cursor)
+        return {
+            "status": "success",
+            "customer_name": customer_name,
+            "order_count": len(page["orders"]),
+            "orders": page["orders"],
+            "has_more": page["next_cursor"] is not None,
+            "next_cursor": page["next_cursor"]
+        }
+    except (ValidationError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+
+
+@tool
+@traced("tool.find_orders")
+@_described_as(order_tools.find_orders)
+async def find_orders(
+    product_sku: Optional[str] = None,
+    billing_address: Optional[str] = None,
+    order_status: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None
+) -> dict:
+    try:
+        page = await async_operations.search_orders_page(
+            product_sku=product_sku,
+            billing_address=billing_address,
+            order_status=order_status,
+            limit=limit,
+            cursor=cursor
+        )
+        return {
+            "status": "success",
+            "match_count": len(page["orders"]),
+            "search_criteria": {
+                "product_sku": product_sku,
+                "billing_address": billing_address,
+                "order_status": order_status
+            },
+            "orders": page["orders"],
+            "has_more": page["next_cursor"] is not None,
+            "next_cursor": page["next_cursor"]
+        }
+    except (ValidationError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+
+
+@tool
+@traced("tool.update_order")
+@_described_as(order_tools.update_order)
+async def update_order(order_id: str, new_status: str, expected_version: Optional[int] = None) -> dict:
+    try:
+        return await async_operations.update_order_status(order_id, new_status, expected_version=expected_version)
+    except (OrderNotFoundError, VersionConflictError, ValidationError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+
+
+@tool
+@traced("tool.list_all_orders")
+@_described_as(order_tools.list_all_orders)
+async def list_all_orders(limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> dict:
+    try:
+        page = await async_operations.get_orders_page(limit=limit, cursor=cursor)
+        return {
+            "status": "success",
+            "order_count": len(page["orders"]),
+            "orders": page["orders"],
+            "has_more": page["next_cursor"] is not None,
+            "next_cursor": page["next_cursor"]
+        }
+    except (ValidationError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+
+
+@tool
+@traced("tool.create_orders_in_bulk")
+@_described_as(order_tools.create_orders_in_bulk)
+async def create_orders_in_bulk(orders: List[dict]) -> dict:
+    if len(orders) > MAX_TOOL_BULK_ORDERS:
+        return {
+            "status": "error",
+            "error": f"At most {MAX_TOOL_BULK_ORDERS} orders per call; split the orders into several calls",
+            "error_type": "ValidationError"
+        }
+    try:
+        report = await asyncio.to_thread(create_orders_bulk, orders, return_ids=True)
+    except DatabaseError as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+    return {
+        "status": "success" if report["failed"] == 0 else "partial" if report["created"] else "error",
+        "created_count": report["created"],
+        "failed_count": report["failed"],
+        "order_ids": report["order_ids"],
+        "errors": report["errors"]
+    }
+
+
+@tool
+@traced("tool.update_orders_in_bulk")
+@_described_as(order_tools.update_orders_in_bulk)
+async def update_orders_in_bulk(
+    new_status: str,
+    order_ids: Optional[List[str]] = None,
+    expected_versions: Optional[Dict[str, int]] = None,
+    current_status: Optional[str] = None,
+    customer_name: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> dict:
+    if len(order_ids or ()) + len(expected_versions or {}) > MAX_TOOL_BULK_ORDERS:
+        return {
+            "status": "error",
+            "error": f"At most {MAX_TOOL_BULK_ORDERS} order IDs per call; split them into several calls",
+            "error_type": "ValidationError"
+        }
+    try:
+        report = await async_operations.update_order_status_bulk(
+            new_status,
+            order_ids=order_ids,
+            expected_versions=expected_versions,
+            current_status=current_status,
+            customer_name=customer_name,
+            start_date=start_date,
+            end_date=end_date
+        )
+    except (ValidationError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+    return bulk_update_result(report)
+
+
+@tool
+@traced("tool.summarize_orders")
+@_described_as(order_tools.summarize_orders)
+async def summarize_orders(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    by_day: bool = False
+) -> dict:
+    try:
+        result = {"status": "success", **await async_operations.get_status_totals(start_date, end_date)}
+        if by_day:
+            result["days"] = await async_operations.get_daily_totals(start_date, end_date)
+        return result
+    except (ValidationError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+
+
+@tool
+@traced("tool.get_top_products")
+@_described_as(order_tools.get_top_products)
+async def get_top_products(
+    customer_name: Optional[str] = None,
+    limit: int = 10,
+    rank_by: str = "amount"
+) -> dict:
+    try:
+        products = await async_operations.get_top_skus(customer_name, limit=limit, rank_by=rank_by)
+        return {
+            "status": "success",
+            "customer_name": customer_name,
+            "rank_by": rank_by,
+            "products": products
+        }
+    except (ValidationError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+
+
+@tool
+@traced("tool.summarize_customer")
+@_described_as(order_tools.summarize_customer)
+async def summarize_customer(customer_name: str, top_products: int = 5) -> dict:
+    try:
+        return {
+            "status": "success",
+            **await async_operations.get_customer_summary(customer_name),
+            "top_products": await async_operations.get_top_skus(customer_name, limit=top_products)
+        }
+    except (ValidationError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+
+
+# Export all tools (same names as order_tools)
+__all__ = [
+    "create_new_order",
+    "get_order",
+    "get_customer_orders",
+    "find_orders",
+    "update_order",
+    "list_all_orders",
+    "create_orders_in_bulk",
+    "update_orders_in_bulk",
+    "summarize_orders",
+    "get_top_products",
+    "summarize_customer"
+]
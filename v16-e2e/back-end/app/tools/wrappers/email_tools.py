@@ -18,9 +18,11 @@ from ..email_sender import (
     SMTPConnectionError,
     EmailSendError
 )
+from ...utils.tracing import traced
 
 
 @tool
+@traced("tool.send_simple_email")
 def send_simple_email(recipients: str, subject: str, body: str, cc: Optional[str] = None) -> dict:
     """
     Send a plain text email to one or more recipients.
@@ -67,6 +69,7 @@ def send_simple_email(recipients: str, subject: str, body: str, cc: Optional[str
 
 
 @tool
+@traced("tool.send_formatted_email")
 def send_formatted_email(recipients: str, subject: str, html_body: str, cc: Optional[str] = None) -> dict:
     """
     Send an HTML formatted email with styling and formatting.
@@ -115,6 +118,7 @@ def send_formatted_email(recipients: str, subject: str, html_body: str, cc: Opti
 
 
 @tool
+@traced("tool.send_email_with_files")
 def send_email_with_files(
     recipients: str,
     subject: str,
@@ -165,6 +169,7 @@ def send_email_with_files(
 
 
 @tool
+@traced("tool.send_complete_email")
 def send_complete_email(
     recipients: str,
     subject: str,
@@ -222,6 +227,7 @@ def send_complete_email(
 
 
 @tool
+@traced("tool.test_email_connection")
 def test_email_connection() -> dict:
     """
     Test the SMTP connection and authentication.
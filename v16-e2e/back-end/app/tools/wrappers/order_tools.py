@@ -5,24 +5,38 @@ These tools wrap the order_management library operations
 and expose them to the agent framework using the @tool decorator.
 """
 from agent_framework import tool
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 
 # Import order management operations
 from ..order_management import (
     create_order,
+    create_orders_bulk,
     get_order_by_id,
-    get_orders_by_customer,
-    search_orders,
+    get_orders_by_customer_page,
+    search_orders_page,
     update_order_status,
-    get_all_orders,
+    update_order_status_bulk,
+    get_orders_page,
+    get_status_totals,
+    get_daily_totals,
+    get_top_skus,
+    get_customer_summary,
+    DEFAULT_PAGE_SIZE,
     OrderNotFoundError,
+    VersionConflictError,
     ValidationError,
     DatabaseError
 )
+from ...utils.tracing import traced
+
+# Orders one create_orders_in_bulk call may carry (larger imports go
+# through scripts/import_orders.py)
+MAX_TOOL_BULK_ORDERS = 500
 
 
 @tool
+@traced("tool.create_new_order")
 def create_new_order(
     order_date: str,
     customer_name: str,
@@ -91,6 +105,7 @@ def create_new_order(
 
 
 @tool
+@traced("tool.get_order")
 def get_order(order_id: str) -> dict:
     """
     Retrieve a specific order by its ID.
@@ -123,55 +138,74 @@ def get_order(order_id: str) -> dict:
 
 
 @tool
-def get_customer_orders(customer_name: str) -> dict:
+@traced("tool.get_customer_orders")
+def get_customer_orders(
+    customer_name: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None
+) -> dict:
     """
-    Retrieve all orders for a specific customer.
+    Retrieve the orders of a specific customer, one page at a time.
     Orders are returned sorted by order date (newest first).
     
     Args:
-        customer_name: Customer's name (case-insensitive, partial match)
+        customer_name: Customer's name (exact match)
+        limit: Orders per page (default 20, at most 100)
+        cursor: next_cursor from the previous result, to get the next page
         
     Returns:
-        dict: List of orders for the customer
+        dict: A page of the customer's orders; next_cursor is set when
+        more orders follow
         
     Example:
         ```
         result = get_customer_orders(customer_name="John Doe")
+        
+        # Next page
+        result = get_customer_orders(customer_name="John Doe", cursor=result["next_cursor"])
         ```
     """
     try:
-        orders = get_orders_by_customer(customer_name)
+        page = get_orders_by_customer_page(customer_name, limit=limit, cursor=cursor)
         return {
             "status": "success",
             "customer_name": customer_name,
-            "order_count": len(orders),
-            "orders": orders
+            "order_count": len(page["orders"]),
+            "orders": page["orders"],
+            "has_more": page["next_cursor"] is not None,
+            "next_cursor": page["next_cursor"]
         }
-    except DatabaseError as e:
+    except (ValidationError, DatabaseError) as e:
         return {
             "status": "error",
             "error": str(e),
-            "error_type": "DatabaseError"
+            "error_type": type(e).__name__
         }
 
 
 @tool
+@traced("tool.find_orders")
 def find_orders(
     product_sku: Optional[str] = None,
     billing_address: Optional[str] = None,
-    order_status: Optional[str] = None
+    order_status: Optional[str] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    cursor: Optional[str] = None
 ) -> dict:
     """
-    Search for orders using multiple criteria.
+    Search for orders using multiple criteria, one page at a time.
     All criteria are optional - use at least one for meaningful results.
+    Best matches come first, then newest first.
     
     Args:
         product_sku: Product SKU to search for (partial match, case-insensitive)
         billing_address: Billing address to search for (partial match, case-insensitive)
         order_status: Exact order status (PENDING, CONFIRMED, SHIPPED, DELIVERED, CANCELLED)
+        limit: Orders per page (default 20, at most 100)
+        cursor: next_cursor from the previous result (same criteria), to get the next page
         
     Returns:
-        dict: List of matching orders
+        dict: A page of matching orders; next_cursor is set when more matches follow
         
     Example:
         ```
@@ -183,23 +217,30 @@ def find_orders(
         
         # Find shipped orders in California
         result = find_orders(billing_address="California", order_status="SHIPPED")
+        
+        # Next page of pending orders
+        result = find_orders(order_status="PENDING", cursor=result["next_cursor"])
         ```
     """
     try:
-        orders = search_orders(
+        page = search_orders_page(
             product_sku=product_sku,
             billing_address=billing_address,
-            order_status=order_status
+            order_status=order_status,
+            limit=limit,
+            cursor=cursor
         )
         return {
             "status": "success",
-            "match_count": len(orders),
+            "match_count": len(page["orders"]),
             "search_criteria": {
                 "product_sku": product_sku,
                 "billing_address": billing_address,
                 "order_status": order_status
             },
-            "orders": orders
+            "orders": page["orders"],
+            "has_more": page["next_cursor"] is not None,
+            "next_cursor": page["next_cursor"]
         }
     except (ValidationError, DatabaseError) as e:
         return {
@@ -210,16 +251,20 @@ def find_orders(
 
 
 @tool
-def update_order(order_id: str, new_status: str) -> dict:
+@traced("tool.update_order")
+def update_order(order_id: str, new_status: str, expected_version: Optional[int] = None) -> dict:
     """
     Update the status of an existing order.
     
     Args:
         order_id: Unique order identifier
         new_status: New order status (must be: PENDING, CONFIRMED, SHIPPED, DELIVERED, or CANCELLED)
+        expected_version: The order's version when you read it; the update
+            fails with VersionConflictError if it changed since (optional)
         
     Returns:
-        dict: Updated order details
+        dict: Updated order details (unchanged if the order already has
+        the new status)
         
     Example:
         ```
@@ -230,8 +275,8 @@ def update_order(order_id: str, new_status: str) -> dict:
         ```
     """
     try:
-        return update_order_status(order_id, new_status)
-    except (OrderNotFoundError, ValidationError, DatabaseError) as e:
+        return update_order_status(order_id, new_status, expected_version=expected_version)
+    except (OrderNotFoundError, VersionConflictError, ValidationError, DatabaseError) as e:
         return {
             "status": "error",
             "error": str(e),
@@ -240,39 +285,285 @@ def update_order(order_id: str, new_status: str) -> dict:
 
 
 @tool
-def list_all_orders(limit: Optional[int] = None) -> dict:
+@traced("tool.list_all_orders")
+def list_all_orders(limit: int = DEFAULT_PAGE_SIZE, cursor: Optional[str] = None) -> dict:
     """
-    Retrieve all orders from the system.
+    Retrieve all orders from the system, one page at a time.
     Orders are returned sorted by order date (newest first).
     
     Args:
-        limit: Optional maximum number of orders to return (default: all orders)
+        limit: Orders per page (default 20, at most 100)
+        cursor: next_cursor from the previous result, to get the next page
         
     Returns:
-        dict: List of all orders
+        dict: A page of orders; next_cursor is set when more orders follow
         
     Example:
         ```
-        # Get all orders
+        # Get the 20 most recent orders
         result = list_all_orders()
         
         # Get 10 most recent orders
         result = list_all_orders(limit=10)
+        
+        # Next page
+        result = list_all_orders(cursor=result["next_cursor"])
         ```
     """
     try:
-        orders = get_all_orders(limit=limit)
+        page = get_orders_page(limit=limit, cursor=cursor)
         return {
             "status": "success",
-            "order_count": len(orders),
-            "limit_applied": limit if limit else "none",
-            "orders": orders
+            "order_count": len(page["orders"]),
+            "orders": page["orders"],
+            "has_more": page["next_cursor"] is not None,
+            "next_cursor": page["next_cursor"]
+        }
+    except (ValidationError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+
+
+@tool
+@traced("tool.create_orders_in_bulk")
+def create_orders_in_bulk(orders: List[dict]) -> dict:
+    """
+    Create several orders in one call.
+    Each order takes the same fields as create_new_order; invalid orders
+    are skipped and reported by their position in the list (starting at 1).
+    
+    Args:
+        orders: Orders to create (at most 500), each with customer_name,
+            billing_address, product_sku, quantity, order_amount and
+            optionally remarks, order_status and order_date (ISO format)
+        
+    Returns:
+        dict: How many orders were created and failed, the created order
+            IDs, and the error of each failed order
+        
+    Example:
+        ```
+        result = create_orders_in_bulk(orders=[
+            {"customer_name": "John Doe", "billing_address": "123 Main St",
+             "product_sku": "LAPTOP-001", "quantity": 1, "order_amount": 999.99},
+            {"customer_name": "Jane Roe", "billing_address": "9 Elm St",
+             "product_sku": "MOUSE-002", "quantity": 2, "order_amount": 39.98}
+        ])
+        ```
+    """
+    if len(orders) > MAX_TOOL_BULK_ORDERS:
+        return {
+            "status": "error",
+            "error": f"At most {MAX_TOOL_BULK_ORDERS} orders per call; split the orders into several calls",
+            "error_type": "ValidationError"
         }
+    try:
+        report = create_orders_bulk(orders, return_ids=True)
     except DatabaseError as e:
         return {
             "status": "error",
             "error": str(e),
-            "error_type": "DatabaseError"
+            "error_type": type(e).__name__
+        }
+    return {
+        "status": "success" if report["failed"] == 0 else "partial" if report["created"] else "error",
+        "created_count": report["created"],
+        "failed_count": report["failed"],
+        "order_ids": report["order_ids"],
+        "errors": report["errors"]
+    }
+
+
+@tool
+@traced("tool.update_orders_in_bulk")
+def update_orders_in_bulk(
+    new_status: str,
+    order_ids: Optional[List[str]] = None,
+    expected_versions: Optional[Dict[str, int]] = None,
+    current_status: Optional[str] = None,
+    customer_name: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None
+) -> dict:
+    """
+    Set the status of many orders in one call, picked by ID and/or by
+    filters (e.g. all CONFIRMED orders from one day). Orders already in
+    the new status are left as they are.
+    
+    Args:
+        new_status: New order status (PENDING, CONFIRMED, SHIPPED, DELIVERED or CANCELLED)
+        order_ids: Orders to update (at most 500)
+        expected_versions: Order ID -> version when you read it; those
+            orders are only updated if unchanged since
+        current_status: Only update orders currently in this status
+        customer_name: Only update this customer's orders
+        start_date: Only orders placed on or after this date (YYYY-MM-DD)
+        end_date: Only orders placed on or before this date (YYYY-MM-DD)
+        
+    Returns:
+        dict: How many orders were updated, counts per outcome and, per
+            order, its outcome (updated, unchanged, not_matched,
+            version_conflict or not_found) and new version
+        
+    Example:
+        ```
+        # Ship all of yesterday's confirmed orders
+        result = update_orders_in_bulk(
+            new_status="SHIPPED",
+            current_status="CONFIRMED",
+            start_date="2024-01-15",
+            end_date="2024-01-15"
+        )
+        ```
+    """
+    if len(order_ids or ()) + len(expected_versions or {}) > MAX_TOOL_BULK_ORDERS:
+        return {
+            "status": "error",
+            "error": f"At most {MAX_TOOL_BULK_ORDERS} order IDs per call; split them into several calls",
+            "error_type": "ValidationError"
+        }
+    try:
+        report = update_order_status_bulk(
+            new_status,
+            order_ids=order_ids,
+            expected_versions=expected_versions,
+            current_status=current_status,
+            customer_name=customer_name,
+            start_date=start_date,
+            end_date=end_date
+        )
+    except (ValidationError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+    return bulk_update_result(report)
+
+
+def bulk_update_result(report: dict) -> dict:
+    """Shape an update_order_status_bulk report as the tool result (at most 500 results)."""
+    return {
+        "status": "success",
+        "new_status": report["new_status"],
+        "updated_count": report["updated_count"],
+        "counts": report["counts"],
+        "results": report["results"][:MAX_TOOL_BULK_ORDERS],
+        "results_truncated": len(report["results"]) > MAX_TOOL_BULK_ORDERS
+    }
+
+
+@tool
+@traced("tool.summarize_orders")
+def summarize_orders(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    by_day: bool = False
+) -> dict:
+    """
+    Get order count, quantity and revenue totals per order status,
+    optionally between two order dates. Use this instead of listing
+    orders to answer questions about totals (e.g. revenue this month).
+    
+    Args:
+        start_date: First order date in YYYY-MM-DD format (inclusive, optional)
+        end_date: Last order date in YYYY-MM-DD format (inclusive, optional)
+        by_day: Also return the totals of each day with orders
+        
+    Returns:
+        dict: Overall totals and totals per status (and per day if requested)
+        
+    Example:
+        ```
+        # Revenue by status in January 2024
+        result = summarize_orders(start_date="2024-01-01", end_date="2024-01-31")
+        ```
+    """
+    try:
+        result = {"status": "success", **get_status_totals(start_date, end_date)}
+        if by_day:
+            result["days"] = get_daily_totals(start_date, end_date)
+        return result
+    except (ValidationError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+
+
+@tool
+@traced("tool.get_top_products")
+def get_top_products(
+    customer_name: Optional[str] = None,
+    limit: int = 10,
+    rank_by: str = "amount"
+) -> dict:
+    """
+    Get the best-selling product SKUs, overall or for one customer.
+    
+    Args:
+        customer_name: Only count this customer's orders (optional)
+        limit: Number of products to return (default 10, at most 100)
+        rank_by: Rank by "amount" (revenue), "quantity" or "orders"
+        
+    Returns:
+        dict: Products with their order count, quantity and revenue, best first
+        
+    Example:
+        ```
+        result = get_top_products(customer_name="John Doe", limit=5)
+        ```
+    """
+    try:
+        products = get_top_skus(customer_name, limit=limit, rank_by=rank_by)
+        return {
+            "status": "success",
+            "customer_name": customer_name,
+            "rank_by": rank_by,
+            "products": products
+        }
+    except (ValidationError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
+        }
+
+
+@tool
+@traced("tool.summarize_customer")
+def summarize_customer(customer_name: str, top_products: int = 5) -> dict:
+    """
+    Get a customer's order count, quantity and revenue totals and their
+    most bought products.
+    
+    Args:
+        customer_name: Customer's full name
+        top_products: Number of top products to include (default 5)
+        
+    Returns:
+        dict: The customer's totals and top products by revenue
+        
+    Example:
+        ```
+        result = summarize_customer(customer_name="John Doe")
+        ```
+    """
+    try:
+        return {
+            "status": "success",
+            **get_customer_summary(customer_name),
+            "top_products": get_top_skus(customer_name, limit=top_products)
+        }
+    except (ValidationError, DatabaseError) as e:
+        return {
+            "status": "error",
+            "error": str(e),
+            "error_type": type(e).__name__
         }
 
 
@@ -283,5 +574,10 @@ __all__ = [
     "get_customer_orders",
     "find_orders",
     "update_order",
-    "list_all_orders"
+    "list_all_orders",
+    "create_orders_in_bulk",
+    "update_orders_in_bulk",
+    "summarize_orders",
+    "get_top_products",
+    "summarize_customer"
 ]
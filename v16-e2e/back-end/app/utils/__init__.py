@@ -5,6 +5,11 @@ from .logger import (
     get_logger,
     add_context_to_logger,
     configure_default_logger,
+    flush_log_queues,
+    stop_log_listeners,
+    get_log_queue_stats,
+    configure_log_sampling,
+    get_log_sampler,
     LogColors,
 )
 
@@ -62,6 +67,11 @@ __all__ = [
     "get_logger",
     "add_context_to_logger",
     "configure_default_logger",
+    "flush_log_queues",
+    "stop_log_listeners",
+    "get_log_queue_stats",
+    "configure_log_sampling",
+    "get_log_sampler",
     "LogColors",
     # Exceptions
     "MSEv15E2EException",
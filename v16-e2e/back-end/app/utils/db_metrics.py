@@ -0,0 +1,243 @@
+"""
+Database Instrumentation
+
+SQLAlchemy cursor hooks that time every statement executed by any engine
+in the process and record it in the SQLite query histogram.
+
+The same hooks:
+
+- count statements per request and per tool call (``query_scope``), so N+1
+  patterns show up as a jump in ``db_queries_per_request`` /
+  ``tool_db_queries`` and in the request log's ``db_queries`` field;
+- keep the slowest recent statements in a ring buffer together with their
+  ``EXPLAIN QUERY PLAN`` output, served at ``/info/profiling/queries``.
+
+The plan is only collected for statements over the slow threshold, so the
+per-statement cost stays a timer, a counter increment and a comparison.
+"""
+import logging
+import math
+import time
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from typing import Deque, Iterator, List, Optional
+
+from .metrics import SQLITE_QUERY_DURATION
+
+logger = logging.getLogger(__name__)
+
+# Statement verbs used as the ``operation`` label; anything else is "OTHER"
+KNOWN_OPERATIONS = frozenset([
+    "SELECT", "INSERT", "UPDATE", "DELETE", "REPLACE", "WITH",
+    "PRAGMA", "BEGIN", "COMMIT", "ROLLBACK", "CREATE", "DROP", "ALTER",
+])
+
+# Cap on cached (engine, statement) -> histogram child entries
+MAX_CACHED_STATEMENTS = 1024
+
+# Histogram children keyed by (engine, statement), so the hot path skips
+# label parsing; compiled statements are reused strings with cached hashes
+_children: dict = {}
+
+
+@lru_cache(maxsize=64)
+def _database_label(database: str) -> str:
+    """Short database label from the URL database path (e.g. 'orders')."""
+    return Path(database).stem if database else "memory"
+
+
+def _operation_label(statement: str) -> str:
+    """Leading SQL verb, bounded to KNOWN_OPERATIONS."""
+    verb = statement.lstrip()[:8].split(None, 1)
+    operation = verb[0].upper() if verb else ""
+    return operation if operation in KNOWN_OPERATIONS else "OTHER"
+
+
+# Longest statement / parameter text kept in the slow query log
+MAX_STATEMENT_LENGTH = 2000
+MAX_PARAMETERS_LENGTH = 500
+
+# Statements EXPLAIN QUERY PLAN accepts
+EXPLAINABLE_OPERATIONS = frozenset(["SELECT", "INSERT", "UPDATE", "DELETE", "REPLACE", "WITH"])
+
+
+class QueryScope:
+    """Statement counter for one request or tool call."""
+
+    __slots__ = ("name", "count", "parent")
+
+    def __init__(self, name: str, parent: Optional["QueryScope"] = None):
+        self.name = name
+        self.count = 0
+        self.parent = parent
+
+
+_query_scope: ContextVar[Optional[QueryScope]] = ContextVar("query_scope", default=None)
+
+
+@contextmanager
+def query_scope(name: str) -> Iterator[QueryScope]:
+    """
+    Count the statements executed in this context.
+
+    Scopes nest: a tool call's count is added to the enclosing request's
+    count when the tool scope closes.
+
+    Args:
+        name: Scope name (route or tool name), recorded on slow queries
+
+    Yields:
+        QueryScope: Counter for this scope
+    """
+    parent = _query_scope.get()
+    scope = QueryScope(name, parent)
+    token = _query_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _query_scope.reset(token)
+        if parent is not None:
+            parent.count += scope.count
+
+
+def current_query_scope() -> Optional[QueryScope]:
+    """Get the innermost active query scope, if any."""
+    return _query_scope.get()
+
+
+class SlowQueryLog:
+    """Ring buffer of recent slow statements with their query plans."""
+
+    def __init__(self, threshold_ms: float = math.inf, maxlen: int = 100):
+        self.threshold = threshold_ms / 1000
+        self.entries: Deque[dict] = deque(maxlen=maxlen)
+        self.total = 0
+
+    def record(self, conn, statement: str, parameters, executemany: bool, duration: float) -> dict:
+        """Add a slow statement, with its query plan, to the log."""
+        scope = _query_scope.get()
+        entry = {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "database": _database_label(conn.engine.url.database or ""),
+            "duration_ms": round(duration * 1000, 3),
+            "scope": scope.name if scope is not None else None,
+            "statement": statement[:MAX_STATEMENT_LENGTH],
+            "parameters": repr(parameters)[:MAX_PARAMETERS_LENGTH],
+            "plan": _explain(conn, statement, parameters, executemany),
+        }
+        self.entries.append(entry)
+        self.total += 1
+        return entry
+
+    def snapshot(self) -> List[dict]:
+        """Recorded slow statements, newest first."""
+        return list(reversed(self.entries))
+
+    def clear(self) -> None:
+        """Drop recorded statements."""
+        self.entries.clear()
+        self.total = 0
+
+
+# Global slow query log (disabled until instrument_sqlalchemy sets a threshold)
+_slow_query_log = SlowQueryLog()
+
+
+def get_slow_query_log() -> SlowQueryLog:
+    """
+    Get the global slow query log.
+
+    Returns:
+        SlowQueryLog: Global slow query log
+    """
+    return _slow_query_log
+
+
+def _explain(conn, statement: str, parameters, executemany: bool) -> List[str]:
+    """Run EXPLAIN QUERY PLAN for a statement on the same DBAPI connection."""
+    if executemany or conn.engine.dialect.name != "sqlite":
+        return []
+    if _operation_label(statement) not in EXPLAINABLE_OPERATIONS:
+        return []
+
+    # A raw DBAPI cursor bypasses the engine events, so this is not timed or logged again
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+        return [str(row[-1]) for row in cursor.fetchall()]
+    except Exception as e:
+        return [f"EXPLAIN failed: {e}"]
+    finally:
+        cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._metrics_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start_time = getattr(context, "_metrics_start_time", None)
+    if start_time is None:
+        return
+    duration = time.perf_counter() - start_time
+
+    engine = conn.engine
+    child = _children.get((engine, statement))
+    if child is None:
+        if len(_children) >= MAX_CACHED_STATEMENTS:
+            _children.clear()
+        child = _children[(engine, statement)] = SQLITE_QUERY_DURATION.labels(
+            _database_label(engine.url.database or ""),
+            _operation_label(statement)
+        )
+    child.observe(duration)
+
+    scope = _query_scope.get()
+    if scope is not None:
+        scope.count += 1
+
+    if duration >= _slow_query_log.threshold:
+        entry = _slow_query_log.record(conn, statement, parameters, executemany, duration)
+        logger.warning(
+            f"Slow query ({entry['duration_ms']:.1f}ms on {entry['database']}): {statement[:200]}",
+            extra={"duration_ms": entry["duration_ms"], "query_plan": entry["plan"], "scope": entry["scope"]}
+        )
+
+
+def instrument_sqlalchemy(slow_query_ms: Optional[float] = None, history: int = 100) -> None:
+    """
+    Attach query timing hooks to all SQLAlchemy engines (idempotent).
+
+    Args:
+        slow_query_ms: Statements at least this slow go to the slow query
+            log (None disables it)
+        history: Number of slow statements kept
+    """
+    global _slow_query_log
+
+    # Imported here so the request middleware can use query_scope without
+    # loading SQLAlchemy at startup
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    if slow_query_ms is not None:
+        _slow_query_log = SlowQueryLog(slow_query_ms, history)
+
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+__all__ = [
+    "QueryScope",
+    "SlowQueryLog",
+    "query_scope",
+    "current_query_scope",
+    "get_slow_query_log",
+    "instrument_sqlalchemy",
+]
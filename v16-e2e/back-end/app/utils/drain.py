@@ -0,0 +1,104 @@
+"""
+Request Drain
+
+Tracks in-flight HTTP requests so shutdown can wait for them instead of
+cutting off SSE streams and tool calls mid-write.
+
+Shutdown happens in two phases. When the shutdown signal arrives,
+``/health/ready`` starts reporting not ready while requests are still
+served, giving load balancers time to stop routing here. Once draining
+starts, new requests (other than health checks) are refused with 503 and
+``Connection: close``, and shutdown waits until the requests already
+running have finished or the drain deadline passes.
+"""
+import asyncio
+import time
+from threading import Lock
+
+
+class RequestDrain:
+    """In-flight request counter with a draining flag."""
+
+    def __init__(self):
+        self._in_flight = 0
+        self._shutting_down = False
+        self._draining = False
+        self._lock = Lock()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently being processed."""
+        return self._in_flight
+
+    @property
+    def shutting_down(self) -> bool:
+        """Whether shutdown has begun (readiness reports not ready)."""
+        return self._shutting_down
+
+    @property
+    def draining(self) -> bool:
+        """Whether the service is shutting down and refusing new requests."""
+        return self._draining
+
+    def enter(self) -> None:
+        """Record a request starting."""
+        with self._lock:
+            self._in_flight += 1
+
+    def leave(self) -> None:
+        """Record a request finishing."""
+        with self._lock:
+            self._in_flight -= 1
+
+    def begin_shutdown(self) -> None:
+        """Report not ready while still serving requests."""
+        self._shutting_down = True
+
+    def start(self) -> None:
+        """Start draining: report not ready and refuse new requests."""
+        with self._lock:
+            self._shutting_down = True
+            self._draining = True
+
+    async def wait_idle(self, timeout: float) -> bool:
+        """
+        Wait until no requests are in flight.
+
+        Args:
+            timeout: Maximum seconds to wait
+
+        Returns:
+            bool: True if all requests finished, False if the timeout passed
+        """
+        deadline = time.monotonic() + timeout
+        while self._in_flight > 0:
+            if time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(0.05)
+        return True
+
+    def reset(self) -> None:
+        """Leave draining mode (for tests and in-process restarts)."""
+        with self._lock:
+            self._shutting_down = False
+            self._draining = False
+
+
+# Global drain state
+_request_drain = RequestDrain()
+
+
+def get_request_drain() -> RequestDrain:
+    """
+    Get the global request drain.
+
+    Returns:
+        RequestDrain: In-flight request tracker
+    """
+    return _request_drain
+
+
+__all__ = [
+    "RequestDrain",
+    "get_request_drain",
+]
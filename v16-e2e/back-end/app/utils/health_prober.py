@@ -0,0 +1,283 @@
+"""
+Health Prober
+
+Checks the service's dependencies in the background and caches the results,
+so ``/health`` and ``/health/ready`` answer from memory in O(1) instead of
+touching the database, MCP server, SMTP server and model endpoint on every
+load balancer poll.
+
+Each round runs all probes concurrently, each bounded by a timeout:
+
+- ``database``: ``SELECT 1`` and a write-lock check (``BEGIN IMMEDIATE`` /
+  ``ROLLBACK``) on the order database, through a separate sqlite3
+  connection so probes never show up in query metrics;
+- ``mcp_server``: an MCP ``ping`` over a short-lived session;
+- ``email``: TCP connect to the SMTP server and read its greeting;
+- ``model``: an HTTP request to the model endpoint (any HTTP response means
+  it is reachable; authentication is not exercised).
+
+Every result carries the time it was taken, so stale results are visible.
+"""
+import asyncio
+import logging
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from .helpers import format_timestamp
+
+logger = logging.getLogger(__name__)
+
+HEALTHY = "healthy"
+DEGRADED = "degraded"
+UNHEALTHY = "unhealthy"
+UNKNOWN = "unknown"
+
+
+class ComponentHealth:
+    """Result of the latest probe of one component."""
+
+    __slots__ = ("status", "message", "checked_at", "latency_ms", "details")
+
+    def __init__(
+        self,
+        status: str,
+        message: str,
+        checked_at: Optional[str] = None,
+        latency_ms: Optional[float] = None,
+        details: Optional[Dict[str, Any]] = None
+    ):
+        self.status = status
+        self.message = message
+        self.checked_at = checked_at
+        self.latency_ms = latency_ms
+        self.details = details or {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "message": self.message,
+            "checked_at": self.checked_at,
+            "latency_ms": self.latency_ms,
+            **self.details,
+        }
+
+
+class HealthProber:
+    """
+    Background prober for external dependencies.
+
+    Args:
+        settings: Application settings instance
+        interval: Seconds between probe rounds
+        timeout: Per-probe timeout in seconds
+    """
+
+    def __init__(self, settings, interval: float = 30.0, timeout: float = 5.0):
+        self.settings = settings
+        self.interval = interval
+        self.timeout = timeout
+        self.rounds = 0
+        self._task: Optional[asyncio.Task] = None
+        self._probes: Dict[str, Callable[[], Awaitable[str]]] = {
+            "database": self._probe_database,
+            "mcp_server": self._probe_mcp,
+            "email": self._probe_smtp,
+            "model": self._probe_model,
+        }
+        self._results: Dict[str, ComponentHealth] = {
+            name: ComponentHealth(UNKNOWN, "Not checked yet") for name in self._probes
+        }
+
+    @property
+    def running(self) -> bool:
+        """Whether background probing is running."""
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        """Run a first probe round, then keep probing in the background."""
+        if self.running:
+            return
+        await self.probe_all()
+        self._task = asyncio.get_running_loop().create_task(self._run(), name="health-prober")
+
+    async def stop(self) -> None:
+        """Stop background probing."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.probe_all()
+            except Exception as e:  # pragma: no cover - probes handle their own errors
+                logger.error(f"Health probe round failed: {e}", exc_info=True)
+
+    async def probe_all(self) -> Dict[str, ComponentHealth]:
+        """Run all probes concurrently and update the cached results."""
+        await asyncio.gather(*(self._probe(name, probe) for name, probe in self._probes.items()))
+        self.rounds += 1
+        return self._results
+
+    async def _probe(self, name: str, probe: Callable[[], Awaitable[str]]) -> None:
+        start = time.perf_counter()
+        try:
+            message = await asyncio.wait_for(probe(), self.timeout)
+            status = HEALTHY
+        except asyncio.TimeoutError:
+            status, message = self._failure_status(name), f"Probe timed out after {self.timeout:g}s"
+        except Exception as e:
+            status, message = self._failure_status(name), f"{type(e).__name__}: {e}"
+
+        previous = self._results[name]
+        self._results[name] = ComponentHealth(
+            status,
+            message,
+            checked_at=format_timestamp(datetime.now()),
+            latency_ms=round((time.perf_counter() - start) * 1000, 2),
+            details=self._details(name)
+        )
+        if status != previous.status:
+            log = logger.info if status == HEALTHY else logger.warning
+            log(f"Health of {name} changed: {previous.status} -> {status} ({message})")
+
+    def _failure_status(self, name: str) -> str:
+        """Status of a failed component: only hard dependencies make the service unhealthy."""
+        if name == "database" or (name == "mcp_server" and self.settings.MCP_SERVER_REQUIRED):
+            return UNHEALTHY
+        return DEGRADED
+
+    def _details(self, name: str) -> Dict[str, Any]:
+        settings = self.settings
+        if name == "database":
+            return {"path": str(settings.ORDER_DB_PATH)}
+        if name == "mcp_server":
+            return {"url": settings.MCP_SERVER_URL, "required": settings.MCP_SERVER_REQUIRED}
+        if name == "email":
+            return {"server": f"{settings.SMTP_SERVER}:{settings.SMTP_PORT}"}
+        return {"endpoint": settings.AZURE_AI_PROJECT_ENDPOINT}
+
+    # ---- probes (return a message on success, raise on failure) ----
+
+    async def _probe_database(self) -> str:
+        return await asyncio.to_thread(_check_sqlite, Path(self.settings.ORDER_DB_PATH), self.timeout)
+
+    async def _probe_mcp(self) -> str:
+        from mcp import ClientSession
+        from mcp.client.streamable_http import streamablehttp_client
+
+        async with streamablehttp_client(self.settings.MCP_SERVER_URL, timeout=self.timeout) as (read, write, _):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                await session.send_ping()
+        return "MCP server answered ping"
+
+    async def _probe_smtp(self) -> str:
+        reader, writer = await asyncio.open_connection(self.settings.SMTP_SERVER, self.settings.SMTP_PORT)
+        try:
+            greeting = (await reader.readline()).decode(errors="replace").strip()
+            if not greeting.startswith("220"):
+                raise ConnectionError(f"Unexpected SMTP greeting: {greeting[:80]!r}")
+            writer.write(b"QUIT\r\n")
+            await writer.drain()
+        finally:
+            writer.close()
+        return "SMTP server reachable"
+
+    async def _probe_model(self) -> str:
+        import httpx
+
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            response = await client.get(self.settings.AZURE_AI_PROJECT_ENDPOINT)
+        if response.status_code >= 500:
+            raise ConnectionError(f"Model endpoint returned HTTP {response.status_code}")
+        return "Model endpoint reachable"
+
+    # ---- cached results ----
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Latest result of every probe."""
+        return {name: result.to_dict() for name, result in self._results.items()}
+
+    def is_ready(self, name: str) -> bool:
+        """Whether the latest probe of a component succeeded."""
+        return self._results[name].status == HEALTHY
+
+
+def _check_sqlite(path: Path, timeout: float) -> str:
+    """Check the database answers queries and can take a write lock."""
+    # mode=rw: never create the file, and fail on a read-only database
+    conn = sqlite3.connect(f"file:{path.resolve()}?mode=rw", uri=True, timeout=timeout)
+    try:
+        conn.execute("SELECT 1").fetchone()
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("ROLLBACK")
+    finally:
+        conn.close()
+    return "Database readable and writable"
+
+
+# Global prober instance
+_health_prober: Optional[HealthProber] = None
+
+
+def get_health_prober() -> Optional[HealthProber]:
+    """
+    Get the global health prober.
+
+    Returns:
+        HealthProber or None if not started
+    """
+    return _health_prober
+
+
+async def start_health_prober(settings) -> Optional[HealthProber]:
+    """
+    Create the global health prober, run a first round and start probing.
+
+    Args:
+        settings: Application settings instance
+
+    Returns:
+        HealthProber or None if disabled
+    """
+    global _health_prober
+
+    if not settings.ENABLE_HEALTH_PROBES:
+        return None
+
+    if _health_prober is None:
+        _health_prober = HealthProber(
+            settings,
+            interval=settings.HEALTH_PROBE_INTERVAL_SECONDS,
+            timeout=settings.HEALTH_PROBE_TIMEOUT_SECONDS
+        )
+    await _health_prober.start()
+    logger.info(f"Health prober started (every {settings.HEALTH_PROBE_INTERVAL_SECONDS}s)")
+    return _health_prober
+
+
+async def stop_health_prober() -> None:
+    """Stop the global health prober."""
+    global _health_prober
+
+    if _health_prober is not None:
+        await _health_prober.stop()
+        _health_prober = None
+
+
+__all__ = [
+    "ComponentHealth",
+    "HealthProber",
+    "get_health_prober",
+    "start_health_prober",
+    "stop_health_prober",
+]
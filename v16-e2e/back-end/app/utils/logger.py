@@ -3,15 +3,38 @@ Logging System Configuration
 
 This module provides comprehensive logging setup with console and file handlers,
 structured formatting, and log rotation support.
+
+Handlers are attached behind a bounded queue: log calls merge the message
+arguments (and render any traceback) and enqueue the record, while
+formatting and console/file I/O (including rotation) run on a dedicated
+listener thread.
 """
 
+import atexit
+import copy
+import json
 import logging
+import queue
+import random
 import sys
+import threading
+import time
 from pathlib import Path
 from typing import Optional
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional fast encoder
+    orjson = None
+
+
+# Queue full policies
+QUEUE_POLICY_DROP = "drop"
+QUEUE_POLICY_BLOCK = "block"
+QUEUE_POLICIES = (QUEUE_POLICY_DROP, QUEUE_POLICY_BLOCK)
+
 
 # ANSI color codes for console output
 class LogColors:
@@ -28,6 +51,13 @@ class LogColors:
     DIM = "\033[2m"
 
 
+def _format_exception(formatter: logging.Formatter, record: logging.LogRecord) -> Optional[str]:
+    """Return the record's traceback text, rendered by the queue handler or now"""
+    if record.exc_info:
+        return formatter.formatException(record.exc_info)
+    return record.exc_text or None
+
+
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with color support for console output"""
     
@@ -41,8 +71,22 @@ class ColoredFormatter(logging.Formatter):
     
     def __init__(self, include_timestamp: bool = True):
         self.include_timestamp = include_timestamp
+        # Timestamps have one-second resolution, so cache the rendered
+        # prefix per second instead of formatting it for every record
+        self._cached_second: Optional[int] = None
+        self._cached_timestamp = ""
         super().__init__()
     
+    def _format_timestamp(self, created: float) -> str:
+        """Return the colored timestamp prefix for a record creation time"""
+        second = int(created)
+        if second != self._cached_second:
+            self._cached_timestamp = (
+                f"{LogColors.DIM}[{datetime.fromtimestamp(second).strftime('%Y-%m-%d %H:%M:%S')}]{LogColors.RESET} "
+            )
+            self._cached_second = second
+        return self._cached_timestamp
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record with colors"""
         # Get color for level
@@ -51,7 +95,7 @@ class ColoredFormatter(logging.Formatter):
         # Format timestamp
         timestamp = ""
         if self.include_timestamp:
-            timestamp = f"{LogColors.DIM}[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}]{LogColors.RESET} "
+            timestamp = self._format_timestamp(record.created)
         
         # Format level
         level = f"{level_color}[{record.levelname:8}]{LogColors.RESET}"
@@ -65,9 +109,10 @@ class ColoredFormatter(logging.Formatter):
         # Combine
         formatted = f"{timestamp}{level} {location} {message}"
         
-        # Add exception info if present
-        if record.exc_info:
-            formatted += "\n" + self.formatException(record.exc_info)
+        # Add exception info if present (pre-rendered when queued)
+        exception = _format_exception(self, record)
+        if exception:
+            formatted += "\n" + exception
         
         return formatted
 
@@ -88,9 +133,10 @@ class StructuredFormatter(logging.Formatter):
             "message": record.getMessage(),
         }
         
-        # Add exception info if present
-        if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+        # Add exception info if present (pre-rendered when queued)
+        exception = _format_exception(self, record)
+        if exception:
+            log_data["exception"] = exception
         
         # Add extra fields if present
         if hasattr(record, "session_id"):
@@ -105,6 +151,334 @@ class StructuredFormatter(logging.Formatter):
         return " | ".join(parts)
 
 
+# Attributes present on every LogRecord; anything else came from ``extra``
+_RESERVED_RECORD_ATTRS = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime"}
+
+
+def _json_dumps(data: dict) -> str:
+    """Serialize a log payload, preferring orjson when installed"""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            pass  # e.g. integers wider than 64 bits; fall back to stdlib
+    return json.dumps(data, default=str, ensure_ascii=False)
+
+
+class JSONFormatter(logging.Formatter):
+    """JSON lines formatter for file output, including all ``extra`` fields"""
+    
+    def __init__(self):
+        super().__init__()
+        self._cached_second: Optional[int] = None
+        self._cached_timestamp = ""
+    
+    def _format_timestamp(self, record: logging.LogRecord) -> str:
+        """Return an ISO-8601 timestamp with milliseconds, cached per second"""
+        second = int(record.created)
+        if second != self._cached_second:
+            self._cached_timestamp = datetime.fromtimestamp(second).strftime("%Y-%m-%dT%H:%M:%S")
+            self._cached_second = second
+        return f"{self._cached_timestamp}.{int(record.msecs):03d}"
+    
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as a single JSON object"""
+        log_data = {
+            "timestamp": self._format_timestamp(record),
+            "level": record.levelname,
+            "module": record.name,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        
+        # Add all extra fields
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED_RECORD_ATTRS and not key.startswith("_"):
+                log_data[key] = value
+        
+        # Add exception info if present (pre-rendered when queued)
+        exception = _format_exception(self, record)
+        if exception:
+            log_data["exception"] = exception
+        if record.stack_info:
+            log_data["stack"] = self.formatStack(record.stack_info)
+        
+        return _json_dumps(log_data)
+
+
+class LogSampler:
+    """
+    Sampling rules for high-volume log records.
+    
+    Rates are matched by longest prefix, on the logger name for
+    per-logger rules and on the request path for per-route rules.
+    Unmatched loggers and routes are always logged. Warnings and errors,
+    and records with a ``duration_ms`` at or above the slow threshold,
+    are never sampled out.
+    """
+    
+    def __init__(
+        self,
+        logger_rates: Optional[dict[str, float]] = None,
+        route_rates: Optional[dict[str, float]] = None,
+        slow_request_ms: float = 1000.0,
+    ):
+        """
+        Initialize log sampler.
+        
+        Args:
+            logger_rates: Sample rates keyed by logger name prefix
+            route_rates: Sample rates keyed by request path prefix
+            slow_request_ms: Duration at or above which records are kept
+        """
+        self.logger_rates = self._sorted(logger_rates or {})
+        self.route_rates = self._sorted(route_rates or {})
+        self.slow_request_ms = slow_request_ms
+    
+    @staticmethod
+    def _sorted(rates: dict[str, float]) -> list[tuple[str, float]]:
+        """Order rules so the longest prefix matches first"""
+        return sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+    
+    @staticmethod
+    def _match(rules: list[tuple[str, float]], key: str) -> float:
+        """Find the rate for the longest matching prefix"""
+        for prefix, rate in rules:
+            if key.startswith(prefix):
+                return rate
+        return 1.0
+    
+    @staticmethod
+    def _roll(rate: float) -> bool:
+        """Make a sampling decision for a rate"""
+        return rate >= 1.0 or random.random() < rate
+    
+    def sample_route(self, path: str) -> bool:
+        """
+        Decide whether a request's routine logs are kept.
+        
+        Args:
+            path: Request path
+            
+        Returns:
+            bool: True if the request is sampled in
+        """
+        if not self.route_rates:
+            return True
+        return self._roll(self._match(self.route_rates, path))
+    
+    def is_slow(self, duration_ms: float) -> bool:
+        """Check whether a duration exceeds the slow threshold"""
+        return duration_ms >= self.slow_request_ms
+    
+    def should_log(self, record: logging.LogRecord) -> bool:
+        """
+        Decide whether a record is kept.
+        
+        A ``sampled`` attribute (set via ``extra``) records a decision
+        already made upstream, e.g. per request, and is honoured as-is.
+        
+        Args:
+            record: Log record
+            
+        Returns:
+            bool: True if the record should be emitted
+        """
+        if record.levelno >= logging.WARNING:
+            return True
+        
+        sampled = getattr(record, "sampled", None)
+        if sampled is not None:
+            return sampled
+        
+        duration_ms = getattr(record, "duration_ms", None)
+        if duration_ms is not None and self.is_slow(duration_ms):
+            return True
+        
+        if not self.logger_rates:
+            return True
+        return self._roll(self._match(self.logger_rates, record.name))
+
+
+class SamplingFilter(logging.Filter):
+    """Logging filter that applies the active LogSampler"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        return get_log_sampler().should_log(record)
+
+
+_log_sampler = LogSampler()
+
+
+def configure_log_sampling(
+    logger_rates: Optional[dict[str, float]] = None,
+    route_rates: Optional[dict[str, float]] = None,
+    slow_request_ms: float = 1000.0,
+) -> LogSampler:
+    """
+    Install the global log sampler.
+    
+    Args:
+        logger_rates: Sample rates keyed by logger name prefix
+        route_rates: Sample rates keyed by request path prefix
+        slow_request_ms: Duration at or above which records are kept
+        
+    Returns:
+        LogSampler: The installed sampler
+    """
+    global _log_sampler
+    _log_sampler = LogSampler(logger_rates, route_rates, slow_request_ms)
+    return _log_sampler
+
+
+def get_log_sampler() -> LogSampler:
+    """
+    Get the global log sampler (keeps everything unless configured).
+    
+    Returns:
+        LogSampler: Active sampler
+    """
+    return _log_sampler
+
+
+class BoundedQueueHandler(QueueHandler):
+    """
+    Queue handler with a bounded queue and a configurable full policy.
+    
+    As in ``QueueHandler``, the message arguments are merged into ``msg``
+    and any traceback is rendered to ``exc_text`` on the calling thread, so
+    the record no longer references caller objects that may change or
+    hold frames alive. Formatting and I/O are left to the listener thread.
+    When the queue is full, the ``drop`` policy discards the record
+    and counts it, while the ``block`` policy waits up to ``block_timeout``
+    seconds for space before dropping.
+    """
+    
+    def __init__(
+        self,
+        log_queue: queue.Queue,
+        policy: str = QUEUE_POLICY_DROP,
+        block_timeout: float = 1.0,
+    ):
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Queue policy must be one of: {', '.join(QUEUE_POLICIES)}")
+        super().__init__(log_queue)
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self.dropped = 0
+        self._drop_lock = threading.Lock()
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Snapshot the message and traceback; the listener formats the rest"""
+        message = record.getMessage()
+        record = copy.copy(record)  # Other handlers still see the original
+        record.message = message
+        record.msg = message
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue a record, applying the full policy"""
+        try:
+            if self.policy == QUEUE_POLICY_BLOCK:
+                self.queue.put(record, block=True, timeout=self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+
+
+# Renders tracebacks on the calling thread in BoundedQueueHandler.prepare
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+# Active queue listeners, keyed by logger name
+_listeners: dict[str, tuple[BoundedQueueHandler, QueueListener]] = {}
+_listeners_lock = threading.Lock()
+_atexit_registered = False
+
+# Package logger of the application's module loggers (``app.*``)
+APP_LOGGER_NAME = "app"
+
+# Handlers shared with the package logger by configure_default_logger
+_app_handlers: list[logging.Handler] = []
+
+
+def _stop_listener(name: str) -> None:
+    """Stop and forget the listener for a logger, draining pending records"""
+    with _listeners_lock:
+        entry = _listeners.pop(name, None)
+    if entry:
+        queue_handler, listener = entry
+        listener.stop()
+        for handler in listener.handlers:
+            handler.flush()
+            handler.close()
+
+
+def flush_log_queues(timeout: float = 5.0) -> bool:
+    """
+    Wait until every log queue has been processed and flush its handlers.
+    
+    Listeners keep running, so records logged afterwards are still handled.
+    
+    Args:
+        timeout: Maximum seconds to wait for the queues to drain
+        
+    Returns:
+        bool: True if all queues drained within the timeout
+    """
+    deadline = time.monotonic() + timeout
+    with _listeners_lock:
+        entries = list(_listeners.values())
+    
+    drained = True
+    for queue_handler, listener in entries:
+        while queue_handler.queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                drained = False
+                break
+            time.sleep(0.005)
+        for handler in listener.handlers:
+            handler.flush()
+    return drained
+
+
+def stop_log_listeners() -> None:
+    """Stop all queue listeners after draining their queues"""
+    with _listeners_lock:
+        names = list(_listeners)
+    for name in names:
+        _stop_listener(name)
+
+
+def get_log_queue_stats() -> dict:
+    """
+    Get queue depth and drop counts for all queued loggers.
+    
+    Returns:
+        dict: Stats keyed by logger name
+    """
+    with _listeners_lock:
+        entries = dict(_listeners)
+    return {
+        name: {
+            "policy": queue_handler.policy,
+            "capacity": queue_handler.queue.maxsize,
+            "pending": queue_handler.queue.qsize(),
+            "dropped": queue_handler.dropped,
+        }
+        for name, (queue_handler, _) in entries.items()
+    }
+
+
 def setup_logger(
     name: str,
     level: str = "INFO",
@@ -113,6 +487,11 @@ def setup_logger(
     backup_count: int = 5,
     enable_console: bool = True,
     enable_file: bool = True,
+    use_queue: bool = True,
+    queue_size: int = 10000,
+    queue_policy: str = QUEUE_POLICY_DROP,
+    log_format: str = "text",
+    sampling: bool = False,
 ) -> logging.Logger:
     """
     Setup logger with console and/or file handlers.
@@ -125,22 +504,32 @@ def setup_logger(
         backup_count: Number of backup files to keep
         enable_console: Enable console output
         enable_file: Enable file output
+        use_queue: Run handlers on a background listener thread
+        queue_size: Maximum number of pending records
+        queue_policy: Behavior when the queue is full ("drop" or "block")
+        log_format: File log format ("text" or "json")
+        sampling: Apply the global LogSampler before records are queued
         
     Returns:
         logging.Logger: Configured logger instance
     """
+    global _atexit_registered
+    
     logger = logging.getLogger(name)
     logger.setLevel(getattr(logging, level.upper()))
     
-    # Remove existing handlers to avoid duplicates
+    # Remove existing handlers (and any listener) to avoid duplicates
+    _stop_listener(name)
     logger.handlers.clear()
     
+    handlers: list[logging.Handler] = []
+    
     # Console handler
     if enable_console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.DEBUG)
         console_handler.setFormatter(ColoredFormatter(include_timestamp=True))
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
     
     # File handler with rotation
     if enable_file and log_file:
@@ -155,8 +544,27 @@ def setup_logger(
             encoding="utf-8"
         )
         file_handler.setLevel(logging.DEBUG)
-        file_handler.setFormatter(StructuredFormatter())
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(JSONFormatter() if log_format == "json" else StructuredFormatter())
+        handlers.append(file_handler)
+    
+    if use_queue and handlers:
+        queue_handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size), policy=queue_policy)
+        listener = QueueListener(queue_handler.queue, *handlers, respect_handler_level=True)
+        listener.start()
+        if sampling:
+            queue_handler.addFilter(SamplingFilter())
+        logger.addHandler(queue_handler)
+        
+        with _listeners_lock:
+            _listeners[name] = (queue_handler, listener)
+            if not _atexit_registered:
+                atexit.register(stop_log_listeners)
+                _atexit_registered = True
+    else:
+        for handler in handlers:
+            if sampling:
+                handler.addFilter(SamplingFilter())
+            logger.addHandler(handler)
     
     # Prevent propagation to root logger
     logger.propagate = False
@@ -215,13 +623,23 @@ def configure_default_logger(settings) -> logging.Logger:
     """
     Configure the default application logger from settings.
     
+    The same handlers are installed on the ``app`` package logger so module
+    loggers (``get_logger(__name__)``) reach the console and log file. The
+    root logger is left alone, so third-party library output is unchanged.
+    
     Args:
         settings: Application settings instance
         
     Returns:
         logging.Logger: Configured logger
     """
-    return setup_logger(
+    configure_log_sampling(
+        logger_rates=settings.log_sample_rates,
+        route_rates=settings.log_route_sample_rates,
+        slow_request_ms=settings.LOG_SLOW_REQUEST_MS,
+    )
+    
+    logger = setup_logger(
         name="msev15e2e",
         level=settings.LOG_LEVEL,
         log_file=settings.LOG_FILE_PATH if settings.LOG_TO_FILE else None,
@@ -229,4 +647,22 @@ def configure_default_logger(settings) -> logging.Logger:
         backup_count=settings.LOG_BACKUP_COUNT,
         enable_console=True,
         enable_file=settings.LOG_TO_FILE,
+        use_queue=settings.LOG_QUEUE_ENABLED,
+        queue_size=settings.LOG_QUEUE_SIZE,
+        queue_policy=settings.LOG_QUEUE_FULL_POLICY,
+        log_format=settings.LOG_FORMAT,
+        sampling=True,
     )
+    
+    # Route module loggers through the same handlers
+    global _app_handlers
+    app_logger = logging.getLogger(APP_LOGGER_NAME)
+    for handler in _app_handlers:
+        app_logger.removeHandler(handler)
+    _app_handlers = list(logger.handlers)
+    for handler in _app_handlers:
+        app_logger.addHandler(handler)
+    app_logger.setLevel(logger.level)
+    app_logger.propagate = False
+    
+    return logger
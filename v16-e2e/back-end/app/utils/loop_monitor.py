@@ -0,0 +1,227 @@
+"""
+Event Loop Monitor
+
+Measures how late the event loop runs scheduled work and captures what was
+blocking it.
+
+A heartbeat task sleeps for ``interval`` seconds in a loop; the extra time
+it takes to wake up is the scheduling lag every other coroutine saw, and
+is recorded in the ``event_loop_lag_seconds`` histogram.
+
+A watchdog thread checks the heartbeat. When it has not ticked for longer
+than ``threshold``, the loop is stuck in a single callback, so the watchdog
+captures the loop thread's stack at that moment. The stall is logged with
+the stack when the loop recovers and kept in a small history for the admin
+endpoint.
+
+The watchdog is used instead of asyncio debug mode (``slow_callback_duration``)
+because debug mode adds overhead to every callback and only reports the
+callback's repr, not where it was blocked.
+"""
+import asyncio
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Deque, List, Optional
+
+from .metrics import EVENT_LOOP_LAG, EVENT_LOOP_STALLS
+
+logger = logging.getLogger(__name__)
+
+
+class LoopStall:
+    """A period where the event loop did not run its heartbeat."""
+
+    __slots__ = ("detected_at", "duration", "stack")
+
+    def __init__(self, detected_at: float, duration: float, stack: List[str]):
+        self.detected_at = detected_at
+        self.duration = duration
+        self.stack = stack
+
+    def to_dict(self) -> dict:
+        return {
+            "detected_at": self.detected_at,
+            "duration_ms": round(self.duration * 1000, 2),
+            "stack": self.stack,
+        }
+
+
+class LoopMonitor:
+    """
+    Event loop lag monitor with a slow-callback watchdog.
+
+    Args:
+        interval: Heartbeat period in seconds
+        threshold: Stall duration that triggers a stack capture, in seconds
+        history: Number of recent stalls kept
+    """
+
+    def __init__(self, interval: float = 0.1, threshold: float = 0.1, history: int = 50):
+        self.interval = interval
+        self.threshold = threshold
+        self.stalls: Deque[LoopStall] = deque(maxlen=history)
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.stall_count = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread_id: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._watchdog: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._last_beat = time.monotonic()
+        self._pending: Optional[LoopStall] = None
+
+    @property
+    def running(self) -> bool:
+        """Whether the monitor is running."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start monitoring the running event loop (call from the loop)."""
+        if self.running:
+            return
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stop.clear()
+        self._task = self._loop.create_task(self._heartbeat(), name="loop-monitor")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        """Stop the heartbeat and watchdog."""
+        self._stop.set()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._watchdog is not None:
+            await asyncio.to_thread(self._watchdog.join)
+            self._watchdog = None
+
+    async def _heartbeat(self) -> None:
+        interval = self.interval
+        while True:
+            start = time.monotonic()
+            await asyncio.sleep(interval)
+            now = time.monotonic()
+            self._last_beat = now
+            lag = max(0.0, now - start - interval)
+            self.last_lag = lag
+            if lag > self.max_lag:
+                self.max_lag = lag
+            EVENT_LOOP_LAG.observe(lag)
+
+            stall = self._pending
+            if stall is not None:
+                self._pending = None
+                # The watchdog can itself be delayed (e.g. waiting for the GIL
+                # behind an import in another thread) and flag a heartbeat
+                # that then turns out to be on time
+                if lag >= self.threshold:
+                    stall.duration = lag
+                    self._report(stall)
+
+    def _watch(self) -> None:
+        # Check often enough to catch a stall while it is still happening
+        period = min(self.interval, self.threshold) / 2
+        while not self._stop.wait(period):
+            if self._pending is not None:
+                continue
+            stalled_for = time.monotonic() - self._last_beat - self.interval
+            if stalled_for > self.threshold:
+                frame = sys._current_frames().get(self._loop_thread_id)
+                stack = traceback.format_stack(frame) if frame is not None else []
+                self._pending = LoopStall(time.time(), stalled_for, [line.rstrip() for line in stack])
+
+    def _report(self, stall: LoopStall) -> None:
+        self.stalls.append(stall)
+        self.stall_count += 1
+        EVENT_LOOP_STALLS.inc()
+        logger.warning(
+            f"Event loop blocked for {stall.duration * 1000:.0f}ms; stack at detection:\n"
+            + "\n".join(stall.stack[-15:]),
+            extra={"duration_ms": round(stall.duration * 1000, 2), "loop_stall": True}
+        )
+
+    def status(self) -> dict:
+        """Current lag statistics and recent stalls (newest first)."""
+        return {
+            "running": self.running,
+            "interval_ms": self.interval * 1000,
+            "threshold_ms": self.threshold * 1000,
+            "last_lag_ms": round(self.last_lag * 1000, 3),
+            "max_lag_ms": round(self.max_lag * 1000, 3),
+            "stall_count": self.stall_count,
+            "stalls": [stall.to_dict() for stall in reversed(self.stalls)],
+        }
+
+
+# Global monitor instance
+_loop_monitor: Optional[LoopMonitor] = None
+
+
+def get_loop_monitor() -> Optional[LoopMonitor]:
+    """
+    Get the global loop monitor.
+
+    Returns:
+        LoopMonitor or None if not started
+    """
+    return _loop_monitor
+
+
+def start_loop_monitor(settings) -> Optional[LoopMonitor]:
+    """
+    Create and start the global loop monitor from settings.
+
+    Must be called from the running event loop.
+
+    Args:
+        settings: Application settings instance
+
+    Returns:
+        LoopMonitor or None if disabled
+    """
+    global _loop_monitor
+
+    if not settings.ENABLE_LOOP_MONITOR:
+        return None
+
+    if _loop_monitor is None:
+        _loop_monitor = LoopMonitor(
+            interval=settings.LOOP_MONITOR_INTERVAL_MS / 1000,
+            threshold=settings.LOOP_SLOW_CALLBACK_MS / 1000,
+            history=settings.LOOP_STALL_HISTORY
+        )
+    _loop_monitor.start()
+    logger.info(
+        f"Event loop monitor started (interval {settings.LOOP_MONITOR_INTERVAL_MS}ms, "
+        f"slow callback threshold {settings.LOOP_SLOW_CALLBACK_MS}ms)"
+    )
+    return _loop_monitor
+
+
+async def stop_loop_monitor() -> None:
+    """Stop the global loop monitor."""
+    global _loop_monitor
+
+    if _loop_monitor is not None:
+        await _loop_monitor.stop()
+        _loop_monitor = None
+
+
+__all__ = [
+    "LoopMonitor",
+    "LoopStall",
+    "get_loop_monitor",
+    "start_loop_monitor",
+    "stop_loop_monitor",
+]
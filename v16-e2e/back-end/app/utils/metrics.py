@@ -0,0 +1,477 @@
+"""
+Prometheus Metrics
+
+Lightweight in-process metrics (counters, gauges, histograms) rendered in
+the Prometheus text exposition format.
+
+Observations are on hot paths (every request, query and tool call), so the
+implementation avoids per-observation allocation: label children are cached
+by their label tuple and histogram buckets are plain per-bucket counters that
+are only made cumulative when scraped.
+
+Observations also come from worker threads (SQLAlchemy cursor hooks run on
+``to_thread`` tool workers), and ``value += amount`` is not atomic, so each
+child updates under its own lock. The uncontended lock keeps an
+observation within its microsecond budget (see benchmarks/bench_metrics.py);
+a histogram snapshot takes the same lock, so a scrape never sees ``_count``
+and ``_sum`` that disagree.
+"""
+import math
+import threading
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Default latency buckets in seconds (1ms .. 60s)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+)
+
+# Buckets for per-request / per-tool-call statement counts
+COUNT_BUCKETS: Tuple[float, ...] = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+# Buckets for fast operations such as SQLite queries (50us .. 1s)
+FAST_BUCKETS: Tuple[float, ...] = (
+    0.00005, 0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0
+)
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value the way Prometheus expects"""
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    if value != value:
+        return "NaN"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """Escape a label value"""
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    """Render a label set, e.g. {method="GET",le="0.1"}"""
+    parts = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+class _Metric(ABC):
+    """Base class for metric families"""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+
+    @abstractmethod
+    def _new_child(self):
+        """Create the per-label-set child holding the values"""
+
+    def labels(self, *values: str):
+        """
+        Get the child metric for a label combination.
+
+        Args:
+            *values: Label values, in labelnames order
+
+        Returns:
+            The child metric for these labels
+        """
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _default(self):
+        """Child for metrics declared without labels"""
+        return self._children[()]
+
+    def clear(self) -> None:
+        """Reset all recorded values"""
+        with self._lock:
+            self._children.clear()
+            if not self.labelnames:
+                self._children[()] = self._new_child()
+
+    def collect(self) -> List[str]:
+        """Render the metric family as exposition lines"""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.metric_type}",
+        ]
+        for values, child in list(self._children.items()):
+            lines.extend(self._render_child(values, child))
+        return lines
+
+    @abstractmethod
+    def _render_child(self, values: Tuple[str, ...], child) -> Iterable[str]:
+        """Render one child's exposition lines"""
+
+
+class _CounterChild:
+    __slots__ = ("value", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+
+class Counter(_Metric):
+    """Monotonically increasing counter"""
+
+    metric_type = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment an unlabelled counter"""
+        self._default().inc(amount)
+
+    def _render_child(self, values, child):
+        yield f"{self.name}_total{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+
+
+class _GaugeChild:
+    __slots__ = ("value", "function", "_lock")
+
+    def __init__(self):
+        self.value = 0.0
+        self.function: Optional[Callable[[], float]] = None
+        self._lock = threading.Lock()
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self.value -= amount
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self.function = function
+
+    def get(self) -> float:
+        if self.function is not None:
+            try:
+                return float(self.function())
+            except Exception:
+                return math.nan
+        return self.value
+
+
+class Gauge(_Metric):
+    """Value that can go up and down, or be computed at scrape time"""
+
+    metric_type = "gauge"
+
+    def _new_child(self):
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        """Set an unlabelled gauge"""
+        self._default().set(value)
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment an unlabelled gauge"""
+        self._default().inc(amount)
+
+    def dec(self, amount: float = 1.0) -> None:
+        """Decrement an unlabelled gauge"""
+        self._default().dec(amount)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Compute an unlabelled gauge from a callback at scrape time"""
+        self._default().set_function(function)
+
+    def _render_child(self, values, child):
+        yield f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.get())}"
+
+
+class _HistogramChild:
+    __slots__ = ("upper_bounds", "counts", "sum", "_lock")
+
+    def __init__(self, upper_bounds: Tuple[float, ...]):
+        self.upper_bounds = upper_bounds
+        self.counts = [0] * (len(upper_bounds) + 1)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.upper_bounds, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        with self._lock:
+            return list(self.counts), self.sum
+
+
+class Histogram(_Metric):
+    """Bucketed distribution of observed values"""
+
+    metric_type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        self.upper_bounds = tuple(sorted(float(b) for b in buckets if b != math.inf))
+        super().__init__(name, documentation, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.upper_bounds)
+
+    def observe(self, value: float) -> None:
+        """Observe a value on an unlabelled histogram"""
+        self._default().observe(value)
+
+    def _render_child(self, values, child):
+        counts, total = child.snapshot()
+        cumulative = 0
+        for bound, count in zip(self.upper_bounds + (math.inf,), counts):
+            cumulative += count
+            labels = _format_labels(self.labelnames, values, f'le="{_format_value(bound)}"')
+            yield f"{self.name}_bucket{labels} {cumulative}"
+        labels = _format_labels(self.labelnames, values)
+        yield f"{self.name}_sum{labels} {_format_value(total)}"
+        yield f"{self.name}_count{labels} {cumulative}"
+
+
+class MetricsRegistry:
+    """Collection of metric families rendered together"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: _Metric) -> _Metric:
+        """
+        Register a metric family.
+
+        Args:
+            metric: Metric to register
+
+        Returns:
+            The registered metric (the existing one if already registered)
+        """
+        with self._lock:
+            return self._metrics.setdefault(metric.name, metric)
+
+    def get(self, name: str) -> Optional[_Metric]:
+        """Get a registered metric by name"""
+        return self._metrics.get(name)
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format"""
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+    def clear(self) -> None:
+        """Reset all recorded values (used by tests)"""
+        for metric in list(self._metrics.values()):
+            metric.clear()
+
+
+# Prometheus exposition content type
+CONTENT_TYPE_LATEST = "text/plain; version=0.0.4; charset=utf-8"
+
+# Global registry
+_registry = MetricsRegistry()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """
+    Get the global metrics registry.
+
+    Returns:
+        MetricsRegistry: Global registry
+    """
+    return _registry
+
+
+def counter(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+    """Create and register a counter"""
+    return _registry.register(Counter(name, documentation, labelnames))
+
+
+def gauge(name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+    """Create and register a gauge"""
+    return _registry.register(Gauge(name, documentation, labelnames))
+
+
+def histogram(
+    name: str,
+    documentation: str,
+    labelnames: Sequence[str] = (),
+    buckets: Sequence[float] = DEFAULT_BUCKETS,
+) -> Histogram:
+    """Create and register a histogram"""
+    return _registry.register(Histogram(name, documentation, labelnames, buckets))
+
+
+# ============================================
+# Application Metrics
+# ============================================
+
+HTTP_REQUEST_DURATION = histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ("method", "route", "status"),
+)
+
+AGENT_RUN_DURATION = histogram(
+    "agent_run_duration_seconds",
+    "Agent run duration",
+    ("mode", "outcome"),
+)
+
+AGENT_TIME_TO_FIRST_TOKEN = histogram(
+    "agent_time_to_first_token_seconds",
+    "Time from stream start to the first text chunk",
+)
+
+TOOL_CALL_DURATION = histogram(
+    "tool_call_duration_seconds",
+    "Agent tool call latency",
+    ("tool", "source"),
+)
+
+TOOL_CALLS = counter(
+    "tool_calls",
+    "Agent tool calls by outcome",
+    ("tool", "source", "outcome"),
+)
+
+MCP_CALL_DURATION = histogram(
+    "mcp_call_duration_seconds",
+    "MCP server call latency",
+    ("operation",),
+)
+
+SQLITE_QUERY_DURATION = histogram(
+    "sqlite_query_duration_seconds",
+    "SQLite statement execution time",
+    ("database", "operation"),
+    buckets=FAST_BUCKETS,
+)
+
+DB_QUERIES_PER_REQUEST = histogram(
+    "db_queries_per_request",
+    "SQL statements executed per HTTP request",
+    ("method", "route"),
+    buckets=COUNT_BUCKETS,
+)
+
+TOOL_DB_QUERIES = histogram(
+    "tool_db_queries",
+    "SQL statements executed per local tool call",
+    ("tool",),
+    buckets=COUNT_BUCKETS,
+)
+
+ORDER_CACHE_LOOKUPS = gauge(
+    "order_cache_lookups",
+    "Order lookup cache lookups since start by result",
+    ("result",),
+)
+
+ORDER_CACHE_HIT_RATIO = gauge(
+    "order_cache_hit_ratio",
+    "Share of order lookups served from the cache",
+)
+
+ORDER_CACHE_ENTRIES = gauge(
+    "order_cache_entries",
+    "Cached order lookups",
+)
+
+ORDER_CACHE_MEMORY_BYTES = gauge(
+    "order_cache_memory_bytes",
+    "Estimated memory held by cached order lookups",
+)
+
+RATE_LIMIT_REJECTIONS = counter(
+    "rate_limit_rejections",
+    "Requests rejected by a rate limiter",
+    ("limiter", "scope"),
+)
+
+ACTIVE_SESSIONS = gauge(
+    "active_sessions",
+    "Active agent sessions",
+)
+
+EVENT_LOOP_LAG = histogram(
+    "event_loop_lag_seconds",
+    "Delay between when the loop monitor heartbeat was due and when it ran",
+    buckets=FAST_BUCKETS,
+)
+
+EVENT_LOOP_STALLS = counter(
+    "event_loop_stalls",
+    "Event loop stalls longer than the slow callback threshold",
+)
+
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "CONTENT_TYPE_LATEST",
+    "DEFAULT_BUCKETS",
+    "FAST_BUCKETS",
+    "COUNT_BUCKETS",
+    "get_metrics_registry",
+    "counter",
+    "gauge",
+    "histogram",
+    "HTTP_REQUEST_DURATION",
+    "AGENT_RUN_DURATION",
+    "AGENT_TIME_TO_FIRST_TOKEN",
+    "TOOL_CALL_DURATION",
+    "TOOL_CALLS",
+    "MCP_CALL_DURATION",
+    "SQLITE_QUERY_DURATION",
+    "DB_QUERIES_PER_REQUEST",
+    "TOOL_DB_QUERIES",
+    "ORDER_CACHE_LOOKUPS",
+    "ORDER_CACHE_HIT_RATIO",
+    "ORDER_CACHE_ENTRIES",
+    "ORDER_CACHE_MEMORY_BYTES",
+    "RATE_LIMIT_REJECTIONS",
+    "ACTIVE_SESSIONS",
+    "EVENT_LOOP_LAG",
+    "EVENT_LOOP_STALLS",
+]
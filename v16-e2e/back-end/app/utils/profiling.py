@@ -0,0 +1,428 @@
+"""
+On-Demand Profiling
+
+Diagnostics for a live process, driven from the admin endpoints:
+
+- ``CpuProfiler``: a sampling profiler. A daemon thread wakes every
+  ``interval`` seconds, reads every thread's stack with
+  ``sys._current_frames()`` and counts identical stacks. Results render
+  as collapsed stacks (Brendan Gregg's ``folded`` format) or a flamegraph
+  SVG.
+- ``MemoryProfiler``: ``tracemalloc`` snapshots, with each snapshot diffed
+  against the previous one to show where memory grew.
+- ``dump_asyncio_tasks``: the await chain of every pending asyncio task.
+
+Nothing here installs hooks or threads until a profile is started, so the
+endpoints cost nothing while idle. While active, the CPU sampler holds the
+GIL for a few microseconds per sample and ``tracemalloc`` slows
+allocations noticeably; both stop on request or when their time limit
+expires.
+"""
+import asyncio
+import html
+import os
+import sys
+import threading
+import time
+import tracemalloc
+import zlib
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+
+Stack = Tuple[str, ...]
+
+
+# ============================================
+# CPU Sampling
+# ============================================
+
+class CpuProfiler:
+    """
+    Sampling CPU profiler for all threads in the process.
+
+    Only one profile runs at a time. The result of the last profile is
+    kept until the next one starts.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._counts: Counter = Counter()
+        self._labels: Dict[object, str] = {}
+        self.samples = 0
+        self.interval = 0.0
+        self.started_at: Optional[float] = None
+        self.stopped_at: Optional[float] = None
+
+    @property
+    def active(self) -> bool:
+        """Whether a profile is running."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, seconds: float, interval: float = 0.01) -> None:
+        """
+        Start sampling in the background.
+
+        Args:
+            seconds: Stop automatically after this many seconds
+            interval: Seconds between samples
+
+        Raises:
+            RuntimeError: If a profile is already running
+        """
+        with self._lock:
+            if self.active:
+                raise RuntimeError("A CPU profile is already running")
+            self._stop.clear()
+            self._counts = Counter()
+            self._labels = {}
+            self.samples = 0
+            self.interval = interval
+            self.started_at = time.time()
+            self.stopped_at = None
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(time.monotonic() + seconds, interval),
+                name="cpu-profiler",
+                daemon=True
+            )
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stop sampling and wait for the sampler thread to exit."""
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+
+    def wait(self) -> None:
+        """Block until the running profile finishes."""
+        thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def _label(self, code) -> str:
+        """Frame label, cached per code object."""
+        label = self._labels.get(code)
+        if label is None:
+            label = f"{code.co_qualname} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            self._labels[code] = label
+        return label
+
+    def _run(self, deadline: float, interval: float) -> None:
+        own_id = threading.get_ident()
+        counts = self._counts
+        label = self._label
+        while not self._stop.wait(interval) and time.monotonic() < deadline:
+            names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(label(frame.f_code))
+                    frame = frame.f_back
+                stack.append(names.get(thread_id, str(thread_id)))
+                stack.reverse()
+                counts[tuple(stack)] += 1
+            self.samples += 1
+        self.stopped_at = time.time()
+
+    def result(self) -> Dict[Stack, int]:
+        """Sample counts per stack (root first) from the last profile."""
+        return dict(self._counts)
+
+    def status(self) -> dict:
+        """Summary of the current or last profile."""
+        return {
+            "active": self.active,
+            "samples": self.samples,
+            "interval_ms": round(self.interval * 1000, 3),
+            "unique_stacks": len(self._counts),
+            "started_at": self.started_at,
+            "stopped_at": self.stopped_at,
+        }
+
+
+def render_collapsed(counts: Dict[Stack, int]) -> str:
+    """
+    Render stack counts in collapsed (folded) format.
+
+    One line per stack, ``frame;frame;frame count``, accepted by
+    flamegraph.pl, speedscope and most flamegraph viewers.
+
+    Args:
+        counts: Sample counts per stack
+
+    Returns:
+        str: Collapsed stacks
+    """
+    lines = [
+        f"{';'.join(frame.replace(';', ':') for frame in stack)} {count}"
+        for stack, count in sorted(counts.items())
+    ]
+    return "\n".join(lines) + ("\n" if lines else "")
+
+
+def _frame_color(name: str) -> str:
+    """Stable warm color per frame name."""
+    seed = zlib.crc32(name.encode())
+    return f"rgb({205 + seed % 50},{(seed >> 8) % 180},{(seed >> 16) % 55})"
+
+
+def render_flamegraph(counts: Dict[Stack, int], title: str = "CPU profile", width: int = 1200) -> str:
+    """
+    Render stack counts as a self-contained flamegraph SVG.
+
+    Args:
+        counts: Sample counts per stack
+        title: Title drawn above the graph
+        width: Image width in pixels
+
+    Returns:
+        str: SVG document
+    """
+    frame_height = 16
+    min_width = 0.5
+
+    # Merge stacks into a tree: name -> [count, children]
+    root: list = [0, {}]
+    for stack, count in counts.items():
+        root[0] += count
+        node = root
+        for frame in stack:
+            node = node[1].setdefault(frame, [0, {}])
+            node[0] += count
+
+    rects: List[str] = []
+    total = root[0] or 1
+    scale = (width - 20) / total
+    max_depth = 0
+
+    def place(children: dict, x: float, depth: int) -> None:
+        nonlocal max_depth
+        for name, (count, grandchildren) in sorted(children.items()):
+            w = count * scale
+            if w >= min_width:
+                max_depth = max(max_depth, depth)
+                rects.append((name, count, x, depth, w))
+                place(grandchildren, x, depth + 1)
+            x += w
+
+    place(root[1], 10.0, 0)
+
+    height = (max_depth + 1) * frame_height + 50
+    parts = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+        f'font-family="Verdana" font-size="11">',
+        f'<rect width="100%" height="100%" fill="#fafafa"/>',
+        f'<text x="{width // 2}" y="20" text-anchor="middle" font-size="15">{html.escape(title)}</text>',
+    ]
+    for name, count, x, depth, w in rects:
+        y = height - 10 - (depth + 1) * frame_height
+        tooltip = html.escape(f"{name} ({count} samples, {count * 100 / total:.2f}%)")
+        label = html.escape(name[: int(w / 7)]) if w > 21 else ""
+        parts.append(
+            f'<g><title>{tooltip}</title>'
+            f'<rect x="{x:.1f}" y="{y}" width="{w:.1f}" height="{frame_height - 1}" '
+            f'fill="{_frame_color(name)}" rx="2"/>'
+            f'<text x="{x + 3:.1f}" y="{y + 11}">{label}</text></g>'
+        )
+    parts.append("</svg>")
+    return "\n".join(parts)
+
+
+# ============================================
+# Memory Snapshots
+# ============================================
+
+class MemoryProfiler:
+    """
+    ``tracemalloc`` session with snapshot-to-snapshot diffs.
+
+    Each snapshot is compared with the previous one, so taking snapshots
+    before and after a burst of sessions shows which lines retained the
+    new memory.
+    """
+
+    # Allocation sources excluded from reports
+    IGNORED_FILES = ("<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>", tracemalloc.__file__)
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._started_here = False
+
+    @property
+    def active(self) -> bool:
+        """Whether tracemalloc is tracing."""
+        return tracemalloc.is_tracing()
+
+    def start(self, frames: int = 1) -> None:
+        """
+        Start tracing allocations.
+
+        Args:
+            frames: Traceback depth stored per allocation
+        """
+        with self._lock:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(frames)
+                self._started_here = True
+            self._previous = None
+
+    def stop(self) -> None:
+        """Stop tracing and drop the stored snapshot."""
+        with self._lock:
+            if self._started_here:
+                tracemalloc.stop()
+                self._started_here = False
+            self._previous = None
+
+    def snapshot(self, limit: int = 25, group_by: str = "lineno") -> dict:
+        """
+        Take a snapshot and report top allocations and growth.
+
+        Args:
+            limit: Number of entries per report
+            group_by: ``lineno``, ``filename`` or ``traceback``
+
+        Returns:
+            dict: Totals, top allocations and the diff against the previous
+            snapshot (empty on the first snapshot)
+
+        Raises:
+            RuntimeError: If tracing has not been started
+        """
+        if not tracemalloc.is_tracing():
+            raise RuntimeError("Memory tracing is not running")
+
+        with self._lock:
+            snapshot = tracemalloc.take_snapshot().filter_traces(
+                [tracemalloc.Filter(False, pattern) for pattern in self.IGNORED_FILES]
+            )
+            previous, self._previous = self._previous, snapshot
+
+        current, peak = tracemalloc.get_traced_memory()
+        report = {
+            "traced_bytes": current,
+            "peak_bytes": peak,
+            "top": [self._stat(stat) for stat in snapshot.statistics(group_by)[:limit]],
+            "growth": [],
+        }
+        if previous is not None:
+            report["growth"] = [
+                self._stat(stat)
+                for stat in snapshot.compare_to(previous, group_by)[:limit]
+                if stat.size_diff > 0
+            ]
+        return report
+
+    @staticmethod
+    def _stat(stat) -> dict:
+        """Serialize a tracemalloc Statistic or StatisticDiff."""
+        entry = {
+            "location": [f"{frame.filename}:{frame.lineno}" for frame in stat.traceback],
+            "size_bytes": stat.size,
+            "count": stat.count,
+        }
+        if hasattr(stat, "size_diff"):
+            entry["size_diff_bytes"] = stat.size_diff
+            entry["count_diff"] = stat.count_diff
+        return entry
+
+
+# ============================================
+# Asyncio Tasks
+# ============================================
+
+def _await_chain(coro, limit: int) -> List[str]:
+    """Follow a coroutine's await chain down to the innermost frame."""
+    frames = []
+    while coro is not None and len(frames) < limit:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None) or getattr(coro, "ag_frame", None)
+        if frame is not None:
+            code = frame.f_code
+            frames.append(f"{code.co_qualname} ({code.co_filename}:{frame.f_lineno})")
+        coro = (
+            getattr(coro, "cr_await", None)
+            or getattr(coro, "gi_yieldfrom", None)
+            or getattr(coro, "ag_await", None)
+        )
+    return frames
+
+
+def dump_asyncio_tasks(loop: Optional[asyncio.AbstractEventLoop] = None, limit: int = 50) -> List[dict]:
+    """
+    Describe every task on an event loop with its await stack.
+
+    Args:
+        loop: Event loop (default: the running loop)
+        limit: Maximum frames per task
+
+    Returns:
+        list: One dict per task (name, state, coroutine, stack), outermost
+        frame first
+    """
+    tasks = []
+    for task in asyncio.all_tasks(loop):
+        coro = task.get_coro()
+        if task.done():
+            state = "cancelled" if task.cancelled() else "done"
+        else:
+            state = "pending"
+        tasks.append({
+            "name": task.get_name(),
+            "state": state,
+            "coroutine": getattr(coro, "__qualname__", repr(coro)),
+            "stack": _await_chain(coro, limit),
+        })
+    tasks.sort(key=lambda item: item["name"])
+    return tasks
+
+
+# ============================================
+# Global Instances
+# ============================================
+
+_cpu_profiler: Optional[CpuProfiler] = None
+_memory_profiler: Optional[MemoryProfiler] = None
+
+
+def get_cpu_profiler() -> CpuProfiler:
+    """
+    Get global CPU profiler instance.
+
+    Returns:
+        CpuProfiler: Global profiler
+    """
+    global _cpu_profiler
+    if _cpu_profiler is None:
+        _cpu_profiler = CpuProfiler()
+    return _cpu_profiler
+
+
+def get_memory_profiler() -> MemoryProfiler:
+    """
+    Get global memory profiler instance.
+
+    Returns:
+        MemoryProfiler: Global profiler
+    """
+    global _memory_profiler
+    if _memory_profiler is None:
+        _memory_profiler = MemoryProfiler()
+    return _memory_profiler
+
+
+__all__ = [
+    "CpuProfiler",
+    "MemoryProfiler",
+    "render_collapsed",
+    "render_flamegraph",
+    "dump_asyncio_tasks",
+    "get_cpu_profiler",
+    "get_memory_profiler",
+]
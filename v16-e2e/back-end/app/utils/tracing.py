@@ -0,0 +1,389 @@
+"""
+OpenTelemetry Tracing
+
+Optional distributed tracing for the request path: HTTP middleware, agent
+runs, tool wrappers and SQLAlchemy statements. Trace context propagates to
+the MCP server through the W3C ``traceparent`` carried in MCP request
+``_meta`` (injected by agent_framework from the active span).
+
+OpenTelemetry is an optional dependency. When it is not installed, or
+tracing is disabled, every helper here is a cheap no-op.
+
+Spans are exported by a ``BatchSpanProcessor``: ending a span only appends
+it to a bounded in-memory queue, and export runs on the processor's worker
+thread, so the event loop never waits on the collector.
+"""
+import functools
+import inspect
+import logging
+from contextlib import contextmanager, nullcontext
+from typing import Any, AsyncIterator, Callable, Optional
+
+try:
+    from opentelemetry import context as otel_context
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+    OTEL_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    OTEL_AVAILABLE = False
+
+from .db_metrics import _database_label, _operation_label
+
+logger = logging.getLogger(__name__)
+
+TRACER_NAME = "msev15e2e"
+
+# Longest SQL statement recorded on database spans
+MAX_STATEMENT_LENGTH = 1000
+
+_enabled = False
+_tracer = None
+_provider = None
+
+
+def _create_exporter(protocol: str, endpoint: str):
+    """Create an OTLP span exporter for the configured protocol."""
+    if protocol == "grpc":
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        return OTLPSpanExporter(endpoint=endpoint, insecure=endpoint.startswith("http://"))
+
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    return OTLPSpanExporter(endpoint=f"{endpoint.rstrip('/')}/v1/traces")
+
+
+def configure_tracing(settings, exporter=None) -> bool:
+    """
+    Configure the global tracer provider from settings.
+
+    Args:
+        settings: Application settings instance
+        exporter: Span exporter to use instead of OTLP (e.g. in tests)
+
+    Returns:
+        bool: True if tracing is active
+    """
+    global _enabled, _tracer, _provider
+
+    if not settings.ENABLE_TRACING:
+        return False
+
+    if not OTEL_AVAILABLE:
+        logger.warning("Tracing enabled but opentelemetry is not installed - tracing disabled")
+        return False
+
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+        if exporter is None:
+            exporter = _create_exporter(
+                settings.OTEL_EXPORTER_OTLP_PROTOCOL,
+                settings.OTEL_EXPORTER_OTLP_ENDPOINT
+            )
+    except ImportError as e:
+        logger.warning(f"Tracing enabled but an OpenTelemetry package is missing ({e}) - tracing disabled")
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": settings.OTEL_SERVICE_NAME}),
+        sampler=ParentBased(TraceIdRatioBased(settings.OTEL_TRACES_SAMPLE_RATIO)),
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            exporter,
+            max_queue_size=settings.TRACING_MAX_QUEUE_SIZE,
+            max_export_batch_size=min(512, settings.TRACING_MAX_QUEUE_SIZE)
+        )
+    )
+
+    # Installing the global provider also activates agent_framework's own
+    # spans and the MCP _meta trace-context injection
+    trace.set_tracer_provider(provider)
+    try:
+        from agent_framework.observability import enable_instrumentation
+        enable_instrumentation()
+    except ImportError:
+        pass
+
+    _provider = provider
+    _tracer = provider.get_tracer(TRACER_NAME)
+    _enabled = True
+
+    logger.info(
+        f"Tracing enabled: {settings.OTEL_EXPORTER_OTLP_PROTOCOL} → {settings.OTEL_EXPORTER_OTLP_ENDPOINT} "
+        f"(sample ratio {settings.OTEL_TRACES_SAMPLE_RATIO})"
+    )
+    return True
+
+
+def shutdown_tracing(timeout_millis: int = 5000) -> None:
+    """
+    Flush pending spans and shut down the tracer provider.
+
+    Args:
+        timeout_millis: Maximum time to wait for the final export
+    """
+    global _enabled, _tracer, _provider
+
+    if _provider is not None:
+        _provider.force_flush(timeout_millis)
+        _provider.shutdown()
+    _enabled = False
+    _tracer = None
+    _provider = None
+
+
+def is_tracing_enabled() -> bool:
+    """Check if tracing is active."""
+    return _enabled
+
+
+def start_span(name: str, attributes: Optional[dict] = None, kind=None):
+    """
+    Start a span as the current span.
+
+    Args:
+        name: Span name
+        attributes: Initial span attributes
+        kind: SpanKind (defaults to INTERNAL)
+
+    Returns:
+        Context manager yielding the span, or None when tracing is disabled
+    """
+    if not _enabled:
+        return nullcontext(None)
+    return _tracer.start_as_current_span(
+        name,
+        attributes=attributes,
+        kind=kind if kind is not None else SpanKind.INTERNAL
+    )
+
+
+def start_server_span(scope: dict):
+    """
+    Start a SERVER span for an ASGI HTTP request.
+
+    Continues an incoming W3C trace context if the client sent one. The
+    span is named after the raw path; rename it to the route template with
+    ``finish_server_span`` once routing has happened.
+
+    Args:
+        scope: ASGI scope
+
+    Returns:
+        Context manager yielding the span, or None when tracing is disabled
+    """
+    if not _enabled:
+        return nullcontext(None)
+
+    carrier = {
+        key.decode("latin-1"): value.decode("latin-1")
+        for key, value in scope.get("headers", ())
+    }
+    return _tracer.start_as_current_span(
+        f"{scope['method']} {scope['path']}",
+        context=propagate.extract(carrier),
+        kind=SpanKind.SERVER,
+        attributes={
+            "http.request.method": scope["method"],
+            "url.path": scope["path"],
+        }
+    )
+
+
+def finish_server_span(span, scope: dict, status_code: Optional[int]) -> None:
+    """
+    Name a server span after its route template and record the status.
+
+    Args:
+        span: Span from start_server_span (may be None)
+        scope: ASGI scope (after routing)
+        status_code: Response status code, if a response was started
+    """
+    if span is None:
+        return
+
+    route = getattr(scope.get("route"), "path", None)
+    if route:
+        span.update_name(f"{scope['method']} {route}")
+        span.set_attribute("http.route", route)
+    if status_code is not None:
+        span.set_attribute("http.response.status_code", status_code)
+        if status_code >= 500:
+            span.set_status(Status(StatusCode.ERROR))
+
+
+def _record_result(span, result: Any) -> None:
+    """Mark a span as failed when a tool returned an error dict."""
+    if isinstance(result, dict) and result.get("status") == "error":
+        span.set_status(Status(StatusCode.ERROR, str(result.get("error", ""))))
+        if result.get("error_type"):
+            span.set_attribute("error.type", result["error_type"])
+
+
+def traced(name: Optional[str] = None, **attributes) -> Callable:
+    """
+    Decorator that runs a function inside a span.
+
+    Works for sync and async functions and preserves the signature (so it
+    can sit under ``@tool``). Exceptions are recorded on the span; tool
+    error dicts (``{"status": "error", ...}``) mark the span as failed.
+
+    Args:
+        name: Span name (default: function name)
+        **attributes: Static span attributes
+
+    Returns:
+        Callable: Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__name__
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _enabled:
+                    return await func(*args, **kwargs)
+                with _tracer.start_as_current_span(span_name, attributes=attributes) as span:
+                    result = await func(*args, **kwargs)
+                    _record_result(span, result)
+                    return result
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            with _tracer.start_as_current_span(span_name, attributes=attributes) as span:
+                result = func(*args, **kwargs)
+                _record_result(span, result)
+                return result
+        return wrapper
+
+    return decorator
+
+
+async def iterate_in_span(span, iterator: AsyncIterator) -> AsyncIterator:
+    """
+    Iterate an async iterator with a span active only while it produces.
+
+    Streaming generators suspend between chunks, so a span cannot stay
+    attached as the current span across ``yield``. Attaching it around
+    each step keeps child spans (model calls, tools) parented correctly.
+
+    Args:
+        span: Span to activate (None iterates without tracing)
+        iterator: Async iterator to consume
+
+    Yields:
+        Items from the iterator
+    """
+    if span is None:
+        async for item in iterator:
+            yield item
+        return
+
+    span_context = trace.set_span_in_context(span)
+    iterator = iterator.__aiter__()
+    while True:
+        token = otel_context.attach(span_context)
+        try:
+            item = await iterator.__anext__()
+        except StopAsyncIteration:
+            return
+        finally:
+            otel_context.detach(token)
+        yield item
+
+
+@contextmanager
+def detached_span(name: str, attributes: Optional[dict] = None):
+    """
+    Start a span that is not made current (for use across ``yield``).
+
+    Args:
+        name: Span name
+        attributes: Initial span attributes
+
+    Yields:
+        The span, or None when tracing is disabled
+    """
+    if not _enabled:
+        yield None
+        return
+
+    span = _tracer.start_span(name, attributes=attributes)
+    try:
+        yield span
+    except BaseException as e:
+        if not isinstance(e, GeneratorExit):
+            span.record_exception(e)
+            span.set_status(Status(StatusCode.ERROR, str(e)))
+        raise
+    finally:
+        span.end()
+
+
+# ============================================
+# SQLAlchemy
+# ============================================
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if not _enabled:
+        return
+    context._trace_span = _tracer.start_span(
+        f"{_operation_label(statement)} {_database_label(conn.engine.url.database)}",
+        kind=SpanKind.CLIENT,
+        attributes={
+            "db.system": conn.engine.dialect.name,
+            "db.name": conn.engine.url.database or "",
+            "db.statement": statement[:MAX_STATEMENT_LENGTH],
+        }
+    )
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    span = getattr(context, "_trace_span", None)
+    if span is not None:
+        if cursor is not None and cursor.rowcount >= 0:
+            span.set_attribute("db.rowcount", cursor.rowcount)
+        span.end()
+        context._trace_span = None
+
+
+def _handle_error(exception_context):
+    span = getattr(exception_context.execution_context, "_trace_span", None)
+    if span is not None:
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+        exception_context.execution_context._trace_span = None
+
+
+def instrument_sqlalchemy_tracing() -> None:
+    """Emit a CLIENT span for every SQLAlchemy statement (idempotent)."""
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    if event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(Engine, "handle_error", _handle_error)
+
+
+__all__ = [
+    "OTEL_AVAILABLE",
+    "configure_tracing",
+    "shutdown_tracing",
+    "is_tracing_enabled",
+    "start_span",
+    "start_server_span",
+    "finish_server_span",
+    "traced",
+    "iterate_in_span",
+    "detached_span",
+    "instrument_sqlalchemy_tracing",
+]
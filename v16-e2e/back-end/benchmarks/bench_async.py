@@ -0,0 +1,158 @@
+"""
+Async Order Tools Benchmark
+
+Runs ``--concurrency`` agent requests at once on one event loop. Each
+request makes the tool calls of a typical order conversation (look up an
+order, list the customer's orders, search, update the status), with a
+short ``await`` between calls standing in for the model. The order tools
+are called three ways:
+
+- ``sync on loop``: the sync tools called directly, as agent_framework
+  does with sync tools; every query blocks the event loop
+- ``sync in threads``: the sync tools via ``asyncio.to_thread`` (the
+  default thread pool)
+- ``async``: the async tools over ``async_operations`` (aiosqlite)
+
+Reports requests per second, the mean and 95th percentile request
+latency, and the event loop's worst scheduling delay (how long anything
+else on the loop, e.g. a health check or a streaming response, waited).
+The lookup cache is off so every call reads SQLite.
+
+Usage:
+    python benchmarks/bench_async.py [--orders 100000] [--concurrency 200] [--requests 2000]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.tools.order_management import (
+    Order,
+    configure_cache,
+    configure_storage,
+    dispose_async_engine,
+    init_db,
+    set_database_path,
+)
+from app.tools.order_management.database import _get_engine
+from app.tools.wrappers import async_order_tools, order_tools
+
+CUSTOMERS = 5000
+THINK_SECONDS = 0.005
+
+
+def populate(count: int):
+    rng = random.Random(7)
+    start = datetime(2024, 1, 1)
+    with _get_engine().begin() as conn:
+        conn.execute(Order.__table__.insert(), [
+            {
+                "order_date": start + timedelta(minutes=i),
+                "customer_name": f"Customer {rng.randrange(CUSTOMERS)}",
+                "billing_address": f"{rng.randrange(1, 9999)} Main Street, Springfield",
+                "product_sku": f"SKU-{rng.randrange(1000):04d}",
+                "quantity": 1 + rng.randrange(5),
+                "order_amount": round(rng.uniform(5, 500), 2),
+                "remarks": None,
+                "order_status": "PENDING",
+            }
+            for i in range(count)
+        ])
+
+
+def calls(count: int, requests: int):
+    """Tool calls of each request: (tool name, kwargs) lists (same for every mode)."""
+    rng = random.Random(42)
+    return [
+        [
+            ("get_order", {"order_id": str(1 + rng.randrange(count))}),
+            ("get_customer_orders", {"customer_name": f"Customer {rng.randrange(CUSTOMERS)}"}),
+            ("find_orders", {"product_sku": f"SKU-{rng.randrange(1000):04d}"}),
+            ("update_order", {"order_id": str(1 + rng.randrange(count)), "new_status": "CONFIRMED"}),
+        ]
+        for _ in range(requests)
+    ]
+
+
+def make_caller(mode: str):
+    if mode == "sync on loop":
+        async def call(name, kwargs):
+            return getattr(order_tools, name).func(**kwargs)
+    elif mode == "sync in threads":
+        async def call(name, kwargs):
+            return await asyncio.to_thread(getattr(order_tools, name).func, **kwargs)
+    else:
+        async def call(name, kwargs):
+            return await getattr(async_order_tools, name).func(**kwargs)
+    return call
+
+
+async def measure_lag(stop: asyncio.Event, lags: list):
+    """Record how late a 10 ms timer fires while the requests run."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append(time.perf_counter() - start - 0.01)
+
+
+async def run(mode: str, workload, concurrency: int):
+    call = make_caller(mode)
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def request(tool_calls):
+        async with semaphore:
+            start = time.perf_counter()
+            for name, kwargs in tool_calls:
+                result = await call(name, kwargs)
+                if result.get("status") == "error":
+                    raise RuntimeError(result["error"])
+                await asyncio.sleep(THINK_SECONDS)
+            latencies.append(time.perf_counter() - start)
+
+    stop, lags = asyncio.Event(), []
+    lag_task = asyncio.create_task(measure_lag(stop, lags))
+    start = time.perf_counter()
+    await asyncio.gather(*(request(tool_calls) for tool_calls in workload))
+    seconds = time.perf_counter() - start
+    stop.set()
+    await lag_task
+    await dispose_async_engine()
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{mode:<18}{len(workload) / seconds:>12,.0f}{statistics.mean(latencies) * 1e3:>10.1f}"
+        f"{p95 * 1e3:>10.1f}{max(lags, default=0) * 1e3:>14.1f}"
+    )
+
+
+def main(count: int, concurrency: int, requests: int):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        set_database_path(str(Path(temp_dir) / "async.db"))
+        configure_storage(profile="performance")
+        init_db()
+        configure_cache(mode="off")
+        populate(count)
+
+        workload = calls(count, requests)
+        print(f"{count:,} orders, {requests:,} requests of {len(workload[0])} tool calls, {concurrency} concurrent")
+        print(f"{'tools':<18}{'requests/s':>12}{'mean ms':>10}{'p95 ms':>10}{'max lag ms':>14}")
+        for mode in ("sync on loop", "sync in threads", "async"):
+            asyncio.run(run(mode, workload, concurrency))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Async order tools benchmark")
+    parser.add_argument("--orders", type=int, default=100_000, help="Orders in the database")
+    parser.add_argument("--concurrency", type=int, default=200, help="Requests in flight at once")
+    parser.add_argument("--requests", type=int, default=2000, help="Requests per run")
+    args = parser.parse_args()
+    main(args.orders, args.concurrency, args.requests)
@@ -0,0 +1,106 @@
+"""
+Bulk Order Ingestion Benchmark
+
+Imports the same generated orders three ways into a fresh database:
+
+- ``create_order()`` in a loop: one validation, session, commit and
+  ``refresh`` per order (the only way to import before bulk ingestion)
+- ``create_orders_bulk()`` from a generator, at two chunk sizes
+- ``create_orders_bulk(read_orders_file(...))`` from a JSONL file, the
+  ``scripts/import_orders.py`` path
+
+Reports orders per second and peak Python allocation; with a streamed
+generator input the peak stays flat as the import grows. The
+``create_order`` loop is only run up to ``--loop-max`` orders.
+
+Usage:
+    python benchmarks/bench_bulk.py [--orders 10000 100000] [--loop-max 10000]
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.tools.order_management import (
+    configure_storage,
+    create_order,
+    create_orders_bulk,
+    dispose_engine,
+    init_db,
+    read_orders_file,
+    set_database_path,
+)
+
+
+def generate(count: int):
+    """Yield ``count`` valid orders (deterministic)."""
+    rng = random.Random(11)
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        yield {
+            "customer_name": f"Customer {rng.randrange(5000)}",
+            "billing_address": f"{rng.randrange(1, 9999)} Main Street, Springfield",
+            "product_sku": f"SKU-{rng.randrange(1000):04d}",
+            "quantity": 1 + rng.randrange(5),
+            "order_amount": round(rng.uniform(5, 500), 2),
+            "remarks": "Leave at the door" if i % 3 == 0 else None,
+            "order_date": (start + timedelta(minutes=i)).isoformat(),
+        }
+
+
+def create_loop(count: int):
+    for order in generate(count):
+        order["order_date"] = datetime.fromisoformat(order["order_date"])
+        create_order(**order)
+
+
+def run(directory: Path, label: str, count: int, fn):
+    """Time ``fn`` against a fresh database and print one result row."""
+    set_database_path(str(directory / f"{label.replace(' ', '_')}_{count}.db"))
+    configure_storage(profile="performance")
+    init_db()
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    dispose_engine()
+
+    print(f"{label:<34}{count:>10,}{seconds:>10.2f}{count / seconds:>14,.0f}{peak // 1024:>12,}")
+    return seconds
+
+
+def main(sizes, loop_max: int):
+    print(f"{'method':<34}{'orders':>10}{'seconds':>10}{'orders/s':>14}{'peak KB':>12}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        directory = Path(temp_dir)
+        for count in sizes:
+            jsonl_path = directory / f"orders_{count}.jsonl"
+            with jsonl_path.open("w") as f:
+                for order in generate(count):
+                    f.write(json.dumps(order) + "\n")
+
+            if count <= loop_max:
+                run(directory, "create_order loop", count, lambda: create_loop(count))
+            for chunk_size in (1000, 10_000):
+                run(directory, f"create_orders_bulk chunk {chunk_size}", count,
+                    lambda: create_orders_bulk(generate(count), chunk_size=chunk_size))
+            run(directory, "bulk from JSONL file", count,
+                lambda: create_orders_bulk(read_orders_file(jsonl_path)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk order ingestion benchmark")
+    parser.add_argument("--orders", type=int, nargs="+", default=[10_000, 100_000], help="Orders per run")
+    parser.add_argument("--loop-max", type=int, default=10_000, help="Largest run of the create_order loop")
+    args = parser.parse_args()
+    main(args.orders, args.loop_max)
@@ -0,0 +1,129 @@
+"""
+Order Lookup Cache Benchmark
+
+Replays the agent's hot lookups, ``get_order_by_id`` and
+``get_orders_by_customer`` with a skewed key distribution (a few
+customers and orders are asked about far more often than the rest),
+under each ORDER_CACHE_MODE:
+
+- ``off``: every lookup reads SQLite
+- ``local``: read-through LRU+TTL cache
+- ``shared``: the same cache, plus a version counter read per lookup
+
+once read-only and once with a share of ``update_order_status`` calls
+mixed in (each invalidates the order and its customer). Reports lookups
+per second, mean latency, hit ratio and the cache's estimated memory.
+
+Usage:
+    python benchmarks/bench_cache.py [--orders 100000] [--lookups 20000] [--write-ratio 0.05]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.tools.order_management import (
+    CACHE_MODES,
+    Order,
+    configure_cache,
+    configure_storage,
+    get_cache_stats,
+    get_order_by_id,
+    get_orders_by_customer,
+    init_db,
+    set_database_path,
+    update_order_status,
+)
+from app.tools.order_management.database import _get_engine
+
+CUSTOMERS = 5000
+
+
+def populate(count: int):
+    rng = random.Random(7)
+    start = datetime(2024, 1, 1)
+    with _get_engine().begin() as conn:
+        conn.execute(Order.__table__.insert(), [
+            {
+                "order_date": start + timedelta(minutes=i),
+                "customer_name": f"Customer {rng.randrange(CUSTOMERS)}",
+                "billing_address": f"{rng.randrange(1, 9999)} Main Street, Springfield",
+                "product_sku": f"SKU-{rng.randrange(1000):04d}",
+                "quantity": 1 + rng.randrange(5),
+                "order_amount": round(rng.uniform(5, 500), 2),
+                "remarks": None,
+                "order_status": "PENDING",
+            }
+            for i in range(count)
+        ])
+
+
+def workload(count: int, lookups: int, write_ratio: float):
+    """Operations with Pareto-skewed keys (same sequence for every mode)."""
+    rng = random.Random(42)
+
+    def skewed(n: int) -> int:
+        return min(int(rng.paretovariate(1.2)) - 1, n - 1)
+
+    ops = []
+    for _ in range(lookups):
+        roll = rng.random()
+        if roll < write_ratio:
+            ops.append(("update", 1 + skewed(count)))
+        elif roll < 0.5 + write_ratio / 2:
+            ops.append(("order", 1 + skewed(count)))
+        else:
+            ops.append(("customer", f"Customer {skewed(CUSTOMERS)}"))
+    return ops
+
+
+def run(ops):
+    statuses = ("CONFIRMED", "SHIPPED")
+    reads = 0
+    start = time.perf_counter()
+    for i, (kind, key) in enumerate(ops):
+        if kind == "order":
+            get_order_by_id(key)
+            reads += 1
+        elif kind == "customer":
+            get_orders_by_customer(key)
+            reads += 1
+        else:
+            update_order_status(key, statuses[i % 2])
+    return time.perf_counter() - start, reads
+
+
+def main(count: int, lookups: int, write_ratio: float):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        set_database_path(str(Path(temp_dir) / "cache.db"))
+        configure_storage(profile="performance")
+        init_db()
+        populate(count)
+
+        print(f"{count:,} orders, {lookups:,} operations")
+        print(f"{'workload':<16}{'mode':<8}{'reads/s':>10}{'mean ms':>10}{'hit ratio':>11}{'cache KB':>10}")
+        for label, ratio in (("read-only", 0.0), (f"{write_ratio:.0%} updates", write_ratio)):
+            ops = workload(count, lookups, ratio)
+            for mode in CACHE_MODES:
+                configure_cache(mode=mode)
+                seconds, reads = run(ops)
+                stats = get_cache_stats()
+                print(
+                    f"{label:<16}{mode:<8}{reads / seconds:>10,.0f}{seconds / len(ops) * 1e3:>10.3f}"
+                    f"{stats.get('hit_ratio', 0):>11.1%}{stats.get('memory_bytes', 0) // 1024:>10,}"
+                )
+        configure_cache(mode="off")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Order lookup cache benchmark")
+    parser.add_argument("--orders", type=int, default=100_000, help="Orders in the database")
+    parser.add_argument("--lookups", type=int, default=20_000, help="Operations per run")
+    parser.add_argument("--write-ratio", type=float, default=0.05, help="Share of status updates in the mixed run")
+    args = parser.parse_args()
+    main(args.orders, args.lookups, args.write_ratio)
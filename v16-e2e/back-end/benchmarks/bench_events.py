@@ -0,0 +1,161 @@
+"""
+Order Change Feed Benchmark
+
+A consumer (a cache, analytics, the complaint service) wants to know
+which orders changed since it last looked. With ``--orders`` orders in
+the database and ``--changes`` status updates between looks, compares:
+
+- polling: read every order with ``get_all_orders`` and diff it with the
+  previous snapshot (the only way before the change feed)
+- tailing: ``read_events`` after the last sequence number seen
+
+Reports time per look and rows read. Then measures what appending the
+events costs writes: ``create_order``, ``update_order_status`` and
+``create_orders_bulk`` with and without the change feed triggers.
+
+Usage:
+    python benchmarks/bench_events.py [--orders 100000] [--changes 100]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from app.tools.order_management import (
+    configure_storage,
+    create_order,
+    create_orders_bulk,
+    dispose_engine,
+    get_all_orders,
+    init_db,
+    latest_event_sequence,
+    read_events,
+    set_database_path,
+    update_order_status,
+)
+from app.tools.order_management.database import _get_engine
+from app.tools.order_management.events import MAX_BATCH_SIZE, _TRIGGERS
+
+STATUSES = ("PENDING", "CONFIRMED", "SHIPPED", "DELIVERED")
+ROUNDS = 5
+
+
+def generate(count: int, seed: int = 11):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        yield {
+            "customer_name": f"Customer {rng.randrange(2000)}",
+            "billing_address": f"{rng.randrange(1, 9999)} Main Street, Springfield",
+            "product_sku": f"SKU-{rng.randrange(500):04d}",
+            "quantity": 1 + rng.randrange(5),
+            "order_amount": round(rng.uniform(5, 500), 2),
+            "order_status": rng.choice(STATUSES),
+            "order_date": (start + timedelta(minutes=5 * i)).isoformat(),
+        }
+
+
+def change_orders(rng, count: int, changes: int):
+    for order_id in rng.sample(range(1, count + 1), changes):
+        update_order_status(order_id, rng.choice(STATUSES))
+
+
+def poll(snapshot):
+    """Changed order IDs since the snapshot, by reading every order."""
+    orders = get_all_orders()
+    current = {order["order_id"]: order["version"] for order in orders}
+    changed = {order_id for order_id, version in current.items() if snapshot.get(order_id) != version}
+    return changed, current, len(orders)
+
+
+def tail(position):
+    """Changed order IDs since the position, from the change feed."""
+    changed, rows = set(), 0
+    while True:
+        events = read_events(position, MAX_BATCH_SIZE)
+        rows += len(events)
+        changed.update(event["order_id"] for event in events)
+        if events:
+            position = events[-1]["sequence"]
+        if len(events) < MAX_BATCH_SIZE:
+            return changed, position, rows
+
+
+def set_triggers(enabled: bool):
+    with _get_engine().begin() as conn:
+        for trigger in _TRIGGERS:
+            name = trigger.split()[5]
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+            if enabled:
+                conn.execute(text(trigger))
+
+
+def main(count: int, changes: int):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        set_database_path(str(Path(temp_dir) / "events.db"))
+        configure_storage(profile="performance")
+        init_db()
+        create_orders_bulk(generate(count), chunk_size=10_000)
+
+        rng = random.Random(5)
+        _, snapshot, _ = poll({})
+        position = latest_event_sequence()
+        timings = {"poll": [0.0, 0], "tail": [0.0, 0]}
+        for _ in range(ROUNDS):
+            change_orders(rng, count, changes)
+
+            start = time.perf_counter()
+            polled, snapshot, rows = poll(snapshot)
+            timings["poll"][0] += time.perf_counter() - start
+            timings["poll"][1] += rows
+
+            start = time.perf_counter()
+            tailed, position, rows = tail(position)
+            timings["tail"][0] += time.perf_counter() - start
+            timings["tail"][1] += rows
+            assert polled == tailed
+
+        print(f"{count:,} orders, {changes:,} status changes between looks")
+        print(f"{'method':<36}{'ms per look':>12}{'rows read':>12}")
+        for label, key in (("get_all_orders and diff", "poll"), ("read_events after position", "tail")):
+            seconds, rows = timings[key]
+            print(f"{label:<36}{seconds / ROUNDS * 1e3:>12.2f}{rows // ROUNDS:>12,}")
+
+        print()
+        print(f"{'write':<30}{'no feed /s':>12}{'feed /s':>12}")
+        writes = {}
+        for enabled in (False, True):
+            set_triggers(enabled)
+            new_orders = list(generate(1000, seed=enabled + 1))
+            for order in new_orders:
+                order["order_date"] = datetime.fromisoformat(order["order_date"])
+            start = time.perf_counter()
+            for order in new_orders:
+                create_order(**order)
+            writes.setdefault("create_order", []).append(1000 / (time.perf_counter() - start))
+            ids = random.Random(3).sample(range(1, count), 1000)
+            start = time.perf_counter()
+            for order_id in ids:
+                update_order_status(order_id, "DELIVERED" if enabled else "SHIPPED")
+            writes.setdefault("update_order_status", []).append(1000 / (time.perf_counter() - start))
+            start = time.perf_counter()
+            create_orders_bulk(generate(20_000, seed=enabled + 3))
+            writes.setdefault("create_orders_bulk (20k)", []).append(20_000 / (time.perf_counter() - start))
+        for name, (without, with_feed) in writes.items():
+            print(f"{name:<30}{without:>12,.0f}{with_feed:>12,.0f}")
+        dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Order change feed benchmark")
+    parser.add_argument("--orders", type=int, default=100_000, help="Orders in the database")
+    parser.add_argument("--changes", type=int, default=100, help="Status changes between looks")
+    args = parser.parse_args()
+    main(args.orders, args.changes)
@@ -0,0 +1,144 @@
+"""
+Large Response Benchmark
+
+Measures memory and bytes-on-wire for the session history of a
+10,000-message session, buffered versus streamed (``STREAM_JSON_MIN_ITEMS``)
+and uncompressed versus gzip/brotli (``CompressionMiddleware``).
+
+Each combination runs in a fresh process so peak RSS is not inherited
+from the previous one. Reports:
+
+- Peak RSS growth while serving the request (``ru_maxrss`` after minus
+  before; the session itself is built before the baseline)
+- Peak Python allocation during the request (``tracemalloc``)
+- Bytes on the wire (response body after compression)
+- Request time
+
+Usage:
+    python benchmarks/bench_large_responses.py [--messages 10000]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+# Minimal configuration so the settings model validates
+os.environ.setdefault("AZURE_AI_PROJECT_ENDPOINT", "https://bench.example.com")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "bench-key")
+os.environ.setdefault("SMTP_SERVER", "smtp.example.com")
+os.environ.setdefault("SENDER_EMAIL", "bench@example.com")
+os.environ.setdefault("SENDER_PASSWORD", "bench-password")
+
+MODES = ("buffered", "streamed")
+ENCODINGS = ("identity", "gzip", "br")
+
+
+def child(mode: str, encoding: str, messages: int) -> dict:
+    """Serve one history request in this process and measure it."""
+    import asyncio
+    import logging
+
+    from fastapi import FastAPI
+
+    from app.api.middleware.compression import CompressionMiddleware
+    from app.api.routes.sessions import router as sessions_router
+    from app.config import get_settings
+    from app.session.manager import get_session_manager
+
+    logging.disable(logging.CRITICAL)
+    settings = get_settings()
+    settings.STREAM_JSON_MIN_ITEMS = 1 if mode == "streamed" else 0
+
+    app = FastAPI()
+    app.include_router(sessions_router)
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MIN_SIZE)
+
+    async def run() -> dict:
+        session = await get_session_manager().create_session("bench-large")
+        for i in range(messages):
+            role = "user" if i % 2 == 0 else "assistant"
+            tool_calls = [{"name": "get_order", "arguments": {"order_id": i}}] if i % 10 == 1 else None
+            session.add_message(role, f"Message {i}: where is my order? " * 4, tool_calls)
+
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+            "scheme": "http", "path": "/api/v1/sessions/bench-large/history", "raw_path": b"",
+            "root_path": "", "query_string": b"",
+            "headers": [(b"host", b"bench"), (b"accept-encoding", encoding.encode())],
+            "client": ("127.0.0.1", 50000), "server": ("bench", 80),
+        }
+        wire = 0
+        chunks = 0
+        request_sent = False
+
+        async def receive():
+            nonlocal request_sent
+            if not request_sent:
+                request_sent = True
+                return {"type": "http.request", "body": b"", "more_body": False}
+            await asyncio.sleep(3600)
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal wire, chunks
+            if message["type"] == "http.response.body":
+                # Count and drop, like a socket write would
+                wire += len(message.get("body", b""))
+                chunks += 1
+
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        tracemalloc.start()
+        start = time.perf_counter()
+        await app(scope, receive, send)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        return {
+            "rss_growth_kb": rss_after - rss_before,
+            "alloc_peak_kb": peak // 1024,
+            "wire_bytes": wire,
+            "chunks": chunks,
+            "ms": elapsed * 1000,
+        }
+
+    return asyncio.run(run())
+
+
+def main(messages: int):
+    print(f"History of a {messages:,}-message session")
+    print(f"{'mode':<10}{'encoding':<10}{'RSS +KB':>9}{'alloc peak KB':>15}{'wire bytes':>12}{'chunks':>8}{'ms':>9}")
+    for mode in MODES:
+        for encoding in ENCODINGS:
+            result = subprocess.run(
+                [sys.executable, __file__, "--child", mode, encoding, "--messages", str(messages)],
+                cwd=ROOT, capture_output=True, text=True
+            )
+            if result.returncode != 0:
+                print(f"{mode:<10}{encoding:<10}failed: {result.stderr.strip().splitlines()[-1]}")
+                continue
+            r = json.loads(result.stdout.strip().splitlines()[-1])
+            print(
+                f"{mode:<10}{encoding:<10}{r['rss_growth_kb']:>9}{r['alloc_peak_kb']:>15}"
+                f"{r['wire_bytes']:>12}{r['chunks']:>8}{r['ms']:>9.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Large response benchmark")
+    parser.add_argument("--messages", type=int, default=10000, help="Messages in the session")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "ENCODING"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(child(*args.child, args.messages)))
+    else:
+        main(args.messages)
@@ -0,0 +1,109 @@
+"""
+Metrics Instrumentation Benchmark
+
+Measures the per-observation cost of the in-process metrics used on hot
+paths, and the cost of the SQLAlchemy query hooks.
+
+Each operation is reported in nanoseconds per call, with the empty-call
+loop cost subtracted, and checked against the 1µs budget (the SQL hook
+pair is two callbacks, so it gets two budgets). End-to-end statement
+timings are shown for context; they include SQLAlchemy's own event
+dispatch and are dominated by noise at this scale.
+
+Usage:
+    python benchmarks/bench_metrics.py [--iterations 1000000]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, text
+
+from app.utils.db_metrics import (
+    _after_cursor_execute,
+    _before_cursor_execute,
+    instrument_sqlalchemy,
+)
+from app.utils.metrics import (
+    ACTIVE_SESSIONS,
+    HTTP_REQUEST_DURATION,
+    RATE_LIMIT_REJECTIONS,
+    TOOL_CALLS,
+    get_metrics_registry,
+)
+
+BUDGET_NS = 1000.0
+
+
+def per_call_ns(func, iterations: int, baseline_ns: float = 0.0) -> float:
+    """Best-of-5 cost of one call in nanoseconds, minus the loop baseline."""
+    best = min(timeit.repeat(func, number=iterations, repeat=5))
+    return max(0.0, best / iterations * 1e9 - baseline_ns)
+
+
+def bench_observations(iterations: int) -> list[tuple[str, float]]:
+    """Time the metric operations used by the instrumentation."""
+    baseline = per_call_ns(lambda: None, iterations)
+    http_child = HTTP_REQUEST_DURATION.labels("GET", "/api/v1/agent/messages", "200")
+
+    cases = [
+        ("histogram.observe (cached child)", lambda: http_child.observe(0.0123)),
+        ("histogram.labels().observe", lambda: HTTP_REQUEST_DURATION.labels("GET", "/api/v1/agent/messages", "200").observe(0.0123)),
+        ("counter.labels().inc", lambda: TOOL_CALLS.labels("get_order", "local", "success").inc()),
+        ("counter.labels().inc (rate limit)", lambda: RATE_LIMIT_REJECTIONS.labels("requests", "ip").inc()),
+        ("gauge.inc", lambda: ACTIVE_SESSIONS.inc()),
+    ]
+    return [(name, per_call_ns(func, iterations, baseline)) for name, func in cases]
+
+
+def bench_sql_hooks(iterations: int) -> tuple[float, float, float]:
+    """Time the hook pair directly, and a trivial statement without/with hooks."""
+    engine = create_engine("sqlite://")
+    statement = text("SELECT 1")
+    with engine.connect() as conn:
+        context = conn.execute(statement).context
+        sql = "SELECT 1"
+
+        def hook_pair():
+            _before_cursor_execute(conn, None, sql, None, context, False)
+            _after_cursor_execute(conn, None, sql, None, context, False)
+
+        baseline = per_call_ns(lambda: None, iterations * 10)
+        hooks = per_call_ns(hook_pair, iterations * 10, baseline)
+
+        plain = per_call_ns(lambda: conn.execute(statement), iterations)
+        instrument_sqlalchemy()
+        hooked = per_call_ns(lambda: conn.execute(statement), iterations)
+    return hooks, plain, hooked
+
+
+def main(iterations: int):
+    print(f"{'operation':<40}{'ns/op':>10}{'budget':>10}")
+    ok = True
+    for name, ns in bench_observations(iterations):
+        within = ns < BUDGET_NS
+        ok &= within
+        print(f"{name:<40}{ns:>10.1f}{'ok' if within else 'OVER':>10}")
+
+    hooks, plain, hooked = bench_sql_hooks(max(1, iterations // 50))
+    within = hooks < BUDGET_NS * 2  # before + after callback
+    ok &= within
+    print(f"{'SQL hook pair (before + after)':<40}{hooks:>10.1f}{'ok' if within else 'OVER':>10}")
+    print(f"{'SQL statement, no hooks (context)':<40}{plain:>10.1f}")
+    print(f"{'SQL statement, with hooks (context)':<40}{hooked:>10.1f}")
+
+    size = len(get_metrics_registry().render())
+    scrape = per_call_ns(get_metrics_registry().render, 200)
+    print(f"\n/metrics render: {scrape / 1000:.1f}µs for {size} bytes")
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Metrics instrumentation benchmark")
+    parser.add_argument("--iterations", type=int, default=1_000_000, help="Calls per operation")
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,173 @@
+"""
+Middleware Overhead Benchmark
+
+Compares the pure-ASGI middleware stack against an equivalent stack of
+Starlette BaseHTTPMiddleware layers (the previous implementation style).
+
+Measures:
+- Per-request overhead on a trivial JSON endpoint
+- Time-to-first-byte on an SSE endpoint
+
+The ASGI app is driven directly (no sockets), so the numbers isolate the
+cost of the middleware layers themselves.
+
+Usage:
+    python benchmarks/bench_middleware.py [--requests 5000]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Minimal configuration so the settings model validates
+os.environ.setdefault("AZURE_AI_PROJECT_ENDPOINT", "https://bench.example.com")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "bench-key")
+os.environ.setdefault("SMTP_SERVER", "smtp.example.com")
+os.environ.setdefault("SENDER_EMAIL", "bench@example.com")
+os.environ.setdefault("SENDER_PASSWORD", "bench-password")
+os.environ.setdefault("ENABLE_RATE_LIMITING", "true")
+os.environ.setdefault("RATE_LIMIT_PER_MINUTE", "100000000")
+
+import logging
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.api.middleware import (
+    ContextInjectionMiddleware,
+    ErrorHandlingMiddleware,
+    RateLimitMiddleware,
+    RequestLoggingMiddleware,
+    SlidingWindowRateLimiter,
+)
+
+
+class LegacyHeaderMiddleware(BaseHTTPMiddleware):
+    """BaseHTTPMiddleware layer doing the same header work as the old stack."""
+
+    def __init__(self, app, header: str):
+        super().__init__(app)
+        self.header = header
+
+    async def dispatch(self, request, call_next):
+        request.state.request_id = "bench"
+        response = await call_next(request)
+        response.headers[self.header] = "1"
+        return response
+
+
+def build_app(stack: str) -> FastAPI:
+    """Build a benchmark app with either the ASGI or BaseHTTPMiddleware stack."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    @app.get("/stream")
+    async def stream():
+        async def events():
+            yield "data: first\n\n"
+            await asyncio.sleep(0.01)
+            yield "data: [DONE]\n\n"
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    if stack == "asgi":
+        app.add_middleware(ErrorHandlingMiddleware)
+        app.add_middleware(RequestLoggingMiddleware)
+        app.add_middleware(ContextInjectionMiddleware)
+        app.add_middleware(RateLimitMiddleware, rate_limiter=SlidingWindowRateLimiter(100_000_000))
+    else:
+        for header in ("X-Error", "X-Request-ID", "X-Context", "X-RateLimit-Limit"):
+            app.add_middleware(LegacyHeaderMiddleware, header=header)
+
+    return app
+
+
+def make_scope(path: str) -> dict:
+    """Build a minimal HTTP scope."""
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"bench"), (b"user-agent", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+
+async def run_request(app, path: str) -> tuple[float, float]:
+    """Run a single request; return (total_seconds, first_body_seconds)."""
+    request_sent = False
+    first_body = None
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await asyncio.sleep(3600)
+        return {"type": "http.disconnect"}
+
+    start = time.perf_counter()
+
+    async def send(message):
+        nonlocal first_body
+        if message["type"] == "http.response.body" and first_body is None and message.get("body"):
+            first_body = time.perf_counter() - start
+
+    await app(make_scope(path), receive, send)
+    return time.perf_counter() - start, first_body or 0.0
+
+
+async def bench(app, path: str, count: int) -> dict:
+    """Benchmark a path and return latency statistics in microseconds."""
+    # Warm up (route compilation, middleware stack build)
+    for _ in range(50):
+        await run_request(app, path)
+
+    totals, ttfbs = [], []
+    for _ in range(count):
+        total, ttfb = await run_request(app, path)
+        totals.append(total * 1e6)
+        ttfbs.append(ttfb * 1e6)
+
+    return {
+        "p50_us": statistics.median(totals),
+        "mean_us": statistics.fmean(totals),
+        "ttfb_p50_us": statistics.median(ttfbs),
+    }
+
+
+async def main(count: int):
+    # Keep log I/O out of the measurement
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'stack':<10}{'endpoint':<10}{'p50 (us)':>12}{'mean (us)':>12}{'TTFB p50 (us)':>16}")
+    for stack in ("basehttp", "asgi"):
+        app = build_app(stack)
+        for path, n in (("/ping", count), ("/stream", max(1, count // 20))):
+            result = await bench(app, path, n)
+            print(
+                f"{stack:<10}{path:<10}{result['p50_us']:>12.1f}"
+                f"{result['mean_us']:>12.1f}{result['ttfb_p50_us']:>16.1f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Middleware overhead benchmark")
+    parser.add_argument("--requests", type=int, default=5000, help="Requests per endpoint")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
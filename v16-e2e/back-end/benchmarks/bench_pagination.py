@@ -0,0 +1,107 @@
+"""
+Order Pagination Benchmark
+
+Measures what one order-listing tool call costs on a large order
+database, before and after keyset pagination:
+
+- ``get_all_orders()``: every order as a dict (the previous
+  ``list_all_orders`` default)
+- ``get_orders_page()``: one default-size page, at the start and deep
+  into the listing (keyset cursor), against ``LIMIT/OFFSET`` at the
+  same depth
+
+Reports time and the JSON size of the result (what the agent would put
+in the prompt; roughly 4 bytes per token).
+
+Uses the database generated by ``bench_search.py`` (run that first).
+
+Usage:
+    python benchmarks/bench_pagination.py [--orders 1000000] [--dir data/bench]
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.tools.order_management import (
+    DEFAULT_PAGE_SIZE,
+    configure_storage,
+    get_all_orders,
+    get_db_session,
+    get_orders_page,
+    set_database_path,
+)
+from app.tools.order_management.models import Order
+from app.tools.order_management.operations import LISTING_KEYS
+from app.tools.order_management.pagination import encode_cursor
+
+
+def timed(fn, repeat: int = 5):
+    """Median milliseconds over ``repeat`` runs, and the last result."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1e3)
+    return sorted(samples)[len(samples) // 2], result
+
+
+def offset_page(offset: int):
+    session = get_db_session()
+    try:
+        query = session.query(Order).order_by(*(key.order_by() for key in LISTING_KEYS))
+        return [order.to_dict() for order in query.offset(offset).limit(DEFAULT_PAGE_SIZE).all()]
+    finally:
+        session.close()
+
+
+def cursor_at(offset: int) -> str:
+    """Cursor a client would hold after paging ``offset`` orders in."""
+    session = get_db_session()
+    try:
+        row = (
+            session.query(Order.order_date, Order.order_id)
+            .order_by(*(key.order_by() for key in LISTING_KEYS))
+            .offset(offset - 1).limit(1).one()
+        )
+        return encode_cursor(LISTING_KEYS, row)
+    finally:
+        session.close()
+
+
+def main(count: int, directory: Path):
+    db_path = directory / f"bench_search_{count}.db"
+    if not db_path.exists():
+        sys.exit(f"{db_path} not found; run benchmarks/bench_search.py --orders {count} first")
+    set_database_path(str(db_path))
+    configure_storage(profile="performance")
+
+    print(f"{count:,} orders, page size {DEFAULT_PAGE_SIZE}")
+    print(f"{'call':<40}{'ms':>10}{'orders':>10}{'JSON bytes':>14}")
+
+    def report(label, ms, orders):
+        print(f"{label:<40}{ms:>10.2f}{len(orders):>10}{len(json.dumps(orders)):>14,}")
+
+    ms, orders = timed(get_all_orders, repeat=1)
+    report("get_all_orders() (unpaged)", ms, orders)
+
+    ms, page = timed(get_orders_page)
+    report("get_orders_page() first page", ms, page["orders"])
+
+    for depth in (10_000, count // 2, count - DEFAULT_PAGE_SIZE):
+        cursor = cursor_at(depth)
+        ms, page = timed(lambda: get_orders_page(cursor=cursor))
+        report(f"keyset page at {depth:,}", ms, page["orders"])
+        ms, orders = timed(lambda: offset_page(depth))
+        report(f"OFFSET page at {depth:,}", ms, orders)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Order pagination benchmark")
+    parser.add_argument("--orders", type=int, default=1_000_000, help="Orders in the benchmark database")
+    parser.add_argument("--dir", type=Path, default=Path("data/bench"), help="Directory of the benchmark database")
+    args = parser.parse_args()
+    main(args.orders, args.dir)
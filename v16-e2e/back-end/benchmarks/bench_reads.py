@@ -0,0 +1,132 @@
+"""
+Order Read Path Benchmark
+
+Compares the two ways of turning order rows into result dictionaries:
+
+- ORM: ``session.query(Order)`` then ``Order.to_dict()`` per object (the
+  previous read path)
+- Core: ``select(*ORDER_COLUMNS)`` then ``row_to_dict()`` per row (the
+  current ``operations.py`` read path)
+
+for listings of 10,000 and 100,000 orders (``get_all_orders``) and for a
+single-order lookup (``get_order_by_id``, where per-call overhead
+dominates). Reports rows per second and peak Python allocation.
+
+Usage:
+    python benchmarks/bench_reads.py [--rows 10000 100000] [--lookups 2000]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.tools.order_management import (
+    Order,
+    configure_storage,
+    dispose_engine,
+    get_all_orders,
+    get_db_session,
+    get_order_by_id,
+    init_db,
+    set_database_path,
+)
+from app.tools.order_management.database import _get_engine
+
+
+def populate(count: int):
+    rng = random.Random(7)
+    start = datetime(2024, 1, 1)
+    with _get_engine().begin() as conn:
+        conn.execute(Order.__table__.insert(), [
+            {
+                "order_date": start + timedelta(minutes=i),
+                "customer_name": f"Customer {rng.randrange(5000)}",
+                "billing_address": f"{rng.randrange(1, 9999)} Main Street, Springfield",
+                "product_sku": f"SKU-{rng.randrange(1000):04d}",
+                "quantity": 1 + rng.randrange(5),
+                "order_amount": round(rng.uniform(5, 500), 2),
+                "remarks": "Leave at the door" if i % 3 == 0 else None,
+                "order_status": "PENDING",
+            }
+            for i in range(count)
+        ])
+
+
+def orm_all_orders():
+    """The previous get_all_orders()."""
+    session = get_db_session()
+    try:
+        orders = session.query(Order).order_by(Order.order_date.desc(), Order.order_id.desc()).all()
+        return [order.to_dict() for order in orders]
+    finally:
+        session.close()
+
+
+def orm_order_by_id(order_id: int):
+    """The previous get_order_by_id()."""
+    session = get_db_session()
+    try:
+        return session.query(Order).filter(Order.order_id == order_id).first().to_dict()
+    finally:
+        session.close()
+
+
+def measure(fn, repeat: int):
+    """Best-of-``repeat`` seconds and peak allocation (KB) of one call."""
+    fn()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak // 1024
+
+
+def main(sizes, lookups: int):
+    print(f"{'workload':<26}{'path':<6}{'ms':>10}{'rows/s':>12}{'peak KB':>10}{'speedup':>9}")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        for count in sizes:
+            set_database_path(str(Path(temp_dir) / f"reads_{count}.db"))
+            configure_storage(profile="performance")
+            init_db()
+            populate(count)
+
+            results = {}
+            for path, fn in (("ORM", orm_all_orders), ("Core", get_all_orders)):
+                seconds, peak = measure(fn, repeat=5 if count <= 10_000 else 3)
+                results[path] = seconds
+                print(
+                    f"{f'get_all_orders ({count:,})':<26}{path:<6}{seconds * 1e3:>10.1f}"
+                    f"{count / seconds:>12,.0f}{peak:>10}{results['ORM'] / seconds:>8.1f}x"
+                )
+
+            ids = [random.randrange(1, count + 1) for _ in range(lookups)]
+            for path, fn in (("ORM", orm_order_by_id), ("Core", get_order_by_id)):
+                start = time.perf_counter()
+                for order_id in ids:
+                    fn(order_id)
+                seconds = time.perf_counter() - start
+                results[f"id-{path}"] = seconds
+                print(
+                    f"{f'get_order_by_id x{lookups:,}':<26}{path:<6}{seconds * 1e3:>10.1f}"
+                    f"{lookups / seconds:>12,.0f}{'':>10}{results['id-ORM'] / seconds:>8.1f}x"
+                )
+            dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Order read path benchmark")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000], help="Orders per run")
+    parser.add_argument("--lookups", type=int, default=2000, help="Single-order lookups per run")
+    args = parser.parse_args()
+    main(args.rows, args.lookups)
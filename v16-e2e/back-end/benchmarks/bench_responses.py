@@ -0,0 +1,148 @@
+"""
+Response Serialization Benchmark
+
+Compares the default runtime against the performance profile
+(``PERFORMANCE_PROFILE``) on the session endpoints:
+
+- ``GET /api/v1/sessions/{id}/history`` for a 1,000-message session
+- ``GET /api/v1/sessions?limit=100`` with 100 sessions
+
+The default profile serializes the response model through FastAPI; the
+performance profile renders it with orjson (``FastJSONResponse``). Each
+profile runs on the asyncio event loop, and on uvloop when it is
+installed. The ASGI app is driven directly (no sockets), so HTTP parser
+choice (httptools vs h11) is not part of these numbers.
+
+Usage:
+    python benchmarks/bench_responses.py [--requests 500]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Minimal configuration so the settings model validates
+os.environ.setdefault("AZURE_AI_PROJECT_ENDPOINT", "https://bench.example.com")
+os.environ.setdefault("AZURE_OPENAI_API_KEY", "bench-key")
+os.environ.setdefault("SMTP_SERVER", "smtp.example.com")
+os.environ.setdefault("SENDER_EMAIL", "bench@example.com")
+os.environ.setdefault("SENDER_PASSWORD", "bench-password")
+
+import logging
+
+from fastapi import FastAPI
+
+from app.api.routes.sessions import router as sessions_router
+from app.config import get_settings
+from app.session.manager import get_session_manager
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+HISTORY_MESSAGES = 1000
+LISTED_SESSIONS = 100
+
+
+async def populate():
+    """Create one long session and enough sessions to fill a listing page."""
+    manager = get_session_manager()
+    session = await manager.create_session("bench-history")
+    for i in range(HISTORY_MESSAGES):
+        role = "user" if i % 2 == 0 else "assistant"
+        tool_calls = [{"name": "get_order", "arguments": {"order_id": i}}] if i % 10 == 1 else None
+        session.add_message(role, f"Message {i}: where is my order? " * 4, tool_calls)
+    for i in range(LISTED_SESSIONS - 1):
+        await manager.create_session(f"bench-{i}")
+
+
+def make_scope(path: str, query: str = "") -> dict:
+    """Build a minimal HTTP scope."""
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": query.encode(),
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("bench", 80),
+    }
+
+
+async def run_request(app, path: str, query: str) -> tuple[float, int]:
+    """Run a single request; return (seconds, body bytes)."""
+    size = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    start = time.perf_counter()
+    await app(make_scope(path, query), receive, send)
+    return time.perf_counter() - start, size
+
+
+async def bench(app, path: str, query: str, count: int) -> dict:
+    """Benchmark a path and return latency statistics."""
+    for _ in range(20):
+        await run_request(app, path, query)
+
+    times = []
+    for _ in range(count):
+        seconds, size = await run_request(app, path, query)
+        times.append(seconds * 1e3)
+    return {"p50_ms": statistics.median(times), "mean_ms": statistics.fmean(times), "bytes": size}
+
+
+async def run_profiles(loop_name: str, count: int):
+    await populate()
+    app = FastAPI()
+    app.include_router(sessions_router)
+    settings = get_settings()
+
+    for profile in (False, True):
+        settings.PERFORMANCE_PROFILE = profile
+        label = "performance" if profile else "default"
+        for name, path, query, n in (
+            ("history (1k msgs)", "/api/v1/sessions/bench-history/history", "", count),
+            ("list (100)", "/api/v1/sessions", f"limit={LISTED_SESSIONS}", count),
+        ):
+            result = await bench(app, path, query, n)
+            print(
+                f"{loop_name:<9}{label:<13}{name:<20}{result['p50_ms']:>10.3f}"
+                f"{result['mean_ms']:>11.3f}{result['bytes']:>10}"
+            )
+
+
+def main(count: int):
+    # Keep log I/O out of the measurement
+    logging.disable(logging.CRITICAL)
+
+    print(f"{'loop':<9}{'profile':<13}{'endpoint':<20}{'p50 (ms)':>10}{'mean (ms)':>11}{'bytes':>10}")
+    asyncio.run(run_profiles("asyncio", count))
+    if uvloop is not None:
+        uvloop.run(run_profiles("uvloop", count))
+    else:
+        print("uvloop not installed; skipped")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Response serialization benchmark")
+    parser.add_argument("--requests", type=int, default=500, help="Requests per endpoint and profile")
+    args = parser.parse_args()
+    main(args.requests)
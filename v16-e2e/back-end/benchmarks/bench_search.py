@@ -0,0 +1,156 @@
+"""
+Order Search Benchmark
+
+Compares substring search on the order database with ``LIKE '%term%'``
+(a full table scan) and with the FTS5 trigram index (``orders_fts``), at
+1,000,000 orders by default.
+
+For each search term it reports the matching rows, the time to find them
+both ways (the ``(order_id, rank)`` lookup that ``search_orders`` joins
+against) and the query plan, then ``search_orders`` end to end. Also
+reports the time to build the index over the existing orders and the
+database size with and without it.
+
+The generated database is kept in ``--dir`` and reused when it already
+has the requested number of orders.
+
+Usage:
+    python benchmarks/bench_search.py [--orders 1000000] [--dir data/bench]
+"""
+import argparse
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from app.tools.order_management import configure_storage, init_db, search_orders, set_database_path
+from app.tools.order_management import database
+from app.tools.order_management.models import Order
+from app.tools.order_management.search import substring_matches
+
+STREETS = [f"{name} {kind}" for name in (
+    "Oak", "Maple", "Cedar", "Elm", "Pine", "Birch", "Willow", "Aspen", "Spruce", "Hickory",
+    "Chestnut", "Magnolia", "Sycamore", "Juniper", "Poplar", "Walnut", "Cypress", "Laurel",
+) for kind in ("Street", "Avenue", "Road", "Lane", "Drive", "Court")]
+CITIES = ["Springfield", "Riverside", "Franklin", "Greenville", "Bristol", "Clinton", "Fairview",
+          "Salem", "Madison", "Georgetown", "Arlington", "Ashland", "Dover", "Oxford", "Jackson"]
+PRODUCTS = ["MOUSE", "KEYBOARD", "MONITOR", "HEADSET", "WEBCAM", "DOCK", "CABLE", "CHARGER"]
+
+# (label, column, term)
+SEARCHES = [
+    ("rare SKU fragment", "product_sku", "R-4821"),
+    ("product name", "product_sku", "webcam"),
+    ("house and street", "billing_address", "4821 oak street"),
+    ("street", "billing_address", "magnolia lane"),
+    ("city", "billing_address", "georgetown"),
+]
+
+
+def build(db_path: Path, count: int):
+    """Create the order table with ``count`` synthetic orders (no search index)."""
+    rng = random.Random(42)
+    start_date = datetime(2024, 1, 1)
+    engine = database._get_engine()
+    Order.metadata.create_all(engine)
+    with engine.begin() as conn:
+        for offset in range(0, count, 50_000):
+            rows = [
+                {
+                    "order_date": start_date + timedelta(minutes=i),
+                    "customer_name": f"Customer {rng.randrange(100_000)}",
+                    "billing_address": f"{rng.randrange(1, 9999)} {rng.choice(STREETS)}, {rng.choice(CITIES)}",
+                    "product_sku": f"{rng.choice(PRODUCTS)}-{rng.randrange(100_000):05d}",
+                    "quantity": 1 + rng.randrange(5),
+                    "order_amount": round(rng.uniform(5, 500), 2),
+                    "order_status": "PENDING",
+                }
+                for i in range(offset, min(offset + 50_000, count))
+            ]
+            conn.execute(Order.__table__.insert(), rows)
+
+
+def timed(fn, repeat: int = 5) -> float:
+    """Median milliseconds over ``repeat`` runs (after one warm-up)."""
+    fn()
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e3)
+    return statistics.median(samples)
+
+
+def main(count: int, directory: Path):
+    directory.mkdir(parents=True, exist_ok=True)
+    db_path = directory / f"bench_search_{count}.db"
+    set_database_path(str(db_path))
+    configure_storage(profile="performance")
+    engine = database._get_engine()
+
+    existing = 0
+    if db_path.exists():
+        with engine.connect() as conn:
+            existing = conn.execute(text("SELECT COUNT(*) FROM orders")).scalar()
+    if existing != count:
+        database.dispose_engine()
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+        print(f"Generating {count:,} orders...")
+        start = time.perf_counter()
+        build(db_path, count)
+        print(f"  generated in {time.perf_counter() - start:.1f}s")
+        engine = database._get_engine()
+
+    with engine.begin() as conn:
+        conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+    size_without = db_path.stat().st_size
+    with engine.begin() as conn:
+        indexed = conn.execute(text("SELECT 1 FROM sqlite_master WHERE name = 'orders_fts'")).first()
+    start = time.perf_counter()
+    init_db()
+    build_seconds = time.perf_counter() - start
+    with engine.begin() as conn:
+        conn.execute(text("PRAGMA wal_checkpoint(TRUNCATE)"))
+    if indexed:
+        print("Search index already built")
+    else:
+        print(f"Built search index in {build_seconds:.1f}s; database "
+              f"{size_without / 1e6:.0f} MB -> {db_path.stat().st_size / 1e6:.0f} MB")
+
+    print(f"\n{count:,} orders")
+    print(f"{'search':<20}{'term':<16}{'rows':>7}{'LIKE ms':>10}{'FTS5 ms':>10}{'speedup':>9}  plan (LIKE / FTS5)")
+    with engine.connect() as conn:
+        for label, column, term in SEARCHES:
+            like = substring_matches(column, term, use_index=False)
+            fts = substring_matches(column, term, use_index=True)
+            rows = len(conn.execute(fts).all())
+            like_ms = timed(lambda: conn.execute(like).all())
+            fts_ms = timed(lambda: conn.execute(fts).all())
+            plans = [
+                conn.execute(text("EXPLAIN QUERY PLAN " + str(query.compile(compile_kwargs={"literal_binds": True})))).first()[-1]
+                for query in (like, fts)
+            ]
+            print(f"{label:<20}{term:<16}{rows:>7}{like_ms:>10.2f}{fts_ms:>10.2f}{like_ms / fts_ms:>8.0f}x  {plans[0]} / {plans[1]}")
+
+    print("\nsearch_orders end to end")
+    for label, column, term in SEARCHES:
+        database._search_index = False
+        like_ms = timed(lambda: search_orders(**{column: term}), repeat=3)
+        database._search_index = True
+        fts_ms = timed(lambda: search_orders(**{column: term}), repeat=3)
+        print(f"{label:<20}{term:<16}{'':>7}{like_ms:>10.2f}{fts_ms:>10.2f}{like_ms / fts_ms:>8.0f}x")
+    database.dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Order search benchmark")
+    parser.add_argument("--orders", type=int, default=1_000_000, help="Orders in the benchmark database")
+    parser.add_argument("--dir", type=Path, default=Path("data/bench"), help="Directory for the benchmark database")
+    args = parser.parse_args()
+    main(args.orders, args.dir)
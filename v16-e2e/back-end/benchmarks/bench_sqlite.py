@@ -0,0 +1,164 @@
+"""
+SQLite Storage Profile Benchmark
+
+Runs a mixed read/write workload against the order database from several
+threads, as concurrent agent runs do, under each storage profile
+(``ORDER_DB_PROFILE``):
+
+- ``default``: rollback journal, ``synchronous=FULL``, default pool
+- ``performance``: WAL, ``synchronous=NORMAL``, mmap, larger cache,
+  busy timeout, ``temp_store=MEMORY``, pool sized for the threads
+
+Each worker loops over the order operations the agent tools call: reads
+(``get_order_by_id``, ``get_orders_by_customer``) and writes (``create_order``,
+``update_order_status``) in the given mix. Reports throughput, read and
+write latency percentiles and failed operations (e.g. "database is
+locked").
+
+fsync cost depends heavily on the filesystem; run with ``--dir`` on the
+same disk as the real database for representative numbers.
+
+Usage:
+    python benchmarks/bench_sqlite.py [--threads 8] [--seconds 5] [--write-ratio 0.2] [--dir PATH]
+"""
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.tools.order_management import (
+    configure_storage,
+    create_order,
+    dispose_engine,
+    get_order_by_id,
+    get_orders_by_customer,
+    init_db,
+    set_database_path,
+    update_order_status,
+)
+
+SEED_ORDERS = 2000
+STATUSES = ("PENDING", "CONFIRMED", "SHIPPED", "DELIVERED")
+
+
+def seed(count: int):
+    """Insert the orders the workload reads and updates."""
+    for i in range(count):
+        create_order(
+            customer_name=f"Customer {i % 200}",
+            billing_address=f"{i} Main St, Springfield",
+            product_sku=f"SKU-{i % 50:03d}",
+            quantity=1 + i % 5,
+            order_amount=10.0 + i % 100,
+        )
+
+
+def percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+def worker(seconds: float, write_ratio: float, seed_value: int, results: dict, lock: threading.Lock):
+    rng = random.Random(seed_value)
+    reads, writes, errors = [], [], 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        is_write = rng.random() < write_ratio
+        start = time.perf_counter()
+        try:
+            if is_write:
+                if rng.random() < 0.5:
+                    create_order(
+                        customer_name=f"Customer {rng.randrange(200)}",
+                        billing_address="1 Bench Rd, Springfield",
+                        product_sku=f"SKU-{rng.randrange(50):03d}",
+                        quantity=1,
+                        order_amount=19.99,
+                    )
+                else:
+                    update_order_status(rng.randrange(1, SEED_ORDERS + 1), rng.choice(STATUSES))
+            elif rng.random() < 0.7:
+                get_order_by_id(rng.randrange(1, SEED_ORDERS + 1))
+            else:
+                get_orders_by_customer(f"Customer {rng.randrange(200)}")
+        except Exception:
+            errors += 1
+            continue
+        (writes if is_write else reads).append((time.perf_counter() - start) * 1e3)
+
+    with lock:
+        results["reads"].extend(reads)
+        results["writes"].extend(writes)
+        results["errors"] += errors
+
+
+def run_profile(profile: str, threads: int, seconds: float, write_ratio: float, directory: Path) -> dict:
+    db_path = directory / f"bench_{profile}.db"
+    for suffix in ("", "-wal", "-shm", "-journal"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
+
+    set_database_path(str(db_path))
+    configure_storage(profile=profile, pool_size=threads)
+    init_db()
+    seed(SEED_ORDERS)
+
+    results = {"reads": [], "writes": [], "errors": 0}
+    lock = threading.Lock()
+    pool = [
+        threading.Thread(target=worker, args=(seconds, write_ratio, i, results, lock))
+        for i in range(threads)
+    ]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    dispose_engine()
+
+    reads, writes = results["reads"], results["writes"]
+    return {
+        "ops_per_s": (len(reads) + len(writes)) / elapsed,
+        "read_p50": statistics.median(reads) if reads else 0.0,
+        "read_p99": percentile(reads, 0.99),
+        "write_p50": statistics.median(writes) if writes else 0.0,
+        "write_p99": percentile(writes, 0.99),
+        "errors": results["errors"],
+    }
+
+
+def main(threads: int, seconds: float, write_ratio: float, directory: Path):
+    print(f"{threads} threads, {seconds:.0f}s, {write_ratio:.0%} writes, database in {directory}")
+    print(
+        f"{'profile':<13}{'ops/s':>9}{'read p50':>10}{'read p99':>10}"
+        f"{'write p50':>11}{'write p99':>11}{'errors':>8}   (latencies in ms)"
+    )
+    for profile in ("default", "performance"):
+        r = run_profile(profile, threads, seconds, write_ratio, directory)
+        print(
+            f"{profile:<13}{r['ops_per_s']:>9.0f}{r['read_p50']:>10.2f}{r['read_p99']:>10.2f}"
+            f"{r['write_p50']:>11.2f}{r['write_p99']:>11.2f}{r['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SQLite storage profile benchmark")
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent worker threads")
+    parser.add_argument("--seconds", type=float, default=5.0, help="Duration per profile")
+    parser.add_argument("--write-ratio", type=float, default=0.2, help="Fraction of operations that write")
+    parser.add_argument("--dir", type=Path, default=None, help="Directory for the benchmark databases")
+    args = parser.parse_args()
+    if args.dir is not None:
+        args.dir.mkdir(parents=True, exist_ok=True)
+        main(args.threads, args.seconds, args.write_ratio, args.dir)
+    else:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            main(args.threads, args.seconds, args.write_ratio, Path(temp_dir))
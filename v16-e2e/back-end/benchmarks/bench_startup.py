@@ -0,0 +1,161 @@
+"""
+Cold Start Benchmark
+
+Measures how long a fresh server process takes to start.
+
+Reports:
+- Import-time profile of ``server`` (``python -X importtime``), the
+  slowest top-level imports first
+- Time-to-listening: process spawn until ``/health/live`` answers
+- Time-to-ready: process spawn until ``/health/ready`` reports ready
+  (background initialization of MCP and the agent finished)
+
+Each run starts uvicorn in a new process, so module caches are cold apart
+from the OS page cache. Time-to-listening is checked against the 1s target.
+The MCP server and SMTP server point at closed local ports unless set in
+the environment, so the numbers do not depend on external services.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 5] [--port 9181]
+"""
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).parent.parent
+TARGET_LISTENING_SECONDS = 1.0
+
+# Minimal configuration so the settings model validates
+BENCH_ENV = {
+    "AZURE_AI_PROJECT_ENDPOINT": "https://bench.example.com",
+    "AZURE_OPENAI_API_KEY": "bench-key",
+    "SMTP_SERVER": "127.0.0.1",
+    "SMTP_PORT": "9",
+    "SENDER_EMAIL": "bench@example.com",
+    "SENDER_PASSWORD": "bench-password",
+    "MCP_SERVER_URL": "http://127.0.0.1:9/mcp",
+    "LOG_TO_FILE": "false",
+    "LOG_LEVEL": "WARNING",
+}
+
+
+def bench_env() -> dict:
+    env = dict(os.environ)
+    for key, value in BENCH_ENV.items():
+        env.setdefault(key, value)
+    return env
+
+
+def import_profile(top: int) -> tuple[float, list[tuple[float, str]]]:
+    """Import ``server`` with -X importtime; return total and slowest top-level imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import server"],
+        cwd=ROOT, env=bench_env(), capture_output=True, text=True, check=True
+    )
+    # Children are printed before their parent: server's direct imports are
+    # the depth-1 entries between the previous top-level import and "server"
+    entries = []
+    total = 0.0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        seconds = int(cumulative) / 1e6
+        if depth == 0:
+            if name.strip() == "server":
+                total = seconds
+                break
+            entries = []  # imported by the interpreter, not by server
+        elif depth == 1:
+            entries.append((seconds, name.strip()))
+    return total, sorted(entries, reverse=True)[:top]
+
+
+def wait_for(url: str, predicate, deadline: float) -> float:
+    """Poll ``url`` until ``predicate(response)``; return the time it happened."""
+    with httpx.Client(timeout=0.5) as client:
+        while time.perf_counter() < deadline:
+            try:
+                response = client.get(url)
+                if predicate(response):
+                    return time.perf_counter()
+            except httpx.TransportError:
+                pass
+            time.sleep(0.01)
+    raise TimeoutError(url)
+
+
+def cold_start(port: int, ready_timeout: float) -> tuple[float, float | None]:
+    """Start a server process; return (time-to-listening, time-to-ready)."""
+    base = f"http://127.0.0.1:{port}"
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "server:create_app", "--factory",
+         "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env=bench_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        listening = wait_for(f"{base}/health/live", lambda r: r.status_code == 200, start + 30)
+        try:
+            ready = wait_for(
+                f"{base}/health/ready",
+                lambda r: r.status_code == 200 and r.json().get("ready"),
+                listening + ready_timeout
+            )
+        except TimeoutError:
+            ready = None
+        return listening - start, (ready - start) if ready is not None else None
+    finally:
+        process.terminate()
+        process.wait(timeout=10)
+
+
+def port_free(port: int) -> bool:
+    with socket.socket() as sock:
+        return sock.connect_ex(("127.0.0.1", port)) != 0
+
+
+def main(runs: int, port: int, ready_timeout: float):
+    total, slowest = import_profile(top=10)
+    print(f"import server: {total * 1000:.0f}ms")
+    for seconds, name in slowest:
+        print(f"  {name:<40}{seconds * 1000:>8.0f}ms")
+
+    if not port_free(port):
+        sys.exit(f"Port {port} is in use")
+
+    listening_times, ready_times = [], []
+    for _ in range(runs):
+        listening, ready = cold_start(port, ready_timeout)
+        listening_times.append(listening)
+        if ready is not None:
+            ready_times.append(ready)
+
+    listening = statistics.median(listening_times)
+    within = listening < TARGET_LISTENING_SECONDS
+    print(f"\n{'time-to-listening (median)':<30}{listening * 1000:>8.0f}ms  {'ok' if within else 'OVER'}")
+    if ready_times:
+        print(f"{'time-to-ready (median)':<30}{statistics.median(ready_times) * 1000:>8.0f}ms")
+    else:
+        print(f"{'time-to-ready':<30}{'not ready':>8}  (agent initialization failed or timed out)")
+
+    sys.exit(0 if within else 1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Cold start benchmark")
+    parser.add_argument("--runs", type=int, default=5, help="Server starts to measure")
+    parser.add_argument("--port", type=int, default=9181, help="Port for the benchmark server")
+    parser.add_argument("--ready-timeout", type=float, default=15.0, help="Seconds to wait for readiness")
+    args = parser.parse_args()
+    main(args.runs, args.port, args.ready_timeout)
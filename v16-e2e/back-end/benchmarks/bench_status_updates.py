@@ -0,0 +1,122 @@
+"""
+Batched Status Update Benchmark
+
+Ships the CONFIRMED orders of one busy day ("mark all CONFIRMED orders
+from yesterday as SHIPPED") in a database of ``--orders`` orders, three
+ways:
+
+- ``update_order_status`` per order: what N ``update_order`` tool calls
+  did (after reading the order list to find the IDs)
+- ``update_order_status_bulk`` with the IDs and their expected versions
+- ``update_order_status_bulk`` with filters only (status and day)
+
+Reports time, orders updated per second and statements sent to SQLite
+(each tool call is also one model round trip for the agent).
+
+Usage:
+    python benchmarks/bench_status_updates.py [--orders 100000] [--per-day 2000]
+"""
+import argparse
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import event, text
+
+from app.tools.order_management import (
+    configure_storage,
+    create_orders_bulk,
+    dispose_engine,
+    init_db,
+    set_database_path,
+    update_order_status,
+    update_order_status_bulk,
+)
+from app.tools.order_management.database import _get_engine
+
+STATUSES = ("PENDING", "CONFIRMED", "SHIPPED", "DELIVERED")
+
+
+def generate(count: int, per_day: int):
+    rng = random.Random(5)
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        yield {
+            "customer_name": f"Customer {rng.randrange(2000)}",
+            "billing_address": f"{rng.randrange(1, 9999)} Main Street, Springfield",
+            "product_sku": f"SKU-{rng.randrange(500):04d}",
+            "quantity": 1 + rng.randrange(5),
+            "order_amount": round(rng.uniform(5, 500), 2),
+            "order_status": rng.choice(STATUSES),
+            "order_date": (start + timedelta(days=i // per_day, seconds=i % per_day)).isoformat(),
+        }
+
+
+def confirmed_on(day: str):
+    """IDs and versions of the day's CONFIRMED orders (what the agent would have read)."""
+    with _get_engine().connect() as conn:
+        return dict(conn.execute(text(
+            "SELECT order_id, version FROM orders WHERE order_status = 'CONFIRMED' AND date(order_date) = :day"
+        ), {"day": day}).all())
+
+
+def reset(order_ids):
+    """Put the shipped orders back to CONFIRMED for the next run."""
+    with _get_engine().begin() as conn:
+        conn.execute(text("UPDATE orders SET order_status = 'CONFIRMED' WHERE order_id = :order_id"),
+                     [{"order_id": order_id} for order_id in order_ids])
+
+
+def run(label: str, fn, statements: list):
+    statements.clear()
+    start = time.perf_counter()
+    updated = fn()
+    seconds = time.perf_counter() - start
+    print(f"{label:<36}{updated:>9,}{seconds * 1e3:>11.1f}{updated / seconds:>12,.0f}{len(statements):>12,}")
+
+
+def main(count: int, per_day: int):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        set_database_path(str(Path(temp_dir) / "status.db"))
+        configure_storage(profile="performance")
+        init_db()
+        create_orders_bulk(generate(count, per_day), chunk_size=10_000)
+
+        statements = []
+        event.listen(_get_engine(), "before_cursor_execute", lambda *args: statements.append(1))
+        day = (datetime(2024, 1, 1) + timedelta(days=(count // per_day) // 2)).date().isoformat()
+
+        print(f"{count:,} orders, shipping the CONFIRMED orders of {day}")
+        print(f"{'method':<36}{'orders':>9}{'ms':>11}{'orders/s':>12}{'statements':>12}")
+
+        versions = confirmed_on(day)
+        run("update_order_status per order",
+            lambda: len([update_order_status(order_id, "SHIPPED", expected_version=version)
+                         for order_id, version in versions.items()]),
+            statements)
+        reset(versions)
+
+        versions = confirmed_on(day)
+        run("bulk, IDs with expected versions",
+            lambda: update_order_status_bulk("SHIPPED", expected_versions=versions)["updated_count"],
+            statements)
+        reset(versions)
+
+        run("bulk, status and day filters",
+            lambda: update_order_status_bulk("SHIPPED", current_status="CONFIRMED",
+                                             start_date=day, end_date=day)["updated_count"],
+            statements)
+        dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Batched order status update benchmark")
+    parser.add_argument("--orders", type=int, default=100_000, help="Orders in the database")
+    parser.add_argument("--per-day", type=int, default=2000, help="Orders placed per day")
+    args = parser.parse_args()
+    main(args.orders, args.per_day)
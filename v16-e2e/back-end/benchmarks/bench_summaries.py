@@ -0,0 +1,156 @@
+"""
+Order Summaries Benchmark
+
+Answers two typical agent questions at 100,000 orders, first the way
+the agent had to before summaries (read the orders, add them up), then
+from the summary tables:
+
+- revenue by status for one month: every page of orders in the month
+  vs ``get_status_totals``
+- top SKUs of a customer: all the customer's orders vs ``get_top_skus``
+
+Reports time per answer and the JSON size of what the agent has to read
+(a proxy for prompt tokens). Then measures what maintaining the
+summaries costs writes: ``create_order``, ``update_order_status`` and
+``create_orders_bulk`` with and without the summary triggers.
+
+Usage:
+    python benchmarks/bench_summaries.py [--orders 100000]
+"""
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import text
+
+from app.tools.order_management import (
+    configure_storage,
+    create_order,
+    create_orders_bulk,
+    dispose_engine,
+    get_orders_by_customer,
+    get_status_totals,
+    get_top_skus,
+    init_db,
+    search_orders_page,
+    set_database_path,
+    update_order_status,
+)
+from app.tools.order_management.database import _get_engine
+from app.tools.order_management.summaries import _TRIGGERS
+
+CUSTOMERS = 2000
+STATUSES = ("PENDING", "CONFIRMED", "SHIPPED", "DELIVERED", "CANCELLED")
+
+
+def generate(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    for i in range(count):
+        yield {
+            "customer_name": f"Customer {rng.randrange(CUSTOMERS)}",
+            "billing_address": f"{rng.randrange(1, 9999)} Main Street, Springfield",
+            "product_sku": f"SKU-{rng.randrange(500):04d}",
+            "quantity": 1 + rng.randrange(5),
+            "order_amount": round(rng.uniform(5, 500), 2),
+            "order_status": rng.choice(STATUSES),
+            "order_date": (start + timedelta(minutes=5 * i)).isoformat(),
+        }
+
+
+def timed(fn, repeat: int):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def month_by_paging(status: str, month: str):
+    """Revenue of one status in one month from order pages (the agent's only way before)."""
+    pages, total, cursor = [], 0.0, None
+    while True:
+        page = search_orders_page(order_status=status, limit=100, cursor=cursor)
+        pages.append(page)
+        for order in page["orders"]:
+            if order["order_date"].startswith(month):
+                total += order["order_amount"]
+        cursor = page["next_cursor"]
+        if cursor is None or page["orders"][-1]["order_date"] < month:
+            return pages, round(total, 2)
+
+
+def top_skus_by_listing(customer_name: str):
+    orders = get_orders_by_customer(customer_name)
+    totals = defaultdict(float)
+    for order in orders:
+        totals[order["product_sku"]] += order["order_amount"]
+    return orders, Counter(totals).most_common(10)
+
+
+def set_triggers(enabled: bool):
+    with _get_engine().begin() as conn:
+        for trigger in _TRIGGERS:
+            name = trigger.split()[5]
+            conn.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+            if enabled:
+                conn.execute(text(trigger))
+
+
+def main(count: int):
+    with tempfile.TemporaryDirectory() as temp_dir:
+        set_database_path(str(Path(temp_dir) / "summaries.db"))
+        configure_storage(profile="performance")
+        init_db()
+        create_orders_bulk(generate(count), chunk_size=10_000)
+
+        print(f"{count:,} orders")
+        print(f"{'question':<36}{'method':<22}{'ms':>10}{'JSON bytes':>12}")
+        last_month = (datetime(2024, 1, 1) + timedelta(minutes=5 * count)).strftime("%Y-%m")
+        seconds, (pages, _) = timed(lambda: month_by_paging("SHIPPED", last_month), 3)
+        print(f"{'shipped revenue, last month':<36}{'order pages':<22}{seconds * 1e3:>10.1f}"
+              f"{len(json.dumps(pages)):>12,}")
+        start, end = f"{last_month}-01", f"{last_month}-31"
+        seconds, totals = timed(lambda: get_status_totals(start, end), 100)
+        print(f"{'revenue by status, last month':<36}{'get_status_totals':<22}{seconds * 1e3:>10.2f}"
+              f"{len(json.dumps(totals)):>12,}")
+
+        seconds, (orders, _) = timed(lambda: top_skus_by_listing("Customer 42"), 20)
+        print(f"{'top SKUs of a customer':<36}{'customer orders':<22}{seconds * 1e3:>10.1f}"
+              f"{len(json.dumps(orders)):>12,}")
+        seconds, skus = timed(lambda: get_top_skus("Customer 42"), 100)
+        print(f"{'top SKUs of a customer':<36}{'get_top_skus':<22}{seconds * 1e3:>10.2f}"
+              f"{len(json.dumps(skus)):>12,}")
+
+        print()
+        print(f"{'write':<30}{'no summaries /s':>16}{'summaries /s':>14}")
+        writes = {}
+        for enabled in (False, True):
+            set_triggers(enabled)
+            new_orders = list(generate(1000, seed=enabled + 1))
+            for order in new_orders:
+                order["order_date"] = datetime.fromisoformat(order["order_date"])
+            seconds, _ = timed(lambda: [create_order(**order) for order in new_orders], 1)
+            writes.setdefault("create_order", []).append(1000 / seconds)
+            ids = random.Random(3).sample(range(1, count), 1000)
+            seconds, _ = timed(lambda: [update_order_status(i, "DELIVERED") for i in ids], 1)
+            writes.setdefault("update_order_status", []).append(1000 / seconds)
+            seconds, _ = timed(lambda: create_orders_bulk(generate(20_000, seed=enabled + 3)), 1)
+            writes.setdefault("create_orders_bulk (20k)", []).append(20_000 / seconds)
+        for name, (without, with_summaries) in writes.items():
+            print(f"{name:<30}{without:>16,.0f}{with_summaries:>14,.0f}")
+        dispose_engine()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Order summaries benchmark")
+    parser.add_argument("--orders", type=int, default=100_000, help="Orders in the database")
+    args = parser.parse_args()
+    main(args.orders)
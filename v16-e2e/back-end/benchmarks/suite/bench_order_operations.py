@@ -0,0 +1,142 @@
+"""
+Order Operation Benchmarks
+
+One benchmark per order management operation, at each database size
+(see conftest.py). Lookups cycle through keys picked from the data, so
+successive rounds do not hit the same rows; writes change the session's
+copy of the database.
+"""
+from datetime import datetime
+from itertools import cycle, islice
+
+from app.tools.order_management import (
+    create_order,
+    create_orders_bulk,
+    get_all_orders,
+    get_customer_summary,
+    get_order_by_id,
+    get_orders_by_customer,
+    get_orders_by_customer_page,
+    get_orders_page,
+    get_status_totals,
+    get_top_skus,
+    latest_event_sequence,
+    read_events,
+    search_orders,
+    search_orders_page,
+    update_order_status,
+    update_order_status_bulk,
+)
+from generate_orders import generate_orders
+
+STATUS_CYCLE = ("CONFIRMED", "SHIPPED")
+
+
+# Reads
+
+def test_get_order_by_id(benchmark, order_db):
+    order_ids = cycle(order_db["order_ids"])
+    benchmark(lambda: get_order_by_id(next(order_ids)))
+
+
+def test_get_orders_by_customer(benchmark, order_db):
+    benchmark(get_orders_by_customer, order_db["customer"])
+
+
+def test_get_orders_by_customer_heavy(benchmark, order_db):
+    """The customer with the most orders (Zipf head)."""
+    benchmark(get_orders_by_customer, order_db["heavy_customer"])
+
+
+def test_get_orders_by_customer_page(benchmark, order_db):
+    benchmark(get_orders_by_customer_page, order_db["heavy_customer"], limit=20)
+
+
+def test_get_orders_page_first(benchmark, order_db):
+    benchmark(get_orders_page, limit=20)
+
+
+def test_get_orders_page_deep(benchmark, order_db):
+    """A page 100 pages in, from its cursor."""
+    cursor = None
+    for _ in range(100):
+        cursor = get_orders_page(limit=20, cursor=cursor)["next_cursor"]
+    benchmark(get_orders_page, limit=20, cursor=cursor)
+
+
+def test_get_all_orders(benchmark, order_db):
+    benchmark(get_all_orders, limit=100)
+
+
+def test_search_orders_sku(benchmark, order_db):
+    benchmark(search_orders, product_sku=order_db["sku"])
+
+
+def test_search_orders_page_address(benchmark, order_db):
+    benchmark(search_orders_page, billing_address="lake view", limit=20)
+
+
+def test_search_orders_page_status(benchmark, order_db):
+    benchmark(search_orders_page, order_status="PENDING", limit=20)
+
+
+# Summaries and change feed
+
+def test_get_status_totals(benchmark, order_db):
+    month = order_db["month"]
+    benchmark(get_status_totals, f"{month}-01", f"{month}-28")
+
+
+def test_get_top_skus(benchmark, order_db):
+    benchmark(get_top_skus, limit=10)
+
+
+def test_get_top_skus_customer(benchmark, order_db):
+    benchmark(get_top_skus, order_db["heavy_customer"], limit=10)
+
+
+def test_get_customer_summary(benchmark, order_db):
+    benchmark(get_customer_summary, order_db["customer"])
+
+
+def test_read_events(benchmark, order_db):
+    after = max(0, latest_event_sequence() - 1000)
+    benchmark(read_events, after, 100)
+
+
+# Writes
+
+def test_create_order(benchmark, order_db):
+    orders = cycle(list(generate_orders(100, seed=3)))
+
+    def create():
+        order = dict(next(orders), order_date=datetime(2025, 1, 1))
+        return create_order(**order)
+
+    benchmark(create)
+
+
+def test_update_order_status(benchmark, order_db):
+    updates = cycle((order_id, status) for status in STATUS_CYCLE for order_id in order_db["order_ids"])
+    benchmark(lambda: update_order_status(*next(updates)))
+
+
+def test_update_order_status_bulk(benchmark, order_db):
+    """100 orders by ID per call."""
+    batches = cycle(
+        (order_ids, status)
+        for status in STATUS_CYCLE
+        for order_ids in (order_db["order_ids"][i:i + 100] for i in range(0, 1000, 100))
+    )
+
+    def update():
+        order_ids, status = next(batches)
+        return update_order_status_bulk(status, order_ids=order_ids)
+
+    benchmark(update)
+
+
+def test_create_orders_bulk(benchmark, order_db):
+    """1,000 orders per call."""
+    orders = list(islice(generate_orders(1000, seed=4), 1000))
+    benchmark.pedantic(create_orders_bulk, args=(orders,), rounds=5, warmup_rounds=1)
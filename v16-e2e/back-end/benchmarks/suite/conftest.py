@@ -0,0 +1,122 @@
+"""
+Storage Benchmark Suite Fixtures
+
+Each benchmark runs against order databases of every size in
+``--rows`` (10k, 100k and 1M orders by default), filled by
+scripts/generate_orders.py. A generated database is kept in
+``--data-dir`` and reused by later runs (the generator is deterministic);
+each session benchmarks a copy, so write benchmarks never change it.
+"""
+import random
+import shutil
+import sys
+from datetime import date, timedelta
+from pathlib import Path
+
+import pytest
+
+BACK_END = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(BACK_END))
+sys.path.insert(0, str(BACK_END / "scripts"))
+
+from generate_orders import DEFAULT_SEED, generate_orders  # noqa: E402
+
+from app.tools.order_management import (  # noqa: E402
+    configure_cache,
+    configure_storage,
+    create_orders_bulk,
+    dispose_engine,
+    get_database_path,
+    init_db,
+    set_database_path,
+)
+from app.tools.order_management.cache import get_cache_mode  # noqa: E402
+from app.tools.order_management.database import get_db_connection  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+
+DEFAULT_ROWS = "10000,100000,1000000"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("storage benchmarks")
+    group.addoption("--rows", default=DEFAULT_ROWS,
+                    help=f"Comma-separated order counts to benchmark (default: {DEFAULT_ROWS})")
+    group.addoption("--data-dir", default=str(Path(__file__).parent / ".data"),
+                    help="Where generated databases are kept between runs")
+
+
+def _label(rows: int) -> str:
+    if rows % 1_000_000 == 0:
+        return f"{rows // 1_000_000}M"
+    if rows % 1000 == 0:
+        return f"{rows // 1000}k"
+    return str(rows)
+
+
+def pytest_generate_tests(metafunc):
+    if "order_db" in metafunc.fixturenames:
+        sizes = [int(rows) for rows in metafunc.config.getoption("rows").split(",")]
+        metafunc.parametrize("order_db", sizes, ids=[_label(rows) for rows in sizes],
+                             indirect=True, scope="session")
+
+
+def _template(rows: int, data_dir: Path) -> Path:
+    """Generated database of ``rows`` orders, created on first use."""
+    path = data_dir / f"orders-{rows}-seed{DEFAULT_SEED}.db"
+    if not path.exists():
+        data_dir.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(".partial")
+        set_database_path(str(partial))
+        configure_storage(profile="performance")
+        init_db()
+        create_orders_bulk(generate_orders(rows), chunk_size=10_000)
+        dispose_engine()  # Checkpoints the WAL into the database file
+        partial.rename(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def order_db(request, tmp_path_factory):
+    """
+    A copy of the generated database of ``request.param`` orders, opened
+    with the performance profile and the lookup cache off.
+
+    Yields:
+        dict: "rows", and lookup keys picked from the data: "customer"
+        (median number of orders), "heavy_customer" (most orders),
+        "sku", "order_ids" (random sample) and "month" (YYYY-MM, the last
+        full month)
+    """
+    rows = request.param
+    previous, previous_cache = get_database_path(), get_cache_mode()
+    template = _template(rows, Path(request.config.getoption("data_dir")))
+    path = tmp_path_factory.mktemp(f"orders-{_label(rows)}") / "orders.db"
+    shutil.copyfile(template, path)
+
+    set_database_path(str(path))
+    configure_storage(profile="performance")
+    configure_cache(mode="off")
+    init_db()
+    with get_db_connection() as conn:
+        customers = conn.execute(text(
+            "SELECT customer_name FROM order_summary_customer ORDER BY order_count DESC, customer_name"
+        )).scalars().all()
+        sku = conn.execute(text(
+            "SELECT product_sku FROM order_summary_sku ORDER BY order_count DESC, product_sku LIMIT 1 OFFSET 10"
+        )).scalar()
+        last_day = conn.execute(text("SELECT max(order_day) FROM order_summary_status_day")).scalar()
+    last_month = (date.fromisoformat(last_day).replace(day=1) - timedelta(days=1)).strftime("%Y-%m")
+
+    yield {
+        "rows": rows,
+        "customer": customers[len(customers) // 2],
+        "heavy_customer": customers[0],
+        "sku": sku,
+        "order_ids": random.Random(1).sample(range(1, rows + 1), 1000),
+        "month": last_month,
+    }
+
+    dispose_engine()
+    configure_cache(mode=previous_cache)
+    configure_storage()
+    set_database_path(previous)
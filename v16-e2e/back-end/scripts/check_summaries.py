@@ -0,0 +1,61 @@
+"""
+Order Summary Check
+
+Compares the order summary tables (totals per customer, SKU,
+customer and SKU, and day and status) with totals aggregated from the
+orders, and with --rebuild recomputes them from the orders. Use it after
+changing orders with the summary triggers dropped, or to check a copy of
+the database.
+
+Usage:
+    python scripts/check_summaries.py
+    python scripts/check_summaries.py --rebuild --db data/orders.db
+
+Exit status is 0 when the summaries match the orders (after rebuilding,
+with --rebuild), 1 otherwise.
+"""
+import argparse
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import get_settings
+from app.tools.order_management import (
+    init_db,
+    rebuild_summaries,
+    set_database_path,
+    verify_summaries,
+)
+
+# Mismatches printed before summarising the rest
+MAX_SHOWN = 20
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Check (and rebuild) the order summary tables")
+    parser.add_argument("--rebuild", action="store_true", help="Recompute the summaries from the orders")
+    parser.add_argument("--db", type=Path, help="Order database (default: the configured DATABASE_PATH)")
+    args = parser.parse_args(argv)
+
+    set_database_path(str(args.db or get_settings().database_path))
+    init_db()
+
+    if args.rebuild:
+        rebuild_summaries()
+        print("Rebuilt order summaries")
+
+    mismatches = verify_summaries()
+    if not mismatches:
+        print("Order summaries match the orders")
+        return 0
+    print(f"{len(mismatches):,} summary groups differ from the orders")
+    for mismatch in mismatches[:MAX_SHOWN]:
+        print(f"  {mismatch['table']} {mismatch['key']}: expected {mismatch['expected']}, found {mismatch['actual']}")
+    if len(mismatches) > MAX_SHOWN:
+        print(f"  ... {len(mismatches) - MAX_SHOWN:,} more")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
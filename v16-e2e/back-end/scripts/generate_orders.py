@@ -0,0 +1,213 @@
+"""
+Synthetic Order Generator
+
+Fills an order database with a deterministic, realistically skewed order
+history for benchmarks and capacity tests (1,000,000 orders take a few
+minutes):
+
+- customers follow a Zipf distribution: a few customers place many
+  orders, most place a handful
+- product SKUs follow a flatter Zipf distribution over a larger
+  catalogue (a long tail of rarely ordered SKUs); each SKU has its own
+  unit price, so order amounts follow quantity and product
+- orders per day grow over the period, with quieter weekends and most
+  orders placed during the day; order IDs increase with order date
+- statuses follow order age: recent orders are mostly PENDING or
+  CONFIRMED, last week's SHIPPED, older ones DELIVERED, a few CANCELLED
+
+The same arguments always produce the same orders. Orders are inserted
+with create_orders_bulk, so the search index, summaries and change feed
+are maintained as for any other write.
+
+Usage:
+    python scripts/generate_orders.py --orders 1000000 --db data/bench.db
+    python scripts/generate_orders.py --orders 100000 --days 365 --seed 7
+
+The complaint server has the matching generator
+(``python -m src.utils.synthetic_data``), whose complaints reference
+these orders.
+"""
+import argparse
+import math
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+DEFAULT_SEED = 42
+DEFAULT_DAYS = 730
+# Orders placed before this instant; fixed so output does not depend on today
+DEFAULT_END = datetime(2025, 1, 1)
+CUSTOMER_SKEW = 0.8
+SKU_SKEW = 1.0
+
+FIRST_NAMES = (
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Elizabeth",
+    "William", "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Charles", "Karen",
+    "Priya", "Arjun", "Wei", "Mei", "Hiroshi", "Yuki", "Carlos", "Sofia", "Ahmed", "Fatima",
+    "Olga", "Ivan", "Chloe", "Lucas", "Amara", "Kwame", "Ana", "Mateo", "Ingrid", "Lars",
+    "Aisha", "Omar", "Elena", "Marco", "Noah", "Emma", "Liam", "Olivia", "Ravi", "Ananya",
+    "Kenji", "Hana", "Diego", "Lucia", "Tariq", "Leila", "Sean", "Niamh", "Pavel", "Zara",
+)
+LAST_NAMES = (
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
+    "Patel", "Sharma", "Iyer", "Chen", "Wang", "Tanaka", "Sato", "Kim", "Park", "Nguyen",
+    "Silva", "Santos", "Rossi", "Muller", "Schmidt", "Dubois", "Novak", "Ivanova", "Okafor", "Mensah",
+    "Haddad", "Khan", "Ali", "Cohen", "Murphy", "Kelly", "Larsen", "Nielsen", "Kowalski", "Costa", "Fischer",
+)
+STREETS = ("Main Street", "Oak Avenue", "Maple Drive", "Cedar Lane", "Park Road", "High Street",
+           "Lake View", "Station Road", "Church Street", "Mill Lane", "River Walk", "Hill Crest")
+CITIES = ("Springfield, IL", "Austin, TX", "Portland, OR", "Denver, CO", "Boston, MA", "Seattle, WA",
+          "Atlanta, GA", "Chicago, IL", "Phoenix, AZ", "Columbus, OH", "Raleigh, NC", "Madison, WI")
+REMARKS = ("Express delivery", "Gift wrap", "Leave at the front door", "Call before delivery",
+           "Deliver after 5 PM", "Fragile - handle with care")
+
+# Status shares by order age in days (upper bound, weights in status order)
+STATUSES = ("PENDING", "CONFIRMED", "SHIPPED", "DELIVERED", "CANCELLED")
+STATUS_BY_AGE = (
+    (1, (60, 35, 0, 0, 5)),
+    (3, (5, 40, 50, 0, 5)),
+    (10, (0, 2, 45, 48, 5)),
+    (math.inf, (0, 0, 1, 92, 7)),
+)
+QUANTITY_WEIGHTS = (50, 22, 11, 6, 4, 3, 2, 1, 0.6, 0.4)
+
+
+def customer_name(rank: int) -> str:
+    """
+    Name of the customer with a popularity rank (unique per rank).
+
+    The first 3,660 ranks get distinct first/last name pairs, the next
+    get a middle initial, then a number.
+    """
+    first, last = FIRST_NAMES[rank % len(FIRST_NAMES)], LAST_NAMES[rank % len(LAST_NAMES)]
+    pairs = len(FIRST_NAMES) * len(LAST_NAMES)
+    group = rank // pairs
+    if group == 0:
+        return f"{first} {last}"
+    if group <= 26:
+        return f"{first} {chr(64 + group)}. {last}"
+    return f"{first} {last} {group - 25}"
+
+
+def customer_count(orders: int) -> int:
+    """Customers in the population for an order count."""
+    return max(100, orders // 20)
+
+
+def sku_count(orders: int) -> int:
+    """SKUs in the catalogue for an order count."""
+    return max(200, orders // 50)
+
+
+def zipf_weights(count: int, skew: float) -> List[float]:
+    """Cumulative Zipf weights of ranks 0..count-1 (for random.choices)."""
+    return list(accumulate(1.0 / (rank + 1) ** skew for rank in range(count)))
+
+
+def orders_per_day(count: int, days: int, end: datetime) -> List[int]:
+    """Orders on each day, growing threefold over the period, 30% fewer on weekends."""
+    start = end - timedelta(days=days)
+    weights = []
+    for day in range(days):
+        weekend = (start + timedelta(days=day)).weekday() >= 5
+        weights.append((1 + 2 * day / max(1, days - 1)) * (0.7 if weekend else 1.0))
+    total = sum(weights)
+    counts = [int(count * weight / total) for weight in weights]
+    # Give the rounding remainder to the busiest days
+    for day in sorted(range(days), key=lambda d: -weights[d])[:count - sum(counts)]:
+        counts[day] += 1
+    return counts
+
+
+def status_for_age(rng: random.Random, age_days: float) -> str:
+    for bound, weights in STATUS_BY_AGE:
+        if age_days < bound:
+            return rng.choices(STATUSES, weights)[0]
+
+
+def generate_orders(
+    count: int,
+    seed: int = DEFAULT_SEED,
+    days: int = DEFAULT_DAYS,
+    end: datetime = DEFAULT_END,
+    customer_skew: float = CUSTOMER_SKEW,
+    sku_skew: float = SKU_SKEW
+) -> Iterator[Dict[str, Any]]:
+    """
+    Yield ``count`` orders in order date order (lazily).
+
+    Args:
+        count: Orders to generate
+        seed: Random seed; the same arguments give the same orders
+        days: Length of the order history in days
+        end: Orders are placed in the ``days`` before this instant
+        customer_skew: Zipf exponent of orders per customer
+        sku_skew: Zipf exponent of orders per SKU
+
+    Yields:
+        dict: Order with create_order's fields (order_date as ISO string)
+    """
+    rng = random.Random(seed)
+    customers = zipf_weights(customer_count(count), customer_skew)
+    skus = zipf_weights(sku_count(count), sku_skew)
+    # Popularity rank -> SKU code and unit price (log-normal around $40)
+    codes = list(range(len(skus)))
+    rng.shuffle(codes)
+    prices = [round(min(2000.0, max(1.0, rng.lognormvariate(math.log(40), 0.9))), 2) for _ in skus]
+    quantities = list(accumulate(QUANTITY_WEIGHTS))
+    start = end - timedelta(days=days)
+
+    for day, day_count in enumerate(orders_per_day(count, days, end)):
+        # Most orders between 8:00 and 22:00, peaking in the early evening
+        seconds = sorted(int(rng.triangular(6, 24, 19) * 3600) % 86400 for _ in range(day_count))
+        customer_ranks = rng.choices(range(len(customers)), cum_weights=customers, k=day_count)
+        sku_ranks = rng.choices(range(len(skus)), cum_weights=skus, k=day_count)
+        for second, customer, sku in zip(seconds, customer_ranks, sku_ranks):
+            order_date = start + timedelta(days=day, seconds=second)
+            quantity = 1 + rng.choices(range(len(quantities)), cum_weights=quantities)[0]
+            yield {
+                "customer_name": customer_name(customer),
+                "billing_address": f"{(customer * 37) % 9999 + 1} {STREETS[customer % len(STREETS)]}, "
+                                   f"{CITIES[(customer // len(STREETS)) % len(CITIES)]}",
+                "product_sku": f"SKU-{codes[sku]:05d}",
+                "quantity": quantity,
+                "order_amount": round(prices[sku] * quantity, 2),
+                "remarks": rng.choice(REMARKS) if rng.random() < 0.05 else None,
+                "order_status": status_for_age(rng, (end - order_date).total_seconds() / 86400),
+                "order_date": order_date.isoformat(),
+            }
+
+
+def main(argv=None) -> int:
+    from app.tools.order_management import configure_storage, create_orders_bulk, init_db, set_database_path
+
+    parser = argparse.ArgumentParser(description="Generate a synthetic order history")
+    parser.add_argument("--orders", type=int, default=100_000, help="Orders to generate")
+    parser.add_argument("--db", type=Path, required=True, help="Order database to fill (created if missing)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed")
+    parser.add_argument("--days", type=int, default=DEFAULT_DAYS, help="Days of order history")
+    parser.add_argument("--chunk-size", type=int, default=10_000, help="Orders per transaction")
+    args = parser.parse_args(argv)
+
+    args.db.parent.mkdir(parents=True, exist_ok=True)
+    set_database_path(str(args.db))
+    configure_storage(profile="performance")
+    init_db()
+
+    start = time.perf_counter()
+    report = create_orders_bulk(generate_orders(args.orders, args.seed, args.days), chunk_size=args.chunk_size)
+    seconds = time.perf_counter() - start
+    print(f"Created {report['created']:,} orders in {seconds:.1f}s ({report['created'] / seconds:,.0f}/s)")
+    return 0 if report["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
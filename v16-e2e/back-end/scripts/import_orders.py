@@ -0,0 +1,80 @@
+"""
+Order Import
+
+Imports orders from a CSV or JSON Lines file into the order database
+with create_orders_bulk: the file is streamed, validated and inserted a
+chunk per transaction, and invalid rows are reported without stopping
+the import.
+
+CSV files need a header row with the order fields (customer_name,
+billing_address, product_sku, quantity, order_amount and optionally
+remarks, order_status, order_date); JSONL files hold one order object
+per line.
+
+Usage:
+    python scripts/import_orders.py orders.csv
+    python scripts/import_orders.py orders.jsonl --chunk-size 5000 --db data/orders.db
+
+Exit status is 0 when every row was imported, 1 otherwise.
+"""
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import get_settings
+from app.tools.order_management import (
+    configure_storage,
+    create_orders_bulk,
+    init_db,
+    read_orders_file,
+    set_database_path,
+)
+from app.tools.order_management.bulk import DEFAULT_CHUNK_SIZE
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Import orders from a CSV or JSONL file")
+    parser.add_argument("file", type=Path, help="CSV or JSONL file of orders")
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="File format (default: from the extension)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Orders per transaction")
+    parser.add_argument("--db", type=Path, help="Order database (default: the configured DATABASE_PATH)")
+    parser.add_argument("--json", action="store_true", help="Print the full report as JSON")
+    args = parser.parse_args(argv)
+
+    settings = get_settings()
+    set_database_path(str(args.db or settings.database_path))
+    configure_storage(
+        profile=settings.ORDER_DB_PROFILE,
+        mmap_size_mb=settings.ORDER_DB_MMAP_SIZE_MB,
+        cache_size_mb=settings.ORDER_DB_CACHE_SIZE_MB,
+        busy_timeout_ms=settings.ORDER_DB_BUSY_TIMEOUT_MS,
+        pool_size=settings.ORDER_DB_POOL_SIZE
+    )
+    init_db()
+
+    try:
+        orders = read_orders_file(args.file, args.format)
+        start = time.perf_counter()
+        report = create_orders_bulk(orders, chunk_size=args.chunk_size)
+    except (OSError, ValueError) as e:
+        print(f"Import failed: {e}", file=sys.stderr)
+        return 1
+    seconds = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"Read {report['total']:,} rows in {seconds:.1f}s: {report['created']:,} created, {report['failed']:,} failed")
+        for error in report["errors"]:
+            print(f"  row {error['row']}: {error['error']}")
+        if report["errors_truncated"]:
+            print(f"  ... {report['failed'] - len(report['errors']):,} more errors not shown")
+    return 0 if report["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
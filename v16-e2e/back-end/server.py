@@ -19,21 +19,32 @@ import uvicorn
 
 from app.config import get_settings
 from app.utils import configure_default_logger
+from app.utils.loop_monitor import start_loop_monitor, stop_loop_monitor
+from app.utils.tracing import configure_tracing, shutdown_tracing
 from app.startup import (
     display_banner, 
     display_ready_message, 
     display_error_banner, 
     run_all_checks,
-    create_shutdown_handler
+    create_shutdown_handler,
+    initialize_services,
+    start_services,
+    stop_background_tasks,
+    drain_in_flight_requests,
+    close_database_connections,
+    close_async_database_connections,
+    flush_logs,
+    DrainingServer,
+    get_server_options
 )
-from app.agent import initialize_agent_manager, shutdown_agent_manager
-from app.tools.mcp_handler import initialize_mcp_handler, shutdown_mcp_handler
-from app.tools.order_management import set_database_path
+from app.agent import shutdown_agent_manager
+from app.tools.mcp_handler import shutdown_mcp_handler
 from app.api import (
     agent_router,
     health_router,
     info_router,
     sessions_router,
+    metrics_router,
     setup_cors_middleware,
     setup_custom_middleware,
     setup_exception_handlers
@@ -92,25 +103,22 @@ async def lifespan(app: FastAPI):
     try:
         settings = get_settings()
         
-        # Configure database path for order management
-        logger.info(f"Configuring database path: {settings.database_path}")
-        set_database_path(str(settings.database_path))
+        # Watch for event loop stalls (blocking calls on the loop thread)
+        start_loop_monitor(settings)
         
-        # Initialize MCP handler
-        logger.info("Initializing MCP handler...")
-        try:
-            initialize_mcp_handler()
-            logger.info("✓ MCP handler initialized")
-        except Exception as e:
-            logger.warning(f"MCP initialization failed (continuing without MCP): {str(e)}")
+        # Export traces (HTTP → agent → tools → MCP/SQLite) if enabled
+        configure_tracing(settings)
         
-        # Initialize agent manager
-        logger.info("Initializing agent manager...")
-        initialize_agent_manager()
-        logger.info("✓ Agent manager initialized")
+        # Database, MCP handler, agent manager and health prober
+        if settings.BACKGROUND_STARTUP:
+            # Start listening now; /health/ready turns ready when this finishes
+            start_services(settings)
+            logger.info("Initializing services in the background...")
+        else:
+            await initialize_services(settings)
         
         logger.info("=" * 80)
-        logger.info("APPLICATION READY")
+        logger.info("APPLICATION STARTED" if settings.BACKGROUND_STARTUP else "APPLICATION READY")
         logger.info("=" * 80)
         
     except Exception as e:
@@ -126,6 +134,11 @@ async def lifespan(app: FastAPI):
     logger.info("=" * 80)
     
     try:
+        # Let in-flight requests (SSE streams, tool calls) finish first
+        await drain_in_flight_requests(settings.SHUTDOWN_DRAIN_TIMEOUT_SECONDS, logger)
+        
+        await stop_background_tasks(logger)
+        
         # Shutdown agent manager
         logger.info("Shutting down agent manager...")
         shutdown_agent_manager()
@@ -136,12 +149,21 @@ async def lifespan(app: FastAPI):
         shutdown_mcp_handler()
         logger.info("✓ MCP handler shutdown complete")
         
+        await close_async_database_connections(logger)
+        close_database_connections(logger)
+        
+        # Flush buffered spans
+        shutdown_tracing()
+        
+        await stop_loop_monitor()
+        
     except Exception as e:
         logger.error(f"Shutdown error: {str(e)}", exc_info=True)
     
     logger.info("=" * 80)
     logger.info("SHUTDOWN COMPLETE")
     logger.info("=" * 80)
+    flush_logs(logger)
 
 
 def create_app() -> FastAPI:
@@ -168,8 +190,9 @@ def create_app() -> FastAPI:
             "### 🔧 Technical Capabilities\n"
             "- **Multi-Tenant**: Tenant isolation for session management\n"
             "- **Rate Limiting**: Configurable per-IP request throttling\n"
-            "- **Request Tracing**: UUID-based request correlation\n"
-            "- **Health Monitoring**: Liveness and readiness probes\n\n"
+            "- **Request Tracing**: UUID-based request correlation and OpenTelemetry traces\n"
+            "- **Health Monitoring**: Liveness and readiness probes\n"
+            "- **Metrics**: Prometheus latency histograms at `/metrics`\n\n"
             "### 📚 Documentation\n"
             "- **Interactive Docs**: Available at `/docs` (Swagger UI)\n"
             "- **Alternative Docs**: Available at `/redoc` (ReDoc)\n"
@@ -205,6 +228,10 @@ def create_app() -> FastAPI:
             {
                 "name": "Info",
                 "description": "API information and tool listing"
+            },
+            {
+                "name": "Metrics",
+                "description": "Prometheus metrics for monitoring"
             }
         ],
         contact={
@@ -231,6 +258,8 @@ def create_app() -> FastAPI:
     app.include_router(agent_router)
     app.include_router(info_router)
     app.include_router(sessions_router)
+    if settings.ENABLE_METRICS:
+        app.include_router(metrics_router)
     
     # Root endpoint
     @app.get(
@@ -307,13 +336,16 @@ def main():
     logger.info("=" * 80)
     
     try:
-        uvicorn.run(
+        config = uvicorn.Config(
             app,
             host=settings.api_host,
             port=settings.api_port,
             log_level=settings.log_level.lower(),
-            access_log=True
+            access_log=True,
+            timeout_graceful_shutdown=settings.SHUTDOWN_DRAIN_TIMEOUT_SECONDS,
+            **get_server_options(settings, logger)
         )
+        DrainingServer(config, readiness_delay=settings.SHUTDOWN_READINESS_DELAY_SECONDS).run()
     except KeyboardInterrupt:
         logger.info("Received shutdown signal (CTRL+C)")
     except Exception as e:
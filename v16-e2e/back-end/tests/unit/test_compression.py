@@ -0,0 +1,177 @@
+"""
+Unit Tests for Compression and Streamed JSON
+
+Tests for app/api/middleware/compression.py and streamed list responses
+in app/api/responses.py.
+"""
+import json
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.middleware.compression import CompressionMiddleware, select_encoding
+from app.api.responses import iter_json_object, list_response
+from app.session.models import SessionData, SessionHistoryResponse
+
+LARGE = "x" * 5000
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/large")
+    async def large():
+        return PlainTextResponse(LARGE)
+
+    @app.get("/small")
+    async def small():
+        return PlainTextResponse("ok")
+
+    @app.get("/events")
+    async def events():
+        async def stream():
+            yield f"data: {LARGE}\n\n"
+        return StreamingResponse(stream(), media_type="text/event-stream")
+
+    @app.get("/chunks")
+    async def chunks():
+        async def stream():
+            for _ in range(3):
+                yield LARGE
+        return StreamingResponse(stream(), media_type="application/json")
+
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+    return app
+
+
+@pytest.fixture
+def client():
+    return TestClient(make_app())
+
+
+def make_history(messages: int) -> SessionHistoryResponse:
+    session = SessionData(session_id="s1")
+    for i in range(messages):
+        session.add_message("user", f"message {i}", tool_calls=[{"n": i}] if i % 3 == 0 else None)
+    return SessionHistoryResponse(
+        session_id=session.session_id,
+        tenant_id=session.tenant_id,
+        message_count=len(session.messages),
+        created_at=session.created_at,
+        last_activity=session.last_activity,
+        messages=session.messages
+    )
+
+
+class TestEncodingNegotiation:
+    """Tests for Accept-Encoding parsing."""
+
+    def test_select_encoding(self):
+        """Test q-values, wildcards and refusals."""
+        assert select_encoding("") is None
+        assert select_encoding("identity") is None
+        assert select_encoding("gzip, deflate") == "gzip"
+        assert select_encoding("gzip;q=0") is None
+        assert select_encoding("*") in ("br", "gzip")
+
+    def test_prefers_brotli(self):
+        """Test brotli wins when installed and accepted."""
+        pytest.importorskip("brotli")
+        assert select_encoding("gzip, br") == "br"
+        assert select_encoding("gzip;q=1.0, br;q=0.5") == "gzip"
+
+
+class TestCompressionMiddleware:
+    """Tests for response compression."""
+
+    def test_gzip_large_response(self, client):
+        """Test large responses are compressed with a correct length."""
+        response = client.get("/large", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) < len(LARGE)
+        assert response.text == LARGE
+
+    def test_small_and_unaccepted_not_compressed(self, client):
+        """Test bodies under the threshold and clients without gzip get identity."""
+        small = client.get("/small", headers={"Accept-Encoding": "gzip"})
+        identity = client.get("/large", headers={"Accept-Encoding": "identity"})
+
+        assert "content-encoding" not in small.headers
+        assert "content-encoding" not in identity.headers
+        assert identity.text == LARGE
+
+    def test_sse_excluded(self, client):
+        """Test event streams are never compressed."""
+        response = client.get("/events", headers={"Accept-Encoding": "gzip, br"})
+
+        assert "content-encoding" not in response.headers
+        assert response.text.startswith("data: x")
+
+    def test_streamed_body_compressed_incrementally(self, client):
+        """Test each streamed chunk is flushed as decodable gzip data."""
+        response = client.get("/chunks", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert response.text == LARGE * 3
+
+    def test_brotli(self, client):
+        """Test brotli responses decode to the original body."""
+        pytest.importorskip("brotli")
+        response = client.get("/large", headers={"Accept-Encoding": "br"})
+
+        assert response.headers["content-encoding"] == "br"
+        assert response.text == LARGE  # decoded by httpx
+
+
+class TestStreamedJSON:
+    """Tests for streamed list responses."""
+
+    def test_stream_matches_model_json(self):
+        """Test the streamed encoding is the same JSON as pydantic's, for any batch size."""
+        history = make_history(7)
+        head = {k: v for k, v in history.__dict__.items() if k != "messages"}
+        expected = json.loads(history.model_dump_json())
+
+        for batch_size in (1, 3, 7, 100):
+            body = b"".join(iter_json_object(head, "messages", history.messages, batch_size=batch_size))
+            assert json.loads(body) == expected
+
+        empty = b"".join(iter_json_object({}, "items", []))
+        assert json.loads(empty) == {"items": []}
+
+    def test_list_response_threshold(self):
+        """Test only lists at or above STREAM_JSON_MIN_ITEMS are streamed."""
+        settings = SimpleNamespace(STREAM_JSON_MIN_ITEMS=5, PERFORMANCE_PROFILE=False)
+        with patch("app.api.responses.get_settings", return_value=settings):
+            small = list_response(make_history(4), "messages")
+            large = list_response(make_history(5), "messages")
+            settings.STREAM_JSON_MIN_ITEMS = 0
+            disabled = list_response(make_history(5), "messages")
+
+        assert isinstance(small, SessionHistoryResponse)
+        assert isinstance(large, StreamingResponse)
+        assert isinstance(disabled, SessionHistoryResponse)
+
+    def test_streamed_history_gzip(self):
+        """Test a streamed history decodes correctly through compression."""
+        history = make_history(20)
+        app = FastAPI()
+
+        @app.get("/history")
+        async def get_history():
+            return list_response(history, "messages")
+
+        app.add_middleware(CompressionMiddleware, minimum_size=10)
+        settings = SimpleNamespace(STREAM_JSON_MIN_ITEMS=5, PERFORMANCE_PROFILE=False)
+        with patch("app.api.responses.get_settings", return_value=settings):
+            response = TestClient(app).get("/history", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.json() == json.loads(history.model_dump_json())
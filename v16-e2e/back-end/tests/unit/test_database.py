@@ -0,0 +1,849 @@
+"""
+Unit Tests for Order Database Storage Profiles
+
+Tests for configure_storage in app/tools/order_management/database.py
+the FTS5 search index in app/tools/order_management/search.py, keyset
+pagination in app/tools/order_management/pagination.py, bulk ingestion
+in app/tools/order_management/bulk.py, the lookup cache in
+app/tools/order_management/cache.py, the asyncio operations in
+app/tools/order_management/async_operations.py, the order summaries
+in app/tools/order_management/summaries.py, batched status updates
+in app/tools/order_management/status_updates.py and the order change
+feed in app/tools/order_management/events.py.
+"""
+import asyncio
+import random
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from app.tools.order_management import (
+    async_operations,
+    commit_offset,
+    compact_events,
+    configure_cache,
+    configure_storage,
+    create_order,
+    create_orders_bulk,
+    EventsExpiredError,
+    get_consumer_offset,
+    get_database_path,
+    get_all_orders,
+    get_cache_stats,
+    get_customer_summary,
+    get_daily_totals,
+    get_db_session,
+    get_order_by_id,
+    get_orders_by_customer,
+    get_orders_by_customer_page,
+    get_orders_page,
+    get_status_totals,
+    get_top_skus,
+    init_db,
+    latest_event_sequence,
+    OrderNotFoundError,
+    read_events,
+    read_orders_file,
+    rebuild_summaries,
+    search_orders,
+    search_orders_page,
+    set_database_path,
+    tail_events,
+    tail_events_async,
+    update_order_status,
+    update_order_status_bulk,
+    ValidationError,
+    VersionConflictError,
+    verify_summaries,
+)
+from app.tools.order_management import database
+
+
+@pytest.fixture
+def storage_db(tmp_path):
+    """Point the library at a fresh database; restore the previous one after."""
+    previous = get_database_path()
+    set_database_path(str(tmp_path / "orders.db"))
+    yield tmp_path / "orders.db"
+    configure_storage()
+    set_database_path(previous)
+
+
+def pragma(name: str):
+    session = get_db_session()
+    try:
+        return session.execute(text(f"PRAGMA {name}")).scalar()
+    finally:
+        session.close()
+
+
+class TestCoreReads:
+    """Tests for the ORM-free read path."""
+
+    def test_reads_match_orm_to_dict(self, storage_db):
+        """Test Core reads return exactly what Order.to_dict() did."""
+        from app.tools.order_management import Order, get_all_orders
+
+        init_db()
+        created = create_order("Ann", "1 Main St", "SKU-1", 3, 12.5, remarks="Gift")
+        create_order("Bob", "2 Main St", "SKU-2", 1, 1.0, order_date=datetime(2026, 1, 1))
+
+        session = get_db_session()
+        try:
+            expected = {order.order_id: order.to_dict() for order in session.query(Order)}
+        finally:
+            session.close()
+
+        assert get_order_by_id(created["order_id"]) == expected[created["order_id"]]
+        assert {order["order_id"]: order for order in get_all_orders()} == expected
+        assert list(get_all_orders()[0]) == list(expected[created["order_id"]])
+
+
+class TestStorageProfiles:
+    """Tests for SQLite storage profiles."""
+
+    def test_performance_profile_pragmas(self, storage_db):
+        """Test every connection gets WAL and the tuned pragmas."""
+        configure_storage(profile="performance", mmap_size_mb=16, cache_size_mb=8, busy_timeout_ms=1234, pool_size=3)
+        init_db()
+
+        assert pragma("journal_mode") == "wal"
+        assert pragma("synchronous") == 1  # NORMAL
+        assert pragma("busy_timeout") == 1234
+        assert pragma("mmap_size") == 16 * 1024 * 1024
+        assert pragma("cache_size") == -8 * 1024
+        assert pragma("temp_store") == 2  # MEMORY
+        assert database._get_engine().pool.size() == 3
+
+    def test_default_profile_unchanged(self, storage_db):
+        """Test the default profile keeps SQLite's rollback journal."""
+        configure_storage(profile="default")
+        init_db()
+
+        assert pragma("journal_mode") == "delete"
+        assert pragma("synchronous") == 2  # FULL
+
+    def test_library_default_matches_server(self):
+        """Test the library and Settings default to the same storage profile."""
+        from app.config.settings import Settings
+
+        assert database.DEFAULT_STORAGE_PROFILE == Settings.model_fields["ORDER_DB_PROFILE"].default
+
+    def test_unknown_profile(self):
+        """Test an unknown profile is rejected."""
+        with pytest.raises(ValueError):
+            configure_storage(profile="turbo")
+
+    def test_concurrent_reads_and_writes(self, storage_db):
+        """Test threads reading and writing concurrently all succeed."""
+        configure_storage(profile="performance", pool_size=4)
+        init_db()
+        order = create_order("Jane", "1 Main St", "SKU-1", 1, 9.99)
+        errors = []
+
+        def work(i):
+            try:
+                for _ in range(10):
+                    create_order(f"Customer {i}", "1 Main St", "SKU-1", 1, 9.99)
+                    get_order_by_id(order["order_id"])
+            except Exception as exc:  # pragma: no cover - reported below
+                errors.append(exc)
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        session = get_db_session()
+        try:
+            assert session.execute(text("SELECT COUNT(*) FROM orders")).scalar() == 41
+        finally:
+            session.close()
+
+
+def ids(orders):
+    return [order["order_id"] for order in orders]
+
+
+class TestSearchIndex:
+    """Tests for substring search through the FTS5 trigram index."""
+
+    @pytest.fixture
+    def orders(self, storage_db):
+        init_db()
+        return [
+            create_order("Ann", "12 Main Street, Springfield", "WIRELESS-MOUSE", 1, 20.0),
+            create_order("Bob", "9 Oak Ave, New York", "USB-HUB", 1, 15.0, order_status="CONFIRMED"),
+            create_order("Cid", "77 mainline Rd, Boston", "MOUSE-PAD", 2, 5.0),
+        ]
+
+    def test_search_uses_index(self, orders):
+        """Test substring matches come from orders_fts, case-insensitively."""
+        session = get_db_session()
+        try:
+            plan = " ".join(
+                str(row[-1]) for row in session.execute(
+                    text("EXPLAIN QUERY PLAN SELECT rowid FROM orders_fts WHERE orders_fts MATCH 'mouse'")
+                )
+            )
+        finally:
+            session.close()
+
+        assert "VIRTUAL TABLE INDEX" in plan
+        assert sorted(ids(search_orders(product_sku="mouse"))) == [orders[0]["order_id"], orders[2]["order_id"]]
+        assert ids(search_orders(billing_address="NEW YORK")) == [orders[1]["order_id"]]
+        assert search_orders(product_sku='mo"use') == []
+
+    def test_criteria_are_combined_with_or(self, orders):
+        """Test status, short-term fallback and text criteria all contribute matches."""
+        result = ids(search_orders(product_sku="hub", order_status="PENDING"))
+        short = ids(search_orders(billing_address="ak"))  # below trigram length: LIKE
+
+        assert result == [order["order_id"] for order in reversed(orders)]  # one criterion each: newest first
+        assert short == [orders[1]["order_id"]]
+
+    def test_mixed_lookups_rank_on_one_scale(self, orders):
+        """Test index hits do not outrank LIKE hits; more matched criteria rank first."""
+        mixed = ids(search_orders(product_sku="mouse", billing_address="ak"))
+        both = ids(search_orders(product_sku="wire", billing_address="ma"))
+
+        assert mixed == [order["order_id"] for order in reversed(orders)]
+        assert both == [orders[0]["order_id"], orders[2]["order_id"]]
+
+    def test_triggers_keep_index_in_sync(self, orders):
+        """Test updates and deletes of indexed columns reach the index."""
+        session = get_db_session()
+        try:
+            session.execute(text("UPDATE orders SET product_sku = 'KEYBOARD' WHERE order_id = :id"), {"id": orders[0]["order_id"]})
+            session.execute(text("DELETE FROM orders WHERE order_id = :id"), {"id": orders[2]["order_id"]})
+            session.commit()
+        finally:
+            session.close()
+
+        assert search_orders(product_sku="mouse") == []
+        assert ids(search_orders(product_sku="keyb")) == [orders[0]["order_id"]]
+
+    def test_index_built_for_existing_orders(self, orders):
+        """Test creating the index on a populated database indexes its rows."""
+        session = get_db_session()
+        try:
+            session.execute(text("DROP TABLE orders_fts"))
+            for trigger in ("insert", "update", "delete"):
+                session.execute(text(f"DROP TRIGGER orders_fts_{trigger}"))
+            session.commit()
+        finally:
+            session.close()
+
+        init_db()
+
+        assert len(search_orders(billing_address="main")) == 2
+
+
+class TestKeysetPagination:
+    """Tests for cursor-paged order listings."""
+
+    @pytest.fixture
+    def orders(self, storage_db):
+        init_db()
+        start = datetime(2026, 1, 1)
+        created = []
+        for i in range(25):
+            # Pairs of orders share a date so order_id has to break ties
+            created.append(create_order(
+                "Ann" if i % 2 else "Bob", f"{i} Main Street", f"SKU-{i % 3}", 1, 10.0,
+                order_date=start + timedelta(days=i // 2)
+            ))
+        return created
+
+    @staticmethod
+    def collect(fetch, **kwargs):
+        pages, cursor = [], None
+        while True:
+            page = fetch(cursor=cursor, **kwargs)
+            pages.append(ids(page["orders"]))
+            cursor = page["next_cursor"]
+            if cursor is None:
+                return pages
+
+    def test_listing_pages(self, orders):
+        """Test pages cover every order once, newest first, ties by order_id."""
+        pages = self.collect(get_orders_page, limit=10)
+        expected = [o["order_id"] for o in sorted(orders, key=lambda o: (o["order_date"], o["order_id"]), reverse=True)]
+
+        assert [len(page) for page in pages] == [10, 10, 5]
+        assert sum(pages, []) == expected
+
+    def test_customer_and_search_pages(self, orders):
+        """Test customer and ranked search pages match the unpaged results."""
+        customer = sum(self.collect(get_orders_by_customer_page, customer_name="Ann", limit=4), [])
+        searched = sum(self.collect(search_orders_page, product_sku="sku-1", order_status="PENDING", limit=7), [])
+
+        assert sorted(customer) == sorted(o["order_id"] for o in orders if o["customer_name"] == "Ann")
+        assert searched == ids(search_orders(product_sku="sku-1", order_status="PENDING"))
+        assert len(searched) == 25
+
+    def test_new_orders_do_not_shift_pages(self, orders):
+        """Test orders created between pages don't cause repeats."""
+        first = get_orders_page(limit=10)
+        create_order("Cid", "1 New Street", "SKU-9", 1, 5.0)
+        second = get_orders_page(limit=10, cursor=first["next_cursor"])
+
+        assert not set(ids(first["orders"])) & set(ids(second["orders"]))
+
+    def test_limits_and_invalid_cursor(self, orders):
+        """Test the page size is clamped and bad cursors are rejected."""
+        assert len(get_orders_page()["orders"]) == 20
+        assert len(get_orders_page(limit=0)["orders"]) == 1
+        with pytest.raises(ValidationError):
+            get_orders_page(cursor="not-a-cursor")
+        listing_cursor = get_orders_page(limit=1)["next_cursor"]
+        with pytest.raises(ValidationError):
+            search_orders_page(product_sku="sku", cursor=listing_cursor)
+
+
+class TestBulkIngestion:
+    """Tests for chunked bulk order creation."""
+
+    @staticmethod
+    def order(i: int, **overrides):
+        order = {
+            "customer_name": f"Customer {i}", "billing_address": f"{i} Main Street",
+            "product_sku": f"SKU-{i}", "quantity": 1 + i % 3, "order_amount": 10.0 + i
+        }
+        order.update(overrides)
+        return order
+
+    def test_creates_valid_orders_and_reports_invalid_ones(self, storage_db):
+        """Test invalid rows are skipped and reported by input position."""
+        init_db()
+        orders = [
+            self.order(1, order_status="shipped", order_date="2026-01-02T03:04:05"),
+            self.order(2, quantity=0),
+            self.order(3),
+            "not an order",
+            self.order(5, order_status="LOST"),
+        ]
+
+        report = create_orders_bulk(orders, chunk_size=2, return_ids=True)
+
+        assert (report["total"], report["created"], report["failed"]) == (5, 2, 3)
+        assert [error["row"] for error in report["errors"]] == [2, 4, 5]
+        assert "quantity" in report["errors"][0]["error"]
+        first = get_order_by_id(report["order_ids"][0])
+        assert first["order_status"] == "SHIPPED"
+        assert first["order_date"] == "2026-01-02T03:04:05"
+        assert get_order_by_id(report["order_ids"][1])["order_status"] == "PENDING"
+
+    def test_streams_input_in_chunks(self, storage_db):
+        """Test a generator is consumed across chunks and errors are capped."""
+        init_db()
+        orders = (self.order(i, quantity=-1 if i % 10 == 0 else 1) for i in range(1, 1001))
+
+        report = create_orders_bulk(orders, chunk_size=64, max_errors=5)
+
+        assert (report["total"], report["created"], report["failed"]) == (1000, 900, 100)
+        assert len(report["errors"]) == 5 and report["errors_truncated"]
+        assert len(get_orders_page(limit=100)["orders"]) == 100
+
+    def test_reads_csv_and_jsonl(self, storage_db, tmp_path):
+        """Test file readers convert CSV cells and report unreadable lines."""
+        csv_path = tmp_path / "orders.csv"
+        csv_path.write_text(
+            "customer_name,billing_address,product_sku,quantity,order_amount,remarks\n"
+            "Ann,1 Main St,SKU-1,2,19.90,\n"
+            "Bob,2 Main St,SKU-2,two,5,Fragile\n"
+        )
+        jsonl_path = tmp_path / "orders.jsonl"
+        jsonl_path.write_text('{"customer_name": "Cid", "billing_address": "3 Main St", '
+                              '"product_sku": "SKU-3", "quantity": 1, "order_amount": 7.5}\n\n{broken\n')
+
+        rows = list(read_orders_file(csv_path))
+        assert rows[0]["quantity"] == 2 and rows[0]["order_amount"] == 19.9 and rows[0]["remarks"] is None
+        assert rows[1]["quantity"] == "two"
+        with pytest.raises(ValueError):
+            list(read_orders_file(tmp_path / "orders.xml"))
+
+        init_db()
+        report = create_orders_bulk(read_orders_file(jsonl_path))
+        assert (report["created"], report["failed"]) == (1, 1)
+        assert report["errors"][0]["row"] == 2
+
+
+class TestOrderCache:
+    """Tests for the order lookup cache."""
+
+    @pytest.fixture
+    def cached_db(self, storage_db):
+        configure_cache(mode="local")
+        init_db()
+        yield storage_db
+        configure_cache(mode="off")
+
+    def test_lru_eviction_and_ttl(self):
+        """Test the least recently used entry is evicted and entries expire."""
+        from app.tools.order_management.cache import OrderCache
+
+        now = [0.0]
+        cache = OrderCache(max_entries=2, ttl_seconds=10, clock=lambda: now[0])
+        for key in ("a", "b"):
+            cache.put(key, {"order_id": key}, cache.generation)
+        cache.get("a")
+        cache.put("c", {"order_id": "c"}, cache.generation)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"order_id": "a"}
+        now[0] = 10.0
+        assert cache.get("c") is None
+        stats = cache.stats()
+        assert (stats["evictions"], stats["expirations"], stats["entries"]) == (1, 1, 1)
+        assert stats["memory_bytes"] > 0
+
+    def test_read_racing_a_write_is_not_cached(self):
+        """Test a value read before an invalidation is not stored."""
+        from app.tools.order_management.cache import OrderCache
+
+        cache = OrderCache()
+        generation = cache.generation
+        cache.invalidate([("order", 1)])
+
+        assert not cache.put(("order", 1), {"order_status": "PENDING"}, generation)
+        assert cache.get(("order", 1)) is None
+
+    def test_lookups_are_cached_and_writes_invalidate(self, cached_db):
+        """Test hits skip the database and writes invalidate exactly."""
+        order = create_order("Ann", "1 Main St", "SKU-1", 1, 5.0)
+        get_order_by_id(order["order_id"])
+        get_orders_by_customer("Ann")
+
+        cached = get_order_by_id(str(order["order_id"]))
+        cached["order_status"] = "MODIFIED"
+        assert get_order_by_id(order["order_id"])["order_status"] == "PENDING"
+        assert get_cache_stats()["hits"] == 2
+
+        update_order_status(order["order_id"], "shipped")
+        create_order("Ann", "1 Main St", "SKU-2", 1, 5.0)
+
+        assert get_order_by_id(order["order_id"])["order_status"] == "SHIPPED"
+        assert len(get_orders_by_customer("Ann")) == 2
+        create_orders_bulk([{"customer_name": "Ann", "billing_address": "1 Main St",
+                             "product_sku": "SKU-3", "quantity": 1, "order_amount": 1.0}])
+        assert len(get_orders_by_customer("Ann")) == 3
+
+    def test_shared_mode_sees_other_writers(self, cached_db):
+        """Test a version bump by another process clears the cache."""
+        configure_cache(mode="shared")
+        order = create_order("Ann", "1 Main St", "SKU-1", 1, 5.0)
+        get_order_by_id(order["order_id"])
+
+        # Another process: writes without touching this process's cache
+        with database._get_engine().begin() as conn:
+            conn.execute(text("UPDATE orders SET order_status = 'DELIVERED'"))
+            conn.execute(text("UPDATE order_cache_version SET version = version + 1"))
+
+        assert get_order_by_id(order["order_id"])["order_status"] == "DELIVERED"
+
+    def test_concurrent_reads_and_updates(self, cached_db):
+        """Test threads reading while others update never leave stale entries."""
+        order = create_order("Ann", "1 Main St", "SKU-1", 1, 5.0)
+        statuses = ["CONFIRMED", "SHIPPED", "DELIVERED"]
+        errors = []
+
+        def read():
+            try:
+                for _ in range(200):
+                    get_order_by_id(order["order_id"])
+                    get_orders_by_customer("Ann")
+            except Exception as e:  # pragma: no cover - reported below
+                errors.append(e)
+
+        def write():
+            for status in statuses * 5:
+                update_order_status(order["order_id"], status)
+
+        threads = [threading.Thread(target=read) for _ in range(4)] + [threading.Thread(target=write)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert not errors
+        assert get_order_by_id(order["order_id"])["order_status"] == "DELIVERED"
+        assert get_orders_by_customer("Ann")[0]["order_status"] == "DELIVERED"
+
+
+class TestAsyncOperations:
+    """Tests for the asyncio order operations."""
+
+    @pytest.fixture
+    def async_db(self, storage_db):
+        init_db()
+        for i in range(5):
+            create_order(f"Customer {i % 2}", f"{i} Main St", f"SKU-{i}", 1 + i, 10.0 * (i + 1),
+                         order_date=datetime(2024, 1, 1) + timedelta(days=i))
+        yield storage_db
+        asyncio.run(database.dispose_async_engine())
+
+    def test_reads_match_sync(self, async_db):
+        """Test each async read returns what its sync counterpart does."""
+        async def reads():
+            first = await async_operations.get_orders_page(limit=2)
+            return (
+                await async_operations.get_order_by_id(3),
+                await async_operations.get_orders_by_customer("Customer 1"),
+                await async_operations.search_orders(product_sku="sku"),
+                await async_operations.get_all_orders(limit=3),
+                first,
+                await async_operations.get_orders_page(limit=2, cursor=first["next_cursor"]),
+            )
+
+        by_id, customer, found, listed, first, second = asyncio.run(reads())
+
+        assert by_id == get_order_by_id(3)
+        assert customer == get_orders_by_customer("Customer 1")
+        assert found == search_orders(product_sku="sku")
+        assert listed == get_orders_page(limit=3)["orders"]
+        assert first == get_orders_page(limit=2)
+        assert second == get_orders_page(limit=2, cursor=first["next_cursor"])
+
+    def test_writes_and_errors(self, async_db):
+        """Test async writes persist and raise the library's exceptions."""
+        async def writes():
+            created = await async_operations.create_order("Ann", "1 Main St", "SKU-9", 2, 5.0)
+            updated = await async_operations.update_order_status(created["order_id"], "shipped")
+            with pytest.raises(OrderNotFoundError):
+                await async_operations.update_order_status(999, "SHIPPED")
+            with pytest.raises(OrderNotFoundError):
+                await async_operations.get_order_by_id(999)
+            with pytest.raises(ValidationError):
+                await async_operations.create_order("Ann", "1 Main St", "SKU-9", 0, 5.0)
+            return created, updated
+
+        created, updated = asyncio.run(writes())
+
+        assert created["order_status"] == "PENDING"
+        assert updated["order_status"] == "SHIPPED"
+        assert get_order_by_id(created["order_id"]) == updated
+
+    def test_create_order_matches_sync(self, async_db):
+        """Test async and sync create_order normalise inputs the same way."""
+        calls = [
+            dict(order_date="2024-03-01T09:30:00"),
+            dict(order_status="", order_date=None),
+            dict(order_status="shipped"),
+        ]
+
+        def created(order):
+            return {key: value for key, value in order.items() if key not in ("order_id", "order_date")}, order["order_date"]
+
+        for kwargs in calls:
+            sync_order = create_order("Ann", "1 Main St", "SKU-9", 2, 5.0, **kwargs)
+            async_order = asyncio.run(async_operations.create_order("Ann", "1 Main St", "SKU-9", 2, 5.0, **kwargs))
+            (sync_fields, sync_date), (async_fields, async_date) = created(sync_order), created(async_order)
+
+            assert sync_fields == async_fields
+            if kwargs.get("order_date"):
+                assert sync_date == async_date == "2024-03-01T09:30:00"
+            else:
+                assert sync_date is not None and async_date is not None
+
+        with pytest.raises(ValidationError):
+            create_order("Ann", "1 Main St", "SKU-9", 2, 5.0, order_date="not a date")
+        with pytest.raises(ValidationError):
+            asyncio.run(async_operations.create_order("Ann", "1 Main St", "SKU-9", 2, 5.0, order_date="not a date"))
+
+    def test_writes_invalidate_the_cache(self, async_db):
+        """Test async writes invalidate lookups cached by either side."""
+        configure_cache(mode="local")
+        try:
+            get_order_by_id(1)
+            get_orders_by_customer("Customer 0")
+
+            async def write_then_read():
+                await async_operations.update_order_status(1, "DELIVERED")
+                await async_operations.create_order("Customer 0", "9 Main St", "SKU-9", 1, 5.0)
+                return (
+                    await async_operations.get_order_by_id(1),
+                    await async_operations.get_orders_by_customer("Customer 0"),
+                )
+
+            order, orders = asyncio.run(write_then_read())
+
+            assert order["order_status"] == "DELIVERED"
+            assert get_order_by_id(1)["order_status"] == "DELIVERED"
+            assert len(orders) == len(get_orders_by_customer("Customer 0")) == 4
+        finally:
+            configure_cache(mode="off")
+
+
+class TestOrderSummaries:
+    """Tests for the trigger-maintained order summaries."""
+
+    @pytest.fixture
+    def summary_db(self, storage_db):
+        init_db()
+        yield storage_db
+
+    def test_summaries_match_orders_after_mixed_writes(self, summary_db):
+        """Test every write path keeps the summaries equal to aggregating orders."""
+        rng = random.Random(3)
+        statuses = ["CONFIRMED", "SHIPPED", "DELIVERED", "CANCELLED"]
+
+        def order(i):
+            return {
+                "customer_name": f"Customer {rng.randrange(4)}",
+                "billing_address": "1 Main St",
+                "product_sku": f"SKU-{rng.randrange(6)}",
+                "quantity": 1 + rng.randrange(5),
+                "order_amount": round(rng.uniform(1, 100), 2),
+                "order_date": datetime(2024, 1, 1) + timedelta(days=rng.randrange(5), hours=i % 24),
+            }
+
+        for i in range(40):
+            create_order(**order(i))
+        create_orders_bulk([order(i) for i in range(40)])
+        for _ in range(60):
+            update_order_status(1 + rng.randrange(80), rng.choice(statuses))
+
+        async def async_writes():
+            for i in range(10):
+                await async_operations.create_order(**order(i))
+            await async_operations.update_order_status(81, "SHIPPED")
+            await database.dispose_async_engine()
+
+        asyncio.run(async_writes())
+        with database._get_engine().begin() as conn:
+            conn.execute(text("DELETE FROM orders WHERE order_id % 7 = 0"))
+            conn.execute(text("UPDATE orders SET customer_name = 'Moved', product_sku = 'SKU-X' WHERE order_id % 5 = 0"))
+
+        assert verify_summaries() == []
+
+        orders = get_all_orders()
+        january_2nd = [o for o in orders if o["order_date"].startswith("2024-01-02")]
+        totals = get_status_totals("2024-01-02", "2024-01-02")
+        assert totals["order_count"] == len(january_2nd)
+        assert totals["total_amount"] == pytest.approx(sum(o["order_amount"] for o in january_2nd), abs=0.01)
+        shipped = [o for o in orders if o["order_status"] == "SHIPPED"]
+        assert sum(day["order_count"] for day in get_daily_totals(order_status="shipped")) == len(shipped)
+
+        moved = [o for o in orders if o["customer_name"] == "Moved"]
+        assert get_customer_summary("Moved")["total_quantity"] == sum(o["quantity"] for o in moved)
+        assert get_top_skus("Moved") == [{
+            "product_sku": "SKU-X",
+            "order_count": len(moved),
+            "total_quantity": sum(o["quantity"] for o in moved),
+            "total_amount": round(sum(o["order_amount"] for o in moved), 2),
+        }]
+
+    def test_rebuild_repairs_summaries(self, summary_db):
+        """Test summaries are rebuilt from orders, and built for existing orders."""
+        create_order("Ann", "1 Main St", "SKU-1", 2, 5.0)
+        create_order("Ann", "1 Main St", "SKU-2", 1, 7.5)
+        with database._get_engine().begin() as conn:
+            conn.execute(text("UPDATE order_summary_sku SET order_count = 9"))
+            conn.execute(text("DELETE FROM order_summary_customer"))
+
+        assert len(verify_summaries()) == 3
+        rebuild_summaries()
+        assert verify_summaries() == []
+
+        with database._get_engine().begin() as conn:
+            conn.execute(text("DROP TRIGGER order_summaries_insert"))
+            conn.execute(text("DELETE FROM order_summary_customer"))
+        init_db()
+        assert get_customer_summary("Ann") == {
+            "customer_name": "Ann", "order_count": 2, "total_quantity": 3, "total_amount": 12.5
+        }
+
+    def test_invalid_arguments(self, summary_db):
+        """Test bad dates and rankings raise ValidationError."""
+        with pytest.raises(ValidationError):
+            get_status_totals(start_date="01/02/2024")
+        with pytest.raises(ValidationError):
+            get_top_skus(rank_by="profit")
+
+
+class TestBulkStatusUpdates:
+    """Tests for versioned and batched order status updates."""
+
+    @pytest.fixture
+    def status_db(self, storage_db):
+        init_db()
+        for i in range(6):
+            create_order("Ann" if i < 3 else "Bob", "1 Main St", f"SKU-{i}", 1, 10.0,
+                         order_status="CONFIRMED" if i % 2 else "PENDING",
+                         order_date=datetime(2024, 1, 1 + i % 2, 12))
+        yield storage_db
+
+    def test_single_update_checks_version(self, status_db):
+        """Test updates increment the version and reject a stale one."""
+        order = get_order_by_id(1)
+        assert order["version"] == 1
+
+        updated = update_order_status(1, "confirmed", expected_version=1)
+        assert (updated["order_status"], updated["version"]) == ("CONFIRMED", 2)
+        with pytest.raises(VersionConflictError):
+            update_order_status(1, "SHIPPED", expected_version=1)
+        assert get_order_by_id(1)["order_status"] == "CONFIRMED"
+
+    def test_same_status_update_is_noop(self, status_db):
+        """Test setting the current status changes nothing, as in bulk updates."""
+        sequence = latest_event_sequence()
+
+        unchanged = update_order_status(2, "confirmed", expected_version=1)
+        assert (unchanged["order_status"], unchanged["version"]) == ("CONFIRMED", 1)
+        assert asyncio.run(async_operations.update_order_status(2, "CONFIRMED"))["version"] == 1
+        assert update_order_status_bulk("CONFIRMED", order_ids=[2])["counts"]["unchanged"] == 1
+        assert latest_event_sequence() == sequence
+        with pytest.raises(VersionConflictError):
+            update_order_status(2, "CONFIRMED", expected_version=5)
+
+    def test_outcome_per_order(self, status_db):
+        """Test each given order reports what happened to it."""
+        update_order_status(4, "SHIPPED")
+        get_order_by_id(2)
+
+        report = update_order_status_bulk(
+            "shipped", order_ids=[2, 3, 4, 99], expected_versions={6: 1, 5: 7}, current_status="CONFIRMED"
+        )
+
+        outcomes = {result["order_id"]: result["outcome"] for result in report["results"]}
+        assert outcomes == {2: "updated", 3: "not_matched", 4: "unchanged", 99: "not_found",
+                            6: "updated", 5: "version_conflict"}
+        assert report["updated_count"] == 2
+        assert get_order_by_id(2)["order_status"] == "SHIPPED"
+        assert get_order_by_id(6)["version"] == 2
+        assert verify_summaries() == []
+
+        report = update_order_status_bulk("DELIVERED", expected_versions={6: 1})
+        assert report["results"] == [{"order_id": 6, "outcome": "version_conflict", "version": 2,
+                                      "expected_version": 1}]
+
+    def test_filter_update(self, status_db):
+        """Test a filter-only update is one set-based change."""
+        report = update_order_status_bulk("SHIPPED", current_status="CONFIRMED",
+                                          start_date="2024-01-02", end_date="2024-01-02")
+
+        assert [result["order_id"] for result in report["results"]] == [2, 4, 6]
+        assert all(order["order_status"] == "SHIPPED" for order in get_orders_by_customer("Bob")
+                   if order["order_id"] in (4, 6))
+        with pytest.raises(ValidationError):
+            update_order_status_bulk("SHIPPED")
+
+    def test_concurrent_updates_with_same_version(self, status_db):
+        """Test only one of two racing versioned updates wins."""
+        barrier = threading.Barrier(2)
+        reports = []
+
+        def update(status):
+            barrier.wait()
+            reports.append(update_order_status_bulk(status, expected_versions={1: 1}))
+
+        threads = [threading.Thread(target=update, args=(status,)) for status in ("SHIPPED", "CANCELLED")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        outcomes = sorted(report["results"][0]["outcome"] for report in reports)
+        assert outcomes == ["updated", "version_conflict"]
+        assert get_order_by_id(1)["version"] == 2
+
+    def test_version_column_added_to_existing_database(self, storage_db):
+        """Test init_db adds the version column to an orders table created without it."""
+        with database._get_engine().begin() as conn:
+            conn.execute(text(
+                "CREATE TABLE orders (order_id INTEGER PRIMARY KEY, order_date DATETIME NOT NULL, "
+                "customer_name VARCHAR(255) NOT NULL, billing_address VARCHAR(500) NOT NULL, "
+                "product_sku VARCHAR(100) NOT NULL, quantity INTEGER NOT NULL, order_amount FLOAT NOT NULL, "
+                "remarks VARCHAR(1000), order_status VARCHAR(50) NOT NULL)"
+            ))
+            conn.execute(text(
+                "INSERT INTO orders VALUES (1, '2024-01-01 00:00:00', 'Ann', '1 Main St', 'SKU-1', 1, 5.0, NULL, 'PENDING')"
+            ))
+
+        init_db()
+
+        assert get_order_by_id(1)["version"] == 1
+        assert update_order_status(1, "SHIPPED", expected_version=1)["version"] == 2
+
+
+class TestOrderEvents:
+    """Tests for the order change feed."""
+
+    @pytest.fixture
+    def events_db(self, storage_db):
+        init_db()
+        for i in range(3):
+            create_order("Ann", "1 Main St", f"SKU-{i}", 1, 10.0)
+        yield storage_db
+        asyncio.run(database.dispose_async_engine())
+
+    def test_every_write_path_appends_events(self, events_db):
+        """Test each committed write appends its events in order, and a rolled back one none."""
+        update_order_status(1, "SHIPPED")
+        create_orders_bulk([{"customer_name": "Bob", "billing_address": "2 Main St", "product_sku": "SKU-9",
+                             "quantity": 2, "order_amount": 5.0}])
+        update_order_status_bulk("CONFIRMED", order_ids=[2, 3])
+        with database._get_engine().begin() as conn:
+            conn.execute(text("UPDATE orders SET remarks = 'gift' WHERE order_id = 4"))
+            conn.execute(text("DELETE FROM orders WHERE order_id = 3"))
+        with pytest.raises(RuntimeError):
+            with database._get_engine().begin() as conn:
+                conn.execute(text("DELETE FROM orders WHERE order_id = 1"))
+                raise RuntimeError("rolled back")
+
+        events = read_events(0, limit=1000)
+        assert [(event["event_type"], event["order_id"]) for event in events] == [
+            ("order.created", 1), ("order.created", 2), ("order.created", 3),
+            ("order.status_changed", 1), ("order.created", 4),
+            ("order.status_changed", 2), ("order.status_changed", 3),
+            ("order.updated", 4), ("order.deleted", 3),
+        ]
+        assert [event["sequence"] for event in events] == list(range(1, 10))
+        changed = events[3]
+        assert (changed["order_status"], changed["version"]) == ("SHIPPED", 2)
+        assert changed["payload"]["previous_status"] == "PENDING"
+        assert events[7]["payload"]["remarks"] == "gift"
+
+    def test_consumer_offset_committed_per_batch(self, events_db):
+        """Test a consumer resumes after its last complete batch (at-least-once)."""
+        tail = tail_events(consumer="analytics", batch_size=2, follow=False)
+        assert [next(tail)["sequence"] for _ in range(3)] == [1, 2, 3]
+        tail.close()  # Stops mid-batch: the second batch is not committed
+        assert get_consumer_offset("analytics") == 2
+
+        update_order_status(2, "CONFIRMED")
+        assert [event["sequence"] for event in tail_events(consumer="analytics", follow=False)] == [3, 4]
+        assert get_consumer_offset("analytics") == 4
+        assert list(tail_events(consumer="analytics", follow=False)) == []
+        assert list(tail_events(after=latest_event_sequence(), follow=False)) == []
+
+    def test_compaction_expires_unread_events(self, events_db):
+        """Test compacted events raise for consumers behind them and sequences are not reused."""
+        commit_offset("cache", 1)
+        assert compact_events(retention_hours=1) == 0
+        assert compact_events(retention_hours=0) == 3
+
+        with pytest.raises(EventsExpiredError):
+            read_events(1)
+        with pytest.raises(EventsExpiredError):
+            list(tail_events(consumer="cache", follow=False))
+        assert read_events(3) == []
+
+        create_order("Bob", "2 Main St", "SKU-9", 1, 5.0)
+        assert [event["sequence"] for event in tail_events(follow=False)] == [4]
+        with pytest.raises(EventsExpiredError):
+            read_events(2)
+
+    def test_async_tail_matches_sync(self, events_db):
+        """Test the async tail yields the same events and commits the offset."""
+        async def tail():
+            return [event async for event in tail_events_async(consumer="async", batch_size=2, follow=False)]
+
+        events = asyncio.run(tail())
+        assert events == list(tail_events(follow=False))
+        assert get_consumer_offset("async") == 3
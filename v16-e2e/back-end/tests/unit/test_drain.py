@@ -0,0 +1,114 @@
+"""
+Unit Tests for Graceful Drain
+
+Tests for in-flight request tracking (app/utils/drain.py,
+app/api/middleware/drain.py) and the draining shutdown sequence.
+"""
+import asyncio
+import signal
+import time
+
+import httpx
+import pytest
+import uvicorn
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from app.api.middleware.drain import DrainMiddleware
+from app.startup.shutdown import DrainingServer, drain_in_flight_requests
+from app.utils.drain import RequestDrain, get_request_drain
+
+
+@pytest.fixture(autouse=True)
+def reset_drain():
+    get_request_drain().reset()
+    yield
+    get_request_drain().reset()
+
+
+def make_app(drain: RequestDrain) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for i in range(3):
+                await asyncio.sleep(0.05)
+                yield f"data: {i}\n\n"
+        return StreamingResponse(chunks(), media_type="text/event-stream")
+
+    @app.get("/health/ready")
+    async def ready():
+        return {"ready": not drain.shutting_down}
+
+    app.add_middleware(DrainMiddleware, drain=drain)
+    return app
+
+
+class TestDrainMiddleware:
+    """Tests for in-flight tracking and refusal while draining."""
+
+    @pytest.mark.asyncio
+    async def test_stream_counted_until_finished(self):
+        """Test a streaming response stays in flight until its body is sent."""
+        drain = RequestDrain()
+        transport = httpx.ASGITransport(app=make_app(drain))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            task = asyncio.create_task(client.get("/stream"))
+            await asyncio.sleep(0.05)
+            assert drain.in_flight == 1
+
+            drain.start()
+            assert await drain.wait_idle(timeout=2)
+            response = await task
+
+        assert response.status_code == 200
+        assert response.text.count("data:") == 3
+        assert drain.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_new_requests_refused_while_draining(self):
+        """Test new requests get 503 with Connection: close; health checks still answer."""
+        drain = RequestDrain()
+        drain.start()
+        transport = httpx.ASGITransport(app=make_app(drain))
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            refused = await client.get("/stream")
+            ready = await client.get("/health/ready")
+
+        assert refused.status_code == 503
+        assert refused.headers["connection"] == "close"
+        assert ready.status_code == 200
+        assert ready.json() == {"ready": False}
+        assert drain.in_flight == 0
+
+
+class TestShutdownSequence:
+    """Tests for draining at shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_drain_times_out(self):
+        """Test the drain gives up at the deadline when a request never finishes."""
+        drain = get_request_drain()
+        drain.enter()
+        try:
+            start = time.perf_counter()
+            assert await drain_in_flight_requests(0.2) is False
+            assert time.perf_counter() - start < 1
+        finally:
+            drain.leave()
+        assert drain.draining
+
+    @pytest.mark.asyncio
+    async def test_server_reports_not_ready_before_exit(self):
+        """Test the first signal only flips readiness until the delay passes."""
+        server = DrainingServer(uvicorn.Config(FastAPI()), readiness_delay=0.2)
+        drain = get_request_drain()
+
+        server.handle_exit(signal.SIGTERM, None)
+        assert drain.shutting_down and not drain.draining
+        assert await server.on_tick(1) is False
+
+        await asyncio.sleep(0.25)
+        assert await server.on_tick(2) is True
+        assert drain.draining
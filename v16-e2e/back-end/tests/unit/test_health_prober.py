@@ -0,0 +1,135 @@
+"""
+Unit Tests for the Health Prober
+
+Tests for app/utils/health_prober.py and the cached /health responses.
+"""
+import asyncio
+import sqlite3
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes.health import router as health_router
+from app.utils.health_prober import HealthProber
+
+
+def make_settings(db_path, smtp_port, **overrides):
+    """Settings pointing every remote dependency at a closed local port unless overridden."""
+    values = dict(
+        ORDER_DB_PATH=str(db_path),
+        MCP_SERVER_URL="http://127.0.0.1:9/mcp",
+        MCP_SERVER_REQUIRED=False,
+        SMTP_SERVER="127.0.0.1",
+        SMTP_PORT=smtp_port,
+        AZURE_AI_PROJECT_ENDPOINT="http://127.0.0.1:9/",
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / "orders.db"
+    sqlite3.connect(path).close()
+    return path
+
+
+@pytest_asyncio.fixture
+async def smtp_port():
+    """Minimal SMTP server that greets and closes."""
+    async def handle(reader, writer):
+        writer.write(b"220 test ESMTP\r\n")
+        await writer.drain()
+        await reader.readline()
+        writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    yield server.sockets[0].getsockname()[1]
+    server.close()
+    await server.wait_closed()
+
+
+class TestHealthProber:
+    """Tests for probe results and status mapping."""
+
+    @pytest.mark.asyncio
+    async def test_probe_round(self, database, smtp_port):
+        """Test reachable dependencies are healthy and optional unreachable ones degraded."""
+        prober = HealthProber(make_settings(database, smtp_port), timeout=2)
+
+        results = prober.snapshot()
+        assert results["database"]["status"] == "unknown"
+
+        await prober.probe_all()
+        results = prober.snapshot()
+
+        assert results["database"]["status"] == "healthy"
+        assert results["email"]["status"] == "healthy"
+        assert results["mcp_server"]["status"] == "degraded"
+        assert results["model"]["status"] == "degraded"
+        assert results["database"]["checked_at"] is not None
+        assert prober.is_ready("database")
+
+    @pytest.mark.asyncio
+    async def test_missing_database_unhealthy(self, tmp_path, smtp_port):
+        """Test a missing database file is reported, not created."""
+        path = tmp_path / "missing.db"
+        prober = HealthProber(make_settings(path, smtp_port, MCP_SERVER_REQUIRED=True), timeout=2)
+
+        await prober.probe_all()
+
+        assert prober.snapshot()["database"]["status"] == "unhealthy"
+        assert prober.snapshot()["mcp_server"]["status"] == "unhealthy"
+        assert not path.exists()
+
+    @pytest.mark.asyncio
+    async def test_locked_database_times_out(self, database, smtp_port):
+        """Test a database held under a write lock fails the writability check."""
+        holder = sqlite3.connect(database)
+        holder.execute("BEGIN IMMEDIATE")
+        try:
+            prober = HealthProber(make_settings(database, smtp_port), timeout=0.2)
+            await prober.probe_all()
+        finally:
+            holder.rollback()
+            holder.close()
+
+        assert prober.snapshot()["database"]["status"] == "unhealthy"
+
+    @pytest.mark.asyncio
+    async def test_background_refresh(self, database, smtp_port):
+        """Test results are refreshed on the interval."""
+        prober = HealthProber(make_settings(database, smtp_port), interval=0.05, timeout=1)
+        await prober.start()
+        await asyncio.sleep(0.3)
+        await prober.stop()
+
+        assert prober.rounds >= 2
+        assert not prober.running
+
+
+class TestHealthEndpoints:
+    """Tests for /health served from the prober cache."""
+
+    def test_health_uses_cached_results(self, database):
+        """Test component status comes from the prober without probing."""
+        prober = HealthProber(make_settings(database, 25))
+        settings = SimpleNamespace(mcp_server_required=False)
+        app = FastAPI()
+        app.include_router(health_router)
+
+        with patch("app.api.routes.health.get_health_prober", return_value=prober), \
+                patch("app.api.routes.health.get_settings", return_value=settings), \
+                patch("app.api.routes.health.get_agent_manager", return_value=None):
+            client = TestClient(app)
+            health = client.get("/health").json()
+            ready = client.get("/health/ready").json()
+
+        assert prober.rounds == 0
+        assert health["checks"]["database"]["status"] == "unknown"
+        assert health["status"] == "unhealthy"  # agent not initialized
+        assert ready["components"]["database"] is False
@@ -0,0 +1,289 @@
+"""
+Unit Tests for Logging System
+
+Tests for app/utils/logger.py.
+"""
+import json
+import logging
+import queue
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from app.config.settings import parse_sample_rates
+from app.utils.logger import (
+    BoundedQueueHandler,
+    ColoredFormatter,
+    JSONFormatter,
+    LogSampler,
+    configure_default_logger,
+    configure_log_sampling,
+    flush_log_queues,
+    get_logger,
+    get_log_queue_stats,
+    setup_logger,
+    stop_log_listeners,
+)
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    """Provide a temporary log file and stop listeners afterwards."""
+    yield tmp_path / "app.log"
+    stop_log_listeners()
+
+
+class TestQueuedLogger:
+    """Tests for queue-based logger setup."""
+
+    def test_records_written_by_listener(self, log_file):
+        """Test records reach the file handler after the queue is flushed."""
+        logger = setup_logger("test.queued", log_file=str(log_file), enable_console=False, log_format="json")
+
+        assert isinstance(logger.handlers[0], BoundedQueueHandler)
+
+        logger.info("hello from the queue", extra={"request_id": "req-1"})
+        assert flush_log_queues(timeout=2.0)
+
+        entry = json.loads(log_file.read_text(encoding="utf-8").splitlines()[-1])
+        assert entry["message"] == "hello from the queue"
+        assert entry["request_id"] == "req-1"
+
+    def test_setup_twice_replaces_listener(self, log_file):
+        """Test reconfiguring a logger does not duplicate handlers."""
+        setup_logger("test.queued", log_file=str(log_file), enable_console=False)
+        logger = setup_logger("test.queued", log_file=str(log_file), enable_console=False)
+
+        logger.info("once")
+        flush_log_queues(timeout=2.0)
+
+        assert len(logger.handlers) == 1
+        assert log_file.read_text(encoding="utf-8").count("once") == 1
+
+    def test_stop_drains_pending_records(self, log_file):
+        """Test stopping listeners writes everything already queued."""
+        logger = setup_logger("test.queued", log_file=str(log_file), enable_console=False)
+        for i in range(200):
+            logger.info(f"record {i}")
+
+        stop_log_listeners()
+
+        assert "record 199" in log_file.read_text(encoding="utf-8")
+        assert "test.queued" not in get_log_queue_stats()
+
+    def test_direct_handlers_without_queue(self, log_file):
+        """Test use_queue=False attaches handlers directly."""
+        logger = setup_logger(
+            "test.direct", log_file=str(log_file), enable_console=False, use_queue=False
+        )
+
+        assert not isinstance(logger.handlers[0], BoundedQueueHandler)
+
+    def test_default_logger_leaves_root_alone(self, log_file):
+        """Test module loggers get the handlers without touching the root logger."""
+        settings = SimpleNamespace(
+            log_sample_rates={}, log_route_sample_rates={}, LOG_SLOW_REQUEST_MS=1000.0,
+            LOG_LEVEL="INFO", LOG_TO_FILE=True, LOG_FILE_PATH=str(log_file), log_max_bytes=1024 * 1024,
+            LOG_BACKUP_COUNT=1, LOG_QUEUE_ENABLED=True, LOG_QUEUE_SIZE=100, LOG_QUEUE_FULL_POLICY="drop",
+            LOG_FORMAT="text",
+        )
+        root_handlers = list(logging.getLogger().handlers)
+        app_logger = logging.getLogger("app")
+
+        try:
+            logger = configure_default_logger(settings)
+            get_logger("app.test").info("from a module logger")
+            logging.getLogger("thirdparty").warning("from a library")
+            flush_log_queues(timeout=2.0)
+
+            assert logging.getLogger().handlers == root_handlers
+            assert app_logger.handlers == logger.handlers
+            content = log_file.read_text(encoding="utf-8")
+            assert "message='from a module logger'" in content
+            assert "from a library" not in content
+        finally:
+            for handler in list(app_logger.handlers):
+                app_logger.removeHandler(handler)
+            app_logger.propagate = True
+            configure_log_sampling()
+
+
+class TestBoundedQueueHandler:
+    """Tests for BoundedQueueHandler full policies."""
+
+    def _record(self):
+        return logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+
+    def test_drop_policy_counts_dropped(self):
+        """Test records are dropped and counted when the queue is full."""
+        handler = BoundedQueueHandler(queue.Queue(maxsize=1), policy="drop")
+
+        handler.emit(self._record())
+        handler.emit(self._record())
+
+        assert handler.dropped == 1
+
+    def test_block_policy_times_out(self):
+        """Test block policy waits, then drops after the timeout."""
+        handler = BoundedQueueHandler(queue.Queue(maxsize=1), policy="block", block_timeout=0.01)
+
+        handler.emit(self._record())
+        handler.emit(self._record())
+
+        assert handler.dropped == 1
+
+    def test_invalid_policy(self):
+        """Test unknown policies are rejected."""
+        with pytest.raises(ValueError):
+            BoundedQueueHandler(queue.Queue(), policy="spill")
+
+    def test_message_merged_on_enqueue(self):
+        """Test message arguments are merged before the record is queued."""
+        handler = BoundedQueueHandler(queue.Queue(), policy="drop")
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "value=%s", ("x",), None)
+
+        handler.emit(record)
+
+        queued = handler.queue.get_nowait()
+        assert queued.msg == "value=x"
+        assert queued.args is None
+        assert record.args == ("x",)
+
+    def test_arg_mutated_after_logging(self):
+        """Test the logged message shows arguments as they were at call time."""
+        handler = BoundedQueueHandler(queue.Queue(), policy="drop")
+        items = ["a"]
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "items=%s", (items,), None)
+
+        handler.emit(record)
+        items.append("b")
+
+        assert json.loads(JSONFormatter().format(handler.queue.get_nowait()))["message"] == "items=['a']"
+
+    def test_exception_rendered_on_enqueue(self):
+        """Test tracebacks are rendered on the calling thread."""
+        handler = BoundedQueueHandler(queue.Queue(), policy="drop")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord("test", logging.ERROR, __file__, 1, "failed", None, sys.exc_info())
+
+        handler.emit(record)
+
+        queued = handler.queue.get_nowait()
+        assert queued.exc_info is None
+        assert "ValueError: boom" in queued.exc_text
+        assert "ValueError: boom" in json.loads(JSONFormatter().format(queued))["exception"]
+        assert "ValueError: boom" in ColoredFormatter().format(queued)
+
+
+class TestColoredFormatter:
+    """Tests for ColoredFormatter timestamp caching."""
+
+    def test_timestamp_uses_record_time(self):
+        """Test the timestamp comes from the record, not the format time."""
+        formatter = ColoredFormatter()
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "msg", None, None)
+        record.created = 0.5
+
+        first = formatter.format(record)
+        record.created = 0.9
+        second = formatter.format(record)
+
+        assert first == second
+        assert "1970-01-01" in first or "1969-12-31" in first
+
+
+def make_record(level=logging.INFO, name="app.test", **extra):
+    """Build a log record with extra attributes."""
+    record = logging.LogRecord(name, level, __file__, 1, "msg", None, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestJSONFormatter:
+    """Tests for JSONFormatter."""
+
+    def test_includes_all_extra_fields(self):
+        """Test every extra field is serialized, not just known IDs."""
+        record = make_record(request_id="r1", status_code=200, duration_ms=1.5, path="/x")
+
+        entry = json.loads(JSONFormatter().format(record))
+
+        assert entry["message"] == "msg"
+        assert entry["level"] == "INFO"
+        assert entry["status_code"] == 200
+        assert entry["duration_ms"] == 1.5
+        assert entry["path"] == "/x"
+        assert "args" not in entry
+
+    def test_unserializable_values_use_str(self):
+        """Test arbitrary objects fall back to their string form."""
+        record = make_record(payload=object(), big=2 ** 80)
+
+        entry = json.loads(JSONFormatter().format(record))
+
+        assert entry["payload"].startswith("<object object")
+        assert entry["big"] == 2 ** 80
+
+    def test_exception_included(self):
+        """Test exception tracebacks are included."""
+        try:
+            raise ValueError("bad")
+        except ValueError:
+            import sys
+            record = logging.LogRecord("t", logging.ERROR, __file__, 1, "failed", None, sys.exc_info())
+
+        entry = json.loads(JSONFormatter().format(record))
+
+        assert "ValueError: bad" in entry["exception"]
+
+
+class TestLogSampler:
+    """Tests for LogSampler."""
+
+    def test_unconfigured_keeps_everything(self):
+        """Test the default sampler keeps all records and requests."""
+        sampler = LogSampler()
+
+        assert sampler.sample_route("/agent/messages")
+        assert sampler.should_log(make_record())
+
+    def test_route_rate_longest_prefix(self):
+        """Test the most specific route rule wins."""
+        sampler = LogSampler(route_rates={"/agent": 1.0, "/agent/messages": 0.0})
+
+        assert not sampler.sample_route("/agent/messages")
+        assert sampler.sample_route("/agent/sessions")
+
+    def test_logger_rate(self):
+        """Test per-logger rates drop routine records."""
+        sampler = LogSampler(logger_rates={"app.tools": 0.0})
+
+        assert not sampler.should_log(make_record(name="app.tools.mcp"))
+        assert sampler.should_log(make_record(name="app.agent"))
+
+    def test_errors_and_slow_records_always_kept(self):
+        """Test warnings, errors and slow records bypass sampling."""
+        sampler = LogSampler(logger_rates={"app": 0.0}, slow_request_ms=500)
+
+        assert sampler.should_log(make_record(level=logging.ERROR))
+        assert sampler.should_log(make_record(duration_ms=750.0))
+        assert not sampler.should_log(make_record(duration_ms=10.0))
+
+    def test_upstream_decision_honoured(self):
+        """Test records carrying a sampling decision are not re-sampled."""
+        sampler = LogSampler(logger_rates={"app": 0.0})
+
+        assert sampler.should_log(make_record(sampled=True))
+
+    def test_parse_sample_rates(self):
+        """Test rate specs parse and validate."""
+        assert parse_sample_rates("/agent/messages:0.01, app.tools:0.5") == {
+            "/agent/messages": 0.01,
+            "app.tools": 0.5,
+        }
+        assert parse_sample_rates("") == {}
+        with pytest.raises(ValueError):
+            parse_sample_rates("/agent:2")
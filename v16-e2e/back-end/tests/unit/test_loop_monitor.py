@@ -0,0 +1,61 @@
+"""
+Unit Tests for the Event Loop Monitor
+
+Tests for app/utils/loop_monitor.py.
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from app.utils import loop_monitor
+from app.utils.loop_monitor import LoopMonitor
+from app.utils.metrics import EVENT_LOOP_LAG
+
+
+def blocking_call(seconds: float) -> None:
+    """Block the calling thread, as a synchronous tool call would."""
+    time.sleep(seconds)
+
+
+class TestLoopMonitor:
+    """Tests for lag measurement and stall capture."""
+
+    @pytest.mark.asyncio
+    async def test_records_lag(self):
+        """Test heartbeats observe the lag histogram."""
+        before = EVENT_LOOP_LAG._default().snapshot()[0]
+        monitor = LoopMonitor(interval=0.01, threshold=0.5)
+        monitor.start()
+        await asyncio.sleep(0.1)
+        await monitor.stop()
+
+        assert sum(EVENT_LOOP_LAG._default().snapshot()[0]) > sum(before)
+        assert monitor.stall_count == 0
+        assert not monitor.running
+
+    @pytest.mark.asyncio
+    async def test_captures_blocking_stack(self):
+        """Test a blocking callback is reported with its stack."""
+        monitor = LoopMonitor(interval=0.01, threshold=0.05)
+        monitor.start()
+        await asyncio.sleep(0.03)
+
+        blocking_call(0.3)
+        await asyncio.sleep(0.05)
+        await monitor.stop()
+
+        assert monitor.stall_count == 1
+        stall = monitor.status()["stalls"][0]
+        assert stall["duration_ms"] >= 250
+        assert any("blocking_call" in line for line in stall["stack"])
+        assert monitor.max_lag >= 0.25
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_settings(self):
+        """Test no monitor is created when disabled."""
+        settings = SimpleNamespace(ENABLE_LOOP_MONITOR=False)
+
+        assert loop_monitor.start_loop_monitor(settings) is None
+        assert loop_monitor.get_loop_monitor() is None
@@ -0,0 +1,264 @@
+"""
+Unit Tests for Metrics
+
+Tests for app/utils/metrics.py, the metrics middleware and the
+instrumentation hooks that feed it.
+"""
+import sys
+import threading
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.agent.middleware import ToolMetricsMiddleware
+from app.api.middleware import MetricsMiddleware
+from app.api.routes.metrics import router as metrics_router
+from app.api.error_handlers import setup_exception_handlers
+from app.api.routes.info import router as info_router
+from app.utils import db_metrics
+from app.utils.db_metrics import get_slow_query_log, instrument_sqlalchemy, query_scope
+from app.utils.metrics import (
+    DB_QUERIES_PER_REQUEST,
+    HTTP_REQUEST_DURATION,
+    SQLITE_QUERY_DURATION,
+    TOOL_CALLS,
+    Counter,
+    Gauge,
+    Histogram,
+    MetricsRegistry,
+)
+
+
+@pytest.fixture
+def registry():
+    """Provide an isolated registry."""
+    return MetricsRegistry()
+
+
+class TestMetricTypes:
+    """Tests for counters, gauges and histograms."""
+
+    def test_histogram_render_is_cumulative(self, registry):
+        """Test bucket counts are cumulative and include +Inf."""
+        hist = registry.register(Histogram("op_seconds", "Op latency", ("op",), buckets=(0.1, 1.0)))
+        child = hist.labels("read")
+        for value in (0.05, 0.5, 0.5, 5.0):
+            child.observe(value)
+
+        output = registry.render()
+
+        assert '# TYPE op_seconds histogram' in output
+        assert 'op_seconds_bucket{op="read",le="0.1"} 1' in output
+        assert 'op_seconds_bucket{op="read",le="1"} 3' in output
+        assert 'op_seconds_bucket{op="read",le="+Inf"} 4' in output
+        assert 'op_seconds_count{op="read"} 4' in output
+        assert 'op_seconds_sum{op="read"} 6.05' in output
+
+    def test_counter_total_suffix(self, registry):
+        """Test counters render with the _total suffix."""
+        count = registry.register(Counter("events", "Events", ("kind",)))
+        count.labels("a").inc()
+        count.labels("a").inc(2)
+
+        assert 'events_total{kind="a"} 3' in registry.render()
+
+    def test_gauge_function(self, registry):
+        """Test gauges can be computed at scrape time."""
+        value = {"n": 3}
+        g = registry.register(Gauge("things", "Things"))
+        g.set_function(lambda: value["n"])
+
+        assert "things 3" in registry.render()
+        value["n"] = 5
+        assert "things 5" in registry.render()
+
+    def test_label_count_validated(self):
+        """Test wrong label arity is rejected."""
+        with pytest.raises(ValueError):
+            HTTP_REQUEST_DURATION.labels("GET")
+
+    def test_label_values_escaped(self, registry):
+        """Test quotes in label values are escaped."""
+        count = registry.register(Counter("errors", "Errors", ("message",)))
+        count.labels('say "hi"').inc()
+
+        assert 'errors_total{message="say \\"hi\\""} 1' in registry.render()
+
+    def test_concurrent_updates_not_lost(self, registry):
+        """Test updates from many threads are all counted."""
+        count = registry.register(Counter("calls", "Calls")).labels()
+        hist = registry.register(Histogram("latency", "Latency", buckets=(1.0,))).labels()
+
+        def work():
+            for _ in range(20000):
+                count.inc()
+                hist.observe(0.5)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [threading.Thread(target=work) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        assert count.value == 160000
+        assert hist.snapshot() == ([160000, 0], 80000.0)
+
+
+class TestMetricsMiddleware:
+    """Tests for HTTP metrics and the /metrics endpoint."""
+
+    def build_app(self) -> FastAPI:
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: str):
+            return {"id": item_id}
+
+        app.include_router(metrics_router)
+        app.add_middleware(MetricsMiddleware)
+        return app
+
+    def test_route_template_label(self):
+        """Test latency is labelled by route template, not raw path."""
+        client = TestClient(self.build_app())
+        client.get("/items/1")
+        client.get("/items/2")
+
+        child = HTTP_REQUEST_DURATION.labels("GET", "/items/{item_id}", "200")
+        assert sum(child.counts) >= 2
+
+    def test_unmatched_routes_grouped(self):
+        """Test 404s do not create a label per path."""
+        client = TestClient(self.build_app())
+        client.get("/nope/12345")
+
+        assert sum(HTTP_REQUEST_DURATION.labels("GET", "unmatched", "404").counts) >= 1
+
+    def test_metrics_endpoint(self):
+        """Test /metrics serves the Prometheus text format."""
+        client = TestClient(self.build_app())
+        client.get("/items/1")
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert "http_request_duration_seconds_bucket" in response.text
+        assert "active_sessions" in response.text
+
+
+class TestInstrumentation:
+    """Tests for database and tool instrumentation."""
+
+    def test_sqlalchemy_queries_timed(self, tmp_path):
+        """Test statements are recorded by database and operation."""
+        instrument_sqlalchemy()
+        instrument_sqlalchemy()  # idempotent
+        engine = create_engine(f"sqlite:///{tmp_path / 'metrics_test.db'}")
+
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+
+        child = SQLITE_QUERY_DURATION.labels("metrics_test", "SELECT")
+        assert sum(child.counts) == 1
+
+    @pytest.mark.asyncio
+    async def test_tool_error_result_counted(self):
+        """Test wrapper error dicts count as failed tool calls."""
+        context = SimpleNamespace(function=SimpleNamespace(name="get_order"), result=None)
+
+        async def call_next():
+            context.result = {"status": "error", "error": "not found"}
+
+        before = TOOL_CALLS.labels("get_order", "local", "error").value
+        await ToolMetricsMiddleware().process(context, call_next)
+
+        assert TOOL_CALLS.labels("get_order", "local", "error").value == before + 1
+
+
+class TestQueryCounting:
+    """Tests for per-scope query counts and the slow query log."""
+
+    @pytest.fixture
+    def engine(self, tmp_path):
+        instrument_sqlalchemy()
+        engine = create_engine(f"sqlite:///{tmp_path / 'counting_test.db'}")
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)"))
+        return engine
+
+    @pytest.fixture
+    def slow_log(self):
+        """Log every statement as slow, restoring the global log afterwards."""
+        original = db_metrics._slow_query_log
+        instrument_sqlalchemy(slow_query_ms=0, history=10)
+        yield get_slow_query_log()
+        db_metrics._slow_query_log = original
+
+    def test_nested_scopes_counted(self, engine):
+        """Test inner scope counts roll up into the enclosing scope."""
+        with query_scope("request") as outer:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                with query_scope("tool:get_order") as inner:
+                    conn.execute(text("SELECT 2"))
+                    conn.execute(text("SELECT 3"))
+
+        assert inner.count == 2
+        assert outer.count == 3
+
+    def test_slow_query_logged_with_plan(self, engine, slow_log):
+        """Test slow statements are kept with their query plan and scope."""
+        with query_scope("tool:search"):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT name FROM items WHERE name = :name"), {"name": "x"})
+
+        entry = slow_log.snapshot()[0]
+        assert entry["database"] == "counting_test"
+        assert entry["scope"] == "tool:search"
+        assert any("SCAN" in line for line in entry["plan"])
+
+    def test_request_query_count_observed(self, engine):
+        """Test the metrics middleware records statements per request."""
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/items")
+        async def list_items():
+            with engine.connect() as conn:
+                conn.execute(text("SELECT * FROM items"))
+                conn.execute(text("SELECT COUNT(*) FROM items"))
+            return []
+
+        TestClient(app).get("/items")
+
+        child = DB_QUERIES_PER_REQUEST.labels("GET", "/items")
+        assert child.sum >= 2
+
+    def test_slow_queries_endpoint(self, engine, slow_log):
+        """Test the admin endpoint returns the logged statements."""
+        with engine.connect() as conn:
+            conn.execute(text("SELECT * FROM items"))
+
+        app = FastAPI()
+        setup_exception_handlers(app)
+        app.include_router(info_router)
+        settings = SimpleNamespace(ADMIN_API_KEY="secret")
+        with patch("app.api.routes.info.get_settings", return_value=settings):
+            response = TestClient(app).get(
+                "/info/profiling/queries?clear=true",
+                headers={"X-Admin-Key": "secret"}
+            )
+
+        assert response.status_code == 200
+        assert response.json()["threshold_ms"] == 0
+        assert response.json()["total_count"] >= 1
+        assert slow_log.snapshot() == []
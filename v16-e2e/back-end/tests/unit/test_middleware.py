@@ -0,0 +1,149 @@
+"""
+Unit Tests for API Middleware
+
+Tests for the pure-ASGI middleware in app/api/middleware/.
+"""
+import logging
+
+from fastapi import FastAPI, Request
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.middleware import (
+    ContextInjectionMiddleware,
+    ErrorHandlingMiddleware,
+    RateLimitMiddleware,
+    RequestLoggingMiddleware,
+    SlidingWindowRateLimiter,
+)
+from app.utils.logger import configure_log_sampling
+
+
+def build_app(requests_per_minute: int = 100) -> FastAPI:
+    """Build a test app with the full custom middleware stack."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"status": "ok"}
+
+    @app.get("/state")
+    async def state(request: Request):
+        return {
+            "request_id": request.state.request_id,
+            "client_ip": request.state.client_ip
+        }
+
+    @app.get("/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/stream")
+    async def stream():
+        async def events():
+            yield "data: one\n\n"
+            yield "data: [DONE]\n\n"
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/health")
+    async def health():
+        return {"status": "healthy"}
+
+    app.add_middleware(ErrorHandlingMiddleware)
+    app.add_middleware(RequestLoggingMiddleware)
+    app.add_middleware(ContextInjectionMiddleware)
+    app.add_middleware(RateLimitMiddleware, rate_limiter=SlidingWindowRateLimiter(requests_per_minute))
+    return app
+
+
+class TestRequestLoggingMiddleware:
+    """Tests for RequestLoggingMiddleware."""
+
+    def test_adds_request_headers(self):
+        """Test request ID and response time headers are injected."""
+        client = TestClient(build_app())
+        response = client.get("/ping")
+
+        assert response.status_code == 200
+        assert len(response.headers["X-Request-ID"]) == 36
+        assert response.headers["X-Response-Time"].endswith("ms")
+
+    def test_request_state_matches_header(self):
+        """Test route handlers see the same request ID as the response header."""
+        client = TestClient(build_app())
+        response = client.get("/state")
+
+        assert response.json()["request_id"] == response.headers["X-Request-ID"]
+        assert response.json()["client_ip"]
+
+    def test_streaming_response_passes_through(self):
+        """Test SSE bodies are forwarded with headers intact."""
+        client = TestClient(build_app())
+        response = client.get("/stream")
+
+        assert response.text == "data: one\n\ndata: [DONE]\n\n"
+        assert "X-Request-ID" in response.headers
+
+
+    def test_route_sampling_keeps_errors(self, caplog):
+        """Test sampled-out routes still log failed responses."""
+        configure_log_sampling(route_rates={"/": 0.0})
+        client = TestClient(build_app(), raise_server_exceptions=False)
+
+        try:
+            with caplog.at_level(logging.INFO, logger="app.api.middleware.request_logging"):
+                client.get("/ping")
+                client.get("/missing")
+        finally:
+            configure_log_sampling()
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert not any("/ping" in m for m in messages)
+        assert any("Response: 404" in m for m in messages)
+
+
+class TestRateLimitMiddleware:
+    """Tests for RateLimitMiddleware."""
+
+    def test_adds_rate_limit_headers(self):
+        """Test rate limit headers are added to allowed responses."""
+        client = TestClient(build_app(requests_per_minute=5))
+        response = client.get("/ping")
+
+        assert response.headers["X-RateLimit-Limit"] == "5"
+        assert response.headers["X-RateLimit-Remaining"] == "4"
+
+    def test_rejects_excess_requests(self):
+        """Test requests over the limit receive 429 with Retry-After."""
+        client = TestClient(build_app(requests_per_minute=2))
+        client.get("/ping")
+        client.get("/ping")
+        response = client.get("/ping")
+
+        assert response.status_code == 429
+        assert int(response.headers["Retry-After"]) >= 1
+        assert response.json()["error"] == "Rate limit exceeded"
+
+    def test_excluded_paths_bypass_limit(self):
+        """Test health checks are never rate limited."""
+        client = TestClient(build_app(requests_per_minute=1))
+        for _ in range(3):
+            response = client.get("/health")
+
+        assert response.status_code == 200
+        assert "X-RateLimit-Limit" not in response.headers
+
+
+class TestErrorHandlingMiddleware:
+    """Tests for ErrorHandlingMiddleware."""
+
+    def test_unhandled_exception_returns_json(self):
+        """Test unexpected exceptions become a standardized 500 response."""
+        client = TestClient(build_app(), raise_server_exceptions=False)
+        response = client.get("/boom")
+
+        assert response.status_code == 500
+        body = response.json()
+        assert body["error"] == "Internal Server Error"
+        assert body["path"] == "/boom"
+        assert body["error_type"] == "RuntimeError"
@@ -0,0 +1,182 @@
+"""
+Unit Tests for Profiling
+
+Tests for app/utils/profiling.py and the admin profiling endpoints.
+"""
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.error_handlers import setup_exception_handlers
+from app.api.routes.info import router as info_router
+from app.utils.profiling import (
+    CpuProfiler,
+    MemoryProfiler,
+    dump_asyncio_tasks,
+    render_collapsed,
+    render_flamegraph,
+)
+
+
+def busy_loop(seconds: float) -> None:
+    """Burn CPU so the sampler has something to see."""
+    end = time.monotonic() + seconds
+    while time.monotonic() < end:
+        sum(range(100))
+
+
+class TestCpuProfiler:
+    """Tests for the sampling profiler and its renderers."""
+
+    def test_samples_running_thread(self):
+        """Test stacks of busy threads are captured."""
+        profiler = CpuProfiler()
+        profiler.start(seconds=5, interval=0.002)
+        busy_loop(0.2)
+        profiler.stop()
+
+        assert not profiler.active
+        assert profiler.samples > 0
+        assert any("busy_loop" in frame for stack in profiler.result() for frame in stack)
+
+    def test_stops_at_deadline(self):
+        """Test the profile ends on its own after the time limit."""
+        profiler = CpuProfiler()
+        profiler.start(seconds=0.05, interval=0.005)
+        profiler.wait()
+
+        assert not profiler.active
+        assert profiler.status()["stopped_at"] is not None
+
+    def test_single_profile_at_a_time(self):
+        """Test a second start is rejected while one is running."""
+        profiler = CpuProfiler()
+        profiler.start(seconds=5)
+        try:
+            with pytest.raises(RuntimeError):
+                profiler.start(seconds=5)
+        finally:
+            profiler.stop()
+
+    def test_render_collapsed(self):
+        """Test folded output, one stack per line."""
+        output = render_collapsed({("main", "a", "b"): 3, ("main", "a"): 1})
+
+        assert output == "main;a 1\nmain;a;b 3\n"
+
+    def test_render_flamegraph(self):
+        """Test the SVG contains a frame per node with escaped names."""
+        svg = render_flamegraph({("main", "f<x>"): 2, ("main", "g"): 2}, title="t")
+
+        assert svg.startswith("<svg")
+        assert "f&lt;x&gt;" in svg
+        assert svg.count("<rect") == 4  # background + main + f + g
+
+
+class TestMemoryProfiler:
+    """Tests for tracemalloc snapshots."""
+
+    def test_snapshot_diff_shows_growth(self):
+        """Test the second snapshot reports newly retained allocations."""
+        profiler = MemoryProfiler()
+        profiler.start()
+        try:
+            first = profiler.snapshot()
+            retained = [bytearray(1024) for _ in range(200)]
+            second = profiler.snapshot()
+        finally:
+            profiler.stop()
+
+        assert first["growth"] == []
+        assert any(entry["size_diff_bytes"] >= 200 * 1024 for entry in second["growth"])
+        assert retained
+
+    def test_snapshot_requires_tracing(self):
+        """Test snapshots fail cleanly when tracing is off."""
+        with pytest.raises(RuntimeError):
+            MemoryProfiler().snapshot()
+
+
+@pytest.mark.asyncio
+async def test_dump_asyncio_tasks():
+    """Test the await chain reaches the innermost coroutine."""
+    async def inner():
+        await asyncio.sleep(10)
+
+    async def outer():
+        await inner()
+
+    task = asyncio.create_task(outer(), name="sleeper")
+    await asyncio.sleep(0)
+    try:
+        dump = {item["name"]: item for item in dump_asyncio_tasks()}
+    finally:
+        task.cancel()
+
+    sleeper = dump["sleeper"]
+    assert sleeper["state"] == "pending"
+    assert [frame.split(" ")[0] for frame in sleeper["stack"][:2]] == [
+        "test_dump_asyncio_tasks.<locals>.outer",
+        "test_dump_asyncio_tasks.<locals>.inner",
+    ]
+
+
+class TestAdminEndpoints:
+    """Tests for access control and responses of /info/profiling."""
+
+    @pytest.fixture
+    def client(self):
+        app = FastAPI()
+        setup_exception_handlers(app)
+        app.include_router(info_router)
+        settings = SimpleNamespace(ADMIN_API_KEY="secret", PROFILING_MAX_SECONDS=10)
+        with patch("app.api.routes.info.get_settings", return_value=settings):
+            yield TestClient(app), settings
+
+    def test_disabled_without_key(self, client):
+        """Test admin endpoints are refused when no admin key is configured."""
+        test_client, settings = client
+        settings.ADMIN_API_KEY = ""
+
+        response = test_client.get("/info/profiling/tasks", headers={"X-Admin-Key": ""})
+
+        assert response.status_code == 403
+
+    def test_wrong_key_rejected(self, client):
+        """Test a wrong admin key is rejected."""
+        test_client, _ = client
+
+        assert test_client.get("/info/profiling/tasks", headers={"X-Admin-Key": "nope"}).status_code == 401
+        assert test_client.get("/info/profiling/tasks").status_code == 401
+
+    def test_tasks_dump(self, client):
+        """Test the task dump lists the request's own task."""
+        test_client, _ = client
+
+        response = test_client.get("/info/profiling/tasks", headers={"X-Admin-Key": "secret"})
+
+        assert response.status_code == 200
+        assert response.json()["total_count"] >= 1
+
+    def test_cpu_profile_round_trip(self, client):
+        """Test start, limit validation and stop with SVG output."""
+        test_client, _ = client
+        headers = {"X-Admin-Key": "secret"}
+
+        assert test_client.post("/info/profiling/cpu/start?seconds=60", headers=headers).status_code == 400
+
+        started = test_client.post("/info/profiling/cpu/start?seconds=5&interval_ms=1", headers=headers)
+        assert started.status_code == 202
+        assert started.json()["active"] is True
+
+        stopped = test_client.post("/info/profiling/cpu/stop?format=svg", headers=headers)
+        assert stopped.status_code == 200
+        assert stopped.headers["content-type"] == "image/svg+xml"
+
+        status = test_client.get("/info/profiling/cpu?format=status", headers=headers).json()
+        assert status["active"] is False
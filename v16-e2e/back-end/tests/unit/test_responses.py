@@ -0,0 +1,74 @@
+"""
+Unit Tests for Fast JSON Responses
+
+Tests for app/api/responses.py and the performance profile options.
+"""
+import json
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from app.api.responses import FastJSONResponse, model_response
+from app.session.models import SessionData, SessionHistoryResponse
+from app.startup.runtime import get_server_options
+
+
+def make_history() -> SessionHistoryResponse:
+    session = SessionData(session_id="s1", created_at=datetime(2026, 1, 2, 3, 4, 5))
+    session.add_message("user", "Where is order 42?")
+    session.add_message("assistant", "Shipped.", tool_calls=[{"name": "get_order", "arguments": {"order_id": 42}}])
+    return SessionHistoryResponse(
+        session_id=session.session_id,
+        tenant_id=session.tenant_id,
+        message_count=len(session.messages),
+        created_at=session.created_at,
+        last_activity=session.last_activity,
+        messages=session.messages
+    )
+
+
+class TestFastJSONResponse:
+    """Tests for orjson rendering of response models."""
+
+    def test_matches_pydantic_serialization(self):
+        """Test the orjson rendering is identical in content to pydantic's."""
+        history = make_history()
+
+        body = FastJSONResponse(history).body
+
+        assert json.loads(body) == json.loads(history.model_dump_json())
+        assert json.loads(body)["created_at"] == "2026-01-02T03:04:05"
+
+    def test_plain_content(self):
+        """Test dicts with non-string keys, sets and datetimes."""
+        body = FastJSONResponse({1: {"a"}, "at": datetime(2026, 1, 1)}).body
+
+        assert json.loads(body) == {"1": ["a"], "at": "2026-01-01T00:00:00"}
+
+    def test_model_response_follows_profile(self):
+        """Test models are only wrapped under the performance profile."""
+        history = make_history()
+
+        with patch("app.api.responses.get_settings", return_value=SimpleNamespace(PERFORMANCE_PROFILE=False)):
+            assert model_response(history) is history
+        with patch("app.api.responses.get_settings", return_value=SimpleNamespace(PERFORMANCE_PROFILE=True)):
+            assert isinstance(model_response(history), FastJSONResponse)
+
+
+class TestServerOptions:
+    """Tests for uvicorn loop and parser selection."""
+
+    def test_default_profile(self):
+        """Test uvicorn chooses when the profile is off."""
+        options = get_server_options(SimpleNamespace(PERFORMANCE_PROFILE=False))
+        assert options == {"loop": "auto", "http": "auto"}
+
+    def test_missing_packages_fall_back(self):
+        """Test the profile falls back to asyncio and h11 when uvloop/httptools are missing."""
+        with patch("app.startup.runtime._installed", return_value=False):
+            options = get_server_options(SimpleNamespace(PERFORMANCE_PROFILE=True))
+        assert options == {"loop": "asyncio", "http": "h11"}
+
+        with patch("app.startup.runtime._installed", return_value=True):
+            options = get_server_options(SimpleNamespace(PERFORMANCE_PROFILE=True))
+        assert options == {"loop": "uvloop", "http": "httptools"}
@@ -0,0 +1,133 @@
+"""
+Unit Tests for Startup
+
+Tests for concurrent startup checks and background service initialization
+(app/startup/checks.py, app/startup/services.py).
+"""
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.routes.health import router as health_router
+from app.startup import get_startup_state, initialize_services, run_all_checks
+
+
+def make_settings(tmp_path):
+    return SimpleNamespace(
+        database_path=tmp_path / "orders.db",
+        ENABLE_METRICS=False,
+        ENABLE_HEALTH_PROBES=False,
+        MCP_SERVER_REQUIRED=False,
+        ORDER_EVENTS_RETENTION_HOURS=0,
+    )
+
+
+class TestStartupChecks:
+    """Tests for run_all_checks."""
+
+    def test_checks_run_concurrently(self):
+        """Test independent checks overlap instead of running back to back."""
+        def slow(result):
+            def check(settings, logger):
+                time.sleep(0.2)
+                return result
+            return check
+
+        with patch("app.startup.checks.check_configuration", slow(True)), \
+                patch("app.startup.checks.check_database", slow(True)), \
+                patch("app.startup.checks.check_azure_openai", slow(True)), \
+                patch("app.startup.checks.check_smtp_configuration", slow(False)), \
+                patch("app.startup.checks.check_mcp_server", slow((True, None))):
+            start = time.perf_counter()
+            passed, warnings = run_all_checks(SimpleNamespace(MCP_SERVER_REQUIRED=False))
+            elapsed = time.perf_counter() - start
+
+        assert passed is True
+        assert warnings == ["SMTP Configuration check failed (non-critical)"]
+        assert elapsed < 0.6  # five 0.2s checks sequentially would take 1s
+
+    def test_critical_failure_reported_in_order(self):
+        """Test the first failing critical check is reported."""
+        with patch("app.startup.checks.check_configuration", return_value=False), \
+                patch("app.startup.checks.check_database", return_value=False), \
+                patch("app.startup.checks.check_azure_openai", return_value=True), \
+                patch("app.startup.checks.check_smtp_configuration", return_value=True), \
+                patch("app.startup.checks.check_mcp_server", return_value=(True, None)):
+            passed, warnings = run_all_checks(SimpleNamespace(MCP_SERVER_REQUIRED=False))
+
+        assert passed is False
+        assert warnings == ["Critical check failed: Configuration"]
+
+
+class TestServiceInitialization:
+    """Tests for initialize_services and startup readiness."""
+
+    @pytest.mark.asyncio
+    async def test_mcp_and_client_created_concurrently(self, tmp_path):
+        """Test MCP connection and client creation overlap, and the agent waits for both."""
+        client = MagicMock()
+        calls = []
+
+        def connect_mcp():
+            time.sleep(0.2)
+            calls.append("mcp")
+
+        def create_client():
+            time.sleep(0.2)
+            calls.append("client")
+            return client
+
+        def init_manager(passed_client):
+            calls.append("agent")
+            assert passed_client is client
+
+        with patch("app.startup.services._prepare_database"), \
+                patch("app.startup.services._connect_mcp", connect_mcp), \
+                patch("app.agent.factory.AgentFactory.create_client", create_client), \
+                patch("app.agent.manager.initialize_agent_manager", init_manager):
+            start = time.perf_counter()
+            await initialize_services(make_settings(tmp_path))
+            elapsed = time.perf_counter() - start
+
+        assert calls[-1] == "agent"
+        assert elapsed < 0.35
+        assert get_startup_state().ready
+        assert get_startup_state().duration is not None
+
+    @pytest.mark.asyncio
+    async def test_failure_recorded(self, tmp_path):
+        """Test a failed initialization leaves the service not ready."""
+        with patch("app.startup.services._prepare_database"), \
+                patch("app.startup.services._connect_mcp"), \
+                patch("app.agent.factory.AgentFactory.create_client", side_effect=ValueError("no key")):
+            with pytest.raises(ValueError):
+                await initialize_services(make_settings(tmp_path))
+
+        state = get_startup_state()
+        assert not state.ready
+        assert state.status == "failed"
+        assert state.error == "no key"
+
+    def test_readiness_waits_for_startup(self):
+        """Test /health/ready is not ready while initialization is running."""
+        app = FastAPI()
+        app.include_router(health_router)
+        manager = MagicMock()
+        manager.is_initialized.return_value = True
+        state = get_startup_state()
+
+        with patch("app.api.routes.health.get_health_prober", return_value=None), \
+                patch("app.api.routes.health.get_agent_manager", return_value=manager):
+            client = TestClient(app)
+            state.status = "starting"
+            starting = client.get("/health/ready").json()
+            state.status = "ready"
+            ready = client.get("/health/ready").json()
+
+        assert starting["ready"] is False
+        assert starting["components"]["startup"] is False
+        assert ready["ready"] is True
@@ -0,0 +1,177 @@
+"""
+Unit Tests for Token Budget Limiter
+
+Tests for app/agent/token_budget.py.
+"""
+import pytest
+from unittest.mock import MagicMock, patch
+
+from app.agent.token_budget import TokenBudgetLimiter, estimate_tokens
+from app.agent.manager import AgentManager
+from app.utils.exceptions import RateLimitError
+
+
+class TestEstimateTokens:
+    """Tests for prompt size estimation."""
+
+    def test_estimate_includes_overhead(self):
+        """Test estimate adds fixed per-turn overhead."""
+        assert estimate_tokens("a" * 400, overhead=100) == 200
+
+    def test_estimate_minimum(self):
+        """Test empty messages still cost at least one token."""
+        assert estimate_tokens("") == 1
+
+
+class TestTokenBudgetLimiter:
+    """Tests for TokenBudgetLimiter."""
+
+    def test_reserve_within_budget(self):
+        """Test reservation is admitted and debited."""
+        limiter = TokenBudgetLimiter(tokens_per_minute=1000)
+
+        limiter.reserve("tenant-a", "s1", 300)
+
+        assert limiter.get_remaining("tenant-a") == 700
+
+    def test_reserve_rejects_when_exhausted(self):
+        """Test exhausted tenant is rejected with retry information."""
+        limiter = TokenBudgetLimiter(tokens_per_minute=600)
+        limiter.reserve("tenant-a", "s1", 600)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            limiter.reserve("tenant-a", "s1", 100)
+
+        assert exc_info.value.details["scope"] == "tenant"
+        assert exc_info.value.details["retry_after"] >= 1
+        assert limiter.get_stats()["rejections"] == 1
+
+    def test_tenants_are_isolated(self):
+        """Test one tenant flooding does not affect another."""
+        limiter = TokenBudgetLimiter(tokens_per_minute=500)
+        limiter.reserve("noisy", "s1", 500)
+
+        reservation = limiter.reserve("quiet", "s2", 400)
+
+        assert reservation.tenant_id == "quiet"
+
+    def test_settle_charges_actual_usage(self):
+        """Test settlement reconciles estimate with actual tokens."""
+        limiter = TokenBudgetLimiter(tokens_per_minute=1000)
+        reservation = limiter.reserve("tenant-a", "s1", 100)
+
+        limiter.settle(reservation, 700)
+
+        assert limiter.get_remaining("tenant-a") == 300
+        assert limiter.get_stats()["tokens_consumed"] == 700
+
+    def test_settle_is_idempotent(self):
+        """Test a reservation is only settled once."""
+        limiter = TokenBudgetLimiter(tokens_per_minute=1000)
+        reservation = limiter.reserve("tenant-a", "s1", 100)
+
+        limiter.settle(reservation, 500)
+        limiter.settle(reservation, 500)
+
+        assert limiter.get_remaining("tenant-a") == 500
+
+    def test_session_budget(self):
+        """Test per-session budget is enforced independently of tenant."""
+        limiter = TokenBudgetLimiter(tokens_per_minute=10000, session_tokens_per_minute=200)
+        limiter.reserve("tenant-a", "s1", 200)
+
+        with pytest.raises(RateLimitError) as exc_info:
+            limiter.reserve("tenant-a", "s1", 50)
+
+        assert exc_info.value.details["scope"] == "session"
+        limiter.reserve("tenant-a", "s2", 50)
+
+    def test_large_prompt_admitted_on_full_bucket(self):
+        """Test prompts larger than the bucket can run when it is full."""
+        limiter = TokenBudgetLimiter(tokens_per_minute=100)
+
+        limiter.reserve("tenant-a", "s1", 5000)
+
+        assert limiter.get_remaining("tenant-a") == 0
+
+
+class TestAgentManagerTokenBudget:
+    """Tests for token budget integration in AgentManager."""
+
+    @pytest.mark.asyncio
+    async def test_execute_settles_reported_usage(self):
+        """Test execute debits the usage reported by the agent."""
+        limiter = TokenBudgetLimiter(tokens_per_minute=10000)
+        result = MagicMock()
+        result.usage_details = {"input_token_count": 1200, "output_token_count": 300}
+
+        async def mock_run(message, session=None):
+            return result
+
+        manager = AgentManager()
+        manager._initialized = True
+        manager._agent = MagicMock()
+        manager._agent.run.side_effect = mock_run
+        manager._sessions["s1"] = MagicMock()
+
+        with patch("app.agent.manager.get_token_budget_limiter", return_value=limiter), \
+             patch("app.agent.manager.get_settings") as mock_get_settings:
+            mock_get_settings.return_value.TOKEN_BUDGET_PROMPT_OVERHEAD = 0
+            response = await manager.execute("s1", "hello", tenant_id="tenant-a")
+
+        assert response["usage"]["input_token_count"] == 1200
+        assert limiter.get_remaining("tenant-a") == 10000 - 1500
+
+    @pytest.mark.asyncio
+    async def test_execute_stream_sums_token_counts_only(self):
+        """Test streamed usage sums token counts and ignores other details."""
+        limiter = TokenBudgetLimiter(tokens_per_minute=10000)
+
+        def update(text, usage_details=None):
+            content = MagicMock(type="usage" if usage_details else "text", usage_details=usage_details)
+            return MagicMock(text=text, contents=[content])
+
+        async def mock_stream():
+            yield update("Hello")
+            yield update("", {"input_token_count": 1000, "output_token_count": 200,
+                              "model": "gpt-4o", "details": {"cached": 10}})
+            yield update("", {"output_token_count": 100})
+
+        manager = AgentManager()
+        manager._initialized = True
+        manager._agent = MagicMock()
+        manager._agent.run.side_effect = lambda message, session=None, stream=False: mock_stream()
+        manager._sessions["s1"] = MagicMock()
+
+        with patch("app.agent.manager.get_token_budget_limiter", return_value=limiter), \
+             patch("app.agent.manager.get_settings") as mock_get_settings:
+            mock_get_settings.return_value.TOKEN_BUDGET_PROMPT_OVERHEAD = 0
+            chunks = [chunk async for chunk in manager.execute_stream("s1", "hello", tenant_id="tenant-a")]
+
+        assert chunks == ["Hello"]
+        assert limiter.get_remaining("tenant-a") == 10000 - 1300
+
+    @pytest.mark.asyncio
+    async def test_stream_reservation_released_if_never_started(self):
+        """Test a streaming reservation is released when the body never runs."""
+        from app.api.models import SendMessageRequest
+        from app.api.routes.agent import send_message_stream
+
+        limiter = TokenBudgetLimiter(tokens_per_minute=10000)
+        manager = AgentManager()
+        manager._initialized = True
+        manager._agent = MagicMock()
+        request = SendMessageRequest(message="hello " * 100, session_id="s1", tenant_id="tenant-a")
+
+        with patch("app.api.routes.agent.get_agent_manager", return_value=manager), \
+             patch("app.agent.manager.get_token_budget_limiter", return_value=limiter), \
+             patch("app.agent.manager.get_settings") as mock_get_settings:
+            mock_get_settings.return_value.TOKEN_BUDGET_PROMPT_OVERHEAD = 0
+            response = await send_message_stream(request, x_request_id="req-1")
+            assert limiter.get_remaining("tenant-a") < 10000
+
+            # Client disconnected before the first chunk: only the background task runs
+            await response.background()
+
+        assert limiter.get_remaining("tenant-a") == 10000
+        manager._agent.run.assert_not_called()
@@ -86,6 +86,138 @@ class TestOrderTools:
                 await get_order_tool(order_id="ORD-123")
 
 
+class TestOrderToolPagination:
+    """Tests for paged order tool results."""
+    
+    def test_list_all_orders_returns_cursor(self):
+        """Test a page result carries next_cursor and has_more."""
+        from app.tools.wrappers.order_tools import list_all_orders
+        
+        page = {"orders": [{"order_id": 1}], "next_cursor": "abc"}
+        with patch("app.tools.wrappers.order_tools.get_orders_page", return_value=page) as mock_page:
+            result = list_all_orders.func(limit=1, cursor="xyz")
+        
+        mock_page.assert_called_once_with(limit=1, cursor="xyz")
+        assert result["has_more"] is True
+        assert result["next_cursor"] == "abc"
+        assert result["order_count"] == 1
+    
+    def test_invalid_cursor_is_reported(self):
+        """Test an invalid cursor comes back as a tool error."""
+        from app.tools.order_management import ValidationError
+        from app.tools.wrappers.order_tools import find_orders
+        
+        with patch("app.tools.wrappers.order_tools.search_orders_page", side_effect=ValidationError("Invalid cursor")):
+            result = find_orders.func(order_status="PENDING", cursor="bad")
+        
+        assert result["status"] == "error"
+        assert result["error_type"] == "ValidationError"
+
+
+class TestBulkOrderTool:
+    """Tests for the bulk order creation tool."""
+    
+    def test_partial_result_lists_errors(self):
+        """Test failed orders are reported alongside the created ones."""
+        from app.tools.wrappers.order_tools import create_orders_in_bulk
+        
+        report = {"total": 2, "created": 1, "failed": 1, "order_ids": [7],
+                  "errors": [{"row": 2, "error": "quantity must be greater than 0"}], "errors_truncated": False}
+        with patch("app.tools.wrappers.order_tools.create_orders_bulk", return_value=report) as mock_bulk:
+            result = create_orders_in_bulk.func(orders=[{}, {}])
+        
+        mock_bulk.assert_called_once_with([{}, {}], return_ids=True)
+        assert result["status"] == "partial"
+        assert result["order_ids"] == [7]
+        assert result["errors"][0]["row"] == 2
+    
+    def test_too_many_orders(self):
+        """Test oversized batches are refused before touching the database."""
+        from app.tools.wrappers.order_tools import MAX_TOOL_BULK_ORDERS, create_orders_in_bulk
+        
+        with patch("app.tools.wrappers.order_tools.create_orders_bulk") as mock_bulk:
+            result = create_orders_in_bulk.func(orders=[{}] * (MAX_TOOL_BULK_ORDERS + 1))
+        
+        mock_bulk.assert_not_called()
+        assert result["status"] == "error"
+
+
+class TestBulkStatusUpdateTool:
+    """Tests for the bulk order status update tool."""
+    
+    def test_bulk_status_update_truncates_results(self):
+        """Test large filter updates return counts and the first 500 outcomes."""
+        from app.tools.wrappers.order_tools import MAX_TOOL_BULK_ORDERS, update_orders_in_bulk
+        
+        results = [{"order_id": i, "outcome": "updated", "version": 2} for i in range(600)]
+        report = {"new_status": "SHIPPED", "updated_count": 600,
+                  "counts": {"updated": 600}, "results": results}
+        with patch("app.tools.wrappers.order_tools.update_order_status_bulk", return_value=report) as mock_bulk:
+            result = update_orders_in_bulk.func(new_status="shipped", current_status="CONFIRMED")
+        
+        assert mock_bulk.call_args.kwargs["current_status"] == "CONFIRMED"
+        assert result["updated_count"] == 600
+        assert len(result["results"]) == MAX_TOOL_BULK_ORDERS
+        assert result["results_truncated"] is True
+
+
+class TestSummaryTools:
+    """Tests for the order summary tools."""
+    
+    def test_summarize_orders_by_day(self):
+        """Test daily totals are only read when asked for."""
+        from app.tools.wrappers.order_tools import summarize_orders
+        
+        totals = {"start_date": "2024-01-01", "end_date": "2024-01-31", "order_count": 2,
+                  "total_quantity": 3, "total_amount": 12.5, "statuses": []}
+        with patch("app.tools.wrappers.order_tools.get_status_totals", return_value=totals), \
+             patch("app.tools.wrappers.order_tools.get_daily_totals", return_value=[]) as mock_daily:
+            result = summarize_orders.func(start_date="2024-01-01", end_date="2024-01-31")
+            assert "days" not in result
+            result = summarize_orders.func(start_date="2024-01-01", end_date="2024-01-31", by_day=True)
+        
+        mock_daily.assert_called_once_with("2024-01-01", "2024-01-31")
+        assert result["status"] == "success"
+        assert result["total_amount"] == 12.5
+        assert result["days"] == []
+    
+    def test_invalid_ranking(self):
+        """Test a bad rank_by is returned as a validation error."""
+        from app.tools.wrappers.order_tools import get_top_products
+        
+        result = get_top_products.func(rank_by="profit")
+        
+        assert result["status"] == "error"
+        assert result["error_type"] == "ValidationError"
+
+
+class TestAsyncOrderTools:
+    """Tests for the async order tool wrappers."""
+    
+    def test_same_tools_as_sync(self):
+        """Test the async tools mirror the sync tools' names and descriptions."""
+        from app.tools.wrappers import async_order_tools, order_tools
+        
+        assert async_order_tools.__all__ == order_tools.__all__
+        for name in order_tools.__all__:
+            sync_tool, async_tool = getattr(order_tools, name), getattr(async_order_tools, name)
+            assert async_tool.name == sync_tool.name
+            assert async_tool.description == sync_tool.description
+    
+    @pytest.mark.asyncio
+    async def test_errors_become_results(self):
+        """Test library exceptions are returned as error results."""
+        from app.tools.order_management import OrderNotFoundError
+        from app.tools.wrappers.async_order_tools import get_order
+        
+        with patch("app.tools.wrappers.async_order_tools.async_operations.get_order_by_id",
+                   AsyncMock(side_effect=OrderNotFoundError("Order with ID 9 not found"))):
+            result = await get_order.func(order_id="9")
+        
+        assert result == {"status": "error", "error": "Order with ID 9 not found",
+                          "error_type": "OrderNotFoundError"}
+
+
 class TestEmailTools:
     """Tests for email tool wrappers."""
     
@@ -0,0 +1,151 @@
+"""
+Unit Tests for Tracing
+
+Tests for app/utils/tracing.py and the spans emitted by the request
+logging middleware, tool wrappers and SQLAlchemy hooks.
+"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.api.middleware import RequestLoggingMiddleware
+from app.utils import tracing
+
+pytest.importorskip("opentelemetry.sdk")
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.trace import SpanKind, StatusCode
+
+
+def tracing_settings(**overrides):
+    """Build the settings consumed by configure_tracing."""
+    values = {
+        "ENABLE_TRACING": True,
+        "OTEL_SERVICE_NAME": "test-service",
+        "OTEL_EXPORTER_OTLP_ENDPOINT": "http://localhost:4317",
+        "OTEL_EXPORTER_OTLP_PROTOCOL": "grpc",
+        "OTEL_TRACES_SAMPLE_RATIO": 1.0,
+        "TRACING_MAX_QUEUE_SIZE": 128,
+    }
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.fixture
+def exporter():
+    """Enable tracing with an in-memory exporter."""
+    span_exporter = InMemorySpanExporter()
+    assert tracing.configure_tracing(tracing_settings(), exporter=span_exporter)
+    yield span_exporter
+    tracing.shutdown_tracing()
+
+
+def finished_spans(span_exporter):
+    """Flush the batch processor and return exported spans."""
+    tracing._provider.force_flush()
+    return {span.name: span for span in span_exporter.get_finished_spans()}
+
+
+class TestDisabled:
+    """Tests for the disabled (default) path."""
+
+    def test_configure_disabled(self):
+        """Test tracing stays off when ENABLE_TRACING is false."""
+        assert not tracing.configure_tracing(tracing_settings(ENABLE_TRACING=False))
+        assert not tracing.is_tracing_enabled()
+
+    def test_helpers_are_noops(self):
+        """Test helpers pass through without creating spans."""
+        @tracing.traced("noop")
+        def add(a, b):
+            return a + b
+
+        assert add(1, 2) == 3
+        with tracing.start_span("noop") as span:
+            assert span is None
+
+
+class TestSpans:
+    """Tests for span creation and parenting."""
+
+    def test_traced_error_result(self, exporter):
+        """Test tool error dicts mark the span as failed."""
+        @tracing.traced("tool.lookup")
+        def lookup(order_id: str) -> dict:
+            return {"status": "error", "error": "not found", "error_type": "OrderNotFoundError"}
+
+        lookup("ORD-1")
+
+        span = finished_spans(exporter)["tool.lookup"]
+        assert span.status.status_code == StatusCode.ERROR
+        assert span.attributes["error.type"] == "OrderNotFoundError"
+
+    @pytest.mark.asyncio
+    async def test_traced_async(self, exporter):
+        """Test async functions are traced and keep their metadata."""
+        @tracing.traced()
+        async def fetch(order_id: str) -> dict:
+            """Fetch an order."""
+            return {"status": "success"}
+
+        assert await fetch("ORD-1") == {"status": "success"}
+        assert fetch.__doc__ == "Fetch an order."
+        assert finished_spans(exporter)["fetch"].status.status_code == StatusCode.UNSET
+
+    @pytest.mark.asyncio
+    async def test_iterate_in_span_parents_children(self, exporter):
+        """Test spans started while a stream produces are children of its span."""
+        async def stream():
+            for i in range(2):
+                with tracing.start_span(f"chunk.{i}"):
+                    yield i
+
+        with tracing.detached_span("agent.run") as span:
+            items = [item async for item in tracing.iterate_in_span(span, stream())]
+
+        assert items == [0, 1]
+        spans = finished_spans(exporter)
+        run_id = spans["agent.run"].context.span_id
+        assert spans["chunk.0"].parent.span_id == run_id
+        assert spans["chunk.1"].parent.span_id == run_id
+
+    def test_http_to_sqlite_hierarchy(self, exporter, tmp_path):
+        """Test request → tool → SQL spans form one trace named by route."""
+        engine = create_engine(f"sqlite:///{tmp_path / 'orders.db'}")
+        tracing.instrument_sqlalchemy_tracing()
+
+        @tracing.traced("tool.get_order")
+        def get_order(order_id: str) -> dict:
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+            return {"status": "success"}
+
+        app = FastAPI()
+        app.add_middleware(RequestLoggingMiddleware)
+
+        @app.get("/orders/{order_id}")
+        def read_order(order_id: str):
+            return get_order(order_id)
+
+        traceparent = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+        response = TestClient(app).get("/orders/ORD-1", headers={"traceparent": traceparent})
+        engine.dispose()
+
+        assert response.status_code == 200
+        tracing._provider.force_flush()
+        spans = exporter.get_finished_spans()
+        server = next(span for span in spans if span.instrumentation_scope.name == tracing.TRACER_NAME
+                      and span.kind == SpanKind.SERVER)
+        tool = next(span for span in spans if span.name == "tool.get_order")
+        query = next(span for span in spans if span.name == "SELECT orders")
+
+        assert server.name == "GET /orders/{order_id}"
+        assert server.attributes["http.route"] == "/orders/{order_id}"
+        assert {format(span.context.trace_id, "032x") for span in (server, tool, query)} == {
+            "0af7651916cd43dd8448eb211c80319c"
+        }
+        assert query.parent.span_id == tool.context.span_id
+        assert query.kind == SpanKind.CLIENT
+        assert query.attributes["db.statement"] == "SELECT 1"
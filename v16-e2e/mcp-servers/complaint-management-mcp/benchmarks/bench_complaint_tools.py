@@ -0,0 +1,81 @@
+"""
+Complaint Tool Benchmarks
+
+One benchmark per complaint tool, at each database size (see
+conftest.py). Lookups and updates cycle through complaints picked from
+the data; resolve and archive take a different open complaint each round.
+Writes change the session's copy of the database.
+"""
+
+from itertools import cycle
+
+from src.tools import (
+    archive_complaint,
+    get_complaint,
+    register_complaint,
+    resolve_complaint,
+    search_complaints,
+    update_complaint,
+)
+
+# Rounds of the one-way writes (each needs a complaint still open)
+ONE_WAY_ROUNDS = 50
+
+
+def _succeeded(result: dict) -> dict:
+    assert result["success"], result
+    return result
+
+
+def test_register_complaint(benchmark, complaint_db, run):
+    benchmark(lambda: _succeeded(run(register_complaint(
+        title="Item received in damaged condition",
+        description="The outer packaging was crushed and the contents were broken on arrival.",
+        customer_name=complaint_db["customer"],
+        order_number=complaint_db["order_number"],
+        priority="HIGH",
+    ))))
+
+
+def test_get_complaint(benchmark, complaint_db, run):
+    complaint_ids = cycle(complaint_db["complaint_ids"])
+    benchmark(lambda: _succeeded(run(get_complaint(next(complaint_ids)))))
+
+
+def test_search_complaints_customer(benchmark, complaint_db, run):
+    benchmark(lambda: _succeeded(run(search_complaints(customer_name=complaint_db["customer"]))))
+
+
+def test_search_complaints_order_number(benchmark, complaint_db, run):
+    benchmark(lambda: _succeeded(run(search_complaints(order_number=complaint_db["order_number"]))))
+
+
+def test_search_complaints_title(benchmark, complaint_db, run):
+    """A title word matching about 5% of complaints."""
+    benchmark(lambda: _succeeded(run(search_complaints(title="refund"))))
+
+
+def test_search_complaints_status(benchmark, complaint_db, run):
+    benchmark(lambda: _succeeded(run(search_complaints(status="OPEN"))))
+
+
+def test_update_complaint(benchmark, complaint_db, run):
+    updates = cycle(enumerate(complaint_db["open_ids"]))
+
+    def update():
+        index, complaint_id = next(updates)
+        return _succeeded(run(update_complaint(complaint_id, remarks=f"Follow-up {index}")))
+
+    benchmark(update)
+
+
+def test_resolve_complaint(benchmark, complaint_db, run):
+    complaint_ids = iter(complaint_db["open_ids"][:ONE_WAY_ROUNDS])
+    benchmark.pedantic(lambda: _succeeded(run(resolve_complaint(next(complaint_ids), "Refund issued"))),
+                       rounds=ONE_WAY_ROUNDS)
+
+
+def test_archive_complaint(benchmark, complaint_db, run):
+    complaint_ids = iter(complaint_db["open_ids"][ONE_WAY_ROUNDS:2 * ONE_WAY_ROUNDS])
+    benchmark.pedantic(lambda: _succeeded(run(archive_complaint(next(complaint_ids)))),
+                       rounds=ONE_WAY_ROUNDS)
@@ -0,0 +1,134 @@
+"""
+Complaint Tool Benchmark Fixtures
+
+Each benchmark runs against complaint databases of every size in
+``--rows`` (10k, 100k and 1M complaints by default), filled by
+``src.utils.synthetic_data``. A generated database is kept in
+``--data-dir`` and reused by later runs (the generator is deterministic);
+each session benchmarks a copy, so write benchmarks never change it.
+"""
+
+import asyncio
+import os
+import random
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Bulk inserts and large searches would fill the slow query log
+os.environ.setdefault("SLOW_QUERY_MS", "0")
+
+import src.config  # noqa: E402
+import src.database  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+from src.utils.synthetic_data import DEFAULT_SEED, generate_complaints, insert_complaints  # noqa: E402
+
+DEFAULT_ROWS = "10000,100000,1000000"
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("complaint benchmarks")
+    group.addoption("--rows", default=DEFAULT_ROWS,
+                    help=f"Comma-separated complaint counts to benchmark (default: {DEFAULT_ROWS})")
+    group.addoption("--data-dir", default=str(Path(__file__).parent / ".data"),
+                    help="Where generated databases are kept between runs")
+
+
+def _label(rows: int) -> str:
+    if rows % 1_000_000 == 0:
+        return f"{rows // 1_000_000}M"
+    if rows % 1000 == 0:
+        return f"{rows // 1000}k"
+    return str(rows)
+
+
+def pytest_generate_tests(metafunc):
+    if "complaint_db" in metafunc.fixturenames:
+        sizes = [int(rows) for rows in metafunc.config.getoption("rows").split(",")]
+        metafunc.parametrize("complaint_db", sizes, ids=[_label(rows) for rows in sizes],
+                             indirect=True, scope="session")
+
+
+def _reset_engine() -> None:
+    """Close the server's engine; the next use reads DATABASE_PATH again."""
+    if src.database._engine is not None:
+        src.database._engine.dispose()
+    src.config._config = None
+    src.database._engine = None
+    src.database._SessionLocal = None
+
+
+def _use_database(path: Path) -> None:
+    """Point the server's engine at another database file."""
+    _reset_engine()
+    os.environ["DATABASE_PATH"] = str(path)
+
+
+def _template(rows: int, data_dir: Path) -> Path:
+    """Generated database of ``rows`` complaints, created on first use."""
+    path = data_dir / f"complaints-{rows}-seed{DEFAULT_SEED}.db"
+    if not path.exists():
+        data_dir.mkdir(parents=True, exist_ok=True)
+        partial = path.with_suffix(".partial")
+        _use_database(partial)
+        src.database.init_database()
+        insert_complaints(generate_complaints(rows, orders=rows))
+        partial.rename(path)
+    return path
+
+
+@pytest.fixture(scope="session")
+def complaint_db(request, tmp_path_factory):
+    """
+    A copy of the generated database of ``request.param`` complaints.
+
+    Yields:
+        dict: "rows", and keys picked from the data: "complaint_ids"
+        (random sample), "open_ids" (OPEN or IN_PROGRESS, not archived),
+        "customer" (median number of complaints), "order_number"
+    """
+    rows = request.param
+    previous = os.environ.get("DATABASE_PATH")
+    template = _template(rows, Path(request.config.getoption("data_dir")))
+    path = tmp_path_factory.mktemp(f"complaints-{_label(rows)}") / "complaints.db"
+    shutil.copyfile(template, path)
+    _use_database(path)
+
+    rng = random.Random(1)
+    with src.database.get_engine().connect() as conn:
+        open_ids = conn.execute(text(
+            "SELECT complaint_id FROM complaints "
+            "WHERE status IN ('OPEN', 'IN_PROGRESS') AND is_archived = 0 ORDER BY complaint_id"
+        )).scalars().all()
+        customers = conn.execute(text(
+            "SELECT customer_name FROM complaints GROUP BY customer_name ORDER BY count(*) DESC, customer_name"
+        )).scalars().all()
+        order_number = conn.execute(
+            text("SELECT order_number FROM complaints WHERE complaint_id = :id"), {"id": rows // 2}
+        ).scalar()
+
+    yield {
+        "rows": rows,
+        "complaint_ids": rng.sample(range(1, rows + 1), 1000),
+        "open_ids": rng.sample(open_ids, min(len(open_ids), 1000)),
+        "customer": customers[len(customers) // 2],
+        "order_number": order_number,
+    }
+
+    _reset_engine()
+    if previous is None:
+        os.environ.pop("DATABASE_PATH", None)
+    else:
+        os.environ["DATABASE_PATH"] = previous
+
+
+@pytest.fixture(scope="session")
+def run():
+    """Run a tool coroutine on one event loop kept for the session."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
@@ -13,6 +13,7 @@ from mcp.server.fastmcp import FastMCP
 
 from src.config import load_config
 from src.tools import register_all_tools
+from src.tracing import configure_tracing
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -25,7 +26,8 @@ def create_app() -> FastMCP:
     Steps:
     1. Load & validate configuration from environment / .env file.
     2. Instantiate :class:`FastMCP` with server metadata and network settings.
-    3. Register all 6 MCP tools via :func:`register_all_tools`.
+    3. Configure OpenTelemetry tracing (if ``OTEL_ENABLED``).
+    4. Register all 6 MCP tools via :func:`register_all_tools`.
 
     Returns:
         A ready-to-run :class:`FastMCP` application.
@@ -48,6 +50,8 @@ def create_app() -> FastMCP:
         port=config.port,
     )
 
+    configure_tracing(config)
+
     register_all_tools(mcp)
     logger.info("All 6 tools registered on FastMCP instance.")
 
@@ -26,11 +26,18 @@ class Config:
         mount_path: MCP endpoint mount path
         database_path: Path to SQLite database file
         database_echo: Enable SQL query logging
+        slow_query_ms: Log statements at least this slow with their query plan (0 disables)
+        tool_query_warn: Warn when a tool call runs at least this many queries (0 disables)
         auto_seed: Auto-seed database on startup
         seed_count: Number of records to seed
         log_level: Logging level
         log_format: Log message format
         timezone: Application timezone
+        otel_enabled: Export OpenTelemetry traces
+        otel_service_name: Service name on exported spans
+        otel_exporter_endpoint: OTLP collector endpoint
+        otel_exporter_protocol: OTLP protocol (grpc or http)
+        otel_sample_ratio: Fraction of new traces sampled
     """
     
     def __init__(self):
@@ -54,6 +61,8 @@ class Config:
         # Database Configuration
         self.database_path = os.getenv('DATABASE_PATH', 'db/complaints.db')
         self.database_echo = os.getenv('DATABASE_ECHO', 'false').lower() == 'true'
+        self.slow_query_ms = float(os.getenv('SLOW_QUERY_MS', '100'))
+        self.tool_query_warn = int(os.getenv('TOOL_QUERY_WARN', '10'))
         
         # Seeding Configuration
         self.auto_seed = os.getenv('AUTO_SEED_DATABASE', 'true').lower() == 'true'
@@ -68,6 +77,13 @@ class Config:
         
         # Application Settings
         self.timezone = os.getenv('TIMEZONE', 'UTC')
+        
+        # Tracing Configuration
+        self.otel_enabled = os.getenv('OTEL_ENABLED', 'false').lower() == 'true'
+        self.otel_service_name = os.getenv('OTEL_SERVICE_NAME', 'complaint-management-mcp')
+        self.otel_exporter_endpoint = os.getenv('OTEL_EXPORTER_OTLP_ENDPOINT', 'http://localhost:4317')
+        self.otel_exporter_protocol = os.getenv('OTEL_EXPORTER_OTLP_PROTOCOL', 'grpc').lower()
+        self.otel_sample_ratio = float(os.getenv('OTEL_TRACES_SAMPLE_RATIO', '1.0'))
     
     def validate(self) -> tuple[bool, Optional[str]]:
         """
@@ -84,11 +100,25 @@ class Config:
         if self.seed_count < 0:
             return False, f"Invalid seed count: {self.seed_count}. Must be non-negative."
         
+        # Validate query diagnostics
+        if self.slow_query_ms < 0:
+            return False, f"Invalid slow query threshold: {self.slow_query_ms}. Must be non-negative."
+        
+        if self.tool_query_warn < 0:
+            return False, f"Invalid tool query warning count: {self.tool_query_warn}. Must be non-negative."
+        
         # Validate log level
         valid_log_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
         if self.log_level.upper() not in valid_log_levels:
             return False, f"Invalid log level: {self.log_level}. Must be one of {valid_log_levels}."
         
+        # Validate tracing settings
+        if self.otel_exporter_protocol not in ('grpc', 'http'):
+            return False, f"Invalid OTLP protocol: {self.otel_exporter_protocol}. Must be 'grpc' or 'http'."
+        
+        if not (0.0 <= self.otel_sample_ratio <= 1.0):
+            return False, f"Invalid trace sample ratio: {self.otel_sample_ratio}. Must be between 0 and 1."
+        
         return True, None
     
     def get_database_url(self) -> str:
@@ -16,6 +16,8 @@ from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.engine import Engine
 from .config import get_config
 from .models import Base
+from .query_stats import instrument_engine as instrument_query_stats
+from .tracing import instrument_engine
 
 
 # Global engine and session factory
@@ -47,6 +49,12 @@ def get_engine() -> Engine:
             cursor = dbapi_conn.cursor()
             cursor.execute("PRAGMA foreign_keys=ON")
             cursor.close()
+        
+        # Span per statement (no-op unless tracing is enabled)
+        instrument_engine(_engine)
+        
+        # Per-tool query counts and slow query log
+        instrument_query_stats(_engine, config)
     
     return _engine
 
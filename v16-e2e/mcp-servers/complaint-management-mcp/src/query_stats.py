@@ -0,0 +1,124 @@
+"""
+Query Statistics
+
+Counts the SQL statements each tool call executes and logs slow statements
+with their SQLite query plan.
+
+A tool whose statement count grows with the size of its result (an N+1
+pattern), or that issues extra diagnostic queries, shows up in the
+"<tool> ran N queries" line logged after each call. Statements slower than
+``SLOW_QUERY_MS`` are logged as warnings with ``EXPLAIN QUERY PLAN`` output,
+so a full table scan is visible without reproducing the query by hand.
+
+Functions:
+    - instrument_engine: Attach counting and slow-query hooks to an engine
+    - counted_tool: Wrap an async MCP tool to count its queries
+"""
+
+import functools
+import time
+from contextvars import ContextVar
+from typing import Callable, List, Optional
+
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Statements EXPLAIN QUERY PLAN accepts
+EXPLAINABLE_PREFIXES = ("SELECT", "INSERT", "UPDATE", "DELETE", "REPLACE", "WITH")
+
+# Statement count of the tool call running in this context (None outside a call)
+_query_count: ContextVar[Optional[List[int]]] = ContextVar("query_count", default=None)
+
+_slow_query_ms: Optional[float] = None
+_tool_query_warn: int = 0
+
+
+def _explain(conn, statement: str, parameters) -> List[str]:
+    """Run EXPLAIN QUERY PLAN on the same connection, bypassing the hooks."""
+    if not statement.lstrip().upper().startswith(EXPLAINABLE_PREFIXES):
+        return []
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+        return [str(row[-1]) for row in cursor.fetchall()]
+    except Exception as exc:
+        return [f"EXPLAIN failed: {exc}"]
+    finally:
+        cursor.close()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._query_stats_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    count = _query_count.get()
+    if count is not None:
+        count[0] += 1
+
+    start = getattr(context, "_query_stats_start", None)
+    if start is None or _slow_query_ms is None:
+        return
+    duration_ms = (time.perf_counter() - start) * 1000
+    if duration_ms < _slow_query_ms:
+        return
+
+    plan = [] if executemany else _explain(conn, statement, parameters)
+    logger.warning(
+        "Slow query (%.1fms): %s%s",
+        duration_ms, statement[:200], "".join(f"\n  {line}" for line in plan),
+    )
+
+
+def instrument_engine(engine, config) -> None:
+    """
+    Count statements and log slow ones on ``engine``.
+
+    Args:
+        engine: SQLAlchemy Engine
+        config: :class:`src.config.Config` instance
+    """
+    global _slow_query_ms, _tool_query_warn
+
+    from sqlalchemy import event
+
+    _slow_query_ms = config.slow_query_ms if config.slow_query_ms > 0 else None
+    _tool_query_warn = config.tool_query_warn
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def counted_tool(func: Callable) -> Callable:
+    """
+    Wrap an async MCP tool so the statements it executes are counted.
+
+    The count is logged at DEBUG after each call, as a warning once it reaches
+    ``TOOL_QUERY_WARN``. The signature and docstring are preserved for
+    FastMCP.
+
+    Args:
+        func: Async tool function
+
+    Returns:
+        Wrapped tool function
+    """
+    name = func.__name__
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        count = [0]
+        token = _query_count.set(count)
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        finally:
+            _query_count.reset(token)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            if _tool_query_warn and count[0] >= _tool_query_warn:
+                logger.warning("%s ran %d queries in %.1fms", name, count[0], elapsed_ms)
+            else:
+                logger.debug("%s ran %d queries in %.1fms", name, count[0], elapsed_ms)
+
+    return wrapper
@@ -22,21 +22,27 @@ from src.tools.search_complaints import search_complaints
 from src.tools.resolve_complaint import resolve_complaint
 from src.tools.update_complaint import update_complaint
 from src.tools.archive_complaint import archive_complaint
+from src.query_stats import counted_tool
+from src.tracing import traced_tool
 
 
 def register_all_tools(mcp) -> None:
     """
     Register all 6 complaint-management tools onto a FastMCP instance.
 
+    Each tool is wrapped with :func:`src.tracing.traced_tool` so calls
+    continue the caller's trace when tracing is enabled, and with
+    :func:`src.query_stats.counted_tool` so each call logs its query count.
+
     Args:
         mcp: A :class:`fastmcp.FastMCP` application instance.
     """
-    mcp.tool()(register_complaint)
-    mcp.tool()(get_complaint)
-    mcp.tool()(search_complaints)
-    mcp.tool()(resolve_complaint)
-    mcp.tool()(update_complaint)
-    mcp.tool()(archive_complaint)
+    mcp.tool()(traced_tool(counted_tool(register_complaint)))
+    mcp.tool()(traced_tool(counted_tool(get_complaint)))
+    mcp.tool()(traced_tool(counted_tool(search_complaints)))
+    mcp.tool()(traced_tool(counted_tool(resolve_complaint)))
+    mcp.tool()(traced_tool(counted_tool(update_complaint)))
+    mcp.tool()(traced_tool(counted_tool(archive_complaint)))
 
 
 __all__ = [
@@ -0,0 +1,223 @@
+"""
+OpenTelemetry Tracing
+
+Optional tracing for MCP tool calls and the SQLite queries they run.
+
+The agent back-end sends its W3C trace context (``traceparent``) in the MCP
+request ``_meta``. Each tool call continues that trace with a SERVER span,
+so a complaint lookup shows up under the agent run that made it.
+
+OpenTelemetry is an optional dependency; without it, or with
+``OTEL_ENABLED=false``, the wrappers call straight through.
+
+Functions:
+    - configure_tracing: Install the tracer provider and OTLP exporter
+    - traced_tool: Wrap an async MCP tool function in a span
+    - instrument_engine: Emit a span per SQL statement on an engine
+"""
+
+import functools
+from pathlib import Path
+from typing import Any, Callable
+
+from src.utils.logger import get_logger
+
+try:
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+    OTEL_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    OTEL_AVAILABLE = False
+
+logger = get_logger(__name__)
+
+TRACER_NAME = "complaint-management-mcp"
+
+# Longest SQL statement recorded on database spans
+MAX_STATEMENT_LENGTH = 1000
+
+_tracer = None
+_provider = None
+
+
+def _create_exporter(protocol: str, endpoint: str):
+    """Create an OTLP span exporter for the configured protocol."""
+    if protocol == "grpc":
+        from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
+        return OTLPSpanExporter(endpoint=endpoint, insecure=endpoint.startswith("http://"))
+
+    from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+    return OTLPSpanExporter(endpoint=f"{endpoint.rstrip('/')}/v1/traces")
+
+
+def configure_tracing(config, exporter=None) -> bool:
+    """
+    Configure the tracer provider from configuration.
+
+    Spans are exported by a ``BatchSpanProcessor`` on a background thread,
+    so tool calls never wait on the collector.
+
+    Args:
+        config: :class:`src.config.Config` instance
+        exporter: Span exporter to use instead of OTLP (e.g. in tests)
+
+    Returns:
+        True if tracing is active
+    """
+    global _tracer, _provider
+
+    if not config.otel_enabled:
+        return False
+
+    if not OTEL_AVAILABLE:
+        logger.warning("OTEL_ENABLED is set but opentelemetry is not installed — tracing disabled.")
+        return False
+
+    try:
+        from opentelemetry.sdk.resources import Resource
+        from opentelemetry.sdk.trace import TracerProvider
+        from opentelemetry.sdk.trace.export import BatchSpanProcessor
+        from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+        if exporter is None:
+            exporter = _create_exporter(config.otel_exporter_protocol, config.otel_exporter_endpoint)
+    except ImportError as exc:
+        logger.warning("OpenTelemetry package missing (%s) — tracing disabled.", exc)
+        return False
+
+    provider = TracerProvider(
+        resource=Resource.create({"service.name": config.otel_service_name}),
+        sampler=ParentBased(TraceIdRatioBased(config.otel_sample_ratio)),
+    )
+    provider.add_span_processor(BatchSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+
+    _provider = provider
+    _tracer = provider.get_tracer(TRACER_NAME)
+
+    logger.info(
+        "Tracing enabled — %s → %s",
+        config.otel_exporter_protocol, config.otel_exporter_endpoint,
+    )
+    return True
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans and shut down the tracer provider."""
+    global _tracer, _provider
+
+    if _provider is not None:
+        _provider.shutdown()
+    _tracer = None
+    _provider = None
+
+
+def _incoming_context():
+    """Extract the caller's trace context from the current MCP request."""
+    from mcp.server.lowlevel.server import request_ctx
+
+    try:
+        ctx = request_ctx.get()
+    except LookupError:
+        return None
+
+    carrier = {}
+    if ctx.meta is not None and ctx.meta.model_extra:
+        carrier.update(ctx.meta.model_extra)
+    if not carrier and ctx.request is not None and hasattr(ctx.request, "headers"):
+        # Fall back to HTTP headers for clients that don't use _meta
+        carrier.update(ctx.request.headers)
+    return propagate.extract(carrier) if carrier else None
+
+
+def _record_result(span, result: Any) -> None:
+    """Mark the span as failed when the tool returned an error response."""
+    if isinstance(result, dict) and result.get("success") is False:
+        error = result.get("error") or {}
+        span.set_status(Status(StatusCode.ERROR, str(error.get("message", ""))))
+        if error.get("code"):
+            span.set_attribute("error.type", error["code"])
+
+
+def traced_tool(func: Callable) -> Callable:
+    """
+    Wrap an async MCP tool so each call runs in a SERVER span.
+
+    The signature and docstring are preserved, so FastMCP derives the same
+    tool schema from the wrapper as from the original function.
+
+    Args:
+        func: Async tool function
+
+    Returns:
+        Wrapped tool function
+    """
+    span_name = f"mcp.tool {func.__name__}"
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        if _tracer is None:
+            return await func(*args, **kwargs)
+
+        with _tracer.start_as_current_span(
+            span_name,
+            context=_incoming_context(),
+            kind=SpanKind.SERVER,
+            attributes={"mcp.tool.name": func.__name__},
+        ) as span:
+            result = await func(*args, **kwargs)
+            _record_result(span, result)
+            return result
+
+    return wrapper
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if _tracer is None:
+        return
+    verb = statement.lstrip()[:8].split(None, 1)
+    database = Path(conn.engine.url.database).stem if conn.engine.url.database else "memory"
+    context._trace_span = _tracer.start_span(
+        f"{verb[0].upper() if verb else 'SQL'} {database}",
+        kind=SpanKind.CLIENT,
+        attributes={
+            "db.system": conn.engine.dialect.name,
+            "db.name": database,
+            "db.statement": statement[:MAX_STATEMENT_LENGTH],
+        },
+    )
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    span = getattr(context, "_trace_span", None)
+    if span is not None:
+        span.end()
+        context._trace_span = None
+
+
+def _handle_error(exception_context):
+    span = getattr(exception_context.execution_context, "_trace_span", None)
+    if span is not None:
+        span.record_exception(exception_context.original_exception)
+        span.set_status(Status(StatusCode.ERROR))
+        span.end()
+        exception_context.execution_context._trace_span = None
+
+
+def instrument_engine(engine) -> None:
+    """
+    Emit a CLIENT span for every statement executed on ``engine``.
+
+    Listeners are cheap no-ops while tracing is disabled.
+
+    Args:
+        engine: SQLAlchemy Engine
+    """
+    if not OTEL_AVAILABLE:
+        return
+
+    from sqlalchemy import event
+
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
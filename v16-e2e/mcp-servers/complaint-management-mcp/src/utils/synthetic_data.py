@@ -0,0 +1,234 @@
+"""
+Synthetic Data Module
+
+Fills the complaints database with a deterministic, realistically skewed
+complaint history for benchmarks and capacity tests (1,000,000
+complaints take a couple of minutes).
+
+Complaints reference orders:
+  - with an order database (``--orders-db``, e.g. one filled by the
+    back-end's ``scripts/generate_orders.py``), complaints are raised
+    against randomly picked real orders, for that order's customer, a few
+    days after the order date. Customers who order more complain more.
+  - without one, order numbers are drawn from ``ORD-00001`` to the
+    ``--orders`` count and customers from a Zipf-distributed population.
+
+Statuses follow complaint age: recent complaints are mostly OPEN or
+IN_PROGRESS, older ones RESOLVED or CLOSED; a share of old CLOSED
+complaints are archived. Rows are inserted with Core ``executemany``,
+one chunk per transaction.
+
+Usage:
+    python -m src.utils.synthetic_data --complaints 1000000 --orders 1000000 --db db/bench.db
+    python -m src.utils.synthetic_data --complaints 100000 --orders-db ../../back-end/data/bench.db
+
+The same arguments always produce the same complaints.
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+from itertools import accumulate, islice
+from typing import Iterator, Optional
+
+from faker import Faker
+from sqlalchemy import insert
+
+from src.enums import Priority, Status
+from src.models import Complaint
+from src.utils.seed_data import _DESCRIPTIONS, _REMARKS, _TITLES
+
+DEFAULT_SEED = 42
+# Complaints are raised before this instant; fixed so output does not depend on today
+DEFAULT_END = datetime(2025, 1, 1)
+DEFAULT_DAYS = 730
+CUSTOMER_SKEW = 0.8
+CHUNK_SIZE = 10_000
+
+
+# ---------------------------------------------------------------------------
+# Distributions
+# ---------------------------------------------------------------------------
+
+_STATUSES = (Status.OPEN, Status.IN_PROGRESS, Status.RESOLVED, Status.CLOSED)
+
+# Status shares by complaint age in days (upper bound, weights in _STATUSES order)
+_STATUS_BY_AGE = (
+    (2, (70, 30, 0, 0)),
+    (7, (30, 45, 25, 0)),
+    (30, (5, 15, 50, 30)),
+    (float("inf"), (1, 2, 27, 70)),
+)
+
+_PRIORITIES = (Priority.LOW, Priority.MEDIUM, Priority.HIGH, Priority.CRITICAL)
+_PRIORITY_WEIGHTS = (30, 40, 20, 10)
+
+# Share of CLOSED complaints older than 90 days that are archived
+_ARCHIVED_SHARE = 0.3
+
+
+def _status_for_age(rng: random.Random, age_days: float) -> Status:
+    for bound, weights in _STATUS_BY_AGE:
+        if age_days < bound:
+            return rng.choices(_STATUSES, weights)[0]
+
+
+# ---------------------------------------------------------------------------
+# Orders complained about
+# ---------------------------------------------------------------------------
+
+def _synthetic_orders(rng: random.Random, count: int, orders: int, days: int, end: datetime):
+    """(order_number, customer_name, order_date) from a Zipf customer population."""
+    faker = Faker()
+    faker.seed_instance(rng.random())
+    customers = [faker.name() for _ in range(max(100, orders // 20))]
+    weights = list(accumulate(1.0 / (rank + 1) ** CUSTOMER_SKEW for rank in range(len(customers))))
+    start = end - timedelta(days=days)
+    for customer in rng.choices(customers, cum_weights=weights, k=count):
+        order_id = rng.randint(1, orders)
+        yield f"ORD-{order_id:05d}", customer, start + timedelta(seconds=days * 86400 * order_id / (orders + 1))
+
+
+def _database_orders(rng: random.Random, count: int, orders_db: str):
+    """(order_number, customer_name, order_date) of randomly picked orders in an order database."""
+    connection = sqlite3.connect(f"file:{orders_db}?mode=ro", uri=True)
+    try:
+        last = connection.execute("SELECT max(order_id) FROM orders").fetchone()[0]
+        if not last:
+            raise ValueError(f"No orders in {orders_db}")
+        picks = iter([rng.randint(1, last) for _ in range(count)])
+        while True:
+            chunk = list(islice(picks, 500))
+            if not chunk:
+                return
+            rows = dict(
+                (order_id, (customer, order_date))
+                for order_id, customer, order_date in connection.execute(
+                    f"SELECT order_id, customer_name, order_date FROM orders "
+                    f"WHERE order_id IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                )
+            )
+            for order_id in chunk:
+                if order_id in rows:  # Deleted orders are skipped
+                    customer, order_date = rows[order_id]
+                    yield f"ORD-{order_id:05d}", customer, datetime.fromisoformat(order_date)
+    finally:
+        connection.close()
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+def generate_complaints(
+    count: int,
+    orders: int = 100_000,
+    orders_db: Optional[str] = None,
+    seed: int = DEFAULT_SEED,
+    days: int = DEFAULT_DAYS,
+    end: datetime = DEFAULT_END,
+) -> Iterator[dict]:
+    """
+    Yield ``count`` complaint rows (lazily).
+
+    Args:
+        count:     Complaints to generate.
+        orders:    Order numbers to draw from when there is no order database.
+        orders_db: Order database whose orders the complaints reference (optional).
+        seed:      Random seed; the same arguments give the same complaints.
+        days:      Length of the order history when there is no order database.
+        end:       Complaints are raised before this instant.
+
+    Yields:
+        dict of Complaint column values.
+    """
+    rng = random.Random(seed)
+    if orders_db:
+        source = _database_orders(rng, count, orders_db)
+    else:
+        source = _synthetic_orders(rng, count, orders, days, end)
+
+    for order_number, customer, order_date in source:
+        created_at = min(end - timedelta(minutes=1), order_date + timedelta(days=rng.expovariate(1 / 5)))
+        age_days = (end - created_at).total_seconds() / 86400
+        status = _status_for_age(rng, age_days)
+
+        updated_at, resolution_date = created_at, None
+        if status in (Status.RESOLVED, Status.CLOSED):
+            resolution_date = min(end, created_at + timedelta(days=rng.expovariate(1 / 4)))
+            updated_at = resolution_date
+        elif status == Status.IN_PROGRESS:
+            updated_at = min(end, created_at + timedelta(hours=rng.expovariate(1 / 12)))
+
+        description = _DESCRIPTIONS[rng.randrange(len(_DESCRIPTIONS))].replace(
+            "{date}", (order_date + timedelta(days=rng.randint(2, 7))).strftime("%d %b %Y")
+        )
+        yield {
+            "title": _TITLES[rng.randrange(len(_TITLES))],
+            "description": description,
+            "customer_name": customer,
+            "order_number": order_number,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "priority": rng.choices(_PRIORITIES, _PRIORITY_WEIGHTS)[0],
+            "status": status,
+            "remarks": _REMARKS[rng.randrange(len(_REMARKS))] if status != Status.OPEN else None,
+            "is_archived": status == Status.CLOSED and age_days > 90 and rng.random() < _ARCHIVED_SHARE,
+            "resolution_date": resolution_date,
+        }
+
+
+def insert_complaints(rows, chunk_size: int = CHUNK_SIZE) -> int:
+    """
+    Insert complaint rows with ``executemany``, one chunk per transaction.
+
+    Args:
+        rows:       Iterable of Complaint column dicts (consumed lazily).
+        chunk_size: Rows per transaction.
+
+    Returns:
+        Number of complaints inserted.
+    """
+    from src.database import get_engine  # configured from DATABASE_PATH on first use
+
+    statement = insert(Complaint.__table__)
+    rows, inserted = iter(rows), 0
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return inserted
+        with get_engine().begin() as conn:
+            conn.execute(statement, chunk)
+        inserted += len(chunk)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Generate a synthetic complaint history")
+    parser.add_argument("--complaints", type=int, default=100_000, help="Complaints to generate")
+    parser.add_argument("--orders", type=int, default=100_000, help="Order numbers to draw from")
+    parser.add_argument("--orders-db", help="Order database whose orders the complaints reference")
+    parser.add_argument("--db", help="Complaints database (default: DATABASE_PATH)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        os.environ["DATABASE_PATH"] = args.db
+    # Every bulk chunk would be logged as a slow query
+    os.environ.setdefault("SLOW_QUERY_MS", "0")
+    from src.database import init_database
+
+    init_database()
+    start = time.perf_counter()
+    inserted = insert_complaints(generate_complaints(args.complaints, args.orders, args.orders_db, args.seed))
+    seconds = time.perf_counter() - start
+    print(f"Created {inserted:,} complaints in {seconds:.1f}s ({inserted / seconds:,.0f}/s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())